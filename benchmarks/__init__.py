@@ -0,0 +1 @@
+"""Benchmarks of each ISPyPSA pipeline stage on synthetic inputs."""
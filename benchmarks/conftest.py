@@ -0,0 +1,185 @@
+"""Shared fixtures for the stage benchmarks.
+
+The synthetic inputs are sized by a scale preset chosen with
+``--benchmark-scale``. Inputs are built once per session, outside the timed
+code, and each stage's benchmark starts from the outputs of the stages before
+it.
+"""
+
+import pytest
+
+from benchmarks.synthetic import (
+    make_synthetic_config,
+    make_synthetic_ispypsa_tables,
+    write_synthetic_trace_directory,
+)
+from ispypsa.pypsa_build import build_pypsa_network
+from ispypsa.results import extract_tabular_results
+from ispypsa.translator import (
+    create_pypsa_friendly_inputs,
+    create_pypsa_friendly_timeseries_inputs,
+)
+
+# Each preset sets the size of the synthetic inputs and the number of timed
+# rounds per benchmark. "nem" has roughly as many sub-regions, REZs and existing
+# generators as the 2024 ISP model.
+SCALES = {
+    "small": {
+        "n_sub_regions": 4,
+        "n_rezs": 8,
+        "n_generators": 40,
+        "investment_periods": [2025, 2026],
+        "end_year": 2026,
+        "representative_weeks": [10, 30],
+        "rounds": 3,
+    },
+    "medium": {
+        "n_sub_regions": 8,
+        "n_rezs": 20,
+        "n_generators": 150,
+        "investment_periods": [2025, 2027, 2029],
+        "end_year": 2030,
+        "representative_weeks": [10, 30],
+        "rounds": 2,
+    },
+    "nem": {
+        "n_sub_regions": 12,
+        "n_rezs": 40,
+        "n_generators": 300,
+        "investment_periods": [2025, 2030, 2035],
+        "end_year": 2035,
+        "representative_weeks": [5, 18, 31, 44],
+        "rounds": 1,
+    },
+}
+
+# HiGHS options for the benchmarks that solve a network: the interior point method
+# without crossover, which is much faster than simplex on these models.
+HIGHS_BENCHMARK_OPTIONS = {
+    "solver": "ipm",
+    "run_crossover": "off",
+    "output_flag": False,
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark-scale",
+        choices=list(SCALES),
+        default="small",
+        help="Size of the synthetic inputs to benchmark with (default: small).",
+    )
+
+
+def copy_tables(tables: dict) -> dict:
+    """Copies a dict of tables, as several stages modify their input tables."""
+    return {name: table.copy() for name, table in tables.items()}
+
+
+@pytest.fixture(scope="session")
+def scale(request) -> dict:
+    return SCALES[request.config.getoption("--benchmark-scale")]
+
+
+@pytest.fixture(scope="session")
+def rounds(scale) -> int:
+    return scale["rounds"]
+
+
+@pytest.fixture(scope="session")
+def synthetic_inputs(scale, tmp_path_factory) -> dict:
+    """Synthetic ISPyPSA tables, a parsed trace directory and a config."""
+    ispypsa_tables = make_synthetic_ispypsa_tables(
+        n_sub_regions=scale["n_sub_regions"],
+        n_rezs=scale["n_rezs"],
+        n_generators=scale["n_generators"],
+        investment_periods=scale["investment_periods"],
+        end_year=scale["end_year"],
+    )
+    trace_directory = write_synthetic_trace_directory(
+        tmp_path_factory.mktemp("parsed_traces"),
+        ispypsa_tables,
+        start_year=scale["investment_periods"][0],
+        end_year=scale["end_year"],
+    )
+    config = make_synthetic_config(
+        trace_directory,
+        investment_periods=scale["investment_periods"],
+        end_year=scale["end_year"],
+        representative_weeks=scale["representative_weeks"],
+    )
+    return {
+        "ispypsa_tables": ispypsa_tables,
+        "trace_directory": trace_directory,
+        "config": config,
+    }
+
+
+@pytest.fixture(scope="session")
+def pypsa_friendly_inputs(synthetic_inputs, tmp_path_factory) -> dict:
+    """PyPSA friendly tables, with snapshots, and their timeseries directory."""
+    config = synthetic_inputs["config"]
+    pypsa_tables = create_pypsa_friendly_inputs(
+        config, copy_tables(synthetic_inputs["ispypsa_tables"])
+    )
+    timeseries_directory = tmp_path_factory.mktemp("pypsa_friendly_timeseries")
+    pypsa_tables["snapshots"] = create_pypsa_friendly_timeseries_inputs(
+        config,
+        "capacity_expansion",
+        copy_tables(synthetic_inputs["ispypsa_tables"]),
+        pypsa_tables["generators"],
+        synthetic_inputs["trace_directory"],
+        timeseries_directory,
+    )
+    return {"tables": pypsa_tables, "timeseries_directory": timeseries_directory}
+
+
+@pytest.fixture(scope="session")
+def single_period_pypsa_friendly_inputs(scale, synthetic_inputs, tmp_path_factory):
+    """PyPSA friendly tables and timeseries for only the first investment period and
+    representative week, which keeps the network quick enough to solve. Every
+    generator, link and storage unit is still included."""
+    first_period = scale["investment_periods"][0]
+    config = make_synthetic_config(
+        synthetic_inputs["trace_directory"],
+        investment_periods=[first_period],
+        end_year=first_period,
+        representative_weeks=scale["representative_weeks"][:1],
+    )
+    pypsa_tables = create_pypsa_friendly_inputs(
+        config, copy_tables(synthetic_inputs["ispypsa_tables"])
+    )
+    timeseries_directory = tmp_path_factory.mktemp("single_period_timeseries")
+    pypsa_tables["snapshots"] = create_pypsa_friendly_timeseries_inputs(
+        config,
+        "capacity_expansion",
+        copy_tables(synthetic_inputs["ispypsa_tables"]),
+        pypsa_tables["generators"],
+        synthetic_inputs["trace_directory"],
+        timeseries_directory,
+    )
+    return {"tables": pypsa_tables, "timeseries_directory": timeseries_directory}
+
+
+@pytest.fixture(scope="session")
+def solved_network(single_period_pypsa_friendly_inputs):
+    """A solved network for benchmarking results extraction and plotting.
+
+    Solving the full synthetic model is slow, so the network is built from the
+    single period inputs. Results extraction and plotting still see every
+    generator, link and storage unit.
+    """
+    network = build_pypsa_network(
+        copy_tables(single_period_pypsa_friendly_inputs["tables"]),
+        single_period_pypsa_friendly_inputs["timeseries_directory"],
+    )
+    network.optimize.solve_model(
+        solver_name="highs",
+        solver_options=HIGHS_BENCHMARK_OPTIONS,
+    )
+    return network
+
+
+@pytest.fixture(scope="session")
+def tabular_results(solved_network, synthetic_inputs) -> dict:
+    return extract_tabular_results(solved_network, synthetic_inputs["ispypsa_tables"])
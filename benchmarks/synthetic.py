@@ -0,0 +1,836 @@
+"""Synthetic, NEM-scale ISPyPSA inputs for benchmarking.
+
+The generators here build a self-consistent set of `ISPyPSA` input tables, a
+parsed trace directory in the layout written by `isp-trace-parser`, and a model
+config to go with them, sized by the number of sub-regions, REZs, existing
+generators, investment periods and modelled years. Nothing is read from the
+IASR workbook or downloaded, so the benchmarks run offline. Values are drawn
+from a seeded random number generator, so the same arguments always give the
+same inputs.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+from ispypsa.config import ModelConfig
+from ispypsa.templater.helpers import _snakecase_string
+
+_NEM_REGIONS = ["QLD", "NSW", "VIC", "SA", "TAS"]
+
+# (technology_type, fuel_type, fuel cost mapping, heat rate GJ/MWh, VOM $/MWh)
+# for existing generators, cycled through as generators are added. A fuel cost
+# mapping of None means the generator's own name is used, as for coal and gas
+# generators in the IASR workbook.
+_ECAA_TECHNOLOGIES = [
+    ("Steam Super Critical", "Black Coal", None, 9.5, 4.0),
+    ("CCGT", "Gas", None, 7.3, 8.0),
+    ("OCGT", "Gas", None, 11.0, 12.0),
+    ("Hydro", "Water", "Hydro", 0.0, 0.0),
+    ("Wind", "Wind", "Wind", 0.0, 0.0),
+    ("Large scale Solar PV", "Solar", "Solar", 0.0, 0.0),
+]
+
+_VRE_RESOURCES = [
+    # (generator id prefix, generator_name, isp_resource_type, fuel_type)
+    ("large_scale_solar_pv", "Large scale Solar PV", "SAT", "Solar"),
+    ("wind", "Wind", "WM", "Wind"),
+    ("wind", "Wind", "WH", "Wind"),
+]
+
+_THERMAL_NEW_ENTRANTS = [
+    # (generator id prefix, generator_name, connection_cost_technology,
+    #  fuel cost mapping suffix, heat rate GJ/MWh, VOM $/MWh, minimum stable level %)
+    ("ocgt_small_gt", "OCGT (small GT)", "Small OCGT", "new OCGT", 10.2, 12.8, 0.0),
+    ("ccgt", "CCGT", "CCGT", "new CCGT", 6.9, 4.1, 40.0),
+]
+
+_NEW_ENTRANT_GENERATOR_COLUMNS = [
+    "generator",
+    "generator_name",
+    "isp_resource_type",
+    "technology_type",
+    "status",
+    "region_id",
+    "sub_region_id",
+    "rez_id",
+    "fuel_type",
+    "fuel_cost_mapping",
+    "fom_$/kw/annum",
+    "vom_$/mwh_sent_out",
+    "heat_rate_gj/mwh",
+    "connection_cost_technology",
+    "connection_cost_rez/_region_id",
+    "build_limit_technology",
+    "build_limit_region_id",
+    "technology_specific_lcf_%",
+    "lifetime",
+    "minimum_stable_level_%",
+    "minimum_load_mw",
+]
+
+_NEW_ENTRANT_BATTERY = "Battery Storage (2hrs storage)"
+
+# Mean build costs in $/MW by technology, falling by 2% a year.
+_BUILD_COSTS = {
+    "OCGT (small GT)": 1.6e6,
+    "CCGT": 1.8e6,
+    "Large scale Solar PV": 1.4e6,
+    "Wind": 2.5e6,
+    _NEW_ENTRANT_BATTERY: 1.2e6,
+}
+
+_TRACE_FREQUENCY = "30min"
+
+
+def _financial_year_columns(start_year: int, end_year: int, unit: str) -> list[str]:
+    """Cost columns, e.g. "2024_25_$/mw", for financial years ending in
+    `start_year` to `end_year` inclusive."""
+    return [
+        f"{year - 1}_{str(year)[-2:]}_{unit}"
+        for year in range(start_year, end_year + 1)
+    ]
+
+
+def _yearly_values(
+    rng: np.random.Generator,
+    base: np.ndarray,
+    n_years: int,
+    annual_change: float = 0.0,
+) -> np.ndarray:
+    """Values for each row of `base` in each year, trending by `annual_change` a year
+    with a little noise."""
+    trend = (1 + annual_change) ** np.arange(n_years)
+    noise = rng.uniform(0.97, 1.03, size=(len(base), n_years))
+    return np.asarray(base, dtype=float)[:, None] * trend[None, :] * noise
+
+
+def _cost_table(
+    rng: np.random.Generator,
+    id_columns: dict[str, list],
+    base: list[float] | np.ndarray,
+    cost_columns: list[str],
+    annual_change: float = 0.0,
+) -> pd.DataFrame:
+    values = _yearly_values(rng, np.asarray(base), len(cost_columns), annual_change)
+    return pd.concat(
+        [
+            pd.DataFrame(id_columns),
+            pd.DataFrame(values, columns=cost_columns),
+        ],
+        axis=1,
+    )
+
+
+def make_synthetic_ispypsa_tables(
+    n_sub_regions: int = 12,
+    n_rezs: int = 40,
+    n_generators: int = 300,
+    investment_periods: list[int] = (2025, 2030, 2035),
+    end_year: int | None = None,
+    seed: int = 0,
+) -> dict[str, pd.DataFrame]:
+    """Creates a synthetic, self-consistent set of `ISPyPSA` input tables.
+
+    Sub-regions are spread across the five NEM regions and connected in a ring
+    of flow paths, and REZs are spread across the sub-regions. Existing (ECAA)
+    generators cycle through coal, gas, hydro, wind and solar technologies,
+    with wind and solar placed in the REZs of their sub-region. Each sub-region
+    gets new entrant OCGT, CCGT and battery options, and each REZ new entrant
+    solar and wind. Every fourth REZ has no transmission limit of its own and
+    is instead grouped into a custom constraint with its neighbours.
+
+    Examples:
+        >>> tables = make_synthetic_ispypsa_tables(
+        ...     n_sub_regions=4, n_rezs=6, n_generators=30,
+        ...     investment_periods=[2025, 2026]
+        ... )
+        >>> len(tables["sub_regions"])
+        4
+
+    Args:
+        n_sub_regions: Number of ISP sub-regions. Defaults to 12.
+        n_rezs: Number of renewable energy zones. Defaults to 40.
+        n_generators: Number of existing (ECAA) generators. Defaults to 300.
+        investment_periods: Investment period start years, first of which is
+            the first modelled year. Defaults to (2025, 2030, 2035).
+        end_year: Last modelled year. Cost and price tables cover every
+            financial year from `investment_periods[0]` to `end_year`. Defaults
+            to the last investment period.
+        seed: Seed for the random values. Defaults to 0.
+
+    Returns:
+        dict[str, pd.DataFrame]: `ISPyPSA` input tables keyed by table name.
+    """
+    rng = np.random.default_rng(seed)
+    investment_periods = list(investment_periods)
+    start_year = investment_periods[0]
+    end_year = investment_periods[-1] if end_year is None else end_year
+    # One year of headroom either side, so build year and snapshot lookups
+    # never fall off the end of a table.
+    cost_columns = _financial_year_columns(start_year - 1, end_year + 1, "$/mw")
+    price_columns = _financial_year_columns(start_year - 1, end_year + 1, "$/gj")
+    percent_columns = _financial_year_columns(start_year - 1, end_year + 1, "%")
+
+    sub_regions = pd.DataFrame(
+        {
+            "isp_sub_region_id": [f"SR{i + 1:02d}" for i in range(n_sub_regions)],
+            "nem_region_id": [
+                _NEM_REGIONS[i % len(_NEM_REGIONS)] for i in range(n_sub_regions)
+            ],
+            "sub_region_reference_node": [
+                f"Reference Node {i + 1}" for i in range(n_sub_regions)
+            ],
+            "sub_region_reference_node_voltage_kv": rng.choice(
+                [220, 275, 330, 500], size=n_sub_regions
+            ),
+        }
+    )
+    region_of = dict(
+        zip(sub_regions["isp_sub_region_id"], sub_regions["nem_region_id"])
+    )
+    sub_region_ids = list(sub_regions["isp_sub_region_id"])
+
+    flow_paths = _make_flow_paths(rng, sub_region_ids)
+    flow_path_expansion_costs = _cost_table(
+        rng,
+        {
+            "flow_path": flow_paths["flow_path"],
+            "option": flow_paths["flow_path"] + " Option 1",
+            "additional_network_capacity_mw": rng.choice(
+                [300.0, 500.0, 900.0], size=len(flow_paths)
+            ),
+        },
+        rng.uniform(0.5e6, 5e6, size=len(flow_paths)),
+        cost_columns,
+        annual_change=0.01,
+    )
+
+    renewable_energy_zones = _make_renewable_energy_zones(rng, n_rezs, sub_region_ids)
+    rez_names = {
+        rez_id: f"Synthetic REZ {rez_id}" for rez_id in renewable_energy_zones["rez_id"]
+    }
+    custom_constraints_lhs, custom_constraints_rhs = _make_custom_constraints(
+        renewable_energy_zones
+    )
+    limited_rezs = renewable_energy_zones.loc[
+        renewable_energy_zones["rez_transmission_network_limit_summer_typical"].notna()
+    ]
+    rez_expansion_ids = list(limited_rezs["rez_id"]) + list(
+        custom_constraints_rhs["constraint_id"]
+    )
+    rez_transmission_expansion_costs = _cost_table(
+        rng,
+        {
+            "rez_constraint_id": rez_expansion_ids,
+            "rez": [
+                rez_names.get(rez_id, f"Group constraint {rez_id}")
+                for rez_id in rez_expansion_ids
+            ],
+            "option": "Option 1",
+            "additional_network_capacity_mw": rng.choice(
+                [200.0, 500.0, 800.0], size=len(rez_expansion_ids)
+            ),
+        },
+        rng.uniform(0.2e6, 3e6, size=len(rez_expansion_ids)),
+        cost_columns,
+        annual_change=0.01,
+    )
+
+    ecaa_generators = _make_ecaa_generators(
+        rng, n_generators, sub_region_ids, region_of, renewable_energy_zones, start_year
+    )
+    # Add a generator output term to each group constraint for an existing
+    # generator connected to one of the grouped REZs, where there is one.
+    generator_terms = (
+        ecaa_generators.dropna(subset=["rez_id"])
+        .merge(
+            custom_constraints_lhs.assign(
+                rez_id=custom_constraints_lhs["term_id"].str.split("-").str[0]
+            ),
+            on="rez_id",
+        )
+        .drop_duplicates(subset=["constraint_id"])
+    )
+    custom_constraints_lhs = pd.concat(
+        [
+            custom_constraints_lhs,
+            pd.DataFrame(
+                {
+                    "constraint_id": generator_terms["constraint_id"],
+                    "term_type": "generator_output",
+                    "term_id": generator_terms["generator"],
+                    "coefficient": 1.0,
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+
+    new_entrant_generators = _make_new_entrant_generators(
+        rng, sub_region_ids, region_of, renewable_energy_zones, rez_names
+    )
+    regions = sorted(set(region_of.values()), key=_NEM_REGIONS.index)
+
+    new_entrant_build_costs = _cost_table(
+        rng,
+        {"technology": list(_BUILD_COSTS)},
+        list(_BUILD_COSTS.values()),
+        cost_columns,
+        annual_change=-0.02,
+    )
+    new_entrant_wind_and_solar_connection_costs = _cost_table(
+        rng,
+        {
+            "REZ names": list(rez_names.values()),
+            "region": [
+                region_of[sub_region]
+                for sub_region in renewable_energy_zones["isp_sub_region_id"]
+            ],
+        },
+        rng.uniform(0.1e6, 0.3e6, size=len(rez_names)),
+        cost_columns,
+        annual_change=0.01,
+    )
+    new_entrant_wind_and_solar_connection_costs[
+        "system_strength_connection_cost_$/mw"
+    ] = rng.uniform(0.05e6, 0.15e6, size=len(rez_names))
+    connection_cost_columns = [
+        f"{_snakecase_string(connection_technology)}_$/mw"
+        for _, _, connection_technology, *_ in _THERMAL_NEW_ENTRANTS
+    ]
+    new_entrant_non_vre_connection_costs = pd.concat(
+        [
+            pd.DataFrame({"Region": regions}),
+            pd.DataFrame(
+                rng.uniform(
+                    0.08e6, 0.12e6, size=(len(regions), len(connection_cost_columns))
+                ),
+                columns=connection_cost_columns,
+            ),
+        ],
+        axis=1,
+    )
+
+    ecaa_batteries, new_entrant_batteries = _make_batteries(
+        rng, sub_region_ids, region_of, start_year
+    )
+
+    gas_generators = list(
+        ecaa_generators.loc[ecaa_generators["fuel_type"] == "Gas", "generator"]
+    ) + [
+        f"{region} {mapping}"
+        for region in regions
+        for _, _, _, mapping, *_ in _THERMAL_NEW_ENTRANTS
+    ]
+    coal_generators = list(
+        ecaa_generators.loc[ecaa_generators["fuel_type"] == "Black Coal", "generator"]
+    )
+
+    return {
+        "sub_regions": sub_regions,
+        "flow_paths": flow_paths,
+        "flow_path_expansion_costs": flow_path_expansion_costs,
+        "renewable_energy_zones": renewable_energy_zones,
+        "rez_transmission_expansion_costs": rez_transmission_expansion_costs,
+        "ecaa_generators": ecaa_generators,
+        "new_entrant_generators": new_entrant_generators,
+        "ecaa_batteries": ecaa_batteries,
+        "new_entrant_batteries": new_entrant_batteries,
+        "new_entrant_build_costs": new_entrant_build_costs,
+        "new_entrant_wind_and_solar_connection_costs": (
+            new_entrant_wind_and_solar_connection_costs
+        ),
+        "new_entrant_non_vre_connection_costs": new_entrant_non_vre_connection_costs,
+        "coal_prices": _cost_table(
+            rng,
+            {"generator": coal_generators},
+            rng.uniform(1.5, 4.0, size=len(coal_generators)),
+            price_columns,
+        ),
+        "gas_prices": _cost_table(
+            rng,
+            {"generator": gas_generators},
+            rng.uniform(10.0, 16.0, size=len(gas_generators)),
+            price_columns,
+            annual_change=-0.01,
+        ),
+        "biomethane_prices": _cost_table(
+            rng, {}, [35.0], price_columns, annual_change=-0.02
+        ),
+        "gpg_emissions_reduction_biomethane": pd.DataFrame(
+            [np.linspace(100.0, 90.0, len(percent_columns))], columns=percent_columns
+        ),
+        "custom_constraints_lhs": custom_constraints_lhs,
+        "custom_constraints_rhs": custom_constraints_rhs,
+    }
+
+
+def _make_flow_paths(
+    rng: np.random.Generator, sub_region_ids: list[str]
+) -> pd.DataFrame:
+    """A ring of flow paths between consecutive sub-regions, or a single path
+    when there are only two."""
+    n_sub_regions = len(sub_region_ids)
+    n_paths = n_sub_regions if n_sub_regions > 2 else n_sub_regions - 1
+    node_from = [sub_region_ids[i] for i in range(n_paths)]
+    node_to = [sub_region_ids[(i + 1) % n_sub_regions] for i in range(n_paths)]
+    return pd.DataFrame(
+        {
+            "flow_path": [f"{a}-{b}" for a, b in zip(node_from, node_to)],
+            "node_from": node_from,
+            "node_to": node_to,
+            "carrier": "AC",
+            "forward_direction_mw_summer_typical": rng.integers(
+                500, 2500, size=n_paths
+            ),
+            "reverse_direction_mw_summer_typical": rng.integers(
+                500, 2500, size=n_paths
+            ),
+        }
+    )
+
+
+def _make_renewable_energy_zones(
+    rng: np.random.Generator, n_rezs: int, sub_region_ids: list[str]
+) -> pd.DataFrame:
+    transmission_limits = rng.integers(200, 2000, size=n_rezs).astype(float)
+    # Every fourth REZ is limited by a group constraint instead.
+    transmission_limits[3::4] = np.nan
+    return pd.DataFrame(
+        {
+            "rez_id": [f"Z{i + 1:02d}" for i in range(n_rezs)],
+            "isp_sub_region_id": [
+                sub_region_ids[i % len(sub_region_ids)] for i in range(n_rezs)
+            ],
+            "carrier": "AC",
+            "wind_generation_total_limits_mw_high": rng.integers(0, 3000, size=n_rezs),
+            "wind_generation_total_limits_mw_medium": rng.integers(
+                0, 5000, size=n_rezs
+            ),
+            "wind_generation_total_limits_mw_offshore_floating": 0.0,
+            "wind_generation_total_limits_mw_offshore_fixed": 0.0,
+            "solar_pv_plus_solar_thermal_limits_mw_solar": rng.integers(
+                1000, 8000, size=n_rezs
+            ),
+            "rez_resource_limit_violation_penalty_factor_$/mw": 288711.0,
+            "rez_transmission_network_limit_summer_typical": transmission_limits,
+            "land_use_limits_mw_wind": rng.uniform(3000, 10000, size=n_rezs),
+            "land_use_limits_mw_solar": rng.uniform(8000, 25000, size=n_rezs),
+        }
+    )
+
+
+def _make_custom_constraints(
+    renewable_energy_zones: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Groups each REZ without a transmission limit with the two REZs before it
+    in a custom constraint on their combined flow to their sub-regions."""
+    unlimited = renewable_energy_zones.index[
+        renewable_energy_zones["rez_transmission_network_limit_summer_typical"].isna()
+    ]
+    lhs = []
+    rhs = []
+    for k, index in enumerate(unlimited):
+        constraint_id = f"GC{k + 1:02d}"
+        grouped = renewable_energy_zones.iloc[max(index - 2, 0) : index + 1]
+        lhs.append(
+            pd.DataFrame(
+                {
+                    "constraint_id": constraint_id,
+                    "term_type": "link_flow",
+                    "term_id": grouped["rez_id"] + "-" + grouped["isp_sub_region_id"],
+                    "coefficient": 1.0,
+                }
+            )
+        )
+        rhs.append(
+            {
+                "constraint_id": constraint_id,
+                "constraint_type": "<=",
+                "rhs": 500.0 * len(grouped),
+            }
+        )
+    lhs_columns = ["constraint_id", "term_type", "term_id", "coefficient"]
+    rhs_columns = ["constraint_id", "constraint_type", "rhs"]
+    if not lhs:
+        return pd.DataFrame(columns=lhs_columns), pd.DataFrame(columns=rhs_columns)
+    return pd.concat(lhs, ignore_index=True), pd.DataFrame(rhs, columns=rhs_columns)
+
+
+def _make_ecaa_generators(
+    rng: np.random.Generator,
+    n_generators: int,
+    sub_region_ids: list[str],
+    region_of: dict[str, str],
+    renewable_energy_zones: pd.DataFrame,
+    start_year: int,
+) -> pd.DataFrame:
+    rezs_by_sub_region = renewable_energy_zones.groupby("isp_sub_region_id")[
+        "rez_id"
+    ].apply(list)
+    rows = []
+    for i in range(n_generators):
+        technology, fuel_type, mapping, heat_rate, vom = _ECAA_TECHNOLOGIES[
+            i % len(_ECAA_TECHNOLOGIES)
+        ]
+        sub_region = sub_region_ids[
+            (i // len(_ECAA_TECHNOLOGIES)) % len(sub_region_ids)
+        ]
+        name = f"{sub_region} {technology} {i + 1}"
+        rez_id = np.nan
+        if fuel_type in ("Wind", "Solar") and sub_region in rezs_by_sub_region:
+            rezs = rezs_by_sub_region[sub_region]
+            rez_id = rezs[i % len(rezs)]
+        capacity = float(rng.uniform(50, 700))
+        rows.append(
+            {
+                "generator": name,
+                "technology_type": technology,
+                "status": "Existing",
+                "region_id": region_of[sub_region],
+                "sub_region_id": sub_region,
+                "rez_id": rez_id,
+                "fuel_type": fuel_type,
+                "fuel_cost_mapping": mapping or name,
+                "fom_$/kw/annum": float(rng.uniform(10, 60)),
+                "vom_$/mwh_sent_out": vom,
+                "heat_rate_gj/mwh": heat_rate,
+                "maximum_capacity_mw": capacity,
+                "commissioning_date": np.nan,
+                "closure_year": (
+                    -1
+                    if fuel_type == "Water"
+                    else int(rng.integers(start_year + 5, 2060))
+                ),
+                "minimum_load_mw": capacity * 0.4 if fuel_type == "Black Coal" else 0.0,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def _make_new_entrant_generators(
+    rng: np.random.Generator,
+    sub_region_ids: list[str],
+    region_of: dict[str, str],
+    renewable_energy_zones: pd.DataFrame,
+    rez_names: dict[str, str],
+) -> pd.DataFrame:
+    rows = []
+    for sub_region in sub_region_ids:
+        region = region_of[sub_region]
+        for (
+            prefix,
+            name,
+            connection_technology,
+            mapping,
+            heat_rate,
+            vom,
+            minimum_stable_level,
+        ) in _THERMAL_NEW_ENTRANTS:
+            rows.append(
+                {
+                    "generator": f"{prefix}_{sub_region.lower()}",
+                    "generator_name": name,
+                    "isp_resource_type": np.nan,
+                    "sub_region_id": sub_region,
+                    "rez_id": np.nan,
+                    "fuel_type": "Gas",
+                    "fuel_cost_mapping": f"{region} {mapping}",
+                    "vom_$/mwh_sent_out": vom,
+                    "heat_rate_gj/mwh": heat_rate,
+                    "connection_cost_technology": connection_technology,
+                    "connection_cost_rez/_region_id": region,
+                    "lifetime": 40,
+                    "minimum_stable_level_%": minimum_stable_level,
+                }
+            )
+    for rez_id, sub_region in zip(
+        renewable_energy_zones["rez_id"], renewable_energy_zones["isp_sub_region_id"]
+    ):
+        for prefix, name, resource_type, fuel_type in _VRE_RESOURCES:
+            rows.append(
+                {
+                    "generator": f"{prefix}_{rez_id.lower()}_{resource_type.lower()}",
+                    "generator_name": name,
+                    "isp_resource_type": resource_type,
+                    "sub_region_id": sub_region,
+                    "rez_id": rez_id,
+                    "fuel_type": fuel_type,
+                    "fuel_cost_mapping": fuel_type,
+                    "vom_$/mwh_sent_out": 0.0,
+                    "heat_rate_gj/mwh": 0.0,
+                    "connection_cost_technology": name,
+                    "connection_cost_rez/_region_id": rez_names[rez_id],
+                    "lifetime": 30,
+                    "minimum_stable_level_%": 0.0,
+                }
+            )
+    generators = pd.DataFrame(rows)
+    generators["technology_type"] = generators["generator_name"]
+    generators["status"] = "New Entrant"
+    generators["region_id"] = generators["sub_region_id"].map(region_of)
+    generators["fom_$/kw/annum"] = rng.uniform(10, 40, size=len(generators))
+    generators["build_limit_technology"] = generators["technology_type"]
+    generators["build_limit_region_id"] = generators["region_id"]
+    generators["technology_specific_lcf_%"] = 100.0
+    generators["minimum_load_mw"] = np.nan
+    return generators.loc[:, _NEW_ENTRANT_GENERATOR_COLUMNS]
+
+
+def _make_batteries(
+    rng: np.random.Generator,
+    sub_region_ids: list[str],
+    region_of: dict[str, str],
+    start_year: int,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """One existing and one new entrant 2 hour battery per sub-region."""
+    n = len(sub_region_ids)
+    shared = {
+        "isp_resource_type": "Battery Storage 2h",
+        "region_id": [region_of[sub_region] for sub_region in sub_region_ids],
+        "sub_region_id": sub_region_ids,
+        "rez_id": np.nan,
+        "fuel_type": "Battery",
+        "fom_$/kw/annum": rng.uniform(7, 11, size=n),
+    }
+    efficiencies = {
+        "round_trip_efficiency_%": 84.0,
+        "charging_efficiency_%": 91.7,
+        "discharging_efficiency_%": 91.7,
+    }
+    ecaa_batteries = pd.DataFrame(
+        {
+            "storage_name": [f"{sub_region} BESS" for sub_region in sub_region_ids],
+            **shared,
+            "technology_type": "Battery Storage",
+            "status": "Existing",
+            "maximum_capacity_mw": rng.uniform(50, 300, size=n),
+            "storage_duration_hours": 2.0,
+            "commissioning_date": np.nan,
+            "closure_year": rng.integers(start_year + 10, start_year + 20, size=n),
+            "lifetime": 20,
+            **efficiencies,
+        }
+    )
+    new_entrant_batteries = pd.DataFrame(
+        {
+            "storage_name": [
+                f"battery_storage_2h_{sub_region.lower()}"
+                for sub_region in sub_region_ids
+            ],
+            **shared,
+            "technology_type": _NEW_ENTRANT_BATTERY,
+            "status": "New Entrant",
+            "connection_cost_$/mw": rng.uniform(0.07e6, 0.11e6, size=n),
+            "technology_specific_lcf_%": 100.0,
+            "maximum_capacity_mw": np.nan,
+            "storage_duration_hours": 2.0,
+            "lifetime": 20,
+            **efficiencies,
+        }
+    )
+    return ecaa_batteries, new_entrant_batteries
+
+
+def write_synthetic_trace_directory(
+    trace_directory: Path | str,
+    ispypsa_tables: dict[str, pd.DataFrame],
+    start_year: int,
+    end_year: int,
+    reference_years: list[int] = (2018,),
+    scenario: str = "Step Change",
+    seed: int = 0,
+) -> Path:
+    """Writes synthetic half-hourly traces in the layout of a directory parsed by
+    `isp-trace-parser`.
+
+    Writes a demand trace for each sub-region, a zone trace for each REZ and
+    resource type used by the new entrant generators, and a project trace for
+    each existing wind and solar generator, one parquet file per trace, under
+    `demand/`, `zone/` and `project/` subdirectories. Each trace covers the
+    financial years `start_year` to `end_year` for each of `reference_years`.
+
+    Args:
+        trace_directory: Directory to write traces to. Created if missing.
+        ispypsa_tables: `ISPyPSA` input tables, e.g. from
+            `make_synthetic_ispypsa_tables`.
+        start_year: First financial year of trace data.
+        end_year: Last financial year of trace data.
+        reference_years: Reference (weather) years to write traces for.
+            Defaults to (2018,).
+        scenario: ISP scenario given to the demand traces. Defaults to
+            "Step Change".
+        seed: Seed for the random values. Defaults to 0.
+
+    Returns:
+        Path: `trace_directory`.
+    """
+    rng = np.random.default_rng(seed)
+    trace_directory = Path(trace_directory)
+    for subdirectory in ["demand", "zone", "project"]:
+        (trace_directory / subdirectory).mkdir(parents=True, exist_ok=True)
+
+    # Parsed traces are period ending, so each financial year runs from
+    # 00:30 on July 1st to 00:00 on the following July 1st.
+    datetimes = pd.date_range(
+        f"{start_year - 1}-07-01 00:30",
+        f"{end_year}-07-01 00:00",
+        freq=_TRACE_FREQUENCY,
+    ).astype("datetime64[us]")
+    hour_of_day = datetimes.hour.to_numpy() + datetimes.minute.to_numpy() / 60
+    day_of_year = datetimes.dayofyear.to_numpy()
+    daily_shape = np.sin(np.pi * (hour_of_day - 6) / 12)
+    seasonal_shape = np.cos(2 * np.pi * (day_of_year - 15) / 365)
+
+    def _write(subdirectory: str, name: str, values: np.ndarray, **columns) -> None:
+        traces = []
+        for reference_year in reference_years:
+            trace = pd.DataFrame({"datetime": datetimes, "value": values})
+            for column, value in columns.items():
+                trace[column] = value
+            trace["reference_year"] = np.int32(reference_year)
+            traces.append(trace)
+        pd.concat(traces, ignore_index=True).to_parquet(
+            trace_directory / subdirectory / f"{name}.parquet", index=False
+        )
+
+    for sub_region in ispypsa_tables["sub_regions"]["isp_sub_region_id"]:
+        peak = rng.uniform(1000, 8000)
+        demand = peak * (
+            0.65
+            + 0.15 * np.clip(daily_shape, 0, None)
+            + 0.1 * seasonal_shape
+            + rng.normal(0, 0.02, size=len(datetimes))
+        )
+        _write(
+            "demand",
+            f"{sub_region}_OPSO_MODELLING_POE50",
+            demand,
+            subregion=sub_region,
+            scenario=scenario,
+            poe="POE50",
+            demand_type="OPSO_MODELLING",
+        )
+
+    zones = (
+        ispypsa_tables["new_entrant_generators"]
+        .dropna(subset=["rez_id"])
+        .loc[:, ["rez_id", "isp_resource_type"]]
+        .drop_duplicates()
+    )
+    for rez_id, resource_type in zones.itertuples(index=False):
+        _write(
+            "zone",
+            f"{rez_id}_{resource_type}",
+            _capacity_factors(rng, resource_type, daily_shape),
+            zone=rez_id,
+            resource_type=resource_type,
+        )
+
+    ecaa_generators = ispypsa_tables["ecaa_generators"]
+    vre_generators = ecaa_generators[
+        ecaa_generators["fuel_type"].isin(["Wind", "Solar"])
+    ]
+    for name, fuel_type in zip(
+        vre_generators["generator"], vre_generators["fuel_type"]
+    ):
+        resource_type = "SAT" if fuel_type == "Solar" else "WM"
+        _write(
+            "project",
+            name.replace(" ", "_"),
+            _capacity_factors(rng, resource_type, daily_shape),
+            project=name,
+            resource_type=resource_type,
+        )
+
+    return trace_directory
+
+
+def _capacity_factors(
+    rng: np.random.Generator, resource_type: str, daily_shape: np.ndarray
+) -> np.ndarray:
+    """Solar follows the sun with cloudy days, wind is a mean reverting random walk."""
+    if resource_type == "SAT":
+        cloudiness = np.repeat(
+            rng.uniform(0.5, 1.0, size=len(daily_shape) // 48 + 1), 48
+        )[: len(daily_shape)]
+        return np.clip(daily_shape, 0, None) * cloudiness
+    mean = 0.45 if resource_type == "WH" else 0.35
+    deviations = lfilter(
+        [1.0], [1.0, -0.98], rng.normal(0, 0.03, size=len(daily_shape))
+    )
+    return np.clip(mean + deviations, 0, 1)
+
+
+def make_synthetic_config(
+    trace_directory: Path | str,
+    investment_periods: list[int] = (2025, 2030, 2035),
+    end_year: int | None = None,
+    reference_years: list[int] = (2018,),
+    representative_weeks: list[int] | None = (10, 30),
+    solver: str = "highs",
+) -> ModelConfig:
+    """Creates a model config for running synthetic inputs.
+
+    Args:
+        trace_directory: Directory of traces written by
+            `write_synthetic_trace_directory`.
+        investment_periods: Investment period start years. Defaults to
+            (2025, 2030, 2035).
+        end_year: Last modelled year. Defaults to the last investment period.
+        reference_years: Reference year cycle. Defaults to (2018,).
+        representative_weeks: Weeks of each year to model, or None to model
+            every snapshot. Defaults to (10, 30).
+        solver: Solver name. Defaults to "highs".
+
+    Returns:
+        ModelConfig: The model config.
+    """
+    investment_periods = list(investment_periods)
+    return ModelConfig(
+        paths={
+            "ispypsa_run_name": "synthetic",
+            "parsed_traces_directory": str(trace_directory),
+            "parsed_workbook_cache": "NOT_USED",
+            "workbook_path": None,
+            "run_directory": "NOT_USED",
+        },
+        scenario="Step Change",
+        wacc=0.07,
+        discount_rate=0.05,
+        network={
+            "transmission_expansion": True,
+            "rez_transmission_expansion": True,
+            "annuitisation_lifetime": 30,
+            "nodes": {
+                "regional_granularity": "sub_regions",
+                "rezs": "discrete_nodes",
+            },
+            "transmission_default_limit": 1e5,
+        },
+        temporal={
+            "year_type": "fy",
+            "range": {
+                "start_year": investment_periods[0],
+                "end_year": investment_periods[-1] if end_year is None else end_year,
+            },
+            "capacity_expansion": {
+                "resolution_min": 30,
+                "reference_year_cycle": list(reference_years),
+                "investment_periods": investment_periods,
+                "aggregation": {
+                    "representative_weeks": (
+                        None
+                        if representative_weeks is None
+                        else list(representative_weeks)
+                    ),
+                },
+            },
+        },
+        unserved_energy={"cost": 10000.0, "max_per_node": 1e5},
+        solver=solver,
+        iasr_workbook_version="6.0",
+    )
@@ -0,0 +1,12 @@
+import pytest
+
+from ispypsa.plotting import create_plot_suite
+
+
+@pytest.mark.benchmark(group="plotting")
+def test_create_plot_suite(benchmark, tabular_results, rounds):
+    plots = benchmark.pedantic(
+        create_plot_suite, args=(tabular_results,), rounds=rounds
+    )
+
+    assert len(plots) > 0
@@ -0,0 +1,65 @@
+import pytest
+
+from benchmarks.conftest import HIGHS_BENCHMARK_OPTIONS, copy_tables
+from ispypsa.pypsa_build import build_pypsa_network, scale_model
+from ispypsa.pypsa_build.custom_constraints import _add_custom_constraints
+
+
+@pytest.mark.benchmark(group="pypsa_build")
+def test_build_pypsa_network(benchmark, pypsa_friendly_inputs, rounds):
+    network = benchmark.pedantic(
+        build_pypsa_network,
+        args=(
+            pypsa_friendly_inputs["tables"],
+            pypsa_friendly_inputs["timeseries_directory"],
+        ),
+        rounds=rounds,
+    )
+
+    assert len(network.generators) > 0
+
+
+@pytest.mark.benchmark(group="pypsa_build")
+def test_add_custom_constraints(benchmark, pypsa_friendly_inputs, rounds):
+    tables = pypsa_friendly_inputs["tables"]
+    tables_without_custom_constraints = {
+        name: table
+        for name, table in tables.items()
+        if name not in ("custom_constraints_rhs", "custom_constraints_lhs")
+    }
+
+    def setup():
+        network = build_pypsa_network(
+            tables_without_custom_constraints,
+            pypsa_friendly_inputs["timeseries_directory"],
+        )
+        return (
+            network,
+            tables["custom_constraints_rhs"],
+            tables["custom_constraints_lhs"],
+        ), {}
+
+    benchmark.pedantic(_add_custom_constraints, setup=setup, rounds=rounds)
+
+
+@pytest.mark.benchmark(group="solve")
+@pytest.mark.parametrize("scaled", [False, True])
+def test_solve_model(benchmark, single_period_pypsa_friendly_inputs, rounds, scaled):
+    def setup():
+        network = build_pypsa_network(
+            copy_tables(single_period_pypsa_friendly_inputs["tables"]),
+            single_period_pypsa_friendly_inputs["timeseries_directory"],
+        )
+        if scaled:
+            scale_model(network)
+        return (network,), {}
+
+    def solve(network):
+        network.optimize.solve_model(
+            solver_name="highs", solver_options=HIGHS_BENCHMARK_OPTIONS
+        )
+        return network
+
+    network = benchmark.pedantic(solve, setup=setup, rounds=rounds)
+
+    assert network.model.status == "ok"
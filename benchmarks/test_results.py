@@ -0,0 +1,14 @@
+import pytest
+
+from ispypsa.results import extract_tabular_results
+
+
+@pytest.mark.benchmark(group="results")
+def test_extract_tabular_results(benchmark, solved_network, synthetic_inputs, rounds):
+    results = benchmark.pedantic(
+        extract_tabular_results,
+        args=(solved_network, synthetic_inputs["ispypsa_tables"]),
+        rounds=rounds,
+    )
+
+    assert len(results) > 0
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from ispypsa.data_fetch import read_csvs
+from ispypsa.templater import (
+    create_ispypsa_inputs_template,
+    load_manually_extracted_tables,
+)
+
+# Synthetic IASR workbook tables aren't generated, so the templater is
+# benchmarked on the trimmed workbook cache used by the test suite. Its runtime
+# doesn't depend on --benchmark-scale.
+_WORKBOOK_CACHE = (
+    Path(__file__).parent.parent / "tests" / "test_workbook_table_cache" / "6.0"
+)
+
+
+@pytest.mark.benchmark(group="templater")
+def test_create_ispypsa_inputs_template(benchmark, rounds):
+    iasr_tables = read_csvs(_WORKBOOK_CACHE)
+    manually_extracted_tables = load_manually_extracted_tables("6.0")
+
+    def setup():
+        return (
+            "Step Change",
+            "sub_regions",
+            {name: table.copy() for name, table in iasr_tables.items()},
+            {name: table.copy() for name, table in manually_extracted_tables.items()},
+            "6.0",
+        ), {}
+
+    template = benchmark.pedantic(
+        create_ispypsa_inputs_template, setup=setup, rounds=rounds
+    )
+
+    assert "sub_regions" in template
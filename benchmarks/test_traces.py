@@ -0,0 +1,100 @@
+import shutil
+
+import pytest
+from isp_trace_parser import get_data
+
+from benchmarks.conftest import copy_tables
+from benchmarks.synthetic import write_synthetic_trace_directory
+from ispypsa.translator import create_pypsa_friendly_timeseries_inputs
+from ispypsa.translator.helpers import _get_traces_by_reference_year
+
+
+@pytest.mark.benchmark(group="traces")
+def test_create_pypsa_friendly_timeseries_inputs(
+    benchmark, synthetic_inputs, pypsa_friendly_inputs, rounds, tmp_path
+):
+    timeseries_directory = tmp_path / "pypsa_friendly_timeseries"
+
+    def setup():
+        shutil.rmtree(timeseries_directory, ignore_errors=True)
+        return (
+            synthetic_inputs["config"],
+            "capacity_expansion",
+            copy_tables(synthetic_inputs["ispypsa_tables"]),
+            pypsa_friendly_inputs["tables"]["generators"].copy(),
+            synthetic_inputs["trace_directory"],
+            timeseries_directory,
+        ), {}
+
+    snapshots = benchmark.pedantic(
+        create_pypsa_friendly_timeseries_inputs, setup=setup, rounds=rounds
+    )
+
+    assert len(snapshots) > 0
+
+
+@pytest.fixture(scope="module")
+def reference_year_trace_directory(scale, synthetic_inputs, tmp_path_factory):
+    """Synthetic traces with three reference years, to cycle between."""
+    return write_synthetic_trace_directory(
+        tmp_path_factory.mktemp("reference_year_traces"),
+        synthetic_inputs["ispypsa_tables"],
+        start_year=scale["investment_periods"][0],
+        end_year=scale["end_year"],
+        reference_years=[2011, 2013, 2018],
+    )
+
+
+# Compares querying demand traces once per model year, as isp-trace-parser's
+# get_demand_multiple_reference_years does, with one query per distinct reference
+# year.
+@pytest.mark.benchmark(group="trace_queries")
+@pytest.mark.parametrize(
+    "reference_year_cycle",
+    [[2018], [2011, 2013, 2018]],
+    ids=["one_reference_year", "cycle"],
+)
+@pytest.mark.parametrize(
+    "by_reference_year", [False, True], ids=["per_model_year", "by_reference_year"]
+)
+def test_get_demand_traces(
+    benchmark,
+    scale,
+    synthetic_inputs,
+    reference_year_trace_directory,
+    rounds,
+    reference_year_cycle,
+    by_reference_year,
+):
+    model_years = range(scale["investment_periods"][0], scale["end_year"] + 1)
+    reference_year_mapping = {
+        year: reference_year_cycle[i % len(reference_year_cycle)]
+        for i, year in enumerate(model_years)
+    }
+    query = {
+        "scenario": "Step Change",
+        "subregion": list(
+            synthetic_inputs["ispypsa_tables"]["sub_regions"]["isp_sub_region_id"]
+        ),
+        "demand_type": "OPSO_MODELLING",
+        "poe": "POE50",
+        "directory": reference_year_trace_directory / "demand",
+        "select_columns": ["subregion", "datetime", "value"],
+    }
+
+    if by_reference_year:
+        traces = benchmark.pedantic(
+            _get_traces_by_reference_year,
+            args=(get_data.get_demand_single_reference_year, reference_year_mapping),
+            kwargs={"year_type": "fy", **query},
+            rounds=rounds,
+        )
+    else:
+        traces = benchmark.pedantic(
+            get_data.get_demand_multiple_reference_years,
+            args=(reference_year_mapping,),
+            kwargs={"year_type": "fy", **query},
+            rounds=rounds,
+        )
+
+    assert len(traces) > 0
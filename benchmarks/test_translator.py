@@ -0,0 +1,132 @@
+import pandas as pd
+import pytest
+
+from benchmarks.conftest import copy_tables
+from benchmarks.synthetic import make_synthetic_ispypsa_tables
+from ispypsa.translator import create_pypsa_friendly_inputs
+from ispypsa.translator.custom_constraints import (
+    _create_vre_build_and_resource_limit_constraints,
+    _translate_custom_constraints,
+)
+from ispypsa.translator.generators import _translate_new_entrant_generators
+from ispypsa.translator.helpers import _resolve_wildcards
+from ispypsa.translator.storage import _translate_new_entrant_batteries
+
+# New entrants get a row per build year, so annual investment periods over a
+# long horizon multiply the rows the new entrant translators work through.
+_ANNUAL_INVESTMENT_PERIODS = list(range(2025, 2051))
+
+
+@pytest.fixture(scope="module")
+def annual_build_year_tables(scale) -> dict:
+    return make_synthetic_ispypsa_tables(
+        n_sub_regions=scale["n_sub_regions"],
+        n_rezs=scale["n_rezs"],
+        n_generators=scale["n_generators"],
+        investment_periods=_ANNUAL_INVESTMENT_PERIODS,
+    )
+
+
+@pytest.mark.benchmark(group="translator")
+def test_create_pypsa_friendly_inputs(benchmark, synthetic_inputs, rounds):
+    def setup():
+        return (
+            synthetic_inputs["config"],
+            copy_tables(synthetic_inputs["ispypsa_tables"]),
+        ), {}
+
+    pypsa_tables = benchmark.pedantic(
+        create_pypsa_friendly_inputs, setup=setup, rounds=rounds
+    )
+
+    assert len(pypsa_tables["generators"]) > 0
+
+
+@pytest.mark.benchmark(group="translator")
+def test_translate_custom_constraints(
+    benchmark, synthetic_inputs, pypsa_friendly_inputs, rounds
+):
+    pypsa_tables = pypsa_friendly_inputs["tables"]
+
+    def setup():
+        return (
+            synthetic_inputs["config"],
+            copy_tables(synthetic_inputs["ispypsa_tables"]),
+            pypsa_tables["links"].copy(),
+            pypsa_tables["generators"].copy(),
+        ), {}
+
+    custom_constraints = benchmark.pedantic(
+        _translate_custom_constraints, setup=setup, rounds=rounds
+    )
+
+    assert len(custom_constraints["custom_constraints_lhs"]) > 0
+
+
+@pytest.mark.benchmark(group="translator")
+@pytest.mark.parametrize(
+    "translate",
+    [_translate_new_entrant_generators, _translate_new_entrant_batteries],
+    ids=["generators", "batteries"],
+)
+def test_translate_new_entrants_annual_build_years(
+    benchmark, translate, annual_build_year_tables, rounds
+):
+    def setup():
+        return (
+            copy_tables(annual_build_year_tables),
+            _ANNUAL_INVESTMENT_PERIODS,
+            0.07,
+        ), {}
+
+    new_entrants = benchmark.pedantic(translate, setup=setup, rounds=rounds)
+
+    assert len(new_entrants) > 0
+
+
+@pytest.mark.benchmark(group="translator")
+def test_create_vre_build_and_resource_limit_constraints_annual_build_years(
+    benchmark, annual_build_year_tables, rounds
+):
+    generators = _translate_new_entrant_generators(
+        copy_tables(annual_build_year_tables), _ANNUAL_INVESTMENT_PERIODS, 0.07
+    )
+
+    lhs, rhs, _ = benchmark.pedantic(
+        _create_vre_build_and_resource_limit_constraints,
+        args=(
+            annual_build_year_tables["renewable_energy_zones"],
+            generators,
+            _ANNUAL_INVESTMENT_PERIODS,
+            0.07,
+            30,
+        ),
+        rounds=rounds,
+    )
+
+    assert len(lhs) > 0
+
+
+@pytest.mark.benchmark(group="translator")
+def test_resolve_wildcards_expansion_costs(benchmark, scale, rounds):
+    # An expansion cost style table: per-path costs for every year on half the
+    # paths, per-path and per-timeslice defaults, and a global default.
+    path_ids = [f"P{i:03d}" for i in range(scale["n_generators"])]
+    years = _ANNUAL_INVESTMENT_PERIODS
+    timeslices = ["peak", "summer", "winter"]
+    rows = []
+    for path_id in path_ids[: len(path_ids) // 2]:
+        rows += [(path_id, year, None, 1.0) for year in years]
+        rows += [(path_id, None, timeslice, 2.0) for timeslice in timeslices]
+    rows += [(path_id, None, None, 3.0) for path_id in path_ids]
+    rows += [(None, None, timeslice, 4.0) for timeslice in timeslices]
+    rows.append((None, None, None, 5.0))
+    costs = pd.DataFrame(rows, columns=["expansion_id", "year", "timeslice", "cost"])
+
+    resolved = benchmark.pedantic(
+        _resolve_wildcards,
+        args=(costs, {"expansion_id": path_ids, "year": years}, ["cost"]),
+        rounds=rounds,
+    )
+
+    assert len(resolved) > len(costs)
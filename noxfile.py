@@ -16,3 +16,11 @@ def tests(session: nox.Session) -> None:
         "requests-mock",
     )
     session.run("pytest")
+
+
+@nox.session(python="3.12")
+def benchmarks(session: nox.Session) -> None:
+    """Run the stage benchmarks, passing any extra arguments on to pytest."""
+    session.install("-e", ".")
+    session.install("pytest", "pytest-cov", "pytest-benchmark")
+    session.run("pytest", "benchmarks", "--no-cov", *session.posargs)
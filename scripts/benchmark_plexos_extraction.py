@@ -0,0 +1,132 @@
+"""Benchmark streamed against plexosdb PLEXOS constraint extraction.
+
+Writes a synthetic PLEXOS XML model shaped like AEMO's -- the 15 extracted
+constraints buried among many generators, each carrying dated, banded data --
+then runs ``extract_plexos_constraints.py``'s extraction on it in a fresh
+process per method, reporting wall-clock time and peak resident memory. The
+default size gives a file of roughly 300 MB, in line with AEMO's models:
+
+    uv run python scripts/benchmark_plexos_extraction.py --generators 10000
+
+The plexosdb method loads the whole model into memory and can take several
+minutes and GB at the default size; use ``--methods stream`` to skip it, or
+``--xml`` to benchmark a real model instead of a synthetic one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from extract_plexos_constraints import CONSTRAINT_NAMES
+
+# The synthetic model writer is shared with the script's tests.
+sys.path.insert(0, str(Path(__file__).parents[1]))
+from tests.test_scripts.synthetic_plexos import write_synthetic_plexos_xml  # noqa: E402
+
+
+def _measure(method: str, xml_path: str) -> None:
+    """Run one extraction in this process and print its time and peak memory."""
+    import extract_plexos_constraints as extract
+
+    import_mib = _peak_memory_mib()
+    start = time.perf_counter()
+    if method == "stream":
+        rows = extract._stream_constraint_rows(xml_path, CONSTRAINT_NAMES)
+    else:
+        db = extract._load_plexos_db(xml_path)
+        rows = extract._query_constraint_rows(db, CONSTRAINT_NAMES)
+    elapsed = time.perf_counter() - start
+    print(
+        json.dumps(
+            {
+                "seconds": elapsed,
+                "peak_mib": _peak_memory_mib(),
+                "import_mib": import_mib,
+                "rows": len(rows),
+            }
+        )
+    )
+
+
+def _peak_memory_mib() -> float:
+    """Peak resident memory of this process, in MiB."""
+    try:
+        # Linux carries ru_maxrss over from the parent across fork and exec,
+        # which would count the memory used writing the synthetic model;
+        # VmHWM starts afresh at exec.
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except FileNotFoundError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _run_measurement(method: str, xml_path: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, __file__, "--measure", method, str(xml_path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--generators",
+        type=int,
+        default=10000,
+        help="Number of synthetic generators; sets the file size (default 10000).",
+    )
+    parser.add_argument(
+        "--years",
+        type=int,
+        default=30,
+        help="Dated data points per generator property (default 30).",
+    )
+    parser.add_argument(
+        "--methods",
+        nargs="+",
+        choices=["stream", "plexosdb"],
+        default=["stream", "plexosdb"],
+    )
+    parser.add_argument(
+        "--xml", type=Path, help="Benchmark this PLEXOS XML file instead."
+    )
+    parser.add_argument("--measure", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        _measure(*args.measure)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_path = args.xml
+        if xml_path is None:
+            xml_path = Path(tmp_dir) / "synthetic_model.xml"
+            write_synthetic_plexos_xml(xml_path, args.generators, args.years)
+        size_mib = xml_path.stat().st_size / 2**20
+        print(f"{xml_path.name}: {size_mib:.0f} MiB")
+        for method in args.methods:
+            result = _run_measurement(method, xml_path)
+            print(
+                f"{method}: {result['seconds']:.1f}s, peak {result['peak_mib']:.0f} MiB "
+                f"({result['peak_mib'] / size_mib:.2f}x file size, of which "
+                f"{result['import_mib']:.0f} MiB is imports), {result['rows']} rows"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark serial against parallel IASR workbook table extraction.
+
+Builds the required-tables cache from scratch into temporary directories, once
+serially and once per requested process count, and reports wall-clock times
+and the peak resident set size of the main and worker processes.
+Pass one workbook path per version to benchmark, e.g. the 6.0 and 7.5
+workbooks:
+
+    uv run python scripts/benchmark_workbook_cache.py \\
+        6.0=data/workbooks/6.0/2024-isp-inputs-and-assumptions-workbook.xlsx \\
+        "7.5=data/workbooks/7.5/Draft 2026 ISP Inputs and Assumptions workbook.xlsx" \\
+        --processes 2 4 8
+
+Run with ``ISPYPSA_USE_NEW_TABLE_FORMAT=true`` to benchmark the new-format
+required tables.
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ispypsa.iasr_table_caching import build_local_cache
+
+
+def _time_build(
+    workbook_path: Path, version: str, n_processes: int
+) -> tuple[float, float, float]:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        build_local_cache(
+            Path(cache_dir), workbook_path, version, n_processes=n_processes
+        )
+        elapsed = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux.
+    return (
+        elapsed,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    )
+
+
+def _time_build_in_fresh_process(
+    workbook_path: Path, version: str, n_processes: int
+) -> tuple[float, float, float]:
+    """Runs `_time_build` in a new process so peak RSS isn't carried over from
+    earlier builds."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(
+            _time_build, workbook_path, version, n_processes
+        ).result()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "workbooks",
+        nargs="+",
+        help="VERSION=PATH pairs, e.g. 6.0=path/to/workbook.xlsx",
+    )
+    parser.add_argument(
+        "--processes",
+        nargs="+",
+        type=int,
+        default=[2, 4],
+        help="Process counts to benchmark against the serial path.",
+    )
+    args = parser.parse_args()
+
+    for spec in args.workbooks:
+        version, workbook_path = spec.split("=", maxsplit=1)
+        serial_time, serial_rss, _ = _time_build_in_fresh_process(
+            Path(workbook_path), version, n_processes=1
+        )
+        print(f"{version}: serial {serial_time:.1f}s, peak RSS {serial_rss:.0f} MB")
+        for n_processes in args.processes:
+            parallel_time, main_rss, worker_rss = _time_build_in_fresh_process(
+                Path(workbook_path), version, n_processes
+            )
+            print(
+                f"{version}: {n_processes} processes {parallel_time:.1f}s "
+                f"(speed-up {serial_time / parallel_time:.2f}x), peak RSS "
+                f"{main_rss:.0f} MB main and {worker_rss:.0f} MB per worker"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,10 @@ ISPyPSA templater at template time.
 Usage:
     uv run python scripts/extract_plexos_constraints.py path/to/model.xml --version 7.5
 
+Pass ``--plexosdb`` to load the full model into SQLite via plexosdb instead of
+streaming it (see "Streaming the XML" below) -- slower and far hungrier for
+memory, but useful for cross-checking the streamed extraction.
+
 The PLEXOS XML model is published by AEMO alongside each ISP and can be
 downloaded from their website -- pass the path to that file as the first
 argument.
@@ -119,6 +123,25 @@ result frames are stitched into one long table by ``_merge_into_long_table``,
 then split into the three output CSVs by ``_split_into_tables``.
 
 
+Streaming the XML
+=================
+
+AEMO's XML dumps run to several hundred MB, and loading one in full -- as an
+ElementTree and then an SQLite database, which is what plexosdb does -- needs
+many GB of memory. By default the script instead streams the file once with
+``iterparse`` (``_read_plexos_tables``), discarding each row element as soon
+as it is read and keeping only the columns listed in ``_STREAMED_COLUMNS``,
+stored as typed arrays (``array('q')`` for ids, ``array('d')`` for values).
+The object catalogue and memberships are kept whole, but ``t_data`` -- the
+bulk of the file -- and its date, tag and band sidecars are kept only for the
+memberships of the constraints being extracted.
+The five steps above are then answered from those arrays by
+``_stream_constraint_rows``, joining on the integer ids with sorted-index
+lookups (``_lookup_positions``) rather than SQL. Each step returns exactly
+the frame its SQL counterpart does, so the merge, validation and split are
+shared by both paths.
+
+
 Validation
 ==========
 
@@ -128,8 +151,8 @@ invariants against the *real* model. Each is a small ``_assert_*`` /
 Together they cover name resolution, structural completeness (a Sense, an RHS
 and LHS terms per constraint), reference integrity, value sanity, tag scoping,
 and the absence of bands or duplicated data points. Most run on the merged
-table, gathered by ``_validate_constraint_rows``; a few need the database and
-run earlier, in ``_query_constraint_rows``.
+table, gathered by ``_validate_constraint_rows``; a few need the full model
+and run earlier, in ``_query_constraint_rows`` / ``_stream_constraint_rows``.
 
 These are deliberately not unit tests on synthetic data -- a synthetic
 fixture can only encode the schema assumptions we are trying to test. The
@@ -165,12 +188,22 @@ into ISPyPSA conventions (timeslice mapping, IASR ID lookup, term-type
 classification, etc.).
 """
 
+from __future__ import annotations
+
 import argparse
+import xml.etree.ElementTree as ET
+from array import array
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
-import plexosdb.xml_handler
-from plexosdb import PlexosDB
+
+# plexosdb is only needed with --plexosdb, so it is imported where it is used and
+# streaming works without it installed.
+if TYPE_CHECKING:
+    from plexosdb import PlexosDB
 
 # The 15 custom constraints we extract. Fourteen are REZ / sub-region
 # export-limit constraints (PLEXOS names them "ExportGroup_<region>"); the
@@ -212,11 +245,38 @@ _KNOWN_PROPERTIES = {
 _KNOWN_PARENT_CLASSES = {"Generator", "Battery", "Line", "Node", "Purchaser", "System"}
 _VALID_SENSE_VALUES = {-1, 0, 1}
 
+# The tables and columns kept when streaming the XML -- see the module
+# docstring's "Streaming the XML" section. Ids are stored as signed 64-bit
+# integers ("q"), values as doubles ("d") and text as Python strings (str).
+_STREAMED_COLUMNS = {
+    "t_class": {"class_id": "q", "name": str},
+    "t_object": {"object_id": "q", "class_id": "q", "name": str},
+    "t_property": {"property_id": "q", "name": str},
+    "t_membership": {
+        "membership_id": "q",
+        "parent_object_id": "q",
+        "child_object_id": "q",
+    },
+    "t_data": {"data_id": "q", "membership_id": "q", "property_id": "q", "value": "d"},
+    "t_date_from": {"data_id": "q", "date": str},
+    "t_date_to": {"data_id": "q", "date": str},
+    "t_tag": {"data_id": "q", "object_id": "q"},
+    "t_band": {"data_id": "q"},
+}
+# Read in full when streaming; t_data and its sidecars are scoped to the
+# constraints' memberships (see ``_read_plexos_tables``).
+_CATALOGUE_TABLES = {"t_class", "t_object", "t_property", "t_membership"}
+# Stands in for a missing (NULL) id in the streamed integer columns.
+_MISSING_ID = -1
+
 
 def main():
     args = _parse_args()
-    db = _load_plexos_db(args.xml_path)
-    rows = _query_constraint_rows(db, CONSTRAINT_NAMES)
+    if args.plexosdb:
+        db = _load_plexos_db(args.xml_path)
+        rows = _query_constraint_rows(db, CONSTRAINT_NAMES)
+    else:
+        rows = _stream_constraint_rows(args.xml_path, CONSTRAINT_NAMES)
     constraints, lhs, rhs = _split_into_tables(rows)
     _write_csvs(args.out_dir / args.version, constraints, lhs, rhs)
 
@@ -235,6 +295,11 @@ def _parse_args():
         default=Path("src/ispypsa/templater/plexos"),
         help="Parent output directory (default: src/ispypsa/templater/plexos).",
     )
+    p.add_argument(
+        "--plexosdb",
+        action="store_true",
+        help="Load the full model with plexosdb instead of streaming the XML.",
+    )
     return p.parse_args()
 
 
@@ -246,6 +311,8 @@ def _load_plexos_db(xml_path: str) -> PlexosDB:
     ``PlexosDB.from_xml`` raises ``OverflowError`` on AEMO files. Reported
     upstream as plexosdb issue #135.
     """
+    from plexosdb import PlexosDB
+
     _install_big_int_workaround()
     return PlexosDB.from_xml(xml_path)
 
@@ -258,6 +325,8 @@ def _install_big_int_workaround() -> None:
     integer column. We wrap ``validate_string`` to keep such values as strings.
     ``uid`` is not read by this script, so stringifying it is harmless.
     """
+    import plexosdb.xml_handler
+
     original = plexosdb.xml_handler.validate_string
 
     def patched(value):
@@ -289,10 +358,12 @@ def _query_constraint_rows(db: PlexosDB, names: list[str]) -> pd.DataFrame:
     """
     constraints = _query_constraint_objects(db, names)
     _check_constraints_resolved(constraints, names)
-    _assert_constraints_are_never_parents(db, constraints["constraint_object_id"])
+    _assert_constraints_are_never_parents(
+        _query_constraint_parent_count(db, constraints["constraint_object_id"])
+    )
     memberships = _query_memberships(db, constraints["constraint_object_id"])
     membership_ids = memberships["membership_id"]
-    _assert_no_banded_data_points(db, membership_ids)
+    _assert_no_banded_data_points(_query_banded_data_count(db, membership_ids))
     data_points = _query_data_points(db, membership_ids)
     dates = _query_dates(db, membership_ids)
     tags = _query_tags(db, membership_ids)
@@ -546,6 +617,379 @@ def _query_tags(db: PlexosDB, membership_ids) -> pd.DataFrame:
     return pd.DataFrame(db.query(sql, tuple(ids)), columns=["data_id", "tags"])
 
 
+def _query_constraint_parent_count(db: PlexosDB, constraint_object_ids) -> int:
+    """Count the memberships with a constraint as the *parent* object.
+
+    Feeds ``_assert_constraints_are_never_parents``.
+    """
+    ids = list(constraint_object_ids)
+    sql = f"""
+        SELECT COUNT(*) FROM t_membership
+        WHERE parent_object_id IN ({_placeholders(len(ids))})
+    """
+    (count,) = db.query(sql, tuple(ids))[0]
+    return count
+
+
+def _query_banded_data_count(db: PlexosDB, membership_ids) -> int:
+    """Count the ``t_band`` rows on data points of the given memberships.
+
+    Feeds ``_assert_no_banded_data_points``.
+    """
+    ids = list(membership_ids)
+    sql = f"""
+        SELECT COUNT(*)
+        FROM t_band
+        JOIN t_data ON t_band.data_id = t_data.data_id
+        WHERE t_data.membership_id IN ({_placeholders(len(ids))})
+    """
+    (count,) = db.query(sql, tuple(ids))[0]
+    return count
+
+
+# --- streaming extraction ---
+#
+# The functions below answer the five pipeline steps from the streamed tables
+# instead of SQL -- see the module docstring's "Streaming the XML" section.
+# Each returns the same frame as its ``_query_*`` counterpart.
+
+
+def _stream_constraint_rows(xml_path, names: list[str]) -> pd.DataFrame:
+    """Build the long-format constraint table by streaming the XML.
+
+    The streamed counterpart of ``_query_constraint_rows``: the same steps,
+    checks and merge, with each step answered from the arrays read by
+    ``_read_plexos_tables`` rather than from a loaded database.
+    """
+    tables = _read_plexos_tables(xml_path, names)
+    constraints = _stream_constraint_objects(tables, names)
+    _check_constraints_resolved(constraints, names)
+    constraint_ids = constraints["constraint_object_id"].to_numpy()
+    parent_ids = tables["t_membership"]["parent_object_id"]
+    _assert_constraints_are_never_parents(
+        int(np.isin(parent_ids, constraint_ids).sum())
+    )
+    memberships = _stream_memberships(tables, constraint_ids)
+    membership_ids = memberships["membership_id"].to_numpy()
+    data_ids = tables["t_data"]["data_id"][
+        np.isin(tables["t_data"]["membership_id"], membership_ids)
+    ]
+    _assert_no_banded_data_points(
+        int(np.isin(tables["t_band"]["data_id"], data_ids).sum())
+    )
+    data_points = _stream_data_points(tables, membership_ids)
+    dates = _stream_dates(tables, data_ids)
+    tags = _stream_tags(tables, data_ids)
+    rows = _merge_into_long_table(constraints, memberships, data_points, dates, tags)
+    _assert_merge_is_one_to_one(data_points, rows)
+    _validate_constraint_rows(rows)
+    return rows
+
+
+def _read_plexos_tables(xml_path, names: list[str]) -> dict[str, dict]:
+    """Stream the XML once, keeping only the ``_STREAMED_COLUMNS`` rows we need.
+
+    Each row element is read and then discarded, so memory grows with the
+    kept rows rather than the size of the document. The catalogue tables
+    (``_CATALOGUE_TABLES``) are kept whole. ``t_data`` -- by far the largest
+    table -- is kept only on memberships whose child is one of the named
+    constraints, and its sidecar tables only for the kept data points.
+
+    That scoping relies on PLEXOS writing the catalogue before ``t_data`` and
+    ``t_data`` before its sidecars, as AEMO's models do. A file in another
+    order raises a ValueError rather than silently losing rows.
+
+    Integer columns become int64 numpy arrays, with ``_MISSING_ID`` for a NULL
+    id; ``t_data.value`` becomes a float64 array, with NaN for a NULL. Text
+    columns stay lists of strings (``None`` for a NULL), with repeated strings
+    stored once. A non-numeric ``t_data.value`` can't be held in the float
+    array, so it is kept as text in ``tables["t_data"]["value_text"]`` (row
+    index -> text) for ``_stream_data_points`` to restore.
+
+    I/O Example:
+        xml_path: a file holding (namespace omitted)
+
+            <MasterDataSet>
+              <t_class><class_id>78</class_id><name>Constraint</name></t_class>
+              <t_object><object_id>20</object_id><class_id>78</class_id>
+                        <name>ExportGroup_SWQLD1</name>...</t_object>
+              <t_membership><membership_id>500</membership_id>
+                            <parent_object_id>10</parent_object_id>
+                            <child_object_id>20</child_object_id></t_membership>
+              <t_data><data_id>900</data_id><membership_id>500</membership_id>
+                      <property_id>44</property_id><value>0.14</value>
+                      <uid>12345678901234567890</uid></t_data>
+              <t_data><data_id>950</data_id><membership_id>777</membership_id>
+                      ...</t_data>
+              ...
+            </MasterDataSet>
+        names: ["ExportGroup_SWQLD1"]
+
+        returns (abbreviated -- data point 950 is on another membership):
+            {
+                "t_class": {"class_id": array([78]), "name": ["Constraint"]},
+                "t_data": {
+                    "data_id": array([900]),
+                    "membership_id": array([500]),
+                    "property_id": array([44]),
+                    "value": array([0.14]),
+                    "value_text": {},
+                },
+                ...
+            }
+    """
+    columns = {
+        table: {col: array(kind) if kind != str else [] for col, kind in spec.items()}
+        for table, spec in _STREAMED_COLUMNS.items()
+    }
+    value_text = {}
+    interned = {}
+    scope = None
+    seen_sidecar = False
+    for table, row in _iter_xml_rows(xml_path, _STREAMED_COLUMNS):
+        if table in _CATALOGUE_TABLES:
+            if scope is not None:
+                raise ValueError(_out_of_order_message(table))
+        else:
+            if scope is None:
+                scope = _constraint_membership_scope(columns, names)
+            if table == "t_data":
+                if seen_sidecar:
+                    raise ValueError(_out_of_order_message(table))
+                if _parse_id(row.get("membership_id")) not in scope["memberships"]:
+                    continue
+                scope["data"].add(_parse_id(row.get("data_id")))
+            else:
+                seen_sidecar = True
+                if _parse_id(row.get("data_id")) not in scope["data"]:
+                    continue
+        for col, kind in _STREAMED_COLUMNS[table].items():
+            text = row.get(col)
+            if kind == "q":
+                columns[table][col].append(_parse_id(text))
+            elif kind == "d":
+                try:
+                    value = float("nan") if text is None else float(text)
+                except ValueError:
+                    value_text[len(columns[table][col])] = text
+                    value = float("nan")
+                columns[table][col].append(value)
+            else:
+                columns[table][col].append(
+                    None if text is None else interned.setdefault(text, text)
+                )
+    tables = _as_numpy_columns(columns)
+    tables["t_data"]["value_text"] = value_text
+    return tables
+
+
+def _parse_id(text: str | None) -> int:
+    return _MISSING_ID if text is None else int(text)
+
+
+def _out_of_order_message(table: str) -> str:
+    return (
+        f"The PLEXOS XML has {table} rows after the data they scope; the "
+        "streamed extraction needs the object catalogue first, then t_data, then "
+        "its date / tag / band tables. Rerun with --plexosdb."
+    )
+
+
+def _as_numpy_columns(columns: dict[str, dict]) -> dict[str, dict]:
+    """View each typed-array column as a numpy array, without copying it."""
+    return {
+        table: {
+            col: np.frombuffer(values, dtype=np.dtype(values.typecode))
+            if isinstance(values, array)
+            else values
+            for col, values in table_columns.items()
+        }
+        for table, table_columns in columns.items()
+    }
+
+
+def _constraint_membership_scope(columns: dict[str, dict], names: list[str]) -> dict:
+    """The memberships wiring entities into the named constraints, from the
+    catalogue streamed so far, plus an empty set to collect their data ids."""
+    catalogue = _as_numpy_columns(
+        {table: columns[table] for table in _CATALOGUE_TABLES}
+    )
+    constraint_ids = _stream_constraint_objects(catalogue, names)[
+        "constraint_object_id"
+    ]
+    memberships = catalogue["t_membership"]
+    in_scope = np.isin(memberships["child_object_id"], constraint_ids)
+    return {
+        "memberships": set(memberships["membership_id"][in_scope].tolist()),
+        "data": set(),
+    }
+
+
+def _iter_xml_rows(xml_path, tables) -> Iterator[tuple[str, dict[str, str]]]:
+    """Yield ``(table, {column: text})`` for each row of the given tables.
+
+    The XML has one element per table row directly under the root, with one
+    child element per non-NULL column. Rows are cleared from the root as soon
+    as they are read, so the parsed tree never holds more than one row.
+    """
+    root = None
+    depth = 0
+    for event, element in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if root is None:
+                root = element
+            continue
+        depth -= 1
+        if depth == 1:
+            table = _local_name(element.tag)
+            if table in tables:
+                yield table, {_local_name(col.tag): col.text for col in element}
+            root.clear()
+
+
+def _local_name(tag: str) -> str:
+    """Strip the namespace from an ElementTree tag: ``"{ns}t_data"`` -> ``"t_data"``."""
+    return tag.rpartition("}")[2]
+
+
+def _lookup_positions(keys: np.ndarray, lookup: np.ndarray) -> np.ndarray:
+    """Return the position of each ``lookup`` id in ``keys``, or -1 where absent.
+
+    The integer-key index behind the streamed joins: ``keys`` is sorted once
+    and each lookup is a binary search, so a join costs O((n + m) log n)
+    rather than a Python dict per table. A -1 marks a broken reference, which
+    callers turn into a NaN -- the streamed equivalent of a LEFT join miss.
+
+    I/O Example:
+        keys:   [30, 10, 20]
+        lookup: [10, 99, 30]
+
+        returns: [1, -1, 0]
+    """
+    if len(keys) == 0:
+        return np.full(len(lookup), -1)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    positions = np.minimum(np.searchsorted(sorted_keys, lookup), len(keys) - 1)
+    return np.where(sorted_keys[positions] == lookup, order[positions], -1)
+
+
+def _take(values: list, positions: np.ndarray) -> list:
+    """Pick ``values`` at ``positions``, with None where the position is -1."""
+    return [values[i] if i >= 0 else None for i in positions]
+
+
+def _stream_constraint_objects(tables: dict, names: list[str]) -> pd.DataFrame:
+    """Step 1 (streamed) -- see ``_query_constraint_objects``."""
+    objects = tables["t_object"]
+    constraint_class_ids = [
+        class_id
+        for class_id, name in zip(
+            tables["t_class"]["class_id"], tables["t_class"]["name"]
+        )
+        if name == "Constraint"
+    ]
+    wanted = set(names)
+    is_named = np.fromiter(
+        (name in wanted for name in objects["name"]), bool, len(objects["name"])
+    )
+    matches = np.flatnonzero(
+        is_named & np.isin(objects["class_id"], constraint_class_ids)
+    )
+    return pd.DataFrame(
+        {
+            "constraint_object_id": objects["object_id"][matches],
+            "constraint_name": _take(objects["name"], matches),
+        }
+    )
+
+
+def _stream_memberships(tables: dict, constraint_object_ids) -> pd.DataFrame:
+    """Step 2 (streamed) -- see ``_query_memberships``."""
+    memberships = tables["t_membership"]
+    objects = tables["t_object"]
+    classes = tables["t_class"]
+    matches = np.isin(memberships["child_object_id"], constraint_object_ids)
+    parent_positions = _lookup_positions(
+        objects["object_id"], memberships["parent_object_id"][matches]
+    )
+    parent_class_ids = np.where(
+        parent_positions >= 0, objects["class_id"][parent_positions], _MISSING_ID
+    )
+    class_positions = _lookup_positions(classes["class_id"], parent_class_ids)
+    return pd.DataFrame(
+        {
+            "membership_id": memberships["membership_id"][matches],
+            "constraint_object_id": memberships["child_object_id"][matches],
+            "parent_class": _take(classes["name"], class_positions),
+            "parent_name": _take(objects["name"], parent_positions),
+        }
+    )
+
+
+def _stream_data_points(tables: dict, membership_ids) -> pd.DataFrame:
+    """Step 3 (streamed) -- see ``_query_data_points``."""
+    data = tables["t_data"]
+    properties = tables["t_property"]
+    matches = np.flatnonzero(np.isin(data["membership_id"], membership_ids))
+    property_positions = _lookup_positions(
+        properties["property_id"], data["property_id"][matches]
+    )
+    values = data["value"][matches]
+    if data["value_text"]:
+        # Restore non-numeric values so _assert_values_are_numeric can see them.
+        values = [
+            data["value_text"].get(row, value) for row, value in zip(matches, values)
+        ]
+    return pd.DataFrame(
+        {
+            "data_id": data["data_id"][matches],
+            "membership_id": data["membership_id"][matches],
+            "property": _take(properties["name"], property_positions),
+            "value": values,
+        }
+    )
+
+
+def _stream_dates(tables: dict, data_ids) -> pd.DataFrame:
+    """Step 4 (streamed) -- see ``_query_dates``."""
+    bounds = []
+    for table, col in [("t_date_from", "date_from"), ("t_date_to", "date_to")]:
+        dates = tables[table]
+        matches = np.flatnonzero(np.isin(dates["data_id"], data_ids))
+        bounds.append(
+            pd.DataFrame(
+                {
+                    "data_id": dates["data_id"][matches],
+                    col: pd.Series(_take(dates["date"], matches), dtype=object),
+                }
+            ).dropna(subset=col)
+        )
+    date_from, date_to = bounds
+    dates = date_from.merge(date_to, on="data_id", how="outer")
+    # A missing bound is None, as it is when read back from SQL.
+    for col in ["date_from", "date_to"]:
+        dates[col] = dates[col].astype(object).where(dates[col].notna(), None)
+    return dates
+
+
+def _stream_tags(tables: dict, data_ids) -> pd.DataFrame:
+    """Step 5 (streamed) -- see ``_query_tags``."""
+    tag = tables["t_tag"]
+    objects = tables["t_object"]
+    matches = np.isin(tag["data_id"], data_ids)
+    tag_positions = _lookup_positions(objects["object_id"], tag["object_id"][matches])
+    found = tag_positions >= 0
+    tags = pd.DataFrame(
+        {
+            "data_id": tag["data_id"][matches][found],
+            "tags": _take(objects["name"], tag_positions[found]),
+        }
+    )
+    return tags.groupby("data_id", as_index=False, sort=False)["tags"].agg("|".join)
+
+
 def _check_constraints_resolved(constraints: pd.DataFrame, names: list[str]) -> None:
     """Each requested name resolves to exactly one Constraint object.
 
@@ -638,8 +1082,9 @@ def _merge_into_long_table(
 def _validate_constraint_rows(rows: pd.DataFrame) -> None:
     """Run every invariant that can be checked on the assembled long table.
 
-    Two further checks need the database and so run earlier, inside
-    ``_query_constraint_rows``: ``_assert_constraints_are_never_parents`` and
+    Two further checks need the full model and so run earlier, inside
+    ``_query_constraint_rows`` / ``_stream_constraint_rows``:
+    ``_assert_constraints_are_never_parents`` and
     ``_assert_no_banded_data_points``. See the module docstring's "Validation"
     section for why these invariants are not circular.
     """
@@ -843,20 +1288,15 @@ def _assert_merge_is_one_to_one(data_points: pd.DataFrame, rows: pd.DataFrame) -
         )
 
 
-def _assert_constraints_are_never_parents(db: PlexosDB, constraint_object_ids) -> None:
+def _assert_constraints_are_never_parents(count: int) -> None:
     """No constraint object sits on the *parent* side of a membership.
 
     The extraction finds participants by taking the memberships where a
     constraint is the *child* (see ``_query_memberships``). If a constraint
     were ever a parent instead, that membership -- and any data on it --
-    would be silently missed. Tested with a direct count over ``t_membership``.
-    """
-    ids = list(constraint_object_ids)
-    sql = f"""
-        SELECT COUNT(*) FROM t_membership
-        WHERE parent_object_id IN ({_placeholders(len(ids))})
+    would be silently missed. Tested with a direct count over ``t_membership``
+    (``_query_constraint_parent_count``, or its streamed equivalent).
     """
-    (count,) = db.query(sql, tuple(ids))[0]
     if count:
         raise ValueError(
             f"{count} membership(s) have a constraint as the parent object; "
@@ -864,23 +1304,16 @@ def _assert_constraints_are_never_parents(db: PlexosDB, constraint_object_ids) -
         )
 
 
-def _assert_no_banded_data_points(db: PlexosDB, membership_ids) -> None:
+def _assert_no_banded_data_points(count: int) -> None:
     """None of our data points are split across bands.
 
     Each value is read as a single ``t_data`` row. PLEXOS can also split a
     value across bands (the ``t_band`` table); the model uses bands elsewhere
     but not on these constraints, and a banded point here would be silently
     reduced to one band. Tested by counting ``t_band`` rows that join to a
-    ``t_data`` row on one of our memberships.
+    ``t_data`` row on one of our memberships (``_query_banded_data_count``,
+    or its streamed equivalent).
     """
-    ids = list(membership_ids)
-    sql = f"""
-        SELECT COUNT(*)
-        FROM t_band
-        JOIN t_data ON t_band.data_id = t_data.data_id
-        WHERE t_data.membership_id IN ({_placeholders(len(ids))})
-    """
-    (count,) = db.query(sql, tuple(ids))[0]
     if count:
         raise ValueError(
             f"{count} data point(s) on these constraints are banded (t_band); "
@@ -1,20 +1,27 @@
+import functools
 import logging
 import os
 import shutil
+import time
 from pathlib import Path
 from shutil import copy2, rmtree
 
 import pypsa
 from doit import create_after, get_var
-from doit.tools import config_changed
 from isp_trace_parser.remote import fetch_trace_data
 
+from ispypsa.cli.fingerprints import (
+    ExplainingReporter,
+    TableContentChecker,
+    TaskFingerprint,
+)
 from ispypsa.config import load_config
 from ispypsa.data_fetch import (
     fetch_workbook,
     read_csvs,
     write_csvs,
 )
+from ispypsa.feature_flags import FEATURE_FLAGS
 from ispypsa.iasr_table_caching import build_local_cache, list_cache_files
 from ispypsa.logging import configure_logging
 from ispypsa.plotting import (
@@ -22,9 +29,15 @@ from ispypsa.plotting import (
     generate_results_website,
     save_plots,
 )
+from ispypsa.profiling import configure_profiling, profile_span
 from ispypsa.pypsa_build import (
     build_pypsa_network,
+    estimate_model_size,
+    model_statistics,
     save_pypsa_network,
+    scale_model,
+    solve_with_benders_decomposition,
+    solve_with_rolling_foresight,
     update_network_timeseries,
 )
 from ispypsa.results import (
@@ -44,6 +57,7 @@ from ispypsa.translator import (
     list_timeseries_files,
     list_translator_output_files,
 )
+from ispypsa.validation import validate_ispypsa_tables
 
 config_path = get_var("config", None)
 
@@ -57,6 +71,14 @@ DOIT_CONFIG = {
     ]
 }
 
+# Task status is decided from content: file dependencies are compared by a
+# canonical hash of their contents, and config by the fields each task reads
+# (see the *_CONFIG_FIELDS below), not the whole config file. The reporter
+# prints why each task ran or was skipped.
+DOIT_CONFIG.update(
+    {"check_file_uptodate": TableContentChecker, "reporter": ExplainingReporter}
+)
+
 if config_path:
     config = load_config(Path(config_path))
 
@@ -67,6 +89,11 @@ if config_path:
 else:
     config = None
 
+# Opt in to profiling with `profile=jsonl` or `profile=chrome`. Each task that
+# runs writes its own profile file, see `cli_task_action`.
+profile_format = get_var("profile", None)
+profile_name = f"ISPyPSA_profile_{time.strftime('%Y%m%d_%H%M%S')}"
+
 
 def check_config_present():
     if not config:
@@ -144,6 +171,11 @@ def get_operational_plots_directory():
     return get_pypsa_outputs_directory() / "operational_plots"
 
 
+def get_capacity_expansion_model_size_directory():
+    """Get capacity expansion model size report directory path."""
+    return get_run_directory() / "capacity_expansion_model_size"
+
+
 def return_empty_list_if_no_config(func):
     def wrapper(*args, **kwargs):
         if not config:
@@ -160,28 +192,96 @@ def get_config_file_dep():
     return [Path(config_path)]
 
 
-def get_cache_config_values():
-    """Get config values relevant to workbook caching."""
+# The config fields each task reads, as dotted paths into the config. Changing
+# any other field doesn't re-run the task.
+CACHE_CONFIG_FIELDS = [
+    "paths.workbook_path",
+    "iasr_workbook_version",
+    "paths.parsed_workbook_cache",
+]
+
+ISPYPSA_INPUTS_CONFIG_FIELDS = [
+    "scenario",
+    "network.nodes.regional_granularity",
+    "iasr_workbook_version",
+    "filter_by_nem_regions",
+    "filter_by_isp_sub_regions",
+]
+
+# The parsed traces are fingerprinted by their location rather than their
+# contents, which are too large to hash on every run.
+PYPSA_FRIENDLY_INPUTS_CONFIG_FIELDS = [
+    "scenario",
+    "wacc",
+    "discount_rate",
+    "network",
+    "temporal.year_type",
+    "temporal.range",
+    "temporal.capacity_expansion",
+    "unserved_energy",
+    "paths.parsed_traces_directory",
+    "trace_data.dataset_year",
+    "memory.timeseries_dtype",
+]
+
+# The solve settings are also under temporal.capacity_expansion, but changing
+# them doesn't change the translated tables, so the solve fingerprints them.
+CAPACITY_EXPANSION_MODEL_CONFIG_FIELDS = [
+    "solver",
+    "scale_model",
+    "temporal.capacity_expansion.foresight",
+    "temporal.capacity_expansion.foresight_window",
+    "temporal.capacity_expansion.compare_foresight",
+    "temporal.capacity_expansion.decomposition",
+    "memory.categorical_results",
+]
+
+OPERATIONAL_TIMESERIES_CONFIG_FIELDS = [
+    "scenario",
+    "network.nodes.regional_granularity",
+    "temporal.year_type",
+    "temporal.range",
+    "temporal.capacity_expansion.investment_periods",
+    "temporal.capacity_expansion.resolution_min",
+    "temporal.operational.reference_year_cycle",
+    "temporal.operational.resolution_min",
+    "temporal.operational.aggregation",
+    "paths.parsed_traces_directory",
+    "trace_data.dataset_year",
+    "memory.timeseries_dtype",
+]
+
+OPERATIONAL_MODEL_CONFIG_FIELDS = [
+    "temporal.operational.horizon",
+    "temporal.operational.overlap",
+    "memory.categorical_results",
+]
+
+PLOTS_CONFIG_FIELDS = ["paths.ispypsa_run_name"]
+
+
+def get_config_values(fields: list[str]) -> dict:
+    """Get the config values at each dotted field path."""
     if not config:
         return {}
-    return {
-        "workbook_path": str(config.paths.workbook_path),
-        "iasr_workbook_version": config.iasr_workbook_version,
-        "parsed_workbook_cache": str(config.paths.parsed_workbook_cache),
-    }
+    config_dict = config.model_dump(mode="json")
+    values = {}
+    for field in fields:
+        value = config_dict
+        for key in field.split("."):
+            value = value[key] if value is not None else None
+        values[field] = value
+    return values
 
 
-def get_ispypsa_inputs_config_values():
-    """Get config values relevant to ISPyPSA inputs creation."""
-    if not config:
-        return {}
-    return {
-        "scenario": config.scenario,
-        "regional_granularity": config.network.nodes.regional_granularity,
-        "iasr_workbook_version": config.iasr_workbook_version,
-        "filter_by_nem_regions": config.filter_by_nem_regions,
-        "filter_by_isp_sub_regions": config.filter_by_isp_sub_regions,
-    }
+def get_run_optimisation_arg() -> bool:
+    """Get the run_optimisation flag from doit variables."""
+    return get_var("run_optimisation", "True") == "True"
+
+
+def get_build_model_arg() -> bool:
+    """Get the build_model flag from doit variables."""
+    return get_var("build_model", "False") == "True"
 
 
 @return_empty_list_if_no_config
@@ -199,6 +299,12 @@ def get_capacity_expansion_pypsa_file():
     return get_pypsa_outputs_directory() / "capacity_expansion.nc"
 
 
+@return_empty_list_if_no_config
+def get_estimated_model_size_file():
+    """Get estimated capacity expansion model size file path."""
+    return get_capacity_expansion_model_size_directory() / "estimated_model_size.csv"
+
+
 @return_empty_list_if_no_config
 def get_operational_pypsa_file():
     """Get operational PyPSA file path."""
@@ -232,6 +338,24 @@ def get_pypsa_friendly_input_files():
     return list_translator_output_files(get_pypsa_friendly_directory())
 
 
+@return_empty_list_if_no_config
+def get_pypsa_friendly_generators_file():
+    """Get PyPSA friendly generators file path."""
+    return get_pypsa_friendly_directory() / "generators.csv"
+
+
+@return_empty_list_if_no_config
+def get_capacity_expansion_results_viewer_file():
+    """Get list with capacity expansion results viewer file."""
+    return [get_pypsa_outputs_directory() / "capacity_expansion_results_viewer.html"]
+
+
+@return_empty_list_if_no_config
+def get_operational_results_viewer_file():
+    """Get list with operational results viewer file."""
+    return [get_pypsa_outputs_directory() / "operational_results_viewer.html"]
+
+
 @return_empty_list_if_no_config
 def get_operational_snapshots_file():
     """Get list with operational snapshots file."""
@@ -274,38 +398,93 @@ def get_operational_tabular_results_files():
     return list_results_files(results_dir)
 
 
-def configure_logging_for_run() -> None:
-    """Configure logging to use run directory."""
-    run_dir = get_run_directory()
-    # Ensure run directory exists before configuring logging
-    run_dir.mkdir(parents=True, exist_ok=True)
-    log_file_path = run_dir / "ISPyPSA.log"
+def get_task_log_file(task_name: str) -> Path:
+    """Get the log file path for a task."""
+    return get_run_directory() / "logs" / f"{task_name}.log"
+
+
+def get_task_profile_file(task_name: str) -> Path:
+    """Get the profile file path for a task."""
+    suffix = "jsonl" if profile_format == "jsonl" else "json"
+    return get_run_directory() / "profiles" / f"{profile_name}_{task_name}.{suffix}"
+
+
+def configure_logging_for_run(task_name: str) -> None:
+    """Configure logging to write to the task's log file in the run directory."""
+    log_file_path = get_task_log_file(task_name)
+    # Ensure the log directory exists before configuring logging
+    log_file_path.parent.mkdir(parents=True, exist_ok=True)
     configure_logging(log_file=str(log_file_path))
 
 
-def create_or_clean_task_output_folder(output_folder: Path) -> None:
+def cli_task_action(task_name: str):
+    """Decorator for task actions that gives each task its own log and profile.
+
+    Tasks can run in parallel processes (`ispypsa -n 4 ...`), so each task logs
+    to its own file and, with `profile=...`, writes its own profile, rather than
+    all tasks sharing one file.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # The download tasks can run without a config.
+            if not config:
+                return func(*args, **kwargs)
+            configure_logging_for_run(task_name)
+            if profile_format is None:
+                return func(*args, **kwargs)
+            configure_profiling(
+                profile_file=get_task_profile_file(task_name),
+                output_format=profile_format,
+            )
+            try:
+                with profile_span(f"cli.{task_name}"):
+                    return func(*args, **kwargs)
+            finally:
+                # Closing the profile writes it. Task processes started for
+                # parallel runs exit without running atexit handlers.
+                configure_profiling(enabled=False)
+
+        return wrapper
+
+    return decorator
+
+
+def create_or_clean_task_output_folder(
+    output_folder: Path, keep: list[Path] | None = None
+) -> None:
+    """Create a task's output folder, or delete its contents if it exists.
+
+    Args:
+        output_folder: The folder to create or clean.
+        keep: Items in the folder written by other tasks, which are left alone.
+    """
+    keep = set(keep or [])
     if not output_folder.exists():
         output_folder.mkdir(parents=True)
     else:
         logging.info(f"Deleting previous outputs in {output_folder}")
         for item in output_folder.iterdir():
+            if item in keep:
+                continue
             if item.is_dir():
                 rmtree(item)
             elif item.is_file():
                 item.unlink()
 
 
+@cli_task_action("cache_required_iasr_workbook_tables")
 def build_parsed_workbook_cache() -> None:
     check_config_present()
-    configure_logging_for_run()
     parsed_workbook_cache = get_parsed_workbook_cache()
     workbook_path = get_workbook_path()
     version = config.iasr_workbook_version
 
-    create_or_clean_task_output_folder(parsed_workbook_cache)
-
     # Check if we're in test mode and should skip actual workbook parsing
     if os.environ.get("ISPYPSA_TEST_MOCK_CACHE", "").lower() == "true":
+        # The mock cache has no manifest, so start from a clean folder.
+        create_or_clean_task_output_folder(parsed_workbook_cache)
         # In test mode, just ensure cache directory exists and copy pre-existing files
         parsed_workbook_cache.mkdir(parents=True, exist_ok=True)
         # Copy any existing test cache files if they don't already exist. The
@@ -333,9 +512,15 @@ def build_parsed_workbook_cache() -> None:
             f"Workbook path must point to a .xlsx file, got: {workbook_path}"
         )
 
-    build_local_cache(parsed_workbook_cache, workbook_path, version)
+    # The cache is not cleaned first: `build_local_cache` uses its manifest to
+    # only re-extract tables that are missing or stale.
+    n_processes = int(get_var("workbook_parsing_processes", "1"))
+    build_local_cache(
+        parsed_workbook_cache, workbook_path, version, n_processes=n_processes
+    )
 
 
+@cli_task_action("download_workbook")
 def download_workbook_from_config() -> None:
     """Download ISP workbook from manifest.
 
@@ -356,7 +541,6 @@ def download_workbook_from_config() -> None:
     else:
         # Use config file
         check_config_present()
-        configure_logging_for_run()
         workbook_path = get_workbook_path()
         version = config.iasr_workbook_version
 
@@ -374,6 +558,7 @@ def download_workbook_from_config() -> None:
     logging.info("Workbook download completed successfully")
 
 
+@cli_task_action("download_trace_data")
 def download_trace_data_from_config() -> None:
     """Download trace data from manifest.
 
@@ -395,7 +580,6 @@ def download_trace_data_from_config() -> None:
     else:
         # Use config file
         check_config_present()
-        configure_logging_for_run()
         trace_dir = get_parsed_trace_directory()
         # Get parameters from config, with command line override
         dataset_type = get_var("trace_dataset_type", config.trace_data.dataset_type)
@@ -442,9 +626,9 @@ def save_config_file() -> None:
     copy2(config_file_path, config_copy_path)
 
 
+@cli_task_action("create_ispypsa_inputs")
 def create_ispypsa_inputs_from_config() -> None:
     check_config_present()
-    configure_logging_for_run()
     input_tables_dir = get_ispypsa_input_tables_directory()
     parsed_workbook_cache = get_parsed_workbook_cache()
 
@@ -464,13 +648,23 @@ def create_ispypsa_inputs_from_config() -> None:
         config.iasr_workbook_version,
         filter_to_nem_regions=config.filter_by_nem_regions,
         filter_to_isp_sub_regions=config.filter_by_isp_sub_regions,
+        max_workers=int(get_var("templater_workers", "1")),
     )
+    # FEATURE_FLAG_CLEANUP[use_new_table_format]: always validate. The
+    # new-format templater doesn't yet output every table with a schema, and
+    # some of its references are incomplete (e.g. non-REZ geo_ids such as N0
+    # aren't in network_geography), so problems are logged rather than raised.
+    if FEATURE_FLAGS["use_new_table_format"]:
+        for error in validate_ispypsa_tables(
+            template, check_required_tables=False, raise_on_error=False
+        ):
+            logging.warning(f"ISPyPSA input table validation: {error}")
     write_csvs(template, input_tables_dir)
 
 
+@cli_task_action("create_pypsa_friendly_inputs")
 def create_pypsa_inputs_for_capacity_expansion_model() -> None:
     check_config_present()
-    configure_logging_for_run()
     pypsa_friendly_dir = get_pypsa_friendly_directory()
     input_tables_dir = get_ispypsa_input_tables_directory()
     parsed_trace_dir = get_parsed_trace_directory()
@@ -478,7 +672,11 @@ def create_pypsa_inputs_for_capacity_expansion_model() -> None:
         get_capacity_expansion_timeseries_location()
     )
 
-    create_or_clean_task_output_folder(pypsa_friendly_dir)
+    # The operational timeseries task also writes to this folder.
+    create_or_clean_task_output_folder(
+        pypsa_friendly_dir,
+        keep=[get_operational_timeseries_location()] + get_operational_snapshots_file(),
+    )
 
     ispypsa_tables = read_csvs(input_tables_dir)
     pypsa_tables = create_pypsa_friendly_inputs(config, ispypsa_tables)
@@ -504,9 +702,9 @@ def get_create_plots_arg() -> bool:
     return create_plots
 
 
+@cli_task_action("create_and_run_capacity_expansion_model")
 def create_and_run_capacity_expansion_model() -> None:
     check_config_present()
-    configure_logging_for_run()
     capacity_expansion_pypsa_file = get_capacity_expansion_pypsa_file()
     pypsa_friendly_dir = get_pypsa_friendly_directory()
     capacity_expansion_timeseries_location = (
@@ -515,27 +713,72 @@ def create_and_run_capacity_expansion_model() -> None:
 
     create_or_clean_task_output_folder(get_pypsa_outputs_directory())
 
-    # Get run_optimisation flag from doit variables
-    run_optimisation = get_var("run_optimisation", "True") == "True"
+    run_optimisation = get_run_optimisation_arg()
 
     ispypsa_tables = read_csvs(get_ispypsa_input_tables_directory())
 
     pypsa_friendly_input_tables = read_csvs(pypsa_friendly_dir)
 
-    network = build_pypsa_network(
-        pypsa_friendly_input_tables,
-        capacity_expansion_timeseries_location,
-    )
+    capacity_expansion_config = config.temporal.capacity_expansion
+    solve_report = {}
+    if run_optimisation and capacity_expansion_config.foresight == "myopic":
+        # Each window of investment periods is built and solved separately.
+        if config.scale_model:
+            logging.warning(
+                "scale_model is not applied with myopic foresight, so the model is "
+                "solved unscaled."
+            )
+        network, solve_report["rolling_foresight_report"] = (
+            solve_with_rolling_foresight(
+                pypsa_friendly_input_tables,
+                capacity_expansion_timeseries_location,
+                solver_name=config.solver,
+                foresight_window=capacity_expansion_config.foresight_window,
+                compare_to_perfect_foresight=capacity_expansion_config.compare_foresight,
+            )
+        )
+    elif run_optimisation and capacity_expansion_config.decomposition is not None:
+        decomposition = capacity_expansion_config.decomposition
+        if config.scale_model:
+            logging.warning(
+                "scale_model is not applied with decomposition, so the model is "
+                "solved unscaled."
+            )
+        network, solve_report["benders_convergence"] = solve_with_benders_decomposition(
+            pypsa_friendly_input_tables,
+            capacity_expansion_timeseries_location,
+            subproblems=decomposition.subproblems,
+            max_iterations=decomposition.max_iterations,
+            tolerance=decomposition.tolerance,
+            processes=decomposition.processes,
+            solver_name=config.solver,
+        )
+    else:
+        network = build_pypsa_network(
+            pypsa_friendly_input_tables,
+            capacity_expansion_timeseries_location,
+        )
+
+        # Save before optimising incase solving fails and you want a copy
+        # of the network for debugging.
+        save_pypsa_network(network, get_pypsa_outputs_directory(), "capacity_expansion")
 
-    # Save before optimising incase solving fails and you want a copy
-    # of the network for debugging.
-    save_pypsa_network(network, get_pypsa_outputs_directory(), "capacity_expansion")
+        if run_optimisation:
+            if config.scale_model:
+                with profile_span("pypsa_build.scale_model"):
+                    solve_report["model_scaling"] = scale_model(network)
+            # Never use network.optimize() as this will remove custom constraints.
+            with profile_span("pypsa.solve_model", solver=config.solver):
+                network.optimize.solve_model(solver_name=config.solver)
 
     if run_optimisation:
-        # Never use network.optimize() as this will remove custom constraints.
-        network.optimize.solve_model(solver_name=config.solver)
         save_pypsa_network(network, get_pypsa_outputs_directory(), "capacity_expansion")
-        results = extract_tabular_results(network, ispypsa_tables)
+        results = extract_tabular_results(
+            network,
+            ispypsa_tables,
+            categorical_identifiers=config.memory.categorical_results,
+        )
+        results.update(solve_report)
 
         # Load ispypsa_tables to create regions and zones mapping
         ispypsa_tables = read_csvs(get_ispypsa_input_tables_directory())
@@ -559,10 +802,31 @@ def create_and_run_capacity_expansion_model() -> None:
             )
 
 
+@cli_task_action("report_capacity_expansion_model_size")
+def report_capacity_expansion_model_size() -> None:
+    """Estimate the size of the capacity expansion model from the PyPSA friendly
+    inputs, and with build_model=True, report the size of the built model."""
+    check_config_present()
+    model_size_dir = get_capacity_expansion_model_size_directory()
+    create_or_clean_task_output_folder(model_size_dir)
+
+    pypsa_friendly_input_tables = read_csvs(get_pypsa_friendly_directory())
+    report = {"estimated_model_size": estimate_model_size(pypsa_friendly_input_tables)}
+
+    if get_build_model_arg():
+        network = build_pypsa_network(
+            pypsa_friendly_input_tables,
+            get_capacity_expansion_timeseries_location(),
+        )
+        report.update(model_statistics(network))
+
+    write_csvs(report, model_size_dir)
+
+
+@cli_task_action("create_operational_timeseries")
 def create_operational_timeseries() -> None:
     """Create operational timeseries inputs."""
     check_config_present()
-    configure_logging_for_run()
     input_tables_dir = get_ispypsa_input_tables_directory()
     pypsa_friendly_dir = get_pypsa_friendly_directory()
     output_tables_dir = get_pypsa_friendly_directory()
@@ -588,10 +852,10 @@ def create_operational_timeseries() -> None:
     write_csvs({"operational_snapshots": operational_snapshots}, output_tables_dir)
 
 
+@cli_task_action("create_and_run_operational_model")
 def create_and_run_operational_model() -> None:
     """Create PyPSA network object for operational model."""
     check_config_present()
-    configure_logging_for_run()
     pypsa_friendly_dir = get_pypsa_friendly_directory()
     capacity_expansion_pypsa_file = get_capacity_expansion_pypsa_file()
     operational_timeseries_location = get_operational_timeseries_location()
@@ -601,8 +865,7 @@ def create_and_run_operational_model() -> None:
     create_or_clean_task_output_folder(get_operational_tabular_results_directory())
     create_or_clean_task_output_folder(get_operational_plots_directory())
 
-    # Get run_optimisation flag from doit variables
-    run_optimisation = get_var("run_optimisation", "True") == "True"
+    run_optimisation = get_run_optimisation_arg()
 
     # Load tables
     pypsa_friendly_input_tables = read_csvs(pypsa_friendly_dir)
@@ -623,17 +886,22 @@ def create_and_run_operational_model() -> None:
 
     if run_optimisation:
         # Never use network.optimize() as this will remove custom constraints.
-        network.optimize.optimize_with_rolling_horizon(
-            horizon=config.temporal.operational.horizon,
-            overlap=config.temporal.operational.overlap,
-        )
+        with profile_span("pypsa.optimize_with_rolling_horizon"):
+            network.optimize.optimize_with_rolling_horizon(
+                horizon=config.temporal.operational.horizon,
+                overlap=config.temporal.operational.overlap,
+            )
 
         # Save the network for operational optimization
         save_pypsa_network(network, get_pypsa_outputs_directory(), "operational")
 
         # Load ispypsa_tables to create regions and zones mapping
         ispypsa_tables = read_csvs(get_ispypsa_input_tables_directory())
-        results = extract_tabular_results(network, ispypsa_tables)
+        results = extract_tabular_results(
+            network,
+            ispypsa_tables,
+            categorical_identifiers=config.memory.categorical_results,
+        )
         results["regions_and_zones_mapping"] = extract_regions_and_zones_mapping(
             ispypsa_tables
         )
@@ -655,10 +923,10 @@ def create_and_run_operational_model() -> None:
             )
 
 
+@cli_task_action("create_capacity_expansion_plots")
 def create_capacity_expansion_plots_suite() -> None:
     """Create and save plots from capacity expansion results."""
     check_config_present()
-    configure_logging_for_run()
     results_dir = get_capacity_expansion_tabular_results_directory()
     plots_dir = get_capacity_expansion_plots_directory()
 
@@ -685,10 +953,10 @@ def create_capacity_expansion_plots_suite() -> None:
     )
 
 
+@cli_task_action("create_operational_plots")
 def create_operational_plots_suite() -> None:
     """Create and save plots from operational results."""
     check_config_present()
-    configure_logging_for_run()
     results_dir = get_operational_tabular_results_directory()
     plots_dir = get_operational_plots_directory()
 
@@ -749,8 +1017,7 @@ def task_cache_required_iasr_workbook_tables():
         "file_dep": [get_workbook_path()],
         "targets": get_local_cache_files(),
         "task_dep": ["save_config"],
-        # Only re-run if cache-relevant config values change
-        "uptodate": [config_changed(get_cache_config_values())],
+        "uptodate": [TaskFingerprint(get_config_values(CACHE_CONFIG_FIELDS))],
     }
 
 
@@ -760,27 +1027,26 @@ def task_create_ispypsa_inputs():
         "actions": [create_ispypsa_inputs_from_config],
         "file_dep": get_local_cache_files(),
         "targets": get_ispypsa_input_files(),
-        "uptodate": [config_changed(get_ispypsa_inputs_config_values())],
+        "uptodate": [TaskFingerprint(get_config_values(ISPYPSA_INPUTS_CONFIG_FIELDS))],
     }
 
 
 @remove_deps_and_targets_if_no_config
 def task_create_pypsa_friendly_inputs():
-    def check_targets():
-        targets = (
+    def get_outputs():
+        return (
             get_pypsa_friendly_input_files() + get_capacity_expansion_timeseries_files()
         )
 
-        for target in targets:
-            if not target.exists():
-                return False
-
-        return True
-
     return {
         "actions": [create_pypsa_inputs_for_capacity_expansion_model],
-        "file_dep": get_ispypsa_input_files() + get_config_file_dep(),
-        "uptodate": [check_targets],
+        "file_dep": get_ispypsa_input_files(),
+        "uptodate": [
+            TaskFingerprint(
+                get_config_values(PYPSA_FRIENDLY_INPUTS_CONFIG_FIELDS),
+                output_files=get_outputs,
+            )
+        ],
     }
 
 
@@ -790,37 +1056,65 @@ def task_create_and_run_capacity_expansion_model():
     capacity_expansion_deps = (
         get_pypsa_friendly_input_files()
         + get_capacity_expansion_timeseries_files()
-        + get_config_file_dep()
+        + get_ispypsa_input_files()
     )
 
     capacity_expansion_targets = [
         get_capacity_expansion_pypsa_file()
     ] + get_capacity_expansion_tabular_results_files()
 
+    # create_plots isn't part of the fingerprint, so switching it doesn't re-run
+    # the solve. Use create_capacity_expansion_plots to plot existing results.
+    config_values = get_config_values(CAPACITY_EXPANSION_MODEL_CONFIG_FIELDS)
+    config_values["run_optimisation"] = get_run_optimisation_arg()
+
     return {
         "actions": [(create_and_run_capacity_expansion_model,)],
         "task_dep": ["create_pypsa_friendly_inputs"],
         "file_dep": capacity_expansion_deps,
         "targets": capacity_expansion_targets,
+        "uptodate": [TaskFingerprint(config_values)],
     }
 
 
-@create_after(executed="create_and_run_capacity_expansion_model")
+# Not part of the default workflow, run it to size a job before solving.
+@create_after(executed="create_pypsa_friendly_inputs")
 @remove_deps_and_targets_if_no_config
-def task_create_operational_timeseries():
-    def check_targets():
-        targets = get_operational_timeseries_files() + get_operational_snapshots_file()
+def task_report_capacity_expansion_model_size():
+    """Estimate the size of the capacity expansion model before solving it."""
+    # With build_model=True the network is built from the timeseries too.
+    model_size_deps = (
+        get_pypsa_friendly_input_files() + get_capacity_expansion_timeseries_files()
+    )
 
-        for target in targets:
-            if not target.exists():
-                return False
+    return {
+        "actions": [report_capacity_expansion_model_size],
+        "task_dep": ["create_pypsa_friendly_inputs"],
+        "file_dep": model_size_deps,
+        "targets": [get_estimated_model_size_file()],
+        "uptodate": [TaskFingerprint({"build_model": get_build_model_arg()})],
+    }
 
-        return True
+
+# The operational timeseries only need the PyPSA friendly inputs, so with
+# parallel execution (`ispypsa -n 2 ...`) they are created while the capacity
+# expansion model solves.
+@create_after(executed="create_pypsa_friendly_inputs")
+@remove_deps_and_targets_if_no_config
+def task_create_operational_timeseries():
+    def get_outputs():
+        return get_operational_timeseries_files() + get_operational_snapshots_file()
 
     return {
         "actions": [create_operational_timeseries],
-        "file_dep": get_ispypsa_input_files() + get_config_file_dep(),
-        "uptodate": [check_targets],
+        "task_dep": ["create_pypsa_friendly_inputs"],
+        "file_dep": get_ispypsa_input_files() + [get_pypsa_friendly_generators_file()],
+        "uptodate": [
+            TaskFingerprint(
+                get_config_values(OPERATIONAL_TIMESERIES_CONFIG_FIELDS),
+                output_files=get_outputs,
+            )
+        ],
     }
 
 
@@ -831,12 +1125,22 @@ def task_create_and_run_operational_model():
         get_pypsa_friendly_input_files()
         + get_operational_timeseries_files()
         + get_operational_snapshots_file()
-        + get_config_file_dep()
+        + get_ispypsa_input_files()
+        + [get_capacity_expansion_pypsa_file()]
     )
+
+    config_values = get_config_values(OPERATIONAL_MODEL_CONFIG_FIELDS)
+    config_values["run_optimisation"] = get_run_optimisation_arg()
+
     return {
         "actions": [create_and_run_operational_model],
+        "task_dep": [
+            "create_and_run_capacity_expansion_model",
+            "create_operational_timeseries",
+        ],
         "file_dep": operational_deps,
         "targets": [get_operational_pypsa_file()],
+        "uptodate": [TaskFingerprint(config_values)],
     }
 
 
@@ -860,12 +1164,20 @@ def check_operational_results_files_exist():
             )
 
 
+# The plotting tasks fingerprint the results files rather than depending on
+# them, so they stay outside the main workflow's dependency chain.
 @remove_deps_and_targets_if_no_config
 def task_create_capacity_expansion_plots():
     """Create and save plots from capacity expansion results."""
     return {
         "actions": [check_results_files_exist, create_capacity_expansion_plots_suite],
-        "uptodate": [False],
+        "uptodate": [
+            TaskFingerprint(
+                get_config_values(PLOTS_CONFIG_FIELDS),
+                input_files=get_capacity_expansion_tabular_results_files,
+                output_files=get_capacity_expansion_results_viewer_file,
+            )
+        ],
     }
 
 
@@ -877,7 +1189,13 @@ def task_create_operational_plots():
             check_operational_results_files_exist,
             create_operational_plots_suite,
         ],
-        "uptodate": [False],
+        "uptodate": [
+            TaskFingerprint(
+                get_config_values(PLOTS_CONFIG_FIELDS),
+                input_files=get_operational_tabular_results_files,
+                output_files=get_operational_results_viewer_file,
+            )
+        ],
     }
 
 
@@ -0,0 +1,268 @@
+"""Content fingerprints that decide whether the CLI's doit tasks are up to date.
+
+doit's default checks re-run a task when a file dependency's bytes change, and
+the tasks used to depend on the whole config file, so touching a file or
+editing an unrelated config field (such as `create_plots`) re-ran translation
+and solving. The pieces here narrow those checks to what each task reads:
+
+- `TableContentChecker` compares file dependencies by a canonical hash of their
+  contents, so a re-written CSV holding the same table is unchanged.
+- `TaskFingerprint` is a doit `uptodate` check over the exact config values a
+  task reads, plus any input and output files not tracked as file dependencies.
+- `ExplainingReporter` prints, under each task, why it ran or was skipped.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+import pandas as pd
+from doit.dependency import FileChangedChecker
+from doit.reporter import ConsoleReporter
+
+# How many changed or missing files are named when explaining a task's status.
+_MAX_FILES_LISTED = 5
+
+
+def hash_config_values(config_values: dict) -> dict[str, str]:
+    """Hashes each config value in its canonical JSON form.
+
+    Values are hashed separately so a changed fingerprint can name the changed
+    fields.
+
+    Args:
+        config_values: Config values keyed by their dotted field path, e.g.
+            {"network.nodes.rezs": "discrete_nodes"}. Values must be JSON
+            serialisable, as from `ModelConfig.model_dump(mode="json")`.
+
+    Returns:
+        dict mapping each field path to the SHA-256 digest of its value.
+    """
+    return {
+        field: hashlib.sha256(
+            json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+        for field, value in config_values.items()
+    }
+
+
+def hash_file_contents(path: Path | str) -> str:
+    """Hashes the contents of a file, canonicalising tables.
+
+    CSV files are hashed from the parsed table (column names, dtypes and
+    values), so formatting differences such as line endings, quoting or how a
+    number is written ("2.5" vs "2.50") don't change the hash. Other files are
+    hashed byte for byte.
+
+    Args:
+        path: Path of the file to hash.
+
+    Returns:
+        str, the SHA-256 hex digest.
+    """
+    path = Path(path)
+    digest = hashlib.sha256()
+    if path.suffix.lower() == ".csv":
+        try:
+            table = pd.read_csv(path)
+        except (pd.errors.EmptyDataError, pd.errors.ParserError):
+            table = None
+        if table is not None:
+            header = [[str(name), str(dtype)] for name, dtype in table.dtypes.items()]
+            digest.update(json.dumps(header).encode())
+            digest.update(pd.util.hash_pandas_object(table, index=False).to_numpy())
+            return digest.hexdigest()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_state(path: Path, previous_state: list | None) -> list | None:
+    """The [size, mtime_ns, digest] state of a file, or None if it is missing.
+
+    The digest is reused from `previous_state` when the size and modification
+    time are unchanged, so unchanged files are not re-read.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if previous_state and previous_state[:2] == [stat.st_size, stat.st_mtime_ns]:
+        return previous_state
+    return [stat.st_size, stat.st_mtime_ns, hash_file_contents(path)]
+
+
+class TableContentChecker(FileChangedChecker):
+    """doit file dependency checker that compares canonical content hashes.
+
+    Like doit's MD5 checker, a file whose size and modification time match the
+    saved state is treated as unchanged without being read. Otherwise its
+    content hash (see `hash_file_contents`) is compared with the saved one.
+    """
+
+    def check_modified(self, file_path, file_stat, state) -> bool:
+        size, mtime_ns, digest = state
+        if [file_stat.st_size, file_stat.st_mtime_ns] == [size, mtime_ns]:
+            return False
+        return hash_file_contents(file_path) != digest
+
+    def get_state(self, dep, current_state) -> list | None:
+        state = _file_state(Path(dep), list(current_state) if current_state else None)
+        if current_state is not None and state == list(current_state):
+            return None
+        return state
+
+
+class TaskFingerprint:
+    """doit `uptodate` check over the config values and files a task reads.
+
+    The fingerprint holds a hash of each config value and of each input file.
+    The task is up to date when the fingerprint matches the one saved after its
+    last successful run and every output file exists. The reasons for a
+    mismatch are kept on `reasons` for `ExplainingReporter` to print.
+
+    Input and output files are given as callables because they are often only
+    known once the tasks before have run.
+
+    Args:
+        config_values: Config (and CLI variable) values the task reads, keyed
+            by name. See `hash_config_values`.
+        input_files: Returns the input files to fingerprint. Files that are
+            already file dependencies of the task don't need listing here.
+        output_files: Returns the files the task writes, for tasks that can't
+            declare them as doit targets.
+    """
+
+    def __init__(
+        self,
+        config_values: dict,
+        input_files: Callable[[], Iterable[Path]] | None = None,
+        output_files: Callable[[], Iterable[Path]] | None = None,
+    ) -> None:
+        self.config_digests = hash_config_values(config_values)
+        self.input_files = input_files
+        self.output_files = output_files
+        self.reasons = []
+        self._fingerprint = None
+
+    def configure_task(self, task) -> None:
+        task.value_savers.append(self._save_fingerprint)
+
+    def _save_fingerprint(self) -> dict:
+        if self._fingerprint is None:
+            self._fingerprint = self._compute({})
+        return {"_fingerprint": self._fingerprint}
+
+    def _compute(self, previous: dict) -> dict:
+        previous_files = previous.get("files", {})
+        files = {}
+        for path in self.input_files() if self.input_files else []:
+            files[str(path)] = _file_state(Path(path), previous_files.get(str(path)))
+        return {"config": self.config_digests, "files": files}
+
+    def __call__(self, task, values) -> bool:
+        previous = values.get("_fingerprint")
+        self._fingerprint = self._compute(previous or {})
+        self.reasons = []
+
+        if previous is None:
+            self.reasons.append("no previous successful run")
+        else:
+            changed_fields = _changed_keys(
+                previous["config"], self._fingerprint["config"]
+            )
+            if changed_fields:
+                self.reasons.append(f"config changed: {', '.join(changed_fields)}")
+            changed_files = _changed_keys(
+                {path: state and state[2] for path, state in previous["files"].items()},
+                {
+                    path: state and state[2]
+                    for path, state in self._fingerprint["files"].items()
+                },
+            )
+            if changed_files:
+                self.reasons.append(f"inputs changed: {_list_files(changed_files)}")
+
+        missing_inputs = [
+            path for path, state in self._fingerprint["files"].items() if state is None
+        ]
+        if missing_inputs:
+            self.reasons.append(f"missing inputs: {_list_files(missing_inputs)}")
+
+        if self.output_files:
+            missing_outputs = [
+                path for path in self.output_files() if not Path(path).exists()
+            ]
+            if missing_outputs:
+                self.reasons.append(f"missing outputs: {_list_files(missing_outputs)}")
+
+        return not self.reasons
+
+
+def _changed_keys(previous: dict, current: dict) -> list[str]:
+    """Keys added, removed or with a different value between two dicts."""
+    return sorted(
+        key
+        for key in previous.keys() | current.keys()
+        if previous.get(key) != current.get(key)
+    )
+
+
+def _list_files(paths: list) -> str:
+    """Names of up to `_MAX_FILES_LISTED` files, and how many more there are."""
+    names = [Path(path).name for path in paths]
+    listed = ", ".join(names[:_MAX_FILES_LISTED])
+    if len(names) > _MAX_FILES_LISTED:
+        listed += f" and {len(names) - _MAX_FILES_LISTED} more"
+    return listed
+
+
+def explain_task_status(task, executed: bool) -> list[str]:
+    """Reasons a task is being run, or why it was skipped as up to date.
+
+    Args:
+        task: The doit task, after doit has checked whether it is up to date.
+        executed: Whether the task is being run.
+
+    Returns:
+        list of str, one reason per line.
+    """
+    if not executed:
+        return ["up to date: config and inputs unchanged"]
+
+    reasons = []
+    for uptodate, _, _ in task.uptodate:
+        if isinstance(uptodate, TaskFingerprint):
+            reasons += uptodate.reasons
+        elif uptodate is False:
+            reasons.append("always runs")
+    missing_targets = [target for target in task.targets if not Path(target).exists()]
+    if missing_targets:
+        reasons.append(f"missing outputs: {_list_files(missing_targets)}")
+    elif task.dep_changed:
+        # doit marks every file dependency as changed when a target is missing,
+        # so changed inputs are only listed when all targets exist.
+        reasons.append(f"inputs changed: {_list_files(task.dep_changed)}")
+    return reasons or ["run requested"]
+
+
+class ExplainingReporter(ConsoleReporter):
+    """doit's console reporter, printing why each task ran or was skipped."""
+
+    desc = "console output, with the reason each task ran or was skipped"
+
+    def execute_task(self, task) -> None:
+        super().execute_task(task)
+        self._write_reasons(task, executed=True)
+
+    def skip_uptodate(self, task) -> None:
+        super().skip_uptodate(task)
+        self._write_reasons(task, executed=False)
+
+    def _write_reasons(self, task, executed: bool) -> None:
+        if task.actions and task.name[0] != "_":
+            for reason in explain_task_status(task, executed):
+                self.write(f"     {reason}\n")
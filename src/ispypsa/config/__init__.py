@@ -1,6 +1,9 @@
 from ispypsa.config.loader import load_config
 from ispypsa.config.validators import (
+    DecompositionConfig,
     ModelConfig,
+    RepresentativePeriodsConfig,
+    SegmentationConfig,
     TemporalAggregationConfig,
     TemporalCapacityInvestmentConfig,
     TemporalOperationalConfig,
@@ -9,7 +12,10 @@ from ispypsa.config.validators import (
 
 __all__ = [
     "load_config",
+    "DecompositionConfig",
     "ModelConfig",
+    "RepresentativePeriodsConfig",
+    "SegmentationConfig",
     "TemporalRangeConfig",
     "TemporalAggregationConfig",
     "TemporalOperationalConfig",
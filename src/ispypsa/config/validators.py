@@ -47,6 +47,32 @@ class NetworkConfig(BaseModel):
     transmission_default_limit: float
 
 
+class RepresentativePeriodsConfig(BaseModel):
+    n_periods: int
+    period_length: Literal["day", "week"] = "week"
+    method: Literal["k-medoids", "hierarchical"] = "k-medoids"
+
+    @field_validator("n_periods")
+    @classmethod
+    def validate_n_periods(cls, n_periods: int):
+        if n_periods < 1:
+            raise ValueError(
+                "config representative_periods n_periods must be at least 1"
+            )
+        return n_periods
+
+
+class SegmentationConfig(BaseModel):
+    segments_per_day: int
+
+    @field_validator("segments_per_day")
+    @classmethod
+    def validate_segments_per_day(cls, segments_per_day: int):
+        if segments_per_day < 1:
+            raise ValueError("config segmentation segments_per_day must be at least 1")
+        return segments_per_day
+
+
 class TemporalAggregationConfig(BaseModel):
     representative_weeks: list[int] | None
     named_representative_weeks: (
@@ -62,6 +88,20 @@ class TemporalAggregationConfig(BaseModel):
         ]
         | None
     ) = None
+    representative_periods: RepresentativePeriodsConfig | None = None
+    segmentation: SegmentationConfig | None = None
+
+    @model_validator(mode="after")
+    def validate_representative_periods(self):
+        if self.representative_periods is not None and (
+            self.representative_weeks is not None
+            or self.named_representative_weeks is not None
+        ):
+            raise ValueError(
+                "config representative_periods cannot be combined with "
+                "representative_weeks or named_representative_weeks"
+            )
+        return self
 
 
 class TemporalRangeConfig(BaseModel):
@@ -85,11 +125,6 @@ class TemporalDetailedConfig(BaseModel):
     @field_validator("resolution_min")
     @classmethod
     def validate_temporal_resolution_min(cls, operational_temporal_resolution_min: int):
-        # TODO properly implement temporal aggregation so this first check can be removed.
-        if operational_temporal_resolution_min != 30:
-            raise ValueError(
-                "config operational_temporal_resolution_min must equal 30 min"
-            )
         if operational_temporal_resolution_min < 30:
             raise ValueError(
                 "config operational_temporal_resolution_min must be greater than or equal to 30 min"
@@ -98,6 +133,10 @@ class TemporalDetailedConfig(BaseModel):
             raise ValueError(
                 "config operational_temporal_resolution_min must be multiple of 30 min"
             )
+        if (24 * 60) % operational_temporal_resolution_min != 0:
+            raise ValueError(
+                "config operational_temporal_resolution_min must divide a day evenly"
+            )
         return operational_temporal_resolution_min
 
 
@@ -106,8 +145,60 @@ class TemporalOperationalConfig(TemporalDetailedConfig):
     overlap: int
 
 
+class DecompositionConfig(BaseModel):
+    subproblems: Literal["investment_period", "week"] = "investment_period"
+    max_iterations: int = 100
+    tolerance: float = 1e-4
+    processes: int = 1
+
+    @field_validator("max_iterations", "processes")
+    @classmethod
+    def validate_at_least_one(cls, value: int, info):
+        if value < 1:
+            raise ValueError(
+                f"config decomposition {info.field_name} must be greater than or equal to 1"
+            )
+        return value
+
+    @field_validator("tolerance")
+    @classmethod
+    def validate_tolerance(cls, tolerance: float):
+        if tolerance < 0:
+            raise ValueError("config decomposition tolerance must be non-negative")
+        return tolerance
+
+
 class TemporalCapacityInvestmentConfig(TemporalDetailedConfig):
     investment_periods: list[int]
+    foresight: Literal["perfect", "myopic"] = "perfect"
+    foresight_window: int = 1
+    compare_foresight: bool = False
+    decomposition: DecompositionConfig | None = None
+
+    @field_validator("foresight_window")
+    @classmethod
+    def validate_foresight_window(cls, foresight_window: int):
+        if foresight_window < 1:
+            raise ValueError(
+                "config foresight_window must be greater than or equal to 1"
+            )
+        return foresight_window
+
+    @model_validator(mode="after")
+    def validate_compare_foresight(self):
+        if self.compare_foresight and self.foresight != "myopic":
+            raise ValueError(
+                "config compare_foresight can only be used with myopic foresight"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_decomposition_foresight(self):
+        if self.decomposition is not None and self.foresight == "myopic":
+            raise ValueError(
+                "config decomposition can only be used with perfect foresight"
+            )
+        return self
 
 
 class TemporalConfig(BaseModel):
@@ -146,6 +237,11 @@ class TraceDataConfig(BaseModel):
     dataset_year: int = 2024
 
 
+class MemoryConfig(BaseModel):
+    timeseries_dtype: Literal["float64", "float32"] = "float64"
+    categorical_results: bool = False
+
+
 class ModelConfig(BaseModel):
     paths: PathsConfig
     scenario: Literal[tuple(_ISP_SCENARIOS)]
@@ -156,6 +252,7 @@ class ModelConfig(BaseModel):
     iasr_workbook_version: str
     unserved_energy: UnservedEnergyConfig
     trace_data: TraceDataConfig = TraceDataConfig()
+    memory: MemoryConfig = MemoryConfig()
     filter_by_nem_regions: list[str] | None = None
     filter_by_isp_sub_regions: list[str] | None = None
     solver: Literal[
@@ -171,6 +268,7 @@ class ModelConfig(BaseModel):
         "mindopt",
         "pips",
     ]
+    scale_model: bool = False
     create_plots: bool = False
 
     @model_validator(mode="after")
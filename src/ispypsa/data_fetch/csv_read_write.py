@@ -1,8 +1,12 @@
+import os
 from pathlib import Path
 
 import pandas as pd
 
+from ispypsa.profiling import profiled
 
+
+@profiled
 def read_csvs(directory: Path | str) -> dict[str : pd.DataFrame]:
     """Read all the CSVs in a directory into a dictionary with filenames (without csv
     extension) as keys.
@@ -32,6 +36,7 @@ def read_csvs(directory: Path | str) -> dict[str : pd.DataFrame]:
     return {file.name[:-4]: pd.read_csv(file) for file in files}
 
 
+@profiled
 def write_csvs(data_dict: dict[str : pd.DataFrame], directory: Path | str):
     """Write all pd.DataFrames in a dictionary with filenames as keys (without csv extension)
     to CSVs.
@@ -50,6 +55,9 @@ def write_csvs(data_dict: dict[str : pd.DataFrame], directory: Path | str):
         Write model results to a directory.
         >>> write_csvs(results, Path("outputs/results"))
 
+    Each file is written to a temporary file and then renamed, so a CSV is
+    never read half written, e.g. by `read_csvs` in another process.
+
     Args:
         data_dict: Dictionary of pd.DataFrames to write to csv files.
         directory: Path to directory to save CSVs to.
@@ -60,5 +68,7 @@ def write_csvs(data_dict: dict[str : pd.DataFrame], directory: Path | str):
     for file_name, data in data_dict.items():
         save_path = Path(directory) / Path(f"{file_name}.csv")
         save_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = save_path.with_name(f"{save_path.name}.tmp")
         # set index=False to avoid adding "Unnamed" cols if/when reading from these csvs later
-        data.to_csv(save_path, index=False)
+        data.to_csv(temp_path, index=False)
+        os.replace(temp_path, save_path)
@@ -1,10 +1,20 @@
+import hashlib
+import logging
+import posixpath
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
 from importlib.resources import files
 from pathlib import Path
+from xml.etree import ElementTree
 
+import isp_workbook_parser
 import yaml
-from isp_workbook_parser import Parser
+from isp_workbook_parser import Parser, load_yaml
 
 from ..feature_flags import FEATURE_FLAGS
+from ..profiling import profile_span, profiled
 from ..templater.mappings import (
     _ACTIONABLE_ISP_PROJECTS_TABLES,
     _FLOW_PATH_AGUMENTATION_TABLES,
@@ -30,6 +40,11 @@ _AUGMENTATION_PREFIXES = (
 )
 
 
+# Records, per cached table, the workbook and extraction spec it was parsed with,
+# so rebuilds only re-extract missing or stale tables.
+_CACHE_MANIFEST_FILENAME = "cache_manifest.yaml"
+
+
 def _load_known_tables() -> dict[str, list[str]]:
     """Loads the static manifest of all tables known to exist per workbook version."""
     return yaml.safe_load(_KNOWN_TABLES_RESOURCE.read_text())
@@ -149,11 +164,259 @@ def _build_required_tables(iasr_workbook_version: str) -> list[str]:
         )
 
 
+@profiled
+def _hash_workbook(workbook_path: Path, chunk_size: int = 2**20) -> str:
+    """Returns the SHA-256 hex digest of the workbook file contents."""
+    digest = hashlib.sha256()
+    with open(workbook_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extraction_spec(iasr_workbook_version: str) -> dict[str, str]:
+    """Returns the parameters that, along with the workbook, determine a table's
+    extracted contents.
+
+    The table configs used to locate each table are shipped with
+    `isp-workbook-parser` per workbook version, so the package version pins them.
+    """
+    return {
+        "iasr_workbook_version": iasr_workbook_version,
+        "isp_workbook_parser_version": version("isp-workbook-parser"),
+    }
+
+
+def _read_cache_manifest(cache_path: Path) -> dict[str, dict]:
+    """Reads the cache manifest, returning an empty manifest if there is none."""
+    manifest_path = cache_path / _CACHE_MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return {}
+    manifest = yaml.safe_load(manifest_path.read_text())
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _write_cache_manifest(cache_path: Path, manifest: dict[str, dict]) -> None:
+    manifest_path = cache_path / _CACHE_MANIFEST_FILENAME
+    manifest_path.write_text(yaml.safe_dump(dict(sorted(manifest.items()))))
+
+
+def _find_stale_tables(
+    cache_path: Path,
+    manifest: dict[str, dict],
+    required_tables: list[str],
+    workbook_hash: str,
+    extraction_spec: dict[str, str],
+) -> list[str]:
+    """Returns the required tables that are missing from the cache or were
+    extracted from a different workbook or with a different extraction spec."""
+    expected_entry = {"workbook_sha256": workbook_hash, **extraction_spec}
+    return [
+        table
+        for table in required_tables
+        if manifest.get(table) != expected_entry
+        or not (cache_path / f"{table}.csv").exists()
+    ]
+
+
+def _load_table_configs(iasr_workbook_version: str) -> dict:
+    """Loads the table configs `isp-workbook-parser` ships for a workbook version.
+
+    Mirrors `Parser.default_config_path` so table locations can be inspected
+    without loading the workbook.
+    """
+    config_dir = (
+        Path(isp_workbook_parser.__file__).parent.parent
+        / "isp_table_configs"
+        / iasr_workbook_version
+    )
+    table_configs = {}
+    for config_file in sorted(config_dir.glob("*.yaml")):
+        table_configs.update(load_yaml(config_file))
+    return table_configs
+
+
+def _group_tables_by_sheet(
+    tables: list[str], iasr_workbook_version: str
+) -> list[list[str]]:
+    """Groups tables by the workbook sheet they are on, largest group first.
+
+    Sheet names are compared case-insensitively, as `isp-workbook-parser` does
+    when matching config sheet names to the workbook. Tables without a config
+    are grouped together so the worker surfaces the parser's usual error.
+    """
+    table_configs = _load_table_configs(iasr_workbook_version)
+    groups = {}
+    for table in tables:
+        config = table_configs.get(table)
+        sheet_name = config.sheet_name.lower() if config is not None else None
+        groups.setdefault(sheet_name, []).append(table)
+    return sorted(groups.values(), key=len, reverse=True)
+
+
+def _check_workbook_version(workbook: Parser, iasr_workbook_version: str) -> None:
+    if workbook.workbook_version != iasr_workbook_version:
+        raise ValueError(
+            "The IASR workbook provided does not match the version "
+            "specified in the config."
+        )
+
+
+# `Parser` reads the workbook version from this sheet, so it is kept in every
+# sheet subset workbook.
+_VERSION_SHEET_NAME = "Change Log"
+
+_SPREADSHEETML_NAMESPACE = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+_PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+_EMPTY_WORKSHEET = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<worksheet xmlns="{_SPREADSHEETML_NAMESPACE}"><sheetData/></worksheet>'
+).encode()
+
+
+def _worksheet_parts(workbook: zipfile.ZipFile) -> dict[str, str]:
+    """Maps the lower case name of each sheet in an xlsx archive to the archive
+    path of its worksheet part."""
+    sheets = ElementTree.fromstring(workbook.read("xl/workbook.xml"))
+    relationships = ElementTree.fromstring(workbook.read("xl/_rels/workbook.xml.rels"))
+    targets = {
+        relationship.get("Id"): relationship.get("Target")
+        for relationship in relationships.iter(
+            f"{{{_PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        )
+    }
+    parts = {}
+    for sheet in sheets.iter(f"{{{_SPREADSHEETML_NAMESPACE}}}sheet"):
+        target = targets[sheet.get(f"{{{_RELATIONSHIPS_NAMESPACE}}}id")]
+        parts[sheet.get("name").lower()] = (
+            target.lstrip("/")
+            if target.startswith("/")
+            else posixpath.normpath(posixpath.join("xl", target))
+        )
+    return parts
+
+
+def _write_sheet_subset_workbook(
+    workbook_path: Path, sheet_names: set[str], subset_path: Path
+) -> None:
+    """Writes a copy of an xlsx workbook in which only the given sheets, and the
+    sheet `Parser` reads the version from, keep their contents.
+
+    The other worksheets are replaced with empty ones and their relationships
+    (drawings, comments, etc.) are dropped, so the workbook keeps its structure
+    and sheet names but is much cheaper to load. The archive is copied part by
+    part, so the workbook is never parsed.
+    """
+    keep = {name.lower() for name in sheet_names} | {_VERSION_SHEET_NAME.lower()}
+    with zipfile.ZipFile(workbook_path) as source:
+        emptied_parts = {
+            part for name, part in _worksheet_parts(source).items() if name not in keep
+        }
+        emptied_rels = {
+            posixpath.join(
+                posixpath.dirname(part), "_rels", posixpath.basename(part) + ".rels"
+            )
+            for part in emptied_parts
+        }
+        with zipfile.ZipFile(
+            subset_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as subset:
+            for item in source.infolist():
+                if item.filename in emptied_rels:
+                    continue
+                elif item.filename in emptied_parts:
+                    subset.writestr(item, _EMPTY_WORKSHEET)
+                else:
+                    subset.writestr(item, source.read(item.filename))
+
+
+def _extract_tables_in_worker(
+    workbook_path: Path, cache_path: Path, tables: list[str], iasr_workbook_version: str
+) -> None:
+    workbook = Parser(workbook_path)
+    _check_workbook_version(workbook, iasr_workbook_version)
+    workbook.save_tables(cache_path, tables=tables)
+
+
+@profiled
+def _extract_tables_in_parallel(
+    cache_path: Path,
+    workbook_path: Path,
+    tables: list[str],
+    iasr_workbook_version: str,
+    n_processes: int,
+) -> None:
+    """Extracts tables with a pool of worker processes, one sheet group per task.
+
+    All tables on a sheet are extracted by the same worker. Each worker loads a
+    copy of the workbook in which only its group's sheet has contents (see
+    `_write_sheet_subset_workbook`), rather than the whole workbook, so memory
+    use doesn't grow with the number of workers by a full workbook each. Groups
+    are submitted largest first to balance the load across workers.
+    """
+    sheet_groups = _group_tables_by_sheet(tables, iasr_workbook_version)
+    table_configs = _load_table_configs(iasr_workbook_version)
+    n_workers = min(n_processes, len(sheet_groups))
+    logging.info(
+        f"Extracting {len(sheet_groups)} sheets with {n_workers} worker processes"
+    )
+    with (
+        tempfile.TemporaryDirectory() as subset_dir,
+        ProcessPoolExecutor(max_workers=n_workers) as executor,
+    ):
+        futures = []
+        for i, group in enumerate(sheet_groups):
+            sheet_names = {
+                table_configs[table].sheet_name
+                for table in group
+                if table in table_configs
+            }
+            # Tables without a config are extracted from the full workbook, so the
+            # parser raises its usual error for them.
+            if sheet_names:
+                group_workbook = Path(subset_dir) / f"sheet_group_{i}.xlsx"
+                _write_sheet_subset_workbook(workbook_path, sheet_names, group_workbook)
+            else:
+                group_workbook = workbook_path
+            futures.append(
+                executor.submit(
+                    _extract_tables_in_worker,
+                    group_workbook,
+                    cache_path,
+                    group,
+                    iasr_workbook_version,
+                )
+            )
+        for future in futures:
+            future.result()
+
+
+@profiled
 def build_local_cache(
-    cache_path: Path | str, workbook_path: Path | str, iasr_workbook_version: str
+    cache_path: Path | str,
+    workbook_path: Path | str,
+    iasr_workbook_version: str,
+    n_processes: int = 1,
 ) -> None:
     """Uses `isp-workbook-parser` to build a local cache of parsed workbook CSVs
 
+    The cache is built incrementally. A manifest in the cache directory records,
+    for each cached table, the SHA-256 hash of the workbook it was extracted from
+    and the extraction spec (workbook version and `isp-workbook-parser` version).
+    Only required tables that are missing or whose manifest entry doesn't match
+    the current workbook and spec are extracted; valid cached files are left
+    untouched. If every required table is valid, the workbook is not opened.
+
+    With `n_processes` greater than one, the tables to extract are grouped by
+    workbook sheet and the groups are extracted concurrently by a pool of worker
+    processes. Each worker only loads the sheet it extracts, so parallel
+    extraction pays off when many tables need extracting.
+
     Examples:
         Perform required imports.
         >>> from pathlib import Path
@@ -171,18 +434,50 @@ def build_local_cache(
         workbook_path: Path to an ISP Assumptions Workbook that is supported by
             `isp-workbook-parser`
         iasr_workbook_version: str specifying the version of the work being used.
+        n_processes: Number of worker processes to extract tables with. Defaults
+            to 1, which extracts tables serially in the calling process.
 
     Returns:
         None
     """
-    workbook = Parser(Path(workbook_path))
-    if workbook.workbook_version != iasr_workbook_version:
-        raise ValueError(
-            "The IASR workbook provided does not match the version "
-            "specified in the config."
+    cache_path = Path(cache_path)
+    workbook_path = Path(workbook_path)
+    cache_path.mkdir(parents=True, exist_ok=True)
+
+    required_tables = _build_required_tables(iasr_workbook_version)
+    workbook_hash = _hash_workbook(workbook_path)
+    extraction_spec = _extraction_spec(iasr_workbook_version)
+    manifest = _read_cache_manifest(cache_path)
+    tables_to_get = _find_stale_tables(
+        cache_path, manifest, required_tables, workbook_hash, extraction_spec
+    )
+    if not tables_to_get:
+        logging.info(f"All {len(required_tables)} required tables are cached")
+        return None
+
+    logging.info(
+        f"Extracting {len(tables_to_get)} of {len(required_tables)} required "
+        f"tables from {workbook_path}"
+    )
+    # Invalidate entries before extracting so a failed run can't leave a
+    # manifest vouching for partially rewritten files.
+    for table in tables_to_get:
+        manifest.pop(table, None)
+    _write_cache_manifest(cache_path, manifest)
+
+    if n_processes > 1:
+        _extract_tables_in_parallel(
+            cache_path, workbook_path, tables_to_get, iasr_workbook_version, n_processes
         )
-    tables_to_get = _build_required_tables(iasr_workbook_version)
-    workbook.save_tables(cache_path, tables=tables_to_get)
+    else:
+        with profile_span("iasr_table_caching.extract_tables"):
+            workbook = Parser(workbook_path)
+            _check_workbook_version(workbook, iasr_workbook_version)
+            workbook.save_tables(cache_path, tables=tables_to_get)
+
+    for table in tables_to_get:
+        manifest[table] = {"workbook_sha256": workbook_hash, **extraction_spec}
+    _write_cache_manifest(cache_path, manifest)
     return None
 
 
@@ -206,7 +206,7 @@ def prepare_dispatch_data(
         group_cols = ["investment_period", "fuel_type", "timestep"]
 
     dispatch = (
-        dispatch.groupby(group_cols)
+        dispatch.groupby(group_cols, observed=True)
         .agg(
             {
                 "dispatch_mw": "sum",
@@ -260,7 +260,7 @@ def prepare_demand_data(
         group_cols = ["investment_period", "timestep"]
 
     demand = (
-        demand.groupby(group_cols)
+        demand.groupby(group_cols, observed=True)
         .agg(
             {
                 "demand_mw": "sum",
@@ -526,7 +526,9 @@ def plot_dispatch(
 
     plots = {}
 
-    for group_key, dispatch_group in dispatch_prepared.groupby(group_cols):
+    for group_key, dispatch_group in dispatch_prepared.groupby(
+        group_cols, observed=True
+    ):
         if geography_level is not None:
             node, investment_period, week_starting = group_key
             demand_group = demand_prepared[
@@ -11,6 +11,7 @@ from ispypsa.plotting.transmission import (
     plot_flows,
     plot_regional_capacity_expansion,
 )
+from ispypsa.profiling import profiled
 
 
 def flatten_dict_with_file_paths_as_keys(
@@ -59,6 +60,7 @@ def flatten_dict_with_file_paths_as_keys(
     return dict(items)
 
 
+@profiled
 def create_plot_suite(
     results: dict[str, pd.DataFrame],
 ) -> dict[Path, dict]:
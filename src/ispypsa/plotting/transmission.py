@@ -260,7 +260,7 @@ def plot_flows(
 
     # Group by isp_type, isp_name, investment_period, and week_starting
     grouped = flows.groupby(
-        ["isp_type", "isp_name", "investment_period", "week_starting"]
+        ["isp_type", "isp_name", "investment_period", "week_starting"], observed=True
     )
 
     for (isp_type, isp_name, investment_period, week_starting), week_data in grouped:
@@ -0,0 +1,285 @@
+import atexit
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# The active profiler, or None when profiling is disabled. Spans and profiled
+# functions check this first, so disabled profiling costs one global lookup.
+_profiler = None
+
+
+class _NullSpan:
+    """Stand-in returned by `profile_span` when profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+    def __setitem__(self, key: str, value) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """A timed region of the pipeline, recorded by the active profiler on exit.
+
+    Extra attributes, such as a row count known only once the work is done, can
+    be set on the span inside the `with` block with `span["rows"] = n`.
+
+    CPU time is that of the thread the span runs in, so spans running
+    concurrently in a thread pool don't count each other's work. Work the span
+    hands off to other threads or processes, e.g. a multithreaded solver or a
+    process pool, isn't included.
+    """
+
+    def __init__(self, profiler: "_Profiler", name: str, attributes: dict) -> None:
+        self._profiler = profiler
+        self.name = name
+        self.attributes = attributes
+
+    def __setitem__(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> "_Span":
+        stack = self._profiler._stack()
+        self.span_id = next(self._profiler._span_ids)
+        self.parent_id = stack[-1].span_id if stack else None
+        self.depth = len(stack)
+        stack.append(self)
+        self._peak_rss_at_start = _peak_rss_mib()
+        self._cpu_start = time.thread_time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        end = time.perf_counter()
+        cpu_end = time.thread_time()
+        peak_rss = _peak_rss_mib()
+        self._profiler._stack().pop()
+        record = {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "depth": self.depth,
+            "thread": threading.current_thread().name,
+            "start_s": self._start - self._profiler.start,
+            "wall_s": end - self._start,
+            "cpu_s": cpu_end - self._cpu_start,
+            "peak_rss_mib": peak_rss,
+            "peak_rss_growth_mib": (
+                None if peak_rss is None else peak_rss - self._peak_rss_at_start
+            ),
+            **self.attributes,
+        }
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+        self._profiler.record(record)
+        return None
+
+
+class _Profiler:
+    """Collects span records and writes them to a JSON lines or Chrome trace file.
+
+    JSON lines are written as each span closes, so a profile survives a run that
+    crashes or is killed part way through. Chrome trace events are held in
+    memory and written by `close`, which is also registered to run at exit.
+    """
+
+    def __init__(
+        self, profile_file: Path, output_format: Literal["jsonl", "chrome"]
+    ) -> None:
+        if output_format not in ("jsonl", "chrome"):
+            raise ValueError(
+                f"Unknown profile output format '{output_format}', expected "
+                "'jsonl' or 'chrome'."
+            )
+        self.profile_file = Path(profile_file)
+        self.output_format = output_format
+        self.start = time.perf_counter()
+        self._span_ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file = None
+        self._chrome_events = []
+
+    def _stack(self) -> list[_Span]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def record(self, record: dict) -> None:
+        with self._lock:
+            if self.output_format == "jsonl":
+                if self._file is None:
+                    self.profile_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.profile_file, "w")
+                self._file.write(json.dumps(record, default=str) + "\n")
+                self._file.flush()
+            else:
+                self._chrome_events.append(_to_chrome_event(record))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self.output_format == "chrome" and self._chrome_events:
+                self.profile_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.profile_file, "w") as f:
+                    json.dump(
+                        {"traceEvents": self._chrome_events, "displayTimeUnit": "ms"},
+                        f,
+                        default=str,
+                    )
+                self._chrome_events = []
+
+
+def _to_chrome_event(record: dict) -> dict:
+    """Converts a span record to a Chrome trace complete ("X") event."""
+    timing_keys = {"name", "start_s", "wall_s", "thread"}
+    return {
+        "name": record["name"],
+        "cat": "ispypsa",
+        "ph": "X",
+        "ts": record["start_s"] * 1e6,
+        "dur": record["wall_s"] * 1e6,
+        "pid": os.getpid(),
+        "tid": record["thread"],
+        "args": {key: value for key, value in record.items() if key not in timing_keys},
+    }
+
+
+def _peak_rss_mib() -> float | None:
+    """Peak resident memory of this process so far, in MiB, where available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _count_rows(result) -> int | None:
+    """Counts the rows in a function result that is a table or dict of tables."""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return len(result)
+    if isinstance(result, dict):
+        tables = [
+            value
+            for value in result.values()
+            if isinstance(value, (pd.DataFrame, pd.Series))
+        ]
+        if tables:
+            return sum(len(table) for table in tables)
+    return None
+
+
+def configure_profiling(
+    enabled: bool = True,
+    profile_file: Path | str = "ISPyPSA_profile.jsonl",
+    output_format: Literal["jsonl", "chrome"] = "jsonl",
+) -> None:
+    """Configures ISPyPSA profiling
+
+    When enabled, each ISPyPSA pipeline stage (and the major steps within it)
+    is recorded as a span with its wall time, CPU time, the process's peak
+    resident memory and how much the span raised it, and, where the stage
+    returns tables, the number of rows returned. Spans are nested, with each
+    recording the id of the span it ran within.
+
+    Profiling is disabled by default and costs next to nothing while disabled.
+    Calling `configure_profiling` again closes the current profile file before
+    starting the new one.
+
+    Examples:
+        Perform required imports.
+        >>> from ispypsa.profiling import configure_profiling
+
+        Record spans as JSON lines, one object per line.
+        >>> configure_profiling(profile_file="my_run_profile.jsonl")
+
+        Record spans as a Chrome trace, which can be opened in chrome://tracing
+        or https://ui.perfetto.dev.
+        >>> configure_profiling(
+        ...     profile_file="my_run_profile.json",
+        ...     output_format="chrome"
+        ... )
+
+        Disable profiling.
+        >>> configure_profiling(enabled=False)
+
+    Args:
+        enabled: Whether to profile. Defaults to True.
+        profile_file: Path of the profile file. JSON lines are written as each
+            span finishes, while a Chrome trace is written when profiling is
+            disabled, reconfigured or the Python process exits. Defaults to
+            "ISPyPSA_profile.jsonl".
+        output_format: Either "jsonl" or "chrome". Defaults to "jsonl".
+
+    Returns:
+        None
+    """
+    global _profiler
+    if _profiler is not None:
+        _profiler.close()
+        atexit.unregister(_profiler.close)
+        _profiler = None
+    if enabled:
+        _profiler = _Profiler(Path(profile_file), output_format)
+        atexit.register(_profiler.close)
+
+
+def profile_span(name: str, **attributes) -> _Span | _NullSpan:
+    """Context manager recording the enclosed code as a span named `name`.
+
+    Keyword arguments, and items set on the span inside the `with` block, are
+    added to the span's record, e.g. `span["rows"] = len(table)`.
+    """
+    if _profiler is None:
+        return _NULL_SPAN
+    return _Span(_profiler, name, attributes)
+
+
+def profiled(func: Callable | None = None, *, name: str | None = None) -> Callable:
+    """Decorator recording each call of a function as a span.
+
+    The span is named after the function's module and name, minus the
+    `ispypsa.` prefix, unless `name` is given. If the function returns a
+    table or a dict of tables the number of rows returned is recorded.
+    """
+    if func is None:
+        return functools.partial(profiled, name=name)
+
+    span_name = name or f"{func.__module__.removeprefix('ispypsa.')}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _profiler is None:
+            return func(*args, **kwargs)
+        with _Span(_profiler, span_name, {}) as span:
+            result = func(*args, **kwargs)
+            rows = _count_rows(result)
+            if rows is not None:
+                span["rows"] = rows
+            return result
+
+    return wrapper
@@ -1,5 +1,18 @@
 from ispypsa.pypsa_build.build import build_pypsa_network
+from ispypsa.pypsa_build.decomposition import solve_with_benders_decomposition
+from ispypsa.pypsa_build.model_size import estimate_model_size, model_statistics
+from ispypsa.pypsa_build.rolling_foresight import solve_with_rolling_foresight
 from ispypsa.pypsa_build.save import save_pypsa_network
+from ispypsa.pypsa_build.scaling import scale_model
 from ispypsa.pypsa_build.update import update_network_timeseries
 
-__all__ = ["build_pypsa_network", "save_pypsa_network", "update_network_timeseries"]
+__all__ = [
+    "build_pypsa_network",
+    "estimate_model_size",
+    "model_statistics",
+    "save_pypsa_network",
+    "scale_model",
+    "solve_with_benders_decomposition",
+    "solve_with_rolling_foresight",
+    "update_network_timeseries",
+]
@@ -1,7 +1,9 @@
 from pathlib import Path
 
 import pandas as pd
+import pypsa
 
+from ispypsa.profiling import profile_span, profiled
 from ispypsa.pypsa_build.buses import (
     _add_bus_for_custom_constraints,
     _add_buses_to_network,
@@ -15,9 +17,15 @@ from ispypsa.pypsa_build.generators import (
 from ispypsa.pypsa_build.initialise import _initialise_network
 from ispypsa.pypsa_build.investment_period_weights import _add_investment_period_weights
 from ispypsa.pypsa_build.links import _add_links_to_network
+from ispypsa.pypsa_build.snapshots import _SnapshotRegistry
 from ispypsa.pypsa_build.storage import _add_batteries_to_network
+from ispypsa.pypsa_build.timeslices import (
+    _add_link_timeslice_limits_to_network,
+    _TimesliceCodes,
+)
 
 
+@profiled
 def build_pypsa_network(
     pypsa_friendly_tables: dict[str : pd.DataFrame],
     path_to_pypsa_friendly_timeseries_data: Path,
@@ -53,7 +61,22 @@ def build_pypsa_network(
     Returns:
         pypsa.Network: A PyPSA network object ready for optimisation.
     """
+    network = _build_network_components(
+        pypsa_friendly_tables, path_to_pypsa_friendly_timeseries_data
+    )
+    _create_model(network, pypsa_friendly_tables)
+    return network
+
+
+def _build_network_components(
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    path_to_pypsa_friendly_timeseries_data: Path,
+) -> pypsa.Network:
+    """Creates a `pypsa.Network` with the components of the pypsa friendly tables,
+    without creating its linopy model."""
     network = _initialise_network(pypsa_friendly_tables["snapshots"])
+    # Every load and generator time series is attached to this one snapshot index.
+    snapshot_registry = _SnapshotRegistry(network.snapshots)
 
     _add_investment_period_weights(
         network, pypsa_friendly_tables["investment_period_weights"]
@@ -66,16 +89,29 @@ def build_pypsa_network(
     )
 
     _add_buses_to_network(
-        network, pypsa_friendly_tables["buses"], path_to_pypsa_friendly_timeseries_data
+        network,
+        pypsa_friendly_tables["buses"],
+        path_to_pypsa_friendly_timeseries_data,
+        snapshot_registry,
     )
 
     if "links" in pypsa_friendly_tables.keys():
         _add_links_to_network(network, pypsa_friendly_tables["links"])
 
+    if "link_timeslice_limits" in pypsa_friendly_tables:
+        _add_link_timeslice_limits_to_network(
+            network,
+            pypsa_friendly_tables["link_timeslice_limits"],
+            _TimesliceCodes(
+                network.snapshots, pypsa_friendly_tables["timeslice_calendar"]
+            ),
+        )
+
     _add_generators_to_network(
         network,
         pypsa_friendly_tables["generators"],
         path_to_pypsa_friendly_timeseries_data,
+        snapshot_registry,
     )
 
     if "batteries" in pypsa_friendly_tables.keys():
@@ -88,8 +124,21 @@ def build_pypsa_network(
             network, pypsa_friendly_tables["custom_constraints_generators"]
         )
 
+    return network
+
+
+def _create_model(
+    network: pypsa.Network,
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    snapshots: pd.MultiIndex | None = None,
+) -> None:
+    """Creates the linopy model of a `pypsa.Network` over `snapshots`, or every
+    snapshot if None, and adds the custom constraints to it."""
     # The underlying linopy model needs to get built so we can add custom constraints.
-    network.optimize.create_model(multi_investment_periods=True)
+    with profile_span("pypsa_build.create_model"):
+        network.optimize.create_model(
+            snapshots=snapshots, multi_investment_periods=True
+        )
 
     if "custom_constraints_rhs" in pypsa_friendly_tables:
         _add_custom_constraints(
@@ -97,5 +146,3 @@ def build_pypsa_network(
             pypsa_friendly_tables["custom_constraints_rhs"],
             pypsa_friendly_tables["custom_constraints_lhs"],
         )
-
-    return network
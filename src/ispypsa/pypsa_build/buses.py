@@ -3,53 +3,69 @@ from pathlib import Path
 import pandas as pd
 import pypsa
 
+from ispypsa.profiling import profiled
+from ispypsa.pypsa_build.snapshots import _set_timeseries, _SnapshotRegistry
 
-def _add_bus_to_network(
-    bus_name: str, network: pypsa.Network, path_to_demand_traces: Path
-) -> None:
-    """
-    Adds a Bus to the network and if a demand trace for the Bus exists, also adds the
-    trace to a Load attached to the Bus.
+
+def _get_demand_traces(
+    bus_names: pd.Series, path_to_demand_traces: Path
+) -> dict[str, pd.DataFrame]:
+    """Fetches the demand traces of the buses that have one.
 
     Args:
-        bus_name: String defining the bus name
-        network: The `pypsa.Network` object
+        bus_names: `pd.Series` of bus names
         path_to_demand_traces: `pathlib.Path` that points to the
             directory containing demand traces
 
-    Returns: None
+    Returns:
+        dict mapping the name of each bus with a demand trace to the trace.
     """
-    network.add(class_name="Bus", name=bus_name)
-
-    demand_trace_path = path_to_demand_traces / Path(f"{bus_name}.parquet")
-    if demand_trace_path.exists():
-        demand = pd.read_parquet(demand_trace_path)
-        demand = demand.set_index(["investment_periods", "snapshots"])
-        network.add(
-            class_name="Load",
-            name=f"load_{bus_name}",
-            bus=bus_name,
-            p_set=demand["p_set"],
-        )
+    traces = {}
+    for bus_name in bus_names:
+        demand_trace_path = path_to_demand_traces / Path(f"{bus_name}.parquet")
+        if demand_trace_path.exists():
+            traces[bus_name] = pd.read_parquet(demand_trace_path)
+    return traces
 
 
+@profiled
 def _add_buses_to_network(
-    network: pypsa.Network, buses: pd.DataFrame, path_to_timeseries_data: Path
+    network: pypsa.Network,
+    buses: pd.DataFrame,
+    path_to_timeseries_data: Path,
+    snapshot_registry: _SnapshotRegistry | None = None,
 ) -> None:
     """Adds buses and demand traces to the `pypsa.Network`.
 
+    If a demand trace for a Bus exists, the trace is added to a Load attached to the
+    Bus. The Buses, and then the Loads, are each added with one call to `network.add`.
+
     Args:
         network: The `pypsa.Network` object
         buses: `pd.DataFrame` with `PyPSA` style `Bus` attributes.
         path_to_timeseries_data: `pathlib.Path` that points to the directory containing
             timeseries data
+        snapshot_registry: `_SnapshotRegistry` of the network's snapshots. Built from
+            `network.snapshots` if not given.
 
     Returns: None
     """
+    if buses.empty:
+        return
+
+    if snapshot_registry is None:
+        snapshot_registry = _SnapshotRegistry(network.snapshots)
+
+    network.add(class_name="Bus", name=buses["name"].to_numpy())
+
     path_to_demand_traces = path_to_timeseries_data / Path("demand_traces")
-    buses["name"].apply(
-        lambda x: _add_bus_to_network(x, network, path_to_demand_traces)
+    demand = snapshot_registry.stack(
+        _get_demand_traces(buses["name"], path_to_demand_traces), "p_set"
     )
+    if not demand.empty:
+        bus_names = list(demand.columns)
+        demand.columns = [f"load_{bus_name}" for bus_name in bus_names]
+        network.add(class_name="Load", name=demand.columns, bus=bus_names, p_set=demand)
 
 
 def _add_bus_for_custom_constraints(network: pypsa.Network) -> None:
@@ -64,46 +80,35 @@ def _add_bus_for_custom_constraints(network: pypsa.Network) -> None:
     network.add(class_name="Bus", name="bus_for_custom_constraint_gens")
 
 
-def _update_bus_demand_timeseries(
-    bus_name: str, network: pypsa.Network, path_to_demand_traces: Path
+@profiled
+def _update_buses_demand_timeseries(
+    network: pypsa.Network,
+    buses: pd.DataFrame,
+    path_to_timeseries_data: Path,
+    snapshot_registry: _SnapshotRegistry | None = None,
 ) -> None:
-    """
-    Update a Bus's demand timeseries data in the pypsa.Network.
+    """Update buses a demand timeseries in the `pypsa.Network`.
 
     The function is used to set up the model for operational modelling following
     capacity expansion optimisation. Once the model snapshots are updated then the
     demand timeseries also need to be updated to match.
 
-    Args:
-        bus_name: String defining the bus name
-        network: The `pypsa.Network` object
-        path_to_demand_traces: `pathlib.Path` that points to the
-            directory containing demand traces
-
-    Returns: None
-    """
-
-    demand_trace_path = path_to_demand_traces / Path(f"{bus_name}.parquet")
-    if demand_trace_path.exists():
-        demand = pd.read_parquet(demand_trace_path)
-        demand = demand.set_index(["investment_periods", "snapshots"])
-        network.loads_t.p_set[f"load_{bus_name}"] = demand.loc[:, ["p_set"]]
-
-
-def _update_buses_demand_timeseries(
-    network: pypsa.Network, buses: pd.DataFrame, path_to_timeseries_data: Path
-) -> None:
-    """Update buses a demand timeseries in the `pypsa.Network`.
-
     Args:
         network: The `pypsa.Network` object
         buses: `pd.DataFrame` with `PyPSA` style `Bus` attributes.
         path_to_timeseries_data: `pathlib.Path` that points to the directory containing
             timeseries data
+        snapshot_registry: `_SnapshotRegistry` of the network's snapshots. Built from
+            `network.snapshots` if not given.
 
     Returns: None
     """
+    if snapshot_registry is None:
+        snapshot_registry = _SnapshotRegistry(network.snapshots)
+
     path_to_demand_traces = path_to_timeseries_data / Path("demand_traces")
-    buses["name"].apply(
-        lambda x: _update_bus_demand_timeseries(x, network, path_to_demand_traces)
+    demand = snapshot_registry.stack(
+        _get_demand_traces(buses["name"], path_to_demand_traces), "p_set"
     )
+    demand.columns = [f"load_{bus_name}" for bus_name in demand.columns]
+    _set_timeseries(network.loads_t, "p_set", demand)
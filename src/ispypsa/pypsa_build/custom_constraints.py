@@ -5,6 +5,8 @@ import linopy
 import pandas as pd
 import pypsa
 
+from ispypsa.profiling import profiled
+
 
 def _get_variables(
     model: linopy.Model, component_name: str, component_type: str, attribute_type: str
@@ -48,6 +50,7 @@ def _get_variables(
     return var
 
 
+@profiled
 def _add_custom_constraints(
     network: pypsa.Network,
     custom_constraints_rhs: pd.DataFrame,
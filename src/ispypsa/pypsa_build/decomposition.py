@@ -0,0 +1,599 @@
+import logging
+import multiprocessing
+from pathlib import Path
+
+import highspy
+import numpy as np
+import pandas as pd
+import pypsa
+from linopy.io import to_highspy
+
+from ispypsa.profiling import profile_span, profiled
+from ispypsa.pypsa_build.build import build_pypsa_network
+from ispypsa.pypsa_build.rolling_foresight import _dispatch_by_period
+
+# Pypsa-friendly tables holding assets that can be expanded, and the `PyPSA`
+# component they are added to the `pypsa.Network` as.
+_EXPANDABLE_ASSET_COMPONENTS = {
+    "generators": "Generator",
+    "batteries": "StorageUnit",
+    "links": "Link",
+    "custom_constraints_generators": "Generator",
+}
+
+
+@profiled
+def solve_with_benders_decomposition(
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    path_to_pypsa_friendly_timeseries_data: Path,
+    subproblems: str = "investment_period",
+    max_iterations: int = 100,
+    tolerance: float = 1e-4,
+    processes: int = 1,
+    solver_name: str = "highs",
+) -> tuple[pypsa.Network, pd.DataFrame]:
+    """Solves the capacity expansion model with Benders decomposition.
+
+    The model is split into a master problem holding the capacity (`p_nom`) of every
+    extendable asset, and operational subproblems that each cover the snapshots of one
+    investment period, or of one week. Custom constraints whose left hand side only
+    has `p_nom` terms go in the master problem, and the rest go in every subproblem.
+
+    Each subproblem is built once from the pypsa-friendly tables with
+    `build_pypsa_network` and passed to HiGHS. At each iteration the capacities from
+    the master problem are fixed in the subproblems by changing the bounds of their
+    `p_nom` columns, and the subproblems are resolved from their previous basis. The
+    operating cost and the reduced costs of the `p_nom` columns of each subproblem give
+    an optimality cut added to the master problem. Iterations stop once the relative
+    gap between the lower bound (the master problem objective) and the best upper
+    bound (capital plus operating cost of a set of capacities) is within `tolerance`.
+
+    Subproblems are spread across `processes` worker processes, with each worker
+    building and keeping its own subproblems for the whole solve.
+
+    Once the capacities have converged, the network for the full model is built with
+    the capacities fixed and dispatched one investment period at a time, so no solve
+    covers the full horizon. This network is returned so results can be extracted as
+    for a solve of the full model.
+
+    The decomposition assumes:
+
+    - Operating costs are non-negative, which bounds each subproblem's cost below by
+      zero in the master problem.
+    - Every subproblem is feasible for any capacities allowed by the master problem,
+      e.g. by modelling unserved energy.
+    - Storage state of charge starts from its initial value in each subproblem, so
+      splitting the model by week doesn't carry storage between weeks.
+
+    Examples:
+        Peform required imports.
+        >>> from pathlib import Path
+        >>> from ispypsa.data_fetch import read_csvs
+        >>> from ispypsa.pypsa_build import solve_with_benders_decomposition
+
+        Read in PyPSA friendly tables from CSV.
+        >>> pypsa_input_tables = read_csvs(Path("pypsa_friendly_inputs_directory"))
+
+        >>> network, convergence = solve_with_benders_decomposition(
+        ... pypsa_friendly_tables=pypsa_input_tables,
+        ... path_to_pypsa_friendly_timeseries_data=Path("pypsa_friendly_timeseries_data"),
+        ... subproblems="week",
+        ... processes=4,
+        ... )
+
+    Args:
+        pypsa_friendly_tables: dictionary of dataframes in the `PyPSA` friendly format.
+        path_to_pypsa_friendly_timeseries_data: `Path` to `PyPSA` friendly time series
+            data.
+        subproblems: "investment_period" for one subproblem per investment period, or
+            "week" for one subproblem per week (Monday to Monday) of snapshots.
+        max_iterations: maximum number of master problem solves.
+        tolerance: relative gap between the lower and upper bounds at which the
+            iterations stop.
+        processes: number of worker processes the subproblems are solved in.
+        solver_name: name of the solver used for the final solve of the full model
+            with fixed capacities. The master problem and subproblems are always
+            solved with HiGHS.
+
+    Returns:
+        tuple[pypsa.Network, pd.DataFrame]: The solved `pypsa.Network` for the full
+            model, and a `pd.DataFrame` with the columns "iteration", "lower_bound",
+            "upper_bound" and "gap" recording the convergence of the decomposition.
+
+    Raises:
+        ValueError: If `subproblems` isn't "investment_period" or "week".
+        RuntimeError: If a master problem or subproblem solve isn't optimal.
+    """
+    master_constraints, subproblem_tables = _split_custom_constraints(
+        pypsa_friendly_tables
+    )
+    subproblem_snapshots = _split_snapshots(
+        pypsa_friendly_tables["snapshots"], subproblems
+    )
+
+    with _SubproblemPool(
+        subproblem_tables,
+        path_to_pypsa_friendly_timeseries_data,
+        subproblem_snapshots,
+        processes,
+    ) as subproblem_pool:
+        master = _MasterProblem(
+            _expandable_assets(pypsa_friendly_tables),
+            subproblem_pool.capital_costs(),
+            len(subproblem_snapshots),
+            master_constraints,
+        )
+
+        best_upper_bound = np.inf
+        best_capacity = None
+        convergence = []
+        for iteration in range(1, max_iterations + 1):
+            lower_bound, capacity = master.solve()
+            results = subproblem_pool.solve(capacity)
+            upper_bound = master.capital_cost(capacity) + sum(
+                operating_cost for operating_cost, _ in results
+            )
+            if upper_bound < best_upper_bound:
+                best_upper_bound = upper_bound
+                best_capacity = capacity
+
+            gap = (best_upper_bound - lower_bound) / max(abs(best_upper_bound), 1.0)
+            convergence.append(
+                {
+                    "iteration": iteration,
+                    "lower_bound": lower_bound,
+                    "upper_bound": best_upper_bound,
+                    "gap": gap,
+                }
+            )
+            logging.info(
+                f"Benders iteration {iteration}: lower bound {lower_bound:.6g}, "
+                f"upper bound {best_upper_bound:.6g}, gap {gap:.3g}"
+            )
+            if gap <= tolerance:
+                break
+
+            for subproblem_index, (operating_cost, marginal_values) in enumerate(
+                results
+            ):
+                master.add_cut(
+                    subproblem_index,
+                    operating_cost,
+                    marginal_values,
+                    subproblem_pool.assets(subproblem_index),
+                    capacity,
+                )
+        else:
+            logging.warning(
+                f"Benders decomposition stopped after {max_iterations} iterations "
+                f"with a gap of {gap:.3g}, the best capacities found are used."
+            )
+
+    network = _dispatch_by_period(
+        pypsa_friendly_tables,
+        path_to_pypsa_friendly_timeseries_data,
+        sorted(pypsa_friendly_tables["investment_period_weights"]["period"]),
+        _capacity_by_table(pypsa_friendly_tables, best_capacity),
+        solver_name,
+    )
+    return network, pd.DataFrame(convergence)
+
+
+def _expandable_assets(pypsa_friendly_tables: dict[str : pd.DataFrame]) -> pd.DataFrame:
+    """Collects the extendable assets of the pypsa-friendly tables.
+
+    Returns:
+        `pd.DataFrame` indexed by ("component", "name") with the columns "p_nom_min"
+            and "p_nom_max".
+    """
+    assets = []
+    for table_name, component in _EXPANDABLE_ASSET_COMPONENTS.items():
+        table = pypsa_friendly_tables.get(table_name)
+        if table is None or "p_nom_extendable" not in table.columns:
+            continue
+        table = table.loc[table["p_nom_extendable"].astype(bool)]
+        assets.append(
+            pd.DataFrame(
+                {
+                    "component": component,
+                    "name": table["name"],
+                    "p_nom_min": table.get("p_nom_min", 0.0),
+                    "p_nom_max": table.get("p_nom_max", np.inf),
+                }
+            )
+        )
+    assets = pd.concat(assets).set_index(["component", "name"])
+    return assets.fillna({"p_nom_min": 0.0, "p_nom_max": np.inf})
+
+
+def _capacity_by_table(
+    pypsa_friendly_tables: dict[str : pd.DataFrame], capacity: pd.Series
+) -> dict[str, pd.Series]:
+    """Splits capacities indexed by ("component", "name") into a `pd.Series` per
+    pypsa-friendly table, indexed by name."""
+    capacity_by_table = {}
+    for table_name, component in _EXPANDABLE_ASSET_COMPONENTS.items():
+        table = pypsa_friendly_tables.get(table_name)
+        if table is None or "p_nom_extendable" not in table.columns:
+            continue
+        names = table.loc[table["p_nom_extendable"].astype(bool), "name"]
+        capacity_by_table[table_name] = capacity.loc[component].loc[names]
+    return capacity_by_table
+
+
+def _split_custom_constraints(
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+) -> tuple[pd.DataFrame | None, dict[str : pd.DataFrame]]:
+    """Separates custom constraints with only `p_nom` terms, which go in the master
+    problem, from the custom constraints that go in every subproblem.
+
+    Returns:
+        tuple of the left hand side rows of the master problem constraints merged with
+            their right hand side, or None if there are none, and a copy of the
+            pypsa-friendly tables with only the subproblem custom constraints.
+    """
+    subproblem_tables = dict(pypsa_friendly_tables)
+    if "custom_constraints_rhs" not in pypsa_friendly_tables:
+        return None, subproblem_tables
+
+    lhs = pypsa_friendly_tables["custom_constraints_lhs"]
+    rhs = pypsa_friendly_tables["custom_constraints_rhs"]
+    is_master_constraint = (
+        (lhs["attribute"] == "p_nom").groupby(lhs["constraint_name"]).all()
+    )
+    master_names = is_master_constraint.index[is_master_constraint]
+
+    subproblem_tables["custom_constraints_lhs"] = lhs.loc[
+        ~lhs["constraint_name"].isin(master_names)
+    ]
+    subproblem_tables["custom_constraints_rhs"] = rhs.loc[
+        ~rhs["constraint_name"].isin(master_names)
+    ]
+    if master_names.empty:
+        return None, subproblem_tables
+
+    master_constraints = pd.merge(
+        lhs.loc[lhs["constraint_name"].isin(master_names)],
+        rhs.loc[:, ["constraint_name", "rhs", "constraint_type"]],
+        on="constraint_name",
+    )
+    return master_constraints, subproblem_tables
+
+
+def _split_snapshots(snapshots: pd.DataFrame, subproblems: str) -> list[pd.DataFrame]:
+    """Splits the snapshots table into the snapshots of each subproblem."""
+    if subproblems == "investment_period":
+        groups = [snapshots["investment_periods"]]
+    elif subproblems == "week":
+        # Weeks run from Monday 00:00:00 exclusive to Monday 00:00:00 inclusive, so
+        # that a week's snapshots include the interval ending at midnight on Monday.
+        datetimes = pd.to_datetime(snapshots["snapshots"])
+        week = (datetimes - pd.Timedelta(microseconds=1)).dt.to_period("W-SUN")
+        groups = [snapshots["investment_periods"], week]
+    else:
+        raise ValueError(
+            f"subproblems must be investment_period or week, got {subproblems}."
+        )
+    return [group for _, group in snapshots.groupby(groups, sort=True)]
+
+
+class _MasterProblem:
+    """The Benders master problem, holding the capacity of every extendable asset and
+    a lower bound on the operating cost of each subproblem."""
+
+    def __init__(
+        self,
+        assets: pd.DataFrame,
+        capital_costs: pd.Series,
+        n_subproblems: int,
+        custom_constraints: pd.DataFrame | None,
+    ):
+        self._assets = assets.index
+        self._capital_costs = capital_costs.reindex(self._assets).fillna(0.0)
+        n_assets = len(self._assets)
+        self._n_subproblems = n_subproblems
+
+        self._highs = highspy.Highs()
+        self._highs.setOptionValue("output_flag", False)
+        # One column per asset, then one per subproblem for its operating cost.
+        self._highs.addVars(
+            n_assets + self._n_subproblems,
+            np.concatenate([assets["p_nom_min"], np.zeros(self._n_subproblems)]),
+            np.concatenate([assets["p_nom_max"], np.full(self._n_subproblems, np.inf)]),
+        )
+        self._highs.changeColsCost(
+            n_assets + self._n_subproblems,
+            np.arange(n_assets + self._n_subproblems, dtype=np.int32),
+            np.concatenate(
+                [self._capital_costs.to_numpy(), np.ones(self._n_subproblems)]
+            ),
+        )
+        if custom_constraints is not None:
+            self._add_custom_constraints(custom_constraints)
+
+    def _add_custom_constraints(self, custom_constraints: pd.DataFrame) -> None:
+        columns = self._assets.get_indexer(
+            pd.MultiIndex.from_arrays(
+                [custom_constraints["component"], custom_constraints["variable_name"]]
+            )
+        )
+        # As when building the full model, variables that aren't in the model are
+        # left out of the constraint.
+        custom_constraints = custom_constraints.loc[columns >= 0]
+        columns = columns[columns >= 0]
+        for (name, rhs, constraint_type), rows in custom_constraints.groupby(
+            ["constraint_name", "rhs", "constraint_type"]
+        ).indices.items():
+            if constraint_type == "<=":
+                lower, upper = -np.inf, rhs
+            elif constraint_type == ">=":
+                lower, upper = rhs, np.inf
+            elif constraint_type == "==":
+                lower, upper = rhs, rhs
+            else:
+                raise ValueError(f"{constraint_type} is not a valid constraint type.")
+            self._highs.addRow(
+                lower,
+                upper,
+                len(rows),
+                columns[rows].astype(np.int32),
+                custom_constraints["coefficient"].to_numpy()[rows],
+            )
+
+    def solve(self) -> tuple[float, pd.Series]:
+        """Solves the master problem and returns its objective value and the
+        capacities of the assets."""
+        with profile_span("pypsa_build.benders_master"):
+            self._highs.run()
+        _check_optimal(self._highs, "the Benders master problem")
+        values = np.asarray(self._highs.getSolution().col_value)
+        return (
+            self._highs.getInfo().objective_function_value,
+            pd.Series(values[: len(self._assets)], index=self._assets),
+        )
+
+    def capital_cost(self, capacity: pd.Series) -> float:
+        return float(self._capital_costs @ capacity)
+
+    def add_cut(
+        self,
+        subproblem_index: int,
+        operating_cost: float,
+        marginal_values: np.ndarray,
+        subproblem_assets: pd.MultiIndex,
+        capacity: pd.Series,
+    ) -> None:
+        """Adds the optimality cut
+        `theta >= operating_cost + marginal_values * (p_nom - capacity)`."""
+        columns = self._assets.get_indexer(subproblem_assets).astype(np.int32)
+        theta_column = np.int32(len(self._assets) + subproblem_index)
+        self._highs.addRow(
+            operating_cost - marginal_values @ capacity.iloc[columns].to_numpy(),
+            np.inf,
+            len(columns) + 1,
+            np.append(columns, theta_column),
+            np.append(-marginal_values, 1.0),
+        )
+
+
+class _Subproblem:
+    """An operational subproblem with the capacity of every extendable asset fixed.
+
+    The subproblem is built once with `build_pypsa_network`, and the capacities are
+    fixed by the bounds of the `p_nom` columns so only the bounds change between
+    solves. The capital cost of the assets is removed from the objective, as it is
+    counted in the master problem.
+    """
+
+    def __init__(
+        self,
+        pypsa_friendly_tables: dict[str : pd.DataFrame],
+        path_to_pypsa_friendly_timeseries_data: Path,
+        snapshots: pd.DataFrame,
+    ):
+        period = snapshots["investment_periods"].iloc[0]
+        subproblem_tables = dict(pypsa_friendly_tables)
+        subproblem_tables["snapshots"] = snapshots.copy()
+        investment_period_weights = pypsa_friendly_tables["investment_period_weights"]
+        subproblem_tables["investment_period_weights"] = investment_period_weights.loc[
+            investment_period_weights["period"] == period
+        ].copy()
+        for table_name in _EXPANDABLE_ASSET_COMPONENTS:
+            if table_name in pypsa_friendly_tables:
+                subproblem_tables[table_name] = pypsa_friendly_tables[table_name].copy()
+
+        network = build_pypsa_network(
+            subproblem_tables, path_to_pypsa_friendly_timeseries_data
+        )
+        model = network.model
+
+        labels = []
+        assets = []
+        for component in dict.fromkeys(_EXPANDABLE_ASSET_COMPONENTS.values()):
+            variable_name = f"{component}-p_nom"
+            if variable_name not in model.variables:
+                continue
+            variable_labels = model.variables[variable_name].labels.to_series()
+            labels.append(variable_labels.to_numpy())
+            assets += [(component, name) for name in variable_labels.index]
+        self.assets = pd.MultiIndex.from_tuples(assets, names=["component", "name"])
+        self._columns = (
+            pd.Index(model.matrices.vlabels)
+            .get_indexer(np.concatenate(labels) if labels else [])
+            .astype(np.int32)
+        )
+
+        self._highs = to_highspy(model)
+        self._highs.setOptionValue("output_flag", False)
+        self.capital_costs = pd.Series(
+            np.asarray(self._highs.getLp().col_cost_)[self._columns],
+            index=self.assets,
+        )
+        self.period = period
+        self._highs.changeColsCost(
+            len(self._columns), self._columns, np.zeros(len(self._columns))
+        )
+
+    def solve(self, capacity: pd.Series) -> tuple[float, np.ndarray]:
+        """Solves the subproblem with fixed capacities and returns its operating cost
+        and the marginal value of each asset's capacity."""
+        values = capacity.reindex(self.assets).to_numpy()
+        self._highs.changeColsBounds(len(self._columns), self._columns, values, values)
+        self._highs.run()
+        _check_optimal(self._highs, f"the Benders subproblem for {self.period}")
+        marginal_values = np.asarray(self._highs.getSolution().col_dual)[self._columns]
+        return self._highs.getInfo().objective_function_value, marginal_values
+
+
+def _check_optimal(highs: highspy.Highs, problem: str) -> None:
+    status = highs.getModelStatus()
+    if status != highspy.HighsModelStatus.kOptimal:
+        raise RuntimeError(
+            f"Solving {problem} failed with status {highs.modelStatusToString(status)}."
+            " Every subproblem needs to be feasible for any capacities, e.g. by"
+            " modelling unserved energy."
+        )
+
+
+def _subproblem_worker(
+    connection,
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    path_to_pypsa_friendly_timeseries_data: Path,
+    subproblem_snapshots: list[pd.DataFrame],
+) -> None:
+    """Builds subproblems in a worker process, then solves them for each set of
+    capacities received until None is received.
+
+    Errors are sent back to the parent process to be raised there.
+    """
+    try:
+        subproblems = [
+            _Subproblem(
+                pypsa_friendly_tables, path_to_pypsa_friendly_timeseries_data, snapshots
+            )
+            for snapshots in subproblem_snapshots
+        ]
+        connection.send(
+            [
+                (subproblem.assets, subproblem.capital_costs)
+                for subproblem in subproblems
+            ]
+        )
+        while (capacity := connection.recv()) is not None:
+            connection.send([subproblem.solve(capacity) for subproblem in subproblems])
+    except Exception as error:
+        connection.send(error)
+
+
+class _SubproblemPool:
+    """Builds the subproblems and solves them, in worker processes if `processes` is
+    greater than one.
+
+    Subproblems are assigned to workers in turn, and results are returned in the order
+    of `subproblem_snapshots`.
+    """
+
+    def __init__(
+        self,
+        pypsa_friendly_tables: dict[str : pd.DataFrame],
+        path_to_pypsa_friendly_timeseries_data: Path,
+        subproblem_snapshots: list[pd.DataFrame],
+        processes: int,
+    ):
+        self._n_subproblems = len(subproblem_snapshots)
+        self._processes = []
+        self._connections = []
+        self._local_subproblems = None
+        self._periods = [
+            snapshots["investment_periods"].iloc[0]
+            for snapshots in subproblem_snapshots
+        ]
+
+        with profile_span("pypsa_build.benders_build_subproblems"):
+            if processes <= 1:
+                self._local_subproblems = [
+                    _Subproblem(
+                        pypsa_friendly_tables,
+                        path_to_pypsa_friendly_timeseries_data,
+                        snapshots,
+                    )
+                    for snapshots in subproblem_snapshots
+                ]
+                built = [
+                    (subproblem.assets, subproblem.capital_costs)
+                    for subproblem in self._local_subproblems
+                ]
+            else:
+                context = multiprocessing.get_context("spawn")
+                n_workers = min(processes, self._n_subproblems)
+                for worker in range(n_workers):
+                    connection, worker_connection = context.Pipe()
+                    process = context.Process(
+                        target=_subproblem_worker,
+                        args=(
+                            worker_connection,
+                            pypsa_friendly_tables,
+                            path_to_pypsa_friendly_timeseries_data,
+                            subproblem_snapshots[worker::n_workers],
+                        ),
+                        daemon=True,
+                    )
+                    process.start()
+                    worker_connection.close()
+                    self._processes.append(process)
+                    self._connections.append(connection)
+                built = self._receive()
+
+        self._assets = [assets for assets, _ in built]
+        self._capital_costs = [capital_costs for _, capital_costs in built]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for connection, process in zip(self._connections, self._processes):
+            if exc_type is None:
+                connection.send(None)
+            else:
+                process.terminate()
+            process.join()
+
+    def _receive(self) -> list:
+        """Receives results from every worker and puts them back in subproblem
+        order, raising any error sent by a worker."""
+        results = [None] * self._n_subproblems
+        n_workers = len(self._connections)
+        for worker, connection in enumerate(self._connections):
+            worker_results = connection.recv()
+            if isinstance(worker_results, Exception):
+                raise worker_results
+            results[worker::n_workers] = worker_results
+        return results
+
+    def assets(self, subproblem_index: int) -> pd.MultiIndex:
+        return self._assets[subproblem_index]
+
+    def capital_costs(self) -> pd.Series:
+        """The capital cost of each asset in the full model.
+
+        Each subproblem's objective has the capital cost of its investment period, so
+        the cost is shared between the subproblems of the same investment period.
+        """
+        subproblems_per_period = pd.Series(self._periods).value_counts()
+        capital_costs = pd.concat(
+            [
+                capital_costs / subproblems_per_period[period]
+                for capital_costs, period in zip(self._capital_costs, self._periods)
+            ]
+        )
+        return capital_costs.groupby(level=["component", "name"]).sum()
+
+    def solve(self, capacity: pd.Series) -> list[tuple[float, np.ndarray]]:
+        with profile_span("pypsa_build.benders_subproblems"):
+            if self._local_subproblems is not None:
+                return [
+                    subproblem.solve(capacity) for subproblem in self._local_subproblems
+                ]
+            for connection in self._connections:
+                connection.send(capacity)
+            return self._receive()
@@ -4,6 +4,8 @@ from pathlib import Path
 import pandas as pd
 import pypsa
 
+from ispypsa.profiling import profiled
+from ispypsa.pypsa_build.snapshots import _set_timeseries, _SnapshotRegistry
 from ispypsa.translator.helpers import convert_to_numeric_if_possible
 
 
@@ -26,9 +28,8 @@ def _get_trace_data(generator_name: str, path_to_traces: Path):
 
 def _get_marginal_cost_timeseries(
     generator_id: str, path_to_marginal_costs: Path
-) -> pd.Series:
-    """Fetches marginal cost timeseries data for a generator and returns a Series
-    with marginal costs and (investment_period, snapshots) multi-index.
+) -> pd.DataFrame:
+    """Fetches marginal cost timeseries data for a generator.
 
     Args:
         generator_id: String defining the generator's id (name with special characters
@@ -36,99 +37,125 @@ def _get_marginal_cost_timeseries(
         path_to_marginal_costs: `pathlib.Path` for directory containing marginal costs.
 
     Returns:
-        Series with marginal cost timeseries data.
+        DataFrame with marginal cost timeseries data, in the columns
+        'investment_periods', 'snapshots' and 'marginal_cost'.
     """
     filename = Path(f"{generator_id}.parquet")
     trace_filepath = path_to_marginal_costs / filename
     marginal_costs = pd.read_parquet(trace_filepath)
-    marginal_costs = marginal_costs.set_index(
-        ["investment_periods", "snapshots"]
-    ).squeeze()
     return marginal_costs
 
 
-def _add_generator_to_network(
-    generator_definition: dict,
-    network: pypsa.Network,
-    path_to_solar_traces: Path,
-    path_to_wind_traces: Path,
-    path_to_marginal_costs: Path,
-) -> None:
-    """Adds a generator to a pypsa.Network based on a dict containing PyPSA Generator
-    attributes.
+def _get_availability_traces(
+    generators: pd.DataFrame, path_to_solar_traces: Path, path_to_wind_traces: Path
+) -> dict[str, pd.DataFrame]:
+    """Fetches the availability traces of the Wind and Solar generators.
 
-    If the carrier of a generator is Wind or Solar then a dynamic maximum availability
-    for the generator is applied (via `p_max_pu`). Otherwise, the nominal capacity of the
-    generator is used to apply a static maximum availability.
+    Generators with the same name apart from their build year share a trace,
+    which is only read once.
 
     Args:
-        generator_definition: dict containing pypsa Generator parameters
-        network: The `pypsa.Network` object
+        generators: `pd.DataFrame` with `PyPSA` style `Generator` attributes.
         path_to_solar_traces: `pathlib.Path` for directory containing solar traces
         path_to_wind_traces: `pathlib.Path` for directory containing wind traces
 
-    Returns: None
+    Returns:
+        dict mapping the name of each Wind and Solar generator to its trace.
     """
-    generator_definition["class_name"] = "Generator"
-
-    if generator_definition["carrier"] == "Wind":
-        trace_data = _get_trace_data(generator_definition["name"], path_to_wind_traces)
-    elif generator_definition["carrier"] == "Solar":
-        trace_data = _get_trace_data(generator_definition["name"], path_to_solar_traces)
-    else:
-        trace_data = None
-
-    if trace_data is not None:
-        trace_data = trace_data.set_index(["investment_periods", "snapshots"])
-        generator_definition["p_max_pu"] = trace_data["p_max_pu"]
-
-    if isinstance(generator_definition["marginal_cost"], str):
-        marginal_cost_timeseries = _get_marginal_cost_timeseries(
-            generator_definition["marginal_cost"], path_to_marginal_costs
-        )
-        generator_definition["marginal_cost"] = marginal_cost_timeseries
-
-    pypsa_attributes_only = {
-        key: value
-        for key, value in generator_definition.items()
-        if not key.startswith("isp_") or key == "isp_technology_type"
-    }
-    network.add(**pypsa_attributes_only)
-
-
+    traces_by_directory = {"Wind": path_to_wind_traces, "Solar": path_to_solar_traces}
+    with_traces = generators[generators["carrier"].isin(traces_by_directory.keys())]
+    read_traces = {}
+    traces = {}
+    for name, carrier in zip(with_traces["name"], with_traces["carrier"]):
+        key = (carrier, re.sub(r"_[0-9]{4}$", "", name))
+        if key not in read_traces:
+            read_traces[key] = _get_trace_data(name, traces_by_directory[carrier])
+        traces[name] = read_traces[key]
+    return traces
+
+
+@profiled
 def _add_generators_to_network(
     network: pypsa.Network,
     generators: pd.DataFrame,
     path_to_timeseries_data: Path,
+    snapshot_registry: _SnapshotRegistry | None = None,
 ) -> None:
     """Adds the generators in a pypsa-friendly `pd.DataFrame` to the `pypsa.Network`.
 
+    If the carrier of a generator is Wind or Solar then a dynamic maximum availability
+    for the generator is applied (via `p_max_pu`). Otherwise, the nominal capacity of the
+    generator is used to apply a static maximum availability. Generators with a string
+    `marginal_cost` get the marginal cost time series saved under that id.
+
+    The generators are added with one call to `network.add`, and each time series
+    attribute is then attached as one `pd.DataFrame` with a column per generator.
+
     Args:
         network: The `pypsa.Network` object
         generators:  `pd.DataFrame` with `PyPSA` style `Generator` attributes.
         path_to_timeseries_data: `pathlib.Path` that points to the directory containing
             timeseries data
+        snapshot_registry: `_SnapshotRegistry` of the network's snapshots. Built from
+            `network.snapshots` if not given.
     Returns: None
     """
+    if generators.empty:
+        return
+
+    if snapshot_registry is None:
+        snapshot_registry = _SnapshotRegistry(network.snapshots)
+
     path_to_solar_traces = path_to_timeseries_data / Path("solar_traces")
     path_to_wind_traces = path_to_timeseries_data / Path("wind_traces")
     path_to_marginal_costs = path_to_timeseries_data / Path("marginal_cost_timeseries")
 
     # This is needed because numbers can be converted to strings if the data has been saved to a csv.
     generators = convert_to_numeric_if_possible(generators, cols=["marginal_cost"])
+    has_marginal_cost_timeseries = generators["marginal_cost"].map(
+        lambda x: isinstance(x, str)
+    )
 
-    generators.apply(
-        lambda row: _add_generator_to_network(
-            row.to_dict(),
-            network,
-            path_to_solar_traces,
-            path_to_wind_traces,
-            path_to_marginal_costs,
-        ),
-        axis=1,
+    pypsa_attributes = {
+        column: generators[column].to_numpy()
+        for column in generators.columns
+        if column != "name"
+        and (not column.startswith("isp_") or column == "isp_technology_type")
+    }
+    # Generators with a marginal cost time series get PyPSA's default static value.
+    pypsa_attributes["marginal_cost"] = pd.to_numeric(
+        generators["marginal_cost"].mask(has_marginal_cost_timeseries)
+    ).to_numpy()
+    network.add("Generator", generators["name"].to_numpy(), **pypsa_attributes)
+
+    availability = snapshot_registry.stack(
+        _get_availability_traces(generators, path_to_solar_traces, path_to_wind_traces),
+        "p_max_pu",
+    )
+    _set_timeseries(network.generators_t, "p_max_pu", availability)
+
+    marginal_cost_ids = generators.loc[
+        has_marginal_cost_timeseries, ["name", "marginal_cost"]
+    ]
+    marginal_cost_traces = {
+        generator_id: _get_marginal_cost_timeseries(
+            generator_id, path_to_marginal_costs
+        )
+        for generator_id in marginal_cost_ids["marginal_cost"].unique()
+    }
+    marginal_costs = snapshot_registry.stack(
+        {
+            name: marginal_cost_traces[generator_id]
+            for name, generator_id in zip(
+                marginal_cost_ids["name"], marginal_cost_ids["marginal_cost"]
+            )
+        },
+        "marginal_cost",
     )
+    _set_timeseries(network.generators_t, "marginal_cost", marginal_costs)
 
 
+@profiled
 def _add_custom_constraint_generators_to_network(
     network: pypsa.Network, generators: pd.DataFrame
 ) -> None:
@@ -147,65 +174,36 @@ def _add_custom_constraint_generators_to_network(
     generators.apply(lambda row: network.add(**row.to_dict()), axis=1)
 
 
-def _update_generator_availability_timeseries(
-    name: str,
-    carrier: str,
-    network: pypsa.Network,
-    path_to_solar_traces: Path,
-    path_to_wind_traces: Path,
-) -> None:
-    """Updates the timeseries availability of the generator in the `pypsa.Network`.
-
-    The function is used to set up the model for operational modelling following
-    capacity expansion optimisation. Once the model snapshots are updated then the
-    generator time series also need to be updated to match.
-
-    Args:
-        name: str specifying the generators name
-        carrier: the generator fuel type
-        network: The `pypsa.Network` object
-        path_to_solar_traces: `pathlib.Path` for directory containing solar traces
-        path_to_wind_traces: `pathlib.Path` for directory containing wind traces
-
-    Returns: None
-    """
-
-    if carrier == "Wind":
-        trace_data = _get_trace_data(name, path_to_wind_traces)
-    elif carrier == "Solar":
-        trace_data = _get_trace_data(name, path_to_solar_traces)
-    else:
-        trace_data = None
-
-    if trace_data is not None:
-        trace_data = trace_data.set_index(["investment_periods", "snapshots"])
-        network.generators_t.p_max_pu[name] = trace_data.loc[:, ["p_max_pu"]]
-
-
+@profiled
 def _update_generators_availability_timeseries(
     network: pypsa.Network,
     generators: pd.DataFrame,
     path_to_timeseries_data: Path,
+    snapshot_registry: _SnapshotRegistry | None = None,
 ) -> None:
     """Updates the timeseries availability of the generators in the pypsa-friendly `
     pd.DataFrame` in the `pypsa.Network`.
 
+    The function is used to set up the model for operational modelling following
+    capacity expansion optimisation. Once the model snapshots are updated then the
+    generator time series also need to be updated to match.
+
     Args:
         network: The `pypsa.Network` object
         generators:  `pd.DataFrame` with `PyPSA` style `Generator` attributes.
         path_to_timeseries_data: `pathlib.Path` that points to the directory containing
             timeseries data
+        snapshot_registry: `_SnapshotRegistry` of the network's snapshots. Built from
+            `network.snapshots` if not given.
     Returns: None
     """
+    if snapshot_registry is None:
+        snapshot_registry = _SnapshotRegistry(network.snapshots)
+
     path_to_solar_traces = path_to_timeseries_data / Path("solar_traces")
     path_to_wind_traces = path_to_timeseries_data / Path("wind_traces")
-    generators.apply(
-        lambda row: _update_generator_availability_timeseries(
-            row["name"],
-            row["carrier"],
-            network,
-            path_to_solar_traces,
-            path_to_wind_traces,
-        ),
-        axis=1,
+    availability = snapshot_registry.stack(
+        _get_availability_traces(generators, path_to_solar_traces, path_to_wind_traces),
+        "p_max_pu",
     )
+    _set_timeseries(network.generators_t, "p_max_pu", availability)
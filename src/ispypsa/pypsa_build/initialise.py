@@ -1,7 +1,10 @@
 import pandas as pd
 import pypsa
 
+from ispypsa.profiling import profiled
 
+
+@profiled
 def _initialise_network(snapshots: pd.DataFrame) -> pypsa.Network:
     """Creates a `pypsa.Network object` with snapshots defined.
 
@@ -1,7 +1,10 @@
 import pandas as pd
 import pypsa
 
+from ispypsa.profiling import profiled
 
+
+@profiled
 def _add_links_to_network(network: pypsa.Network, links: pd.DataFrame) -> None:
     """Adds the Links defined in a pypsa-friendly input table called `"links"` to the
     `pypsa.Network` object.
@@ -0,0 +1,380 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pypsa
+from linopy.constants import TERM_DIM
+
+# Pypsa-friendly tables holding assets, and the `PyPSA` component they are added to
+# the `pypsa.Network` as.
+_ASSET_COMPONENTS = {
+    "generators": "Generator",
+    "custom_constraints_generators": "Generator",
+    "links": "Link",
+    "batteries": "StorageUnit",
+}
+
+# Component groups in the order they are reported, before any custom constraints.
+_COMPONENT_GROUPS = ["Generator", "Link", "StorageUnit", "Bus"]
+
+# Dispatch variables of each component, each with a lower and upper limit
+# constraint per active snapshot.
+_DISPATCH_VARIABLES = {
+    "Generator": ["p"],
+    "Link": ["p"],
+    "StorageUnit": ["p_dispatch", "p_store", "state_of_charge"],
+}
+
+
+def estimate_model_size(
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+) -> pd.DataFrame:
+    """Estimates the size of the linear program `build_pypsa_network` would create
+    from a set of pypsa-friendly tables, without building it.
+
+    Counts follow the multi-investment period formulation of `PyPSA`, where an asset
+    only has dispatch variables and constraints in the snapshots of the investment
+    periods it is active in, i.e. from its "build_year" until the end of its
+    "lifetime". Variable and constraint counts are exact for the components ISPyPSA
+    adds. Nonzero counts are an upper bound, as coefficients from time series, such
+    as a zero `p_max_pu` overnight for a solar generator, are dropped from the model
+    when they are zero.
+
+    Examples:
+        >>> from pathlib import Path
+        >>> from ispypsa.data_fetch import read_csvs
+        >>> from ispypsa.pypsa_build import estimate_model_size
+
+        >>> pypsa_input_tables = read_csvs(Path("pypsa_friendly_inputs_directory"))
+        >>> model_size = estimate_model_size(pypsa_input_tables)
+
+    Args:
+        pypsa_friendly_tables: dictionary of dataframes in the `PyPSA` friendly format,
+            including "snapshots".
+
+    Returns:
+        `pd.DataFrame` with the columns "kind", "group", "variables", "constraints"
+            and "nonzeros". There is a row with the kind "component" for each of
+            "Generator", "Link", "StorageUnit" and "Bus" (the nodal balance), and a
+            row with the kind "custom_constraint" for each custom constraint.
+    """
+    snapshots_per_period = (
+        pypsa_friendly_tables["snapshots"]["investment_periods"]
+        .value_counts()
+        .sort_index()
+    )
+    n_snapshots = int(snapshots_per_period.sum())
+
+    sizes = {group: np.zeros(3, dtype=np.int64) for group in _COMPONENT_GROUPS}
+    active_snapshots = {}
+    bus_terms = []
+    for table_name, component in _ASSET_COMPONENTS.items():
+        assets = pypsa_friendly_tables.get(table_name)
+        if assets is None or assets.empty:
+            continue
+        assets = _with_default_attributes(assets)
+        active = _active_in_periods(assets, snapshots_per_period.index)
+        snapshots_active = active.to_numpy() @ snapshots_per_period.to_numpy()
+        sizes[component] += _component_size(component, assets, snapshots_active)
+        active_snapshots.update(
+            {(component, name): n for name, n in zip(assets["name"], snapshots_active)}
+        )
+        bus_terms += _bus_terms(component, assets, active)
+
+    sizes["Bus"] += _nodal_balance_size(bus_terms, snapshots_per_period)
+
+    rows = [
+        {
+            "kind": "component",
+            "group": group,
+            "variables": size[0],
+            "constraints": size[1],
+            "nonzeros": size[2],
+        }
+        for group, size in sizes.items()
+    ]
+    if "custom_constraints_rhs" in pypsa_friendly_tables:
+        rows += _custom_constraints_size(
+            pypsa_friendly_tables["custom_constraints_rhs"],
+            pypsa_friendly_tables["custom_constraints_lhs"],
+            active_snapshots,
+            n_snapshots,
+        )
+
+    model_size = pd.DataFrame(rows)
+    logging.info(
+        f"Estimated model size: {model_size['variables'].sum()} variables, "
+        f"{model_size['constraints'].sum()} constraints and "
+        f"{model_size['nonzeros'].sum()} nonzeros"
+    )
+    return model_size
+
+
+def model_statistics(network: pypsa.Network) -> dict[str : pd.DataFrame]:
+    """Reports the size and coefficient ranges of the linear program of a
+    `pypsa.Network` after `network.optimize.create_model` has been called.
+
+    Examples:
+        >>> from ispypsa.pypsa_build import build_pypsa_network, model_statistics
+
+        >>> network = build_pypsa_network(
+        ... pypsa_friendly_tables=pypsa_input_tables,
+        ... path_to_pypsa_friendly_timeseries_data=Path("pypsa_friendly_timeseries_data")
+        ... )
+        >>> statistics = model_statistics(network)
+
+    Args:
+        network: `pypsa.Network` with a linopy model built.
+
+    Returns:
+        dict of `pd.DataFrame`s:
+            - "model_size": the same format as `estimate_model_size`, counted from
+                the model.
+            - "constraint_blocks": the "constraints" and "nonzeros" of each block of
+                constraints in the model, with the "group" it's counted under,
+                largest (by nonzeros) first.
+            - "coefficient_ranges": the smallest and largest absolute nonzero values
+                of the "matrix", "objective", "bounds" and "rhs" coefficients.
+    """
+    model = network.model
+    components = {component.name for component in network.components}
+
+    def group_of(block_name: str) -> str:
+        component = block_name.split("-")[0]
+        return component if component in components else block_name
+
+    variables = pd.Series(
+        {
+            name: int((variable.labels.values != -1).sum())
+            for name, variable in model.variables.items()
+        },
+        dtype="int64",
+    )
+    variables = variables.groupby(variables.index.map(group_of), sort=False).sum()
+
+    constraint_blocks = []
+    matrix_values = []
+    rhs_values = []
+    for name, constraint in model.constraints.items():
+        dims = list(constraint.labels.dims)
+        active = constraint.labels.values != -1
+        coeffs = constraint.coeffs.transpose(*dims, TERM_DIM).values
+        terms = (
+            (constraint.vars.transpose(*dims, TERM_DIM).values != -1)
+            & (coeffs != 0)
+            & active[..., None]
+        )
+        constraint_blocks.append(
+            {
+                "block": name,
+                "group": group_of(name),
+                "constraints": int(active.sum()),
+                "nonzeros": int(terms.sum()),
+            }
+        )
+        matrix_values.append(coeffs[terms])
+        rhs_values.append(np.broadcast_to(constraint.rhs.values, active.shape)[active])
+
+    constraint_blocks = pd.DataFrame(
+        constraint_blocks, columns=["block", "group", "constraints", "nonzeros"]
+    )
+    constraints = constraint_blocks.groupby("group", sort=False)[
+        ["constraints", "nonzeros"]
+    ].sum()
+
+    groups = list(
+        dict.fromkeys(
+            _COMPONENT_GROUPS + list(variables.index) + list(constraints.index)
+        )
+    )
+    model_size = pd.DataFrame({"group": groups})
+    model_size.insert(
+        0,
+        "kind",
+        np.where(
+            model_size["group"].isin(components), "component", "custom_constraint"
+        ),
+    )
+    model_size["variables"] = model_size["group"].map(variables).fillna(0)
+    model_size["constraints"] = model_size["group"].map(constraints["constraints"])
+    model_size["nonzeros"] = model_size["group"].map(constraints["nonzeros"])
+    model_size = model_size.fillna(0).astype(
+        {"variables": "int64", "constraints": "int64", "nonzeros": "int64"}
+    )
+
+    bounds = []
+    for _, variable in model.variables.items():
+        active = variable.labels.values != -1
+        bounds.append(np.broadcast_to(variable.lower.values, active.shape)[active])
+        bounds.append(np.broadcast_to(variable.upper.values, active.shape)[active])
+    objective = model.objective.expression
+    objective_values = objective.coeffs.values[objective.vars.values != -1]
+
+    coefficient_ranges = pd.DataFrame(
+        [
+            _coefficient_range("matrix", matrix_values),
+            _coefficient_range("objective", [objective_values]),
+            _coefficient_range("bounds", bounds),
+            _coefficient_range("rhs", rhs_values),
+        ]
+    )
+
+    return {
+        "model_size": model_size,
+        "constraint_blocks": constraint_blocks.sort_values(
+            "nonzeros", ascending=False, ignore_index=True
+        ),
+        "coefficient_ranges": coefficient_ranges,
+    }
+
+
+def _coefficient_range(coefficient: str, values: list[np.ndarray]) -> dict:
+    values = np.abs(np.concatenate([np.ravel(v) for v in values] + [np.array([])]))
+    values = values[np.isfinite(values) & (values != 0)]
+    if values.size == 0:
+        return {"coefficient": coefficient, "min": np.nan, "max": np.nan}
+    return {"coefficient": coefficient, "min": values.min(), "max": values.max()}
+
+
+def _with_default_attributes(assets: pd.DataFrame) -> pd.DataFrame:
+    """Fills in the `PyPSA` defaults of the attributes that change the model size."""
+    defaults = {
+        "p_nom_extendable": False,
+        "p_nom_max": np.inf,
+        "p_min_pu": 0.0,
+        "build_year": 0,
+        "lifetime": np.inf,
+        "cyclic_state_of_charge": False,
+    }
+    assets = assets.copy()
+    for attribute, default in defaults.items():
+        if attribute not in assets.columns:
+            assets[attribute] = default
+        assets[attribute] = assets[attribute].fillna(default)
+    assets["p_nom_extendable"] = assets["p_nom_extendable"].astype(bool)
+    return assets
+
+
+def _active_in_periods(assets: pd.DataFrame, periods: pd.Index) -> pd.DataFrame:
+    """Whether each asset is active in each investment period, as `PyPSA` decides
+    it: from the build year until the end of the asset's lifetime."""
+    build_year = assets["build_year"].to_numpy(dtype="float64")[:, None]
+    end_year = build_year + assets["lifetime"].to_numpy(dtype="float64")[:, None]
+    period_years = periods.to_numpy(dtype="float64")[None, :]
+    return pd.DataFrame(
+        (build_year <= period_years) & (period_years < end_year),
+        index=assets.index,
+        columns=periods,
+    )
+
+
+def _component_size(
+    component: str, assets: pd.DataFrame, snapshots_active: np.ndarray
+) -> np.ndarray:
+    """Counts the variables, constraints and nonzeros of a table of assets."""
+    extendable = assets["p_nom_extendable"].to_numpy()
+    n_extendable = int(extendable.sum())
+    n_limited = int((extendable & np.isfinite(assets["p_nom_max"].to_numpy())).sum())
+    fixed_snapshots = int(snapshots_active[~extendable].sum())
+    extendable_snapshots = int(snapshots_active[extendable].sum())
+    n_dispatch = len(_DISPATCH_VARIABLES[component])
+
+    variables = n_dispatch * (fixed_snapshots + extendable_snapshots) + n_extendable
+    # Lower and upper limits on each dispatch variable, plus the p_nom limits.
+    constraints = 2 * n_dispatch * (fixed_snapshots + extendable_snapshots)
+    constraints += n_extendable + n_limited
+    # Fixed limits only have the dispatch variable, extendable upper limits also have
+    # p_nom, as do extendable lower limits with a nonzero p_min_pu.
+    nonzeros = 2 * n_dispatch * fixed_snapshots + 3 * n_dispatch * extendable_snapshots
+    if component != "StorageUnit":
+        has_min = extendable & (assets["p_min_pu"].to_numpy() != 0)
+        nonzeros += int(snapshots_active[has_min].sum())
+    nonzeros += n_extendable + n_limited
+
+    if component == "StorageUnit":
+        # The energy balance links the state of charge to the previous snapshot,
+        # except in the first active snapshot of non-cyclic storage.
+        n_active = int(snapshots_active.sum())
+        first_snapshots = int(
+            ((snapshots_active > 0) & ~assets["cyclic_state_of_charge"].astype(bool))
+            .to_numpy()
+            .sum()
+        )
+        constraints += n_active
+        nonzeros += 4 * n_active - first_snapshots
+
+    return np.array([variables, constraints, nonzeros], dtype=np.int64)
+
+
+def _bus_terms(
+    component: str, assets: pd.DataFrame, active: pd.DataFrame
+) -> list[pd.DataFrame]:
+    """The periods each bus has a dispatch variable of an asset in, one row per
+    variable appearing in the bus's nodal balance."""
+    if component == "Link":
+        bus_columns, terms_per_bus = ["bus0", "bus1"], 1
+    elif component == "StorageUnit":
+        bus_columns, terms_per_bus = ["bus"], 2
+    else:
+        bus_columns, terms_per_bus = ["bus"], 1
+    return [
+        active.set_index(assets[bus_column]).rename_axis("bus")
+        for bus_column in bus_columns
+        for _ in range(terms_per_bus)
+    ]
+
+
+def _nodal_balance_size(
+    bus_terms: list[pd.DataFrame], snapshots_per_period: pd.Series
+) -> np.ndarray:
+    """Counts the nodal balance constraints, one per bus and snapshot with at least
+    one active variable, and their nonzeros."""
+    if not bus_terms:
+        return np.zeros(3, dtype=np.int64)
+    terms = pd.concat(bus_terms).astype("int64").groupby(level="bus").sum()
+    snapshots = snapshots_per_period.to_numpy()
+    constraints = int(((terms.to_numpy() > 0) @ snapshots).sum())
+    nonzeros = int((terms.to_numpy() @ snapshots).sum())
+    return np.array([0, constraints, nonzeros], dtype=np.int64)
+
+
+def _custom_constraints_size(
+    custom_constraints_rhs: pd.DataFrame,
+    custom_constraints_lhs: pd.DataFrame,
+    active_snapshots: dict[tuple[str, str], int],
+    n_snapshots: int,
+) -> list[dict]:
+    """Counts the constraints and nonzeros of each custom constraint.
+
+    A constraint with dispatch (`p`) terms has a row per snapshot, with the `p_nom`
+    terms repeated in every row. A constraint with only `p_nom` terms is one row.
+    Terms for components that `_add_custom_constraints` doesn't add are left out.
+    """
+    lhs = custom_constraints_lhs.loc[
+        custom_constraints_lhs["component"].isin(["Generator", "Link"])
+    ]
+    rows = []
+    for constraint_name in custom_constraints_rhs["constraint_name"]:
+        terms = lhs.loc[lhs["constraint_name"] == constraint_name]
+        dispatch = terms.loc[terms["attribute"] == "p"]
+        n_capacity_terms = int((terms["attribute"] == "p_nom").sum())
+        if dispatch.empty:
+            constraints, nonzeros = 1, n_capacity_terms
+        else:
+            constraints = n_snapshots
+            nonzeros = n_capacity_terms * n_snapshots + sum(
+                active_snapshots.get((component, name), 0)
+                for component, name in zip(
+                    dispatch["component"], dispatch["variable_name"]
+                )
+            )
+        rows.append(
+            {
+                "kind": "custom_constraint",
+                "group": constraint_name,
+                "variables": 0,
+                "constraints": constraints,
+                "nonzeros": nonzeros,
+            }
+        )
+    return rows
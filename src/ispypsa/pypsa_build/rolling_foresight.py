@@ -0,0 +1,312 @@
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pypsa
+
+from ispypsa.profiling import profile_span, profiled
+from ispypsa.pypsa_build.build import (
+    _build_network_components,
+    _create_model,
+    build_pypsa_network,
+)
+
+# Pypsa-friendly tables holding assets that can be expanded, and the `pypsa.Network`
+# attribute their solved capacities are read back from.
+_EXPANDABLE_ASSET_TABLES = {
+    "generators": "generators",
+    "batteries": "storage_units",
+    "links": "links",
+    "custom_constraints_generators": "generators",
+}
+
+
+@profiled
+def solve_with_rolling_foresight(
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    path_to_pypsa_friendly_timeseries_data: Path,
+    solver_name: str = "highs",
+    foresight_window: int = 1,
+    compare_to_perfect_foresight: bool = False,
+) -> tuple[pypsa.Network, pd.DataFrame]:
+    """Solves the capacity expansion model with myopic (rolling) foresight.
+
+    Rather than optimising investment across every investment period at once, the
+    model is solved for a window of `foresight_window` investment periods at a time,
+    starting from the first period. After each window is solved, the capacity of
+    assets built in or before the window's first period is fixed, and the window
+    moves forward by one period. Fixed assets stay extendable with `p_nom_min` and
+    `p_nom_max` set to the solved capacity, so custom constraints that reference
+    their `p_nom` variables are built in the same way as for the full model.
+
+    Once every period has been committed, the network for all investment periods is
+    built with every asset fixed, and dispatched one investment period at a time, so
+    no solve covers more than `foresight_window` periods. This network is returned
+    so results can be extracted as for a perfect foresight solve.
+
+    With `compare_to_perfect_foresight`, the full model is also solved with perfect
+    foresight, and its cost for each period is added to the report. This solve covers
+    every investment period at once, so it needs as much memory as a perfect
+    foresight solve.
+
+    Examples:
+        Peform required imports.
+        >>> from pathlib import Path
+        >>> from ispypsa.data_fetch import read_csvs
+        >>> from ispypsa.pypsa_build import solve_with_rolling_foresight
+
+        Read in PyPSA friendly tables from CSV.
+        >>> pypsa_input_tables = read_csvs(Path("pypsa_friendly_inputs_directory"))
+
+        >>> network, foresight_report = solve_with_rolling_foresight(
+        ... pypsa_friendly_tables=pypsa_input_tables,
+        ... path_to_pypsa_friendly_timeseries_data=Path("pypsa_friendly_timeseries_data"),
+        ... foresight_window=2,
+        ... )
+
+    Args:
+        pypsa_friendly_tables: dictionary of dataframes in the `PyPSA` friendly format.
+        path_to_pypsa_friendly_timeseries_data: `Path` to `PyPSA` friendly time series
+            data.
+        solver_name: name of the solver passed to `network.optimize.solve_model`.
+        foresight_window: number of investment periods the model can see ahead when
+            making investment decisions, including the period being committed.
+        compare_to_perfect_foresight: if True, also solve the model with perfect
+            foresight and report its cost for each period.
+
+    Returns:
+        tuple[pypsa.Network, pd.DataFrame]: The solved `pypsa.Network` covering every
+            investment period, and a `pd.DataFrame` with the columns
+            "investment_period", "window_end", "window_objective" and "system_cost".
+            "window_objective" is the objective value of the solve that committed the
+            period and "system_cost" is the period's cost in the dispatched network.
+            With `compare_to_perfect_foresight`, the columns
+            "perfect_foresight_cost", the period's cost in the perfect foresight
+            solve, and "cost_difference", "system_cost" less
+            "perfect_foresight_cost", are added.
+
+    Raises:
+        RuntimeError: If a solve does not finish with an optimal solution.
+    """
+    investment_periods = sorted(
+        pypsa_friendly_tables["investment_period_weights"]["period"]
+    )
+    committed_capacity = {}
+    window_objectives = []
+
+    for i, period in enumerate(investment_periods):
+        window = investment_periods[i : i + foresight_window]
+        logging.info(f"Solving investment periods {window} to commit {period}")
+        network = _solve_window(
+            pypsa_friendly_tables,
+            path_to_pypsa_friendly_timeseries_data,
+            window,
+            committed_capacity,
+            solver_name,
+        )
+        committed_capacity = _commit_capacity(
+            network, pypsa_friendly_tables, period, committed_capacity
+        )
+        window_objectives.append(
+            {
+                "investment_period": period,
+                "window_end": window[-1],
+                "window_objective": network.objective,
+            }
+        )
+
+    network = _dispatch_by_period(
+        pypsa_friendly_tables,
+        path_to_pypsa_friendly_timeseries_data,
+        investment_periods,
+        committed_capacity,
+        solver_name,
+    )
+
+    foresight_report = pd.DataFrame(window_objectives)
+    foresight_report["system_cost"] = foresight_report["investment_period"].map(
+        _system_cost_by_period(network)
+    )
+    if compare_to_perfect_foresight:
+        logging.info("Solving all investment periods with perfect foresight")
+        perfect_foresight_network = _solve_window(
+            pypsa_friendly_tables,
+            path_to_pypsa_friendly_timeseries_data,
+            investment_periods,
+            {},
+            solver_name,
+        )
+        foresight_report["perfect_foresight_cost"] = foresight_report[
+            "investment_period"
+        ].map(_system_cost_by_period(perfect_foresight_network))
+        foresight_report["cost_difference"] = (
+            foresight_report["system_cost"] - foresight_report["perfect_foresight_cost"]
+        )
+    return network, foresight_report
+
+
+def _solve_window(
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    path_to_pypsa_friendly_timeseries_data: Path,
+    window: list[int],
+    committed_capacity: dict[str, pd.Series],
+    solver_name: str,
+) -> pypsa.Network:
+    """Builds and solves the network for a window of investment periods."""
+    window_tables = _restrict_tables_to_window(
+        pypsa_friendly_tables, window, committed_capacity
+    )
+    network = build_pypsa_network(window_tables, path_to_pypsa_friendly_timeseries_data)
+    # Never use network.optimize() as this will remove custom constraints.
+    with profile_span("pypsa.solve_model", solver=solver_name, window=str(window)):
+        status, condition = network.optimize.solve_model(solver_name=solver_name)
+    if status != "ok":
+        raise RuntimeError(
+            f"Solving investment periods {window} failed with status {status} "
+            f"and termination condition {condition}."
+        )
+    return network
+
+
+def _dispatch_by_period(
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    path_to_pypsa_friendly_timeseries_data: Path,
+    investment_periods: list[int],
+    committed_capacity: dict[str, pd.Series],
+    solver_name: str,
+) -> pypsa.Network:
+    """Builds the network for every investment period with the committed capacities
+    fixed, and solves its dispatch one investment period at a time.
+
+    With every capacity fixed the periods don't share any variables, so solving them
+    separately gives the same dispatch as one solve over all periods. The network's
+    objective is the sum of the periods' objectives.
+    """
+    tables = _restrict_tables_to_window(
+        pypsa_friendly_tables, investment_periods, committed_capacity
+    )
+    network = _build_network_components(tables, path_to_pypsa_friendly_timeseries_data)
+    objective, objective_constant = 0.0, 0.0
+    for period in investment_periods:
+        snapshots = network.snapshots[
+            network.snapshots.get_level_values("period") == period
+        ]
+        _create_model(network, tables, snapshots)
+        with profile_span("pypsa.solve_model", solver=solver_name, period=period):
+            status, condition = network.optimize.solve_model(solver_name=solver_name)
+        if status != "ok":
+            raise RuntimeError(
+                f"Dispatching investment period {period} failed with status {status} "
+                f"and termination condition {condition}."
+            )
+        objective += network.objective
+        objective_constant += network.objective_constant
+    network._objective = objective
+    network._objective_constant = objective_constant
+    return network
+
+
+def _restrict_tables_to_window(
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    window: list[int],
+    committed_capacity: dict[str, pd.Series],
+) -> dict[str : pd.DataFrame]:
+    """Returns a copy of the pypsa-friendly tables limited to a window of investment
+    periods.
+
+    Snapshots and investment period weights outside the window are dropped. Assets
+    with committed capacity are fixed at that capacity, and assets with a build year
+    after the window can't be built, so they can't be used to meet custom constraints.
+    """
+    window_tables = dict(pypsa_friendly_tables)
+
+    snapshots = pypsa_friendly_tables["snapshots"]
+    window_tables["snapshots"] = snapshots.loc[
+        snapshots["investment_periods"].isin(window)
+    ].copy()
+
+    investment_period_weights = pypsa_friendly_tables["investment_period_weights"]
+    window_tables["investment_period_weights"] = investment_period_weights.loc[
+        investment_period_weights["period"].isin(window)
+    ].copy()
+
+    for table_name in _EXPANDABLE_ASSET_TABLES:
+        if table_name in pypsa_friendly_tables:
+            window_tables[table_name] = _fix_capacity(
+                pypsa_friendly_tables[table_name],
+                committed_capacity.get(table_name),
+                window[-1],
+            )
+
+    return window_tables
+
+
+def _fix_capacity(
+    assets: pd.DataFrame, committed_capacity: pd.Series | None, last_period: int
+) -> pd.DataFrame:
+    """Sets `p_nom_min` and `p_nom_max` of extendable assets to their committed
+    capacity, and `p_nom_max` to zero for extendable assets built after `last_period`.
+    """
+    assets = assets.copy()
+    if "p_nom_extendable" not in assets.columns:
+        return assets
+
+    if "p_nom_min" not in assets.columns:
+        assets["p_nom_min"] = 0.0
+    if "p_nom_max" not in assets.columns:
+        assets["p_nom_max"] = np.inf
+
+    extendable = assets["p_nom_extendable"].astype(bool)
+
+    if committed_capacity is not None:
+        capacity = assets["name"].map(committed_capacity)
+        fixed = extendable & capacity.notna()
+        assets.loc[fixed, "p_nom_min"] = capacity[fixed]
+        assets.loc[fixed, "p_nom_max"] = capacity[fixed]
+
+    built_after_window = extendable & (_build_years(assets) > last_period)
+    assets.loc[built_after_window, "p_nom_max"] = 0.0
+
+    return assets
+
+
+def _commit_capacity(
+    network: pypsa.Network,
+    pypsa_friendly_tables: dict[str : pd.DataFrame],
+    period: int,
+    committed_capacity: dict[str, pd.Series],
+) -> dict[str, pd.Series]:
+    """Adds the solved capacity of extendable assets built in or before `period` to
+    the committed capacities.
+
+    Assets without a build year are treated as PyPSA does, as built before the first
+    investment period, and are committed with the first period.
+    """
+    committed_capacity = dict(committed_capacity)
+    for table_name, component in _EXPANDABLE_ASSET_TABLES.items():
+        assets = pypsa_friendly_tables.get(table_name)
+        if assets is None or "p_nom_extendable" not in assets.columns:
+            continue
+        to_commit = assets.loc[
+            assets["p_nom_extendable"].astype(bool) & (_build_years(assets) <= period),
+            "name",
+        ]
+        capacity = getattr(network, component).loc[to_commit, "p_nom_opt"]
+        previous = committed_capacity.get(table_name)
+        if previous is not None:
+            capacity = previous.combine_first(capacity)
+        committed_capacity[table_name] = capacity
+    return committed_capacity
+
+
+def _build_years(assets: pd.DataFrame) -> pd.Series:
+    if "build_year" not in assets.columns:
+        return pd.Series(0, index=assets.index)
+    return assets["build_year"].fillna(0)
+
+
+def _system_cost_by_period(network: pypsa.Network) -> pd.Series:
+    """Capital and operational cost of a solved network summed for each investment
+    period, including the objective weighting of the period."""
+    return network.statistics.system_cost().sum()
@@ -2,7 +2,10 @@ from pathlib import Path
 
 import pypsa
 
+from ispypsa.profiling import profiled
 
+
+@profiled
 def save_pypsa_network(
     network: pypsa.Network, save_directory: Path, save_name: str
 ) -> None:
@@ -0,0 +1,186 @@
+import logging
+
+import linopy
+import numpy as np
+import pandas as pd
+import pypsa
+import xarray as xr
+
+from ispypsa.pypsa_build.model_size import _coefficient_range
+
+# Matrix coefficients smaller than this, in absolute value, are treated as zero by
+# solvers (HiGHS's default small_matrix_value), so they are left out of the scaling.
+_SMALL_MATRIX_COEFFICIENT = 1e-9
+
+# Ratio of the largest to smallest constraint matrix coefficient above which the
+# model is still considered poorly conditioned after scaling.
+_MAX_MATRIX_RANGE = 1e9
+
+
+def scale_model(network: pypsa.Network, iterations: int = 10) -> pd.DataFrame:
+    """Scales the rows, columns and objective of a `pypsa.Network`'s linopy model to
+    bring its coefficients closer to one, and reports the coefficient ranges before
+    and after scaling.
+
+    Scaling factors are found by geometric mean scaling of the constraint matrix:
+    alternately choosing the row and column factors which minimise the sum of squared
+    log2 coefficients. Factors are rounded to powers of two, so scaling adds no
+    rounding error. The objective is then scaled so its coefficients have a geometric
+    mean near one. Matrix coefficients smaller than 1e-9, which solvers treat as
+    zero, are left out of the scaling and the reported ranges, and a warning gives
+    their number.
+
+    Factors are set as linopy's solver-side scaling, so only the problem passed to the
+    solver is scaled. Linopy unscales the solution and duals as they are read back,
+    and `network.optimize.solve_model` assigns them to the network as usual. If the
+    constraint matrix coefficients still span more than nine orders of magnitude
+    after scaling, a warning recommends changing the units of the inputs (e.g. GW
+    instead of MW, or $M instead of $).
+
+    Examples:
+        >>> from ispypsa.pypsa_build import build_pypsa_network, scale_model
+
+        >>> network = build_pypsa_network(pypsa_friendly_tables, path_to_timeseries)
+        >>> coefficient_ranges = scale_model(network)
+        >>> network.optimize.solve_model(solver_name="highs")
+
+    Args:
+        network: `pypsa.Network` with a linopy model created, e.g. by
+            `build_pypsa_network`.
+        iterations: number of alternating row and column passes used to compute
+            the scaling factors.
+
+    Returns:
+        `pd.DataFrame` with the columns "coefficient", "unscaled_min",
+            "unscaled_max", "scaled_min" and "scaled_max", with a row for each of
+            the "matrix", "objective", "bounds" and "rhs" coefficients. Ranges are
+            of the absolute value of nonzero, finite coefficients.
+    """
+    # pypsa installs linopy itself, so an older linopy is possible without the
+    # `solvers` extra.
+    if not hasattr(linopy.Variable, "scaling"):
+        raise ImportError(
+            "scale_model requires linopy>=0.10.0 for solver-side scaling, but "
+            f"linopy {linopy.__version__} is installed."
+        )
+    model = network.model
+    matrices = model.matrices
+    matrix = matrices.A.tocoo()
+    small = np.abs(matrix.data) < _SMALL_MATRIX_COEFFICIENT
+    if (small & (matrix.data != 0)).any():
+        logging.warning(
+            f"{int((small & (matrix.data != 0)).sum())} constraint matrix "
+            f"coefficients are smaller than {_SMALL_MATRIX_COEFFICIENT:.0e} and will "
+            "be treated as zero by the solver."
+        )
+    rows, columns, values = matrix.row[~small], matrix.col[~small], matrix.data[~small]
+
+    row_scaling, column_scaling = _geometric_scaling(
+        rows, columns, values, matrix.shape, iterations
+    )
+    objective = np.abs(matrices.c * column_scaling)
+    objective = objective[objective != 0]
+    objective_scaling = (
+        2.0 ** -np.round(np.log2(objective).mean()) if objective.size else 1.0
+    )
+
+    row_positions = model.constraints.label_index.label_to_pos
+    for _, constraint in model.constraints.items():
+        constraint.scaling = _scaling_for_labels(
+            constraint.labels, row_positions, row_scaling
+        )
+    # linopy represents a scaled variable as `scaling * variable`, which divides its
+    # column by `scaling`, i.e. the inverse of the column factor.
+    column_positions = model.variables.label_index.label_to_pos
+    for _, variable in model.variables.items():
+        variable.scaling = _scaling_for_labels(
+            variable.labels, column_positions, 1.0 / column_scaling
+        )
+    model.objective.scaling = float(objective_scaling)
+
+    unscaled = [
+        _coefficient_range("matrix", [values]),
+        _coefficient_range("objective", [matrices.c]),
+        _coefficient_range("bounds", [matrices.lb, matrices.ub]),
+        _coefficient_range("rhs", [matrices.b]),
+    ]
+    scaled = [
+        _coefficient_range(
+            "matrix", [row_scaling[rows] * values * column_scaling[columns]]
+        ),
+        _coefficient_range(
+            "objective", [matrices.c * column_scaling * objective_scaling]
+        ),
+        _coefficient_range(
+            "bounds", [matrices.lb / column_scaling, matrices.ub / column_scaling]
+        ),
+        _coefficient_range("rhs", [matrices.b * row_scaling]),
+    ]
+    coefficient_ranges = pd.DataFrame(
+        {
+            "coefficient": [r["coefficient"] for r in unscaled],
+            "unscaled_min": [r["min"] for r in unscaled],
+            "unscaled_max": [r["max"] for r in unscaled],
+            "scaled_min": [r["min"] for r in scaled],
+            "scaled_max": [r["max"] for r in scaled],
+        }
+    )
+
+    for _, row in coefficient_ranges.iterrows():
+        logging.info(
+            f"Model {row['coefficient']} coefficient range "
+            f"[{row['unscaled_min']:.1e}, {row['unscaled_max']:.1e}] scaled to "
+            f"[{row['scaled_min']:.1e}, {row['scaled_max']:.1e}]"
+        )
+    matrix_range = coefficient_ranges.set_index("coefficient").loc["matrix"]
+    if matrix_range["scaled_max"] > _MAX_MATRIX_RANGE * matrix_range["scaled_min"]:
+        logging.warning(
+            "Constraint matrix coefficients span "
+            f"[{matrix_range['scaled_min']:.1e}, {matrix_range['scaled_max']:.1e}] "
+            "after scaling. Consider changing the units of the inputs, e.g. GW "
+            "instead of MW or $M instead of $, to improve the model's conditioning."
+        )
+
+    return coefficient_ranges
+
+
+def _geometric_scaling(
+    rows: np.ndarray,
+    columns: np.ndarray,
+    values: np.ndarray,
+    shape: tuple[int, int],
+    iterations: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row and column factors, as powers of two, which minimise the sum of squared
+    log2 coefficients of a scaled matrix given in coordinate format. Rows and columns
+    without coefficients keep a factor of one."""
+    nonzero = values != 0
+    rows, columns = rows[nonzero], columns[nonzero]
+    logs = np.log2(np.abs(values[nonzero]))
+    n_rows, n_columns = shape
+    row_counts = np.maximum(np.bincount(rows, minlength=n_rows), 1)
+    column_counts = np.maximum(np.bincount(columns, minlength=n_columns), 1)
+
+    row_logs = np.zeros(n_rows)
+    column_logs = np.zeros(n_columns)
+    for _ in range(iterations):
+        row_logs = (
+            -np.bincount(rows, logs + column_logs[columns], minlength=n_rows)
+            / row_counts
+        )
+        column_logs = (
+            -np.bincount(columns, logs + row_logs[rows], minlength=n_columns)
+            / column_counts
+        )
+    return 2.0 ** np.round(row_logs), 2.0 ** np.round(column_logs)
+
+
+def _scaling_for_labels(
+    labels: xr.DataArray, label_to_pos: np.ndarray, scaling: np.ndarray
+) -> xr.DataArray:
+    """Looks up the scaling of each label in an array of linopy variable or
+    constraint labels, with a scaling of one for masked labels (-1)."""
+    values = np.ones(labels.shape)
+    active = labels.values != -1
+    values[active] = scaling[label_to_pos[labels.values[active]]]
+    return xr.DataArray(values, coords=labels.coords, dims=labels.dims)
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+
+class _SnapshotRegistry:
+    """The network's snapshot index, shared by every time series added to it.
+
+    The translator writes each trace with the same (investment_periods, snapshots)
+    rows, in the same order, as the network's snapshots. Rather than building a
+    MultiIndex per trace with `set_index` and aligning it with the snapshots,
+    the registry checks each trace's rows against the snapshots position by
+    position and stacks the traces' values into one array, indexed by the
+    network's snapshots.
+
+    Args:
+        snapshots: The `pypsa.Network`'s snapshots, a (period, timestep)
+            MultiIndex.
+    """
+
+    def __init__(self, snapshots: pd.Index) -> None:
+        self.index = snapshots
+        if isinstance(snapshots, pd.MultiIndex) and snapshots.nlevels == 2:
+            self._periods = snapshots.get_level_values(0).to_numpy()
+            self._timesteps = snapshots.get_level_values(1).to_numpy()
+        else:
+            self._periods = None
+            self._timesteps = None
+
+    def is_aligned(self, trace: pd.DataFrame) -> bool:
+        """Whether a trace's rows match the snapshots, position by position.
+
+        Args:
+            trace: `pd.DataFrame` with the columns 'investment_periods' and
+                'snapshots'.
+
+        Returns:
+            bool, True if row i of the trace is snapshot i for every snapshot.
+        """
+        if self._periods is None or len(trace) != len(self.index):
+            return False
+        return np.array_equal(
+            trace["investment_periods"].to_numpy(), self._periods
+        ) and np.array_equal(trace["snapshots"].to_numpy(), self._timesteps)
+
+    def stack(self, traces: dict[str, pd.DataFrame], column: str) -> pd.DataFrame:
+        """Stacks one column of several traces into a `pd.DataFrame`.
+
+        Traces aligned with the snapshots (see `is_aligned`) are copied in by
+        position. Others, e.g. with their rows in a different order, are
+        matched to the snapshots by their (investment_periods, snapshots)
+        values.
+
+        Args:
+            traces: dict mapping each column name of the result to a
+                `pd.DataFrame` with the columns 'investment_periods',
+                'snapshots' and `column`.
+            column: Name of the column with the time series values.
+
+        Returns:
+            `pd.DataFrame` with one column per trace, indexed by the snapshots.
+
+        Raises:
+            ValueError: If a trace doesn't have a value for every snapshot.
+        """
+        values = np.empty((len(self.index), len(traces)))
+        for position, (name, trace) in enumerate(traces.items()):
+            if self.is_aligned(trace):
+                values[:, position] = trace[column].to_numpy()
+            else:
+                values[:, position] = self._values_by_label(name, trace, column)
+        return pd.DataFrame(values, index=self.index, columns=list(traces))
+
+    def _values_by_label(
+        self, name: str, trace: pd.DataFrame, column: str
+    ) -> np.ndarray:
+        series = trace.set_index(["investment_periods", "snapshots"])[column]
+        values = series.reindex(self.index)
+        missing = values.isna() & ~self.index.isin(series.index)
+        if missing.any():
+            raise ValueError(
+                f"The {column} time series for {name} has no values for "
+                f"{missing.sum()} of the network's snapshots."
+            )
+        return values.to_numpy()
+
+
+def _set_timeseries(
+    network_timeseries: dict, attribute: str, timeseries: pd.DataFrame
+) -> None:
+    """Sets an attribute's time series for several components at once.
+
+    Columns for components that already have a time series are overwritten in
+    place. The rest are joined on in one step, rather than inserted one by one.
+
+    Args:
+        network_timeseries: The component's time series in the `pypsa.Network`,
+            e.g. `network.generators_t`.
+        attribute: Name of the time series attribute, e.g. 'p_max_pu'.
+        timeseries: `pd.DataFrame` indexed by the network's snapshots with a
+            column per component.
+    """
+    if timeseries.empty:
+        return
+    existing = network_timeseries[attribute]
+    is_new = ~timeseries.columns.isin(existing.columns)
+    if not is_new.all():
+        existing[timeseries.columns[~is_new]] = timeseries.loc[:, ~is_new]
+    if is_new.any():
+        combined = pd.concat([existing, timeseries.loc[:, is_new]], axis=1)
+        combined.columns.name = existing.columns.name
+        network_timeseries[attribute] = combined
@@ -1,6 +1,8 @@
 import pandas as pd
 import pypsa
 
+from ispypsa.profiling import profiled
+
 
 def _add_battery_to_network(
     network: pypsa.Network,
@@ -25,6 +27,7 @@ def _add_battery_to_network(
     network.add(**pypsa_attributes_only)
 
 
+@profiled
 def _add_batteries_to_network(
     network: pypsa.Network,
     batteries: pd.DataFrame,
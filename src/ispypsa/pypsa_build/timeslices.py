@@ -0,0 +1,228 @@
+import numpy as np
+import pandas as pd
+import pypsa
+
+from ispypsa.profiling import profiled
+from ispypsa.pypsa_build.snapshots import _set_timeseries
+
+# Month-day slots are numbered (month - 1) * 31 + (day - 1): gaps for short
+# months don't matter (no snapshot falls in them) and the numbering keeps
+# month-days in calendar order without any leap year handling.
+_MONTH_DAY_SLOTS = 12 * 31
+
+
+class _TimesliceCodes:
+    """The timeslice active in each snapshot, as a compact code per region.
+
+    Snapshots are placed in a model year by a binary search over the years'
+    [year_start, year_end) ranges, and each (region, model year) gets a lookup
+    table from month-day slot to timeslice code. A snapshot's code is then one
+    fancy-indexing step, `lookup[year, slot]`, so the work is done once per
+    snapshot set for every link that uses the timeslices rather than once per
+    link. Code -1 marks snapshots no timeslice of the region covers: model years
+    without windows and days the windows leave out.
+
+    A snapshot is placed by its own timestamp, as investment periods are (see
+    `ispypsa.translator.snapshots._add_investment_periods`).
+
+    Args:
+        snapshots: The `pypsa.Network`'s snapshots, a (period, timestep)
+            MultiIndex.
+        timeslice_calendar: `pd.DataFrame` with the columns 'year_start',
+            'year_end', 'timeslice_id', 'start_month_day' and 'end_month_day'
+            (see `ispypsa.translator.timeslices`). Windows are
+            [start_month_day, end_month_day) and wrap past the year end when the
+            end is not after the start.
+    """
+
+    def __init__(self, snapshots: pd.Index, timeslice_calendar: pd.DataFrame) -> None:
+        timesteps = pd.DatetimeIndex(snapshots.get_level_values(-1))
+        calendar = timeslice_calendar.assign(
+            region=timeslice_calendar["timeslice_id"].str.split("_").str[0],
+            year_start=pd.to_datetime(timeslice_calendar["year_start"]),
+            year_end=pd.to_datetime(timeslice_calendar["year_end"]),
+        )
+        years = calendar.loc[:, ["year_start", "year_end"]].drop_duplicates()
+        years = years.sort_values("year_start").reset_index(drop=True)
+
+        years["year_position"] = np.arange(len(years))
+        calendar = calendar.merge(years, on=["year_start", "year_end"])
+
+        year_position = (
+            np.searchsorted(years["year_start"].to_numpy(), timesteps, side="right") - 1
+        )
+        in_a_year = year_position >= 0
+        in_a_year[in_a_year] = (
+            timesteps[in_a_year]
+            < years["year_end"].to_numpy()[year_position[in_a_year]]
+        )
+        # Snapshots outside every model year read the lookup's last row, which no
+        # window fills.
+        year_position = np.where(in_a_year, year_position, len(years))
+        slot = (timesteps.month.to_numpy() - 1) * 31 + timesteps.day.to_numpy() - 1
+
+        self.index = snapshots
+        self.timeslices = {}
+        self.codes = {}
+        for region, windows in calendar.groupby("region"):
+            self.timeslices[region] = pd.Index(sorted(windows["timeslice_id"].unique()))
+            lookup = _month_day_lookup(
+                windows, self.timeslices[region], n_years=len(years)
+            )
+            self.codes[region] = lookup[year_position, slot]
+
+
+def _month_day_lookup(
+    windows: pd.DataFrame, timeslices: pd.Index, n_years: int
+) -> np.ndarray:
+    """Builds a (model year, month-day slot) -> timeslice code table for a region.
+
+    The table has one row per model year plus a last row of -1 for snapshots
+    outside every model year.
+
+    I/O Example:
+        windows (year_position 0 only):
+            timeslice_id          start_month_day  end_month_day
+            qld_summer_typical    10-01            04-01
+            qld_winter_reference  04-01            10-01
+
+        timeslices = ["qld_summer_typical", "qld_winter_reference"]
+
+        returns row 0: slots for 01-01 .. 03-31 -> 0, 04-01 .. 09-30 -> 1,
+            10-01 .. 12-31 -> 0; row 1: all -1.
+    """
+    lookup = np.full((n_years + 1, _MONTH_DAY_SLOTS), -1, dtype=np.int16)
+    codes = timeslices.get_indexer(windows["timeslice_id"])
+    starts = _month_day_slots(windows["start_month_day"])
+    ends = _month_day_slots(windows["end_month_day"])
+    for year_position, code, start, end in zip(
+        windows["year_position"], codes, starts, ends
+    ):
+        if start < end:
+            lookup[year_position, start:end] = code
+        else:
+            # The window wraps past the year end; a window ending where it
+            # starts covers the whole year.
+            lookup[year_position, start:] = code
+            lookup[year_position, :end] = code
+    return lookup
+
+
+def _month_day_slots(month_days: pd.Series) -> np.ndarray:
+    """Converts "%m-%d" strings to month-day slots.
+
+    I/O Example:
+        ["01-01", "04-01"] -> [0, 93]
+    """
+    parts = month_days.str.split("-", expand=True).astype(int)
+    return ((parts[0] - 1) * 31 + parts[1] - 1).to_numpy()
+
+
+def _expand_link_timeslice_limits(
+    link_timeslice_limits: pd.DataFrame,
+    defaults: pd.DataFrame,
+    timeslice_codes: _TimesliceCodes,
+    attribute: str,
+) -> pd.DataFrame:
+    """Expands one attribute's per-timeslice link limits into time series.
+
+    Each link's values are laid out in a row of a (link, timeslice code) matrix
+    per region, with the link's fallback (timeslice = NaN) value in the last
+    column, which code -1 selects. All of a region's links are then expanded
+    with one gather, `values[:, codes]`. Limits missing for a timeslice, with
+    no fallback, take the link's static value from `defaults`.
+
+    I/O Example:
+        link_timeslice_limits:
+            name            attribute  timeslice           value
+            CQ-NQ_existing  p_max_pu   qld_peak_demand     0.857
+            CQ-NQ_existing  p_max_pu   ,                   1.0   # fallback
+
+        snapshots in qld_peak_demand, qld_summer_typical returns (attribute="p_max_pu"):
+            CQ-NQ_existing
+            0.857
+            1.0
+
+    Returns:
+        `pd.DataFrame` indexed by the snapshots with a column per link with a
+        limit for `attribute`.
+
+    Raises:
+        ValueError: If a link has limits for timeslices of more than one region,
+            which can be active at the same time.
+    """
+    limits = link_timeslice_limits[link_timeslice_limits["attribute"] == attribute]
+    names = pd.Index(limits["name"].unique())
+    is_named = limits["timeslice"].notna()
+    link_regions = pd.DataFrame(
+        {
+            "name": limits.loc[is_named, "name"],
+            "region": limits.loc[is_named, "timeslice"].str.split("_").str[0],
+        }
+    ).drop_duplicates()
+    in_several_regions = link_regions.loc[
+        link_regions["name"].duplicated(), "name"
+    ].unique()
+    if len(in_several_regions) > 0:
+        raise ValueError(
+            f"Links have {attribute} limits for the timeslices of more than one "
+            f"region: {sorted(in_several_regions)}"
+        )
+    link_region = link_regions.set_index("name")["region"].reindex(names)
+
+    n_snapshots = len(timeslice_codes.index)
+    # Built link by snapshot, the layout pandas stores a float frame's block in,
+    # so the frame below wraps its transpose without copying.
+    expanded = np.empty((len(names), n_snapshots))
+    fallbacks = limits[~is_named].set_index("name")["value"]
+    for region, region_names in link_region.groupby(link_region, dropna=False):
+        columns = names.get_indexer(region_names.index)
+        if pd.isna(region) or region not in timeslice_codes.codes:
+            timeslices = pd.Index([])
+            codes = np.full(n_snapshots, -1, dtype=np.int16)
+        else:
+            timeslices = timeslice_codes.timeslices[region]
+            codes = timeslice_codes.codes[region]
+        values = np.full((len(columns), len(timeslices) + 1), np.nan)
+        values[:, -1] = fallbacks.reindex(region_names.index).to_numpy()
+        named = limits[is_named & limits["name"].isin(region_names.index)]
+        rows = region_names.index.get_indexer(named["name"])
+        timeslice_columns = timeslices.get_indexer(named["timeslice"])
+        # Timeslices without windows are never active, so their values are
+        # never read.
+        known = timeslice_columns >= 0
+        values[rows[known], timeslice_columns[known]] = named["value"].to_numpy()[known]
+        static = defaults.loc[region_names.index, attribute].to_numpy()
+        values = np.where(np.isnan(values), static[:, np.newaxis], values)
+        expanded[columns] = values[:, codes]
+    return pd.DataFrame(
+        expanded.T, index=timeslice_codes.index, columns=names, copy=False
+    )
+
+
+@profiled
+def _add_link_timeslice_limits_to_network(
+    network: pypsa.Network,
+    link_timeslice_limits: pd.DataFrame,
+    timeslice_codes: _TimesliceCodes,
+) -> None:
+    """Sets the links' p_max_pu and p_min_pu time series from their
+    per-timeslice limits.
+
+    Args:
+        network: The `pypsa.Network` object, with the links already added.
+        link_timeslice_limits: `pd.DataFrame` with the columns 'name',
+            'attribute', 'timeslice' and 'value' (see
+            `ispypsa.translator.network._translate_timeslice_limits_to_pu`).
+        timeslice_codes: `_TimesliceCodes` for the network's snapshots.
+
+    Returns: None
+    """
+    for attribute in ["p_max_pu", "p_min_pu"]:
+        _set_timeseries(
+            network.links_t,
+            attribute,
+            _expand_link_timeslice_limits(
+                link_timeslice_limits, network.links, timeslice_codes, attribute
+            ),
+        )
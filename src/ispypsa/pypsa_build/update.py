@@ -3,11 +3,18 @@ from pathlib import Path
 import pandas as pd
 import pypsa
 
+from ispypsa.profiling import profile_span, profiled
 from ispypsa.pypsa_build.buses import _update_buses_demand_timeseries
 from ispypsa.pypsa_build.custom_constraints import _add_custom_constraints
 from ispypsa.pypsa_build.generators import _update_generators_availability_timeseries
+from ispypsa.pypsa_build.snapshots import _SnapshotRegistry
+from ispypsa.pypsa_build.timeslices import (
+    _add_link_timeslice_limits_to_network,
+    _TimesliceCodes,
+)
 
 
+@profiled
 def update_network_timeseries(
     network: pypsa.Network,
     pypsa_friendly_input_tables: dict[str, pd.DataFrame],
@@ -78,20 +85,32 @@ def update_network_timeseries(
     if isinstance(network.snapshots, pd.MultiIndex) and network.snapshots.name is None:
         network._snapshots_data.index.name = "snapshot"
     network.set_investment_periods(snapshots["investment_periods"].unique())
+    snapshot_registry = _SnapshotRegistry(network.snapshots)
     _update_generators_availability_timeseries(
         network,
         pypsa_friendly_input_tables["generators"],
         pypsa_friendly_timeseries_location,
+        snapshot_registry,
     )
     _update_buses_demand_timeseries(
         network,
         pypsa_friendly_input_tables["buses"],
         pypsa_friendly_timeseries_location,
+        snapshot_registry,
     )
+    if "link_timeslice_limits" in pypsa_friendly_input_tables:
+        _add_link_timeslice_limits_to_network(
+            network,
+            pypsa_friendly_input_tables["link_timeslice_limits"],
+            _TimesliceCodes(
+                network.snapshots, pypsa_friendly_input_tables["timeslice_calendar"]
+            ),
+        )
 
     # The underlying linopy model needs to get built again here so that the new time
     # series data is used in the linopy model rather than the old data.
-    network.optimize.create_model(multi_investment_periods=True)
+    with profile_span("pypsa_build.create_model"):
+        network.optimize.create_model(multi_investment_periods=True)
 
     # As we rebuilt the linopy model now we need to re add custom constrains.
     _add_custom_constraints(
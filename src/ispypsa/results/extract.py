@@ -3,6 +3,7 @@ from pathlib import Path
 import pandas as pd
 import pypsa
 
+from ispypsa.profiling import profiled
 from ispypsa.results.generation import (
     extract_demand,
     extract_generation_expansion_results,
@@ -73,15 +74,24 @@ RESULTS_FILES = {
 }
 
 
+@profiled
 def extract_tabular_results(
     network: pypsa.Network,
     ispypsa_tables: dict[str, pd.DataFrame],
+    categorical_identifiers: bool = False,
 ) -> dict[str : pd.DataFrame]:
     """Extract the results from the PyPSA network and return a dictionary of results.
 
     Extracts generation expansion, transmission expansion, dispatch, demand, and
     transmission flow results from the solved PyPSA network.
 
+    The time series results (those with a 'timestep' column) have a row per
+    component and snapshot, so the names in them repeat many times. With
+    `categorical_identifiers` these string columns are stored as pandas
+    categoricals, which use much less memory. The values, and the CSV files
+    written from them, are unchanged. Note that `groupby` on a categorical
+    column needs `observed=True` to skip unused categories.
+
     Examples:
         Perform required imports.
         >>> from pathlib import Path
@@ -105,6 +115,8 @@ def extract_tabular_results(
     Args:
         network: The PyPSA network object.
         ispypsa_tables: Dictionary of ISPyPSA input tables (needed for regions mapping).
+        categorical_identifiers: Whether to store the string columns of the time
+            series results as categoricals. Defaults to False.
 
     Returns:
         A dictionary of results with the file name as the key and the results as the value.
@@ -138,9 +150,20 @@ def extract_tabular_results(
         else:
             results[file] = function(network)
 
+    if categorical_identifiers:
+        for file, table in results.items():
+            if "timestep" in table.columns:
+                results[file] = _strings_to_categoricals(table)
+
     return results
 
 
+def _strings_to_categoricals(table: pd.DataFrame) -> pd.DataFrame:
+    """Converts the string (object dtype) columns of a table to categoricals."""
+    string_columns = table.select_dtypes(include="object").columns
+    return table.astype({col: "category" for col in string_columns})
+
+
 def list_results_files(results_directory: Path) -> list[Path]:
     """List all the results files, with full file paths.
 
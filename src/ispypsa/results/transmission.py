@@ -198,7 +198,9 @@ def _calculate_transmission_flows_by_geography(
 
     # Aggregate by geography, period, and timestep
     result = (
-        all_flows.groupby([geography_column_name, "investment_period", "timestep"])
+        all_flows.groupby(
+            [geography_column_name, "investment_period", "timestep"], observed=True
+        )
         .agg({"imports_mw": "sum", "exports_mw": "sum"})
         .reset_index()
     )
@@ -4,6 +4,7 @@ from pathlib import Path
 import pandas as pd
 
 from ispypsa.feature_flags import FEATURE_FLAGS
+from ispypsa.profiling import profiled
 from ispypsa.templater.connection_and_build_costs import _template_connection_costs
 from ispypsa.templater.custom_constraints_from_plexos import (
     template_custom_constraints_from_plexos,
@@ -44,6 +45,7 @@ from ispypsa.templater.nodes import (
 from ispypsa.templater.renewable_energy_zones import (
     _template_rez_build_limits,
 )
+from ispypsa.templater.scheduler import TemplateBuilder, _run_template_builders
 from ispypsa.templater.static_ecaa_generator_properties import (
     _template_ecaa_generators_static_properties,
 )
@@ -109,6 +111,7 @@ _CUSTOM_CONSTRAINT_OUTPUTS = [
 ]
 
 
+@profiled
 def create_ispypsa_inputs_template(
     scenario: str,
     regional_granularity: str,
@@ -117,9 +120,16 @@ def create_ispypsa_inputs_template(
     iasr_workbook_version: str,
     filter_to_nem_regions: list[str] | None = None,
     filter_to_isp_sub_regions: list[str] | None = None,
+    max_workers: int = 1,
 ) -> dict[str, pd.DataFrame]:
     """Creates a template set of [`ISPyPSA` input tables](tables/ispypsa.md).
 
+    The template is built by a set of builders (e.g. for ECAA generators, new
+    entrants, storage, flow paths, REZs, fuel prices and policy targets) that
+    declare the template tables they consume and output. Builders are run in
+    dependency order, and independent builders can run concurrently in a thread
+    pool. Regional filtering is applied once, after all builders have finished.
+
     Examples:
         Perform required imports.
         >>> from pathlib import Path
@@ -166,6 +176,8 @@ def create_ispypsa_inputs_template(
         filter_to_isp_sub_regions: Optional list of ISP sub-region IDs
             (e.g., ['CNSW', 'VIC', 'TAS']) to filter the template to. Cannot be
             specified together with filter_to_nem_regions.
+        max_workers: Maximum number of templater builders to run concurrently.
+            Defaults to 1, which runs builders one at a time.
 
     Returns:
         dictionary of dataframes in the [`ISPyPSA` format](tables/ispypsa.md)
@@ -182,172 +194,398 @@ def create_ispypsa_inputs_template(
     # FEATURE_FLAG_CLEANUP[use_new_table_format]: drop the else-branch (legacy
     # templater path) and inline this branch.
     if FEATURE_FLAGS["use_new_table_format"]:
-        template = {}
-        sub_regional_geography = _template_network_geography(
-            iasr_tables["sub_regional_reference_nodes"],
-            iasr_tables["renewable_energy_zones"],
-            "sub_regions",
+        # connection_capacity_non_vre is in manually_extracted_template_tables/ (sourced from
+        # ENOR tables 16-17 and confirmed with AEMO) but is needed as an iasr_tables input,
+        # not a template output. TODO revisit when more manual tables added and consider
+        # reading direct from disk in templater functions vs. dict as input here.
+        iasr_tables["connection_capacity_non_vre"] = manually_extracted_tables[
+            "connection_capacity_non_vre"
+        ].copy()
+        builders = _new_format_template_builders(
+            scenario, regional_granularity, iasr_workbook_version
         )
+        return _run_template_builders(builders, iasr_tables, max_workers)
+
+    builders = _legacy_template_builders(
+        scenario, regional_granularity, manually_extracted_tables
+    )
+    template = _run_template_builders(builders, iasr_tables, max_workers)
+
+    # Apply regional filtering if requested
+    if filter_to_nem_regions or filter_to_isp_sub_regions:
+        template = _filter_template(
+            template,
+            nem_regions=filter_to_nem_regions,
+            isp_sub_regions=filter_to_isp_sub_regions,
+        )
+
+    return template
+
+
+def _new_format_template_builders(
+    scenario: str, regional_granularity: str, iasr_workbook_version: str
+) -> list[TemplateBuilder]:
+    """Declares the new-format templater builders and the tables they exchange."""
+
+    def build_sub_regional_geography(iasr_tables, inputs):
+        return {
+            "sub_regional_geography": _template_network_geography(
+                iasr_tables["sub_regional_reference_nodes"],
+                iasr_tables["renewable_energy_zones"],
+                "sub_regions",
+            )
+        }
+
+    def build_network_geography(iasr_tables, inputs):
         if regional_granularity == "sub_regions":
-            template["network_geography"] = sub_regional_geography
-        else:
-            template["network_geography"] = _template_network_geography(
+            return {"network_geography": inputs["sub_regional_geography"]}
+        return {
+            "network_geography": _template_network_geography(
                 iasr_tables["sub_regional_reference_nodes"],
                 iasr_tables["renewable_energy_zones"],
                 regional_granularity,
             )
-        region_lookup = _build_geo_region_lookup(sub_regional_geography)
-        flow_path_options = _filter_flow_path_augmentations_to_granularity(
-            _extract_flow_path_options_from_iasr(iasr_tables),
-            regional_granularity,
-            region_lookup,
-        )
-        flow_path_costs = _filter_flow_path_augmentations_to_granularity(
-            _extract_flow_path_costs_from_iasr(iasr_tables, scenario),
-            regional_granularity,
-            region_lookup,
-        )
+        }
+
+    def build_flow_path_augmentations(iasr_tables, inputs):
+        region_lookup = _build_geo_region_lookup(inputs["sub_regional_geography"])
+        return {
+            "flow_path_options": _filter_flow_path_augmentations_to_granularity(
+                _extract_flow_path_options_from_iasr(iasr_tables),
+                regional_granularity,
+                region_lookup,
+            ),
+            "flow_path_costs": _filter_flow_path_augmentations_to_granularity(
+                _extract_flow_path_costs_from_iasr(iasr_tables, scenario),
+                regional_granularity,
+                region_lookup,
+            ),
+        }
+
+    def build_network_transmission(iasr_tables, inputs):
         paths, limits = _template_network_transmission(
             iasr_tables["flow_path_transfer_capability"],
             iasr_tables["initial_transmission_limits"],
             iasr_tables["renewable_energy_zones"],
-            sub_regional_geography,
+            inputs["sub_regional_geography"],
             regional_granularity,
-            flow_path_options,
+            inputs["flow_path_options"],
         )
-        template["network_transmission_paths"] = paths
-        template["network_transmission_path_limits"] = limits
+        return {
+            "network_transmission_paths": paths,
+            "network_transmission_path_limits": limits,
+        }
+
+    def build_network_expansion(iasr_tables, inputs):
         expansion_options, expansion_costs = _template_network_expansion(
-            flow_path_options=flow_path_options,
-            flow_path_costs=flow_path_costs,
+            flow_path_options=inputs["flow_path_options"],
+            flow_path_costs=inputs["flow_path_costs"],
             rez_options=_extract_rez_options_from_iasr(iasr_tables),
             rez_costs=_extract_rez_costs_from_iasr(iasr_tables, scenario),
-            network_transmission_paths=paths,
+            network_transmission_paths=inputs["network_transmission_paths"],
             rez_ids=set(iasr_tables["renewable_energy_zones"]["ID"]),
         )
-        template["network_expansion_options"] = expansion_options
-        template["network_transmission_path_expansion_costs"] = expansion_costs
-
-        # connection_capacity_non_vre is in manually_extracted_template_tables/ (sourced from
-        # ENOR tables 16-17 and confirmed with AEMO) but is needed as an iasr_tables input,
-        # not a template output. TODO revisit when more manual tables added and consider
-        # reading direct from disk in templater functions vs. dict as input here.
-        iasr_tables["connection_capacity_non_vre"] = manually_extracted_tables[
-            "connection_capacity_non_vre"
-        ].copy()
-
-        template["generators_new_entrant"] = _template_generators_new_entrant(
-            iasr_tables, regional_granularity, sub_regional_geography
-        )
-        template["storage_new_entrant"] = _template_storage_new_entrant(
-            iasr_tables, regional_granularity, sub_regional_geography
-        )
-        template["costs_connection"] = _template_connection_costs(
-            iasr_tables,
-            scenario,
-            regional_granularity,
-            template["generators_new_entrant"],
-            template["storage_new_entrant"],
-            sub_regional_geography,
-        )
-        # Custom constraints from PLEXOS are sub-regional export-group limits:
-        # their LHS references sub-region nodes, sub-regional flow paths, and
-        # REZ-located units that only exist as distinct entities at sub_regions
-        # granularity. Once sub-regions are collapsed (nem_regions /
-        # single_region) they have no meaningful representation, so only emit
-        # them for sub_regions.
-        if regional_granularity == "sub_regions":
-            template.update(
-                template_custom_constraints_from_plexos(
-                    iasr_tables, iasr_workbook_version=iasr_workbook_version
-                )
+        return {
+            "network_expansion_options": expansion_options,
+            "network_transmission_path_expansion_costs": expansion_costs,
+        }
+
+    def build_generators_new_entrant(iasr_tables, inputs):
+        return {
+            "generators_new_entrant": _template_generators_new_entrant(
+                iasr_tables, regional_granularity, inputs["sub_regional_geography"]
             )
-        return template
-
-    template = {}
-
-    template.update(manually_extracted_tables)
-
-    if regional_granularity == "sub_regions":
-        template["sub_regions"] = _template_sub_regions(
-            iasr_tables["sub_regional_reference_nodes"], mapping_only=False
-        )
+        }
 
-        template["flow_paths"] = _template_sub_regional_flow_paths(
-            iasr_tables["flow_path_transfer_capability"]
-        )
+    def build_storage_new_entrant(iasr_tables, inputs):
+        return {
+            "storage_new_entrant": _template_storage_new_entrant(
+                iasr_tables, regional_granularity, inputs["sub_regional_geography"]
+            )
+        }
 
-        template["flow_path_expansion_costs"] = _template_sub_regional_flow_path_costs(
-            iasr_tables,
-            scenario,
-        )
+    def build_costs_connection(iasr_tables, inputs):
+        return {
+            "costs_connection": _template_connection_costs(
+                iasr_tables,
+                scenario,
+                regional_granularity,
+                inputs["generators_new_entrant"],
+                inputs["storage_new_entrant"],
+                inputs["sub_regional_geography"],
+            )
+        }
 
-    elif regional_granularity == "nem_regions":
-        template["sub_regions"] = _template_sub_regions(
-            iasr_tables["sub_regional_reference_nodes"], mapping_only=True
+    def build_custom_constraints(iasr_tables, inputs):
+        return template_custom_constraints_from_plexos(
+            iasr_tables, iasr_workbook_version=iasr_workbook_version
         )
 
-        template["nem_regions"] = _template_regions(
-            iasr_tables["regional_reference_nodes"]
+    builders = [
+        {
+            "name": "sub_regional_geography",
+            "inputs": [],
+            "outputs": ["sub_regional_geography"],
+            "build": build_sub_regional_geography,
+            "intermediate": True,
+        },
+        {
+            "name": "flow_path_augmentations",
+            "inputs": ["sub_regional_geography"],
+            "outputs": ["flow_path_options", "flow_path_costs"],
+            "build": build_flow_path_augmentations,
+            "intermediate": True,
+        },
+        {
+            "name": "network_geography",
+            "inputs": ["sub_regional_geography"],
+            "outputs": ["network_geography"],
+            "build": build_network_geography,
+        },
+        {
+            "name": "network_transmission",
+            "inputs": ["sub_regional_geography", "flow_path_options"],
+            "outputs": [
+                "network_transmission_paths",
+                "network_transmission_path_limits",
+            ],
+            "build": build_network_transmission,
+        },
+        {
+            "name": "network_expansion",
+            "inputs": [
+                "flow_path_options",
+                "flow_path_costs",
+                "network_transmission_paths",
+            ],
+            "outputs": [
+                "network_expansion_options",
+                "network_transmission_path_expansion_costs",
+            ],
+            "build": build_network_expansion,
+        },
+        {
+            "name": "generators_new_entrant",
+            "inputs": ["sub_regional_geography"],
+            "outputs": ["generators_new_entrant"],
+            "build": build_generators_new_entrant,
+        },
+        {
+            "name": "storage_new_entrant",
+            "inputs": ["sub_regional_geography"],
+            "outputs": ["storage_new_entrant"],
+            "build": build_storage_new_entrant,
+        },
+        {
+            "name": "costs_connection",
+            "inputs": [
+                "generators_new_entrant",
+                "storage_new_entrant",
+                "sub_regional_geography",
+            ],
+            "outputs": ["costs_connection"],
+            "build": build_costs_connection,
+        },
+    ]
+    # Custom constraints from PLEXOS are sub-regional export-group limits:
+    # their LHS references sub-region nodes, sub-regional flow paths, and
+    # REZ-located units that only exist as distinct entities at sub_regions
+    # granularity. Once sub-regions are collapsed (nem_regions /
+    # single_region) they have no meaningful representation, so only emit
+    # them for sub_regions.
+    if regional_granularity == "sub_regions":
+        builders.append(
+            {
+                "name": "custom_constraints",
+                "inputs": [],
+                "outputs": _CUSTOM_CONSTRAINT_OUTPUTS,
+                "build": build_custom_constraints,
+            }
         )
+    return builders
 
-        template["flow_paths"] = _template_regional_interconnectors(
-            iasr_tables["interconnector_transfer_capability"]
-        )
 
-    else:
-        template["sub_regions"] = _template_sub_regions(
-            iasr_tables["sub_regional_reference_nodes"], mapping_only=True
+def _legacy_template_builders(
+    scenario: str,
+    regional_granularity: str,
+    manually_extracted_tables: dict[str, pd.DataFrame],
+) -> list[TemplateBuilder]:
+    """Declares the legacy templater builders and the tables they exchange."""
+
+    def build_rez_transmission_expansion_costs(iasr_tables, inputs):
+        possible_rez_or_constraint_names = list(
+            set(
+                list(inputs["renewable_energy_zones"]["rez_id"])
+                + list(inputs["custom_constraints_rhs"]["constraint_id"])
+            )
         )
+        return {
+            "rez_transmission_expansion_costs": _template_rez_transmission_costs(
+                iasr_tables,
+                scenario,
+                possible_rez_or_constraint_names,
+            )
+        }
 
-    template["renewable_energy_zones"] = _template_rez_build_limits(
-        iasr_tables["initial_build_limits"], scenario
-    )
-
-    possible_rez_or_constraint_names = list(
-        set(
-            list(template["renewable_energy_zones"]["rez_id"])
-            + list(template["custom_constraints_rhs"]["constraint_id"])
+    def build_batteries(iasr_tables, inputs):
+        ecaa_batteries, new_entrant_batteries = _template_battery_properties(
+            iasr_tables
         )
-    )
-
-    template["rez_transmission_expansion_costs"] = _template_rez_transmission_costs(
-        iasr_tables,
-        scenario,
-        possible_rez_or_constraint_names,
-    )
-
-    template["ecaa_generators"] = _template_ecaa_generators_static_properties(
-        iasr_tables
-    )
-
-    template["new_entrant_generators"] = _template_new_generators_static_properties(
-        iasr_tables
-    )
-
-    ecaa_batteries, new_entrant_batteries = _template_battery_properties(iasr_tables)
-    template["ecaa_batteries"] = ecaa_batteries
-    template["new_entrant_batteries"] = new_entrant_batteries
-
-    dynamic_generator_property_templates = _template_generator_dynamic_properties(
-        iasr_tables, scenario
-    )
-
-    template.update(dynamic_generator_property_templates)
-
-    energy_policy_targets = _template_energy_policy_targets(iasr_tables, scenario)
-
-    template.update(energy_policy_targets)
+        return {
+            "ecaa_batteries": ecaa_batteries,
+            "new_entrant_batteries": new_entrant_batteries,
+        }
+
+    builders = [
+        {
+            "name": "manually_extracted_tables",
+            "inputs": [],
+            "outputs": list(manually_extracted_tables),
+            "build": lambda iasr_tables, inputs: dict(manually_extracted_tables),
+        },
+        {
+            "name": "sub_regions",
+            "inputs": [],
+            "outputs": ["sub_regions"],
+            "build": lambda iasr_tables, inputs: {
+                "sub_regions": _template_sub_regions(
+                    iasr_tables["sub_regional_reference_nodes"],
+                    mapping_only=regional_granularity != "sub_regions",
+                )
+            },
+        },
+    ]
 
-    # Apply regional filtering if requested
-    if filter_to_nem_regions or filter_to_isp_sub_regions:
-        template = _filter_template(
-            template,
-            nem_regions=filter_to_nem_regions,
-            isp_sub_regions=filter_to_isp_sub_regions,
-        )
+    if regional_granularity == "sub_regions":
+        builders += [
+            {
+                "name": "flow_paths",
+                "inputs": [],
+                "outputs": ["flow_paths"],
+                "build": lambda iasr_tables, inputs: {
+                    "flow_paths": _template_sub_regional_flow_paths(
+                        iasr_tables["flow_path_transfer_capability"]
+                    )
+                },
+            },
+            {
+                "name": "flow_path_expansion_costs",
+                "inputs": [],
+                "outputs": ["flow_path_expansion_costs"],
+                "build": lambda iasr_tables, inputs: {
+                    "flow_path_expansion_costs": _template_sub_regional_flow_path_costs(
+                        iasr_tables,
+                        scenario,
+                    )
+                },
+            },
+        ]
 
-    return template
+    elif regional_granularity == "nem_regions":
+        builders += [
+            {
+                "name": "nem_regions",
+                "inputs": [],
+                "outputs": ["nem_regions"],
+                "build": lambda iasr_tables, inputs: {
+                    "nem_regions": _template_regions(
+                        iasr_tables["regional_reference_nodes"]
+                    )
+                },
+            },
+            {
+                "name": "flow_paths",
+                "inputs": [],
+                "outputs": ["flow_paths"],
+                "build": lambda iasr_tables, inputs: {
+                    "flow_paths": _template_regional_interconnectors(
+                        iasr_tables["interconnector_transfer_capability"]
+                    )
+                },
+            },
+        ]
+
+    builders += [
+        {
+            "name": "renewable_energy_zones",
+            "inputs": [],
+            "outputs": ["renewable_energy_zones"],
+            "build": lambda iasr_tables, inputs: {
+                "renewable_energy_zones": _template_rez_build_limits(
+                    iasr_tables["initial_build_limits"], scenario
+                )
+            },
+        },
+        {
+            "name": "rez_transmission_expansion_costs",
+            "inputs": ["renewable_energy_zones", "custom_constraints_rhs"],
+            "outputs": ["rez_transmission_expansion_costs"],
+            "build": build_rez_transmission_expansion_costs,
+        },
+        {
+            "name": "ecaa_generators",
+            "inputs": [],
+            "outputs": ["ecaa_generators"],
+            "build": lambda iasr_tables, inputs: {
+                "ecaa_generators": _template_ecaa_generators_static_properties(
+                    iasr_tables
+                )
+            },
+        },
+        {
+            "name": "new_entrant_generators",
+            "inputs": [],
+            "outputs": ["new_entrant_generators"],
+            "build": lambda iasr_tables, inputs: {
+                "new_entrant_generators": _template_new_generators_static_properties(
+                    iasr_tables
+                )
+            },
+        },
+        {
+            "name": "batteries",
+            "inputs": [],
+            "outputs": ["ecaa_batteries", "new_entrant_batteries"],
+            "build": build_batteries,
+        },
+        {
+            "name": "dynamic_generator_properties",
+            "inputs": [],
+            "outputs": [
+                "coal_prices",
+                "gas_prices",
+                "liquid_fuel_prices",
+                "biomass_prices",
+                "hydrogen_prices",
+                "biomethane_prices",
+                "gpg_emissions_reduction_h2",
+                "gpg_emissions_reduction_biomethane",
+                "full_outage_forecasts",
+                "partial_outage_forecasts",
+                "seasonal_ratings",
+                "new_entrant_build_costs",
+                "new_entrant_wind_and_solar_connection_costs",
+                "new_entrant_non_vre_connection_costs",
+            ],
+            "build": lambda iasr_tables, inputs: _template_generator_dynamic_properties(
+                iasr_tables, scenario
+            ),
+        },
+        {
+            "name": "energy_policy_targets",
+            "inputs": [],
+            "outputs": [
+                "renewable_share_targets",
+                "powering_australia_plan",
+                "renewable_generation_targets",
+                "technology_capacity_targets",
+            ],
+            "build": lambda iasr_tables, inputs: _template_energy_policy_targets(
+                iasr_tables, scenario
+            ),
+        },
+    ]
+    return builders
 
 
 def list_templater_output_files(regional_granularity, output_path=None):
@@ -1,9 +1,13 @@
+import heapq
 import logging
 import re
+from functools import lru_cache
 from typing import Iterable
 
 import numpy as np
 import pandas as pd
+from rapidfuzz import fuzz as rapidfuzz_fuzz
+from rapidfuzz import process as rapidfuzz_process
 from thefuzz import fuzz
 
 
@@ -56,6 +60,11 @@ def _one_to_one_priority_based_fuzzy_matching(
         2. Matching remaining strings by finding the highest similarity pair and then
            recording the best match (iteratively).
 
+    The similarity of every remaining pair is scored once, and matches are then
+    popped from a priority queue in order of descending score. Ties are broken by
+    the sorted order of the strings and then the choices. Results are memoised, so
+    repeated calls with the same inputs during a templating run are free.
+
     Args:
         strings_to_match: set of strings to find a match for in the set of choices.
         choices: set of strings to choose from when finding matches.
@@ -68,56 +77,77 @@ def _one_to_one_priority_based_fuzzy_matching(
     Returns:
         dict: dict matching strings to the choice they matched with.
     """
+    matches = _cached_one_to_one_priority_based_fuzzy_matching(
+        frozenset(strings_to_match), frozenset(choices), not_match, threshold
+    )
+    return dict(matches)
 
-    matches = []
 
-    remaining_strings_to_match = strings_to_match
-    remaining_choices = choices
+@lru_cache(maxsize=1024)
+def _cached_one_to_one_priority_based_fuzzy_matching(
+    strings_to_match: frozenset, choices: frozenset, not_match: str, threshold: int
+) -> tuple[tuple[str, str], ...]:
+    """Memoised implementation of `_one_to_one_priority_based_fuzzy_matching`.
+
+    Returns a tuple of (string, match) pairs so cached results can't be mutated
+    by callers.
+    """
+    matches = []
 
     # Find and remove exact matches
-    exact_matches = remaining_strings_to_match.intersection(remaining_choices)
-    for s in exact_matches:
+    exact_matches = strings_to_match.intersection(choices)
+    for s in sorted(exact_matches, key=str):
         matches.append((s, s))
-        remaining_strings_to_match.remove(s)
-        remaining_choices.remove(s)
-
-    # Convert remaining sets to lists for index access
-    remaining_strings_to_match_list = list(remaining_strings_to_match)
-    remaining_choices_list = list(remaining_choices)
-
-    # For remaining strings, use greedy approach with fuzzy matching
-    while remaining_strings_to_match_list and remaining_choices_list:
-        best_score = -1
-        best_pair = None
-
-        # Find the highest similarity score among remaining pairs
-        for i, str_a in enumerate(remaining_strings_to_match_list):
-            for j, str_b in enumerate(remaining_choices_list):
-                score = fuzz.ratio(str_a, str_b)
-                if score > best_score and score >= threshold:
-                    best_score = score
-                    best_pair = (i, j, str_a, str_b, score)
-
-        if best_pair:
-            i, j, str_a, str_b, score = best_pair
-            matches.append((str_a, str_b))
-
-            # Remove matched strings
-            remaining_strings_to_match_list.pop(i)
-            remaining_choices_list.pop(j)
-        else:
-            # If none of the remaining string comparisons is greater
-            # than the threshold provided break and resort to the
-            # no_match strategy.
-            break
 
-    for str_to_match in remaining_strings_to_match_list:
+    # Sort remaining strings so ties are broken deterministically
+    remaining_strings_to_match = sorted(strings_to_match - exact_matches, key=str)
+    remaining_choices = sorted(choices - exact_matches, key=str)
+
+    matched_strings = set()
+    if remaining_strings_to_match and remaining_choices:
+        scores = _fuzz_ratio_matrix(remaining_strings_to_match, remaining_choices)
+        # Queue every pair that meets the threshold, highest score first, with
+        # ties going to the earliest string and then the earliest choice.
+        rows, cols = np.nonzero(scores >= threshold)
+        queue = list(zip((-scores[rows, cols]).tolist(), rows.tolist(), cols.tolist()))
+        heapq.heapify(queue)
+        matched_choices = set()
+        max_matches = min(len(remaining_strings_to_match), len(remaining_choices))
+        while queue and len(matched_strings) < max_matches:
+            _, i, j = heapq.heappop(queue)
+            if i in matched_strings or j in matched_choices:
+                continue
+            matches.append((remaining_strings_to_match[i], remaining_choices[j]))
+            matched_strings.add(i)
+            matched_choices.add(j)
+
+    # Strings with no remaining choice above the threshold resort to the
+    # not_match strategy.
+    for i, str_to_match in enumerate(remaining_strings_to_match):
+        if i in matched_strings:
+            continue
         if not_match == "existing":
             matches.append((str_to_match, str_to_match))
         else:
             matches.append((str_to_match, not_match))
 
-    return dict(matches)
+    return tuple(matches)
+
+
+def _fuzz_ratio_matrix(strings: list, choices: list) -> np.ndarray:
+    """Scores every (string, choice) pair with `fuzz.ratio` in one batched call.
+
+    Scores are rounded to integers, matching `thefuzz.fuzz.ratio`. Missing values
+    (None/NaN) score 0, as they do in `fuzz.ratio`.
+    """
+    scores = rapidfuzz_process.cdist(
+        strings, choices, scorer=rapidfuzz_fuzz.ratio, dtype=np.float64
+    )
+    scores = np.round(scores)
+    # cdist leaves the scores of missing values unset rather than zero
+    scores[pd.isna(strings), :] = 0
+    scores[:, pd.isna(choices)] = 0
+    return scores
 
 
 def _log_fuzzy_match(
@@ -0,0 +1,178 @@
+import logging
+import time
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from ispypsa.profiling import profile_span
+
+# A templater builder is declared as a dict with the keys:
+#   "name": unique name used in logging and error messages.
+#   "inputs": template tables (outputs of other builders) the builder consumes.
+#   "outputs": template tables the builder returns.
+#   "build": callable taking (iasr_tables, inputs) and returning a dict with
+#       exactly the declared outputs as keys.
+#   "intermediate": optional, if True the outputs only feed other builders and
+#       are left out of the template.
+TemplateBuilder = dict[str, str | list[str] | Callable]
+
+
+class _CopyOnReadTables(MutableMapping):
+    """A builder's private view of the shared IASR tables.
+
+    Each table is copied the first time the builder reads it and writes stay in
+    the view, so builders that modify tables in place can run concurrently
+    without affecting each other.
+    """
+
+    def __init__(self, shared_tables: Mapping[str, pd.DataFrame]) -> None:
+        self._shared_tables = shared_tables
+        self._local_tables = {}
+        self._deleted = set()
+
+    def __getitem__(self, key: str) -> pd.DataFrame:
+        if key in self._deleted:
+            raise KeyError(key)
+        if key not in self._local_tables:
+            self._local_tables[key] = self._shared_tables[key].copy()
+        return self._local_tables[key]
+
+    def __setitem__(self, key: str, value: pd.DataFrame) -> None:
+        self._deleted.discard(key)
+        self._local_tables[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._local_tables.pop(key, None)
+        self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        keys = dict.fromkeys(self._shared_tables) | dict.fromkeys(self._local_tables)
+        return (key for key in keys if key not in self._deleted)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._deleted:
+            return False
+        return key in self._local_tables or key in self._shared_tables
+
+
+def _map_outputs_to_builders(builders: list[TemplateBuilder]) -> dict[str, str]:
+    """Maps each template table to the name of the builder that outputs it."""
+    producers = {}
+    for builder in builders:
+        for table in builder["outputs"]:
+            if table in producers:
+                raise ValueError(
+                    f"Template table '{table}' is output by both the "
+                    f"'{producers[table]}' and '{builder['name']}' builders."
+                )
+            producers[table] = builder["name"]
+    return producers
+
+
+def _map_builder_dependencies(
+    builders: list[TemplateBuilder], producers: dict[str, str]
+) -> dict[str, set[str]]:
+    """Maps each builder name to the names of the builders it depends on."""
+    dependencies = {}
+    for builder in builders:
+        missing = [table for table in builder["inputs"] if table not in producers]
+        if missing:
+            raise ValueError(
+                f"The '{builder['name']}' builder needs template tables that no "
+                f"builder outputs: {missing}"
+            )
+        dependencies[builder["name"]] = {
+            producers[table] for table in builder["inputs"]
+        }
+    return dependencies
+
+
+def _run_builder(
+    builder: TemplateBuilder,
+    iasr_tables: Mapping[str, pd.DataFrame],
+    inputs: dict[str, pd.DataFrame],
+) -> dict[str, pd.DataFrame]:
+    start = time.perf_counter()
+    with profile_span(f"templater.{builder['name']}") as span:
+        outputs = builder["build"](_CopyOnReadTables(iasr_tables), inputs)
+        span["rows"] = sum(len(table) for table in outputs.values())
+    elapsed = time.perf_counter() - start
+    if set(outputs) != set(builder["outputs"]):
+        raise ValueError(
+            f"The '{builder['name']}' builder returned tables "
+            f"{sorted(outputs)} but declares {sorted(builder['outputs'])}."
+        )
+    logging.info(f"Templated {builder['name']} in {elapsed:.2f}s")
+    return outputs
+
+
+def _run_template_builders(
+    builders: list[TemplateBuilder],
+    iasr_tables: Mapping[str, pd.DataFrame],
+    max_workers: int = 1,
+) -> dict[str, pd.DataFrame]:
+    """Runs templater builders in dependency order, concurrently where possible.
+
+    Builders whose input tables are all available are submitted to a thread
+    pool, in declaration order, as soon as the builders they depend on finish.
+    Each builder gets a copy-on-read view of `iasr_tables` and copies of its
+    input tables, so builders can't see each other's in-place modifications.
+
+    The returned template is assembled in builder declaration order, and in the
+    order each builder returns its tables, so it doesn't depend on the order
+    builders finish in. Outputs of intermediate builders are left out.
+
+    Args:
+        builders: List of builder declarations (see `TemplateBuilder`).
+        iasr_tables: Dict of tables from the IASR workbook that have been parsed
+            using `isp-workbook-parser`. Not modified.
+        max_workers: Maximum number of builders to run at once. Defaults to 1.
+
+    Returns:
+        dict[str, pd.DataFrame]: The combined outputs of all non-intermediate
+            builders.
+
+    Raises:
+        ValueError: If two builders output the same table, a builder's inputs
+            aren't output by any builder, the dependencies are cyclic, or a
+            builder's returned tables don't match its declared outputs.
+    """
+    producers = _map_outputs_to_builders(builders)
+    dependencies = _map_builder_dependencies(builders, producers)
+    builders_by_name = {builder["name"]: builder for builder in builders}
+
+    results = {}
+    pending = [builder["name"] for builder in builders]
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            ready = [name for name in pending if dependencies[name] <= results.keys()]
+            for name in ready:
+                pending.remove(name)
+                inputs = {
+                    table: results[producers[table]][table].copy()
+                    for table in builders_by_name[name]["inputs"]
+                }
+                future = executor.submit(
+                    _run_builder, builders_by_name[name], iasr_tables, inputs
+                )
+                running[future] = name
+            if not running:
+                raise ValueError(
+                    f"Templater builders have cyclic dependencies: {pending}"
+                )
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    template = {}
+    for builder in builders:
+        if not builder.get("intermediate", False):
+            template.update(results[builder["name"]])
+    return template
@@ -429,6 +429,7 @@ def _process_and_merge_connection_cost(
     df["connection_cost_$/mw"] = (
         df["connection_cost_rez/_region_id"] + "_" + df["connection_cost_technology"]
     )
+    connection_costs_table = connection_costs_table.copy()
     for col in connection_costs_table.columns[1:]:
         connection_costs_table[col] *= 1000  # convert to $/mw
 
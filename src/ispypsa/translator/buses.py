@@ -4,6 +4,13 @@ from typing import Literal
 import pandas as pd
 from isp_trace_parser import get_data
 
+from ispypsa.profiling import profiled
+from ispypsa.translator.helpers import (
+    _empty_trace,
+    _get_traces_by_reference_year,
+    _resample_trace,
+    _split_traces,
+)
 from ispypsa.translator.mappings import _BUS_ATTRIBUTES
 from ispypsa.translator.temporal_filters import _time_series_filter
 from ispypsa.translator.time_series_checker import _check_time_series
@@ -62,6 +69,7 @@ def _translate_rezs_to_buses(renewable_energy_zones: pd.DataFrame) -> pd.DataFra
     return buses
 
 
+@profiled
 def create_pypsa_friendly_bus_demand_timeseries(
     isp_sub_regions: pd.DataFrame,
     trace_data_path: Path | str,
@@ -69,6 +77,8 @@ def create_pypsa_friendly_bus_demand_timeseries(
     regional_granularity: str,
     reference_year_mapping: dict[int:int],
     year_type: Literal["fy", "calendar"],
+    value_dtype: Literal["float64", "float32"] = "float64",
+    resolution_min: int = 30,
 ) -> dict[str, pd.DataFrame]:
     """Gets trace data for operational demand by constructing a timeseries from the
     start to end year using the reference year cycle provided. Returns a dictionary
@@ -88,6 +98,12 @@ def create_pypsa_friendly_bus_demand_timeseries(
             year with start_year and end_year specifiying the financial year to return
             data for, using year ending nomenclature (2016 ->FY2015/2016). If
             'calendar', then filtering is by calendar year.
+        value_dtype: str, 'float64' or 'float32', the dtype to store demand values
+            as. Sub-region demand is summed at full precision before conversion.
+            Defaults to 'float64'.
+        resolution_min: int, the model's temporal resolution in minutes. Demand is
+            averaged over each interval if coarser than the 30 minute traces.
+            Defaults to 30.
 
     Returns:
         dict[str, pd.DataFrame]: Dictionary with demand node names as keys and trace
@@ -104,29 +120,36 @@ def create_pypsa_friendly_bus_demand_timeseries(
 
     demand_nodes = list(isp_sub_regions["demand_nodes"].unique())
 
-    trace_data = get_data.get_demand_multiple_reference_years(
-        reference_year_mapping=reference_year_mapping,
-        subregion=list(isp_sub_regions["isp_sub_region_id"].unique()),
-        scenario=scenario,
-        poe="POE50",
-        demand_type="OPSO_MODELLING",
-        directory=trace_data_path / Path("demand"),
-        year_type=year_type,
-        select_columns=["subregion", "datetime", "value"],
+    traces_by_sub_region = _split_traces(
+        _get_traces_by_reference_year(
+            get_data.get_demand_single_reference_year,
+            reference_year_mapping,
+            year_type,
+            subregion=list(isp_sub_regions["isp_sub_region_id"].unique()),
+            scenario=scenario,
+            poe="POE50",
+            demand_type="OPSO_MODELLING",
+            directory=trace_data_path / Path("demand"),
+            select_columns=["subregion", "datetime", "value"],
+        ),
+        key_columns=["subregion"],
     )
 
     demand_traces = {}
 
     for demand_node in demand_nodes:
         mask = isp_sub_regions["demand_nodes"] == demand_node
-        sub_regions_to_aggregate = list(isp_sub_regions.loc[mask, "isp_sub_region_id"])
-        node_traces = trace_data[
-            trace_data["subregion"].isin(sub_regions_to_aggregate)
-        ].copy()
-        node_trace = node_traces.groupby("datetime", as_index=False)["value"].sum()
-        node_trace["value"] = node_trace["value"].clip(lower=0.0)
-        # datetime in nanoseconds required by PyPSA
-        node_trace["datetime"] = node_trace["datetime"].astype("datetime64[ns]")
-        demand_traces[demand_node] = node_trace
+        node_traces = [
+            traces_by_sub_region[sub_region]
+            for sub_region in isp_sub_regions.loc[mask, "isp_sub_region_id"].unique()
+            if sub_region in traces_by_sub_region
+        ]
+        node_trace = (
+            pd.concat(node_traces or [_empty_trace()])
+            .groupby("datetime", as_index=False)["value"]
+            .sum()
+        )
+        node_trace["value"] = node_trace["value"].clip(lower=0.0).astype(value_dtype)
+        demand_traces[demand_node] = _resample_trace(node_trace, resolution_min)
 
     return demand_traces
@@ -8,6 +8,7 @@ from isp_trace_parser import construct_reference_year_mapping
 from ispypsa.config import (
     ModelConfig,
 )
+from ispypsa.profiling import profiled
 from ispypsa.translator.buses import (
     _create_single_region_bus,
     _translate_isp_sub_regions_to_buses,
@@ -17,6 +18,7 @@ from ispypsa.translator.buses import (
 )
 from ispypsa.translator.custom_constraints import (
     _append_if_not_empty,
+    _presolve_custom_constraints,
     _translate_custom_constraints,
 )
 from ispypsa.translator.generators import (
@@ -35,7 +37,7 @@ from ispypsa.translator.renewable_energy_zones import (
 from ispypsa.translator.snapshots import (
     _add_snapshot_weightings,
     _create_investment_period_weightings,
-    create_pypsa_friendly_snapshots,
+    _create_snapshots_and_period_sequence,
 )
 from ispypsa.translator.storage import (
     _translate_ecaa_batteries,
@@ -57,6 +59,7 @@ _BASE_TRANSLATOR_OUTPUTS = [
 ]
 
 
+@profiled
 def create_pypsa_friendly_inputs(
     config: ModelConfig, ispypsa_tables: dict[str, pd.DataFrame]
 ) -> dict[str, pd.DataFrame]:
@@ -203,10 +206,12 @@ def create_pypsa_friendly_inputs(
             config, ispypsa_tables, pypsa_inputs["links"], pypsa_inputs["generators"]
         )
     )
+    pypsa_inputs.update(_presolve_custom_constraints(pypsa_inputs))
 
     return pypsa_inputs
 
 
+@profiled
 def create_pypsa_friendly_timeseries_inputs(
     config: ModelConfig,
     model_phase: Literal["capacity_expansion", "operational"],
@@ -239,6 +244,21 @@ def create_pypsa_friendly_timeseries_inputs(
     data is saved in parquet files in the 'demand_traces' directory with the columns
     "snapshots" (datetime) and "p_set" (float specifying load in MW).
 
+    - if segmentation is configured, the availability and load values are averaged
+    over each segment of snapshots.
+
+    - if representative_periods is configured, the representative period standing
+    for each day or week of each year is saved in the file
+    'representative_period_sequence.parquet', with the columns "year",
+    "period_end" and "representative_period_end", so the representative periods
+    can be linked back into a chronology.
+
+    - the availability and load values are saved as 32-bit floats, rather than
+    64-bit, if config.memory.timeseries_dtype is "float32".
+
+    - if the phase's resolution_min is coarser than the 30 minute trace data, the
+    availability and load values are averaged over each snapshot's interval.
+
     Examples:
         Perform required imports.
         >>> from pathlib import Path
@@ -286,8 +306,10 @@ def create_pypsa_friendly_timeseries_inputs(
 
     if model_phase == "capacity_expansion":
         reference_year_cycle = config.temporal.capacity_expansion.reference_year_cycle
+        resolution_min = config.temporal.capacity_expansion.resolution_min
     else:
         reference_year_cycle = config.temporal.operational.reference_year_cycle
+        resolution_min = config.temporal.operational.resolution_min
 
     reference_year_mapping = construct_reference_year_mapping(
         start_year=config.temporal.range.start_year,
@@ -302,6 +324,8 @@ def create_pypsa_friendly_timeseries_inputs(
         generator_types=["solar", "wind"],
         reference_year_mapping=reference_year_mapping,
         year_type=config.temporal.year_type,
+        value_dtype=config.memory.timeseries_dtype,
+        resolution_min=resolution_min,
     )
 
     # Load demand timeseries data
@@ -312,6 +336,8 @@ def create_pypsa_friendly_timeseries_inputs(
         regional_granularity=config.network.nodes.regional_granularity,
         reference_year_mapping=reference_year_mapping,
         year_type=config.temporal.year_type,
+        value_dtype=config.memory.timeseries_dtype,
+        resolution_min=resolution_min,
     )
 
     # Use provided snapshots or create new ones
@@ -320,13 +346,17 @@ def create_pypsa_friendly_timeseries_inputs(
         # Flatten generator traces for snapshot creation
         all_generator_traces = _flatten_generator_traces(generator_traces_by_type)
 
-        snapshots = create_pypsa_friendly_snapshots(
+        snapshots, period_sequence = _create_snapshots_and_period_sequence(
             config,
             model_phase,
             existing_generators=ispypsa_tables.get("ecaa_generators"),
             demand_traces=demand_traces,
             generator_traces=all_generator_traces,
         )
+        if period_sequence is not None:
+            _save_period_sequence(
+                period_sequence, pypsa_friendly_timeseries_inputs_location
+            )
 
     if generator_traces_by_type is not None:
         # Filter and save generator timeseries by type
@@ -355,6 +385,8 @@ def create_pypsa_friendly_timeseries_inputs(
         reference_year_mapping=reference_year_mapping,
         year_type=config.temporal.year_type,
         snapshots=snapshots,
+        value_dtype=config.memory.timeseries_dtype,
+        resolution_min=resolution_min,
     )
 
     # This is needed because numbers can be converted to strings if the data has been saved to a csv.
@@ -364,13 +396,11 @@ def create_pypsa_friendly_timeseries_inputs(
     create_pypsa_friendly_dynamic_marginal_costs(
         ispypsa_tables,
         generators,
-        snapshots,
+        snapshots.loc[:, ["investment_periods", "snapshots"]],
         pypsa_friendly_timeseries_inputs_location,
     )
 
-    snapshots = _add_snapshot_weightings(
-        snapshots, config.temporal.capacity_expansion.resolution_min
-    )
+    snapshots = _add_snapshot_weightings(snapshots, resolution_min)
 
     return snapshots
 
@@ -463,6 +493,17 @@ def _flatten_generator_traces(
     return flattened_traces
 
 
+def _save_period_sequence(period_sequence: pd.DataFrame, output_path: Path) -> None:
+    """Saves the representative period sequence to a parquet file in `output_path`."""
+    output_path = Path(output_path)
+    if not output_path.exists():
+        output_path.mkdir(parents=True)
+    period_sequence.to_parquet(
+        output_path / "representative_period_sequence.parquet", index=False
+    )
+
+
+@profiled
 def _filter_and_save_timeseries(
     timeseries_data: dict[str, pd.DataFrame],
     snapshots: pd.DataFrame,
@@ -6,6 +6,7 @@ import pandas as pd
 from ispypsa.config import (
     ModelConfig,
 )
+from ispypsa.profiling import profiled
 from ispypsa.translator.helpers import (
     _add_investment_periods_as_build_years,
     _annuitised_investment_costs,
@@ -21,6 +22,7 @@ from ispypsa.translator.mappings import (
 logger = logging.getLogger(__name__)
 
 
+@profiled
 def _translate_custom_constraints(
     config: ModelConfig,
     ispypsa_tables: dict[str, pd.DataFrame],
@@ -553,6 +555,203 @@ def _filter_rhs_without_lhs_terms(
     return rhs
 
 
+# Pypsa-friendly tables holding the components a single variable custom constraint
+# on `p_nom` can be converted into a bound on.
+_CUSTOM_CONSTRAINT_BOUND_TABLES = {
+    "Generator": ["generators", "custom_constraints_generators"],
+    "Link": ["links"],
+}
+
+
+@profiled
+def _presolve_custom_constraints(
+    pypsa_inputs: dict[str, pd.DataFrame],
+) -> dict[str, pd.DataFrame]:
+    """Removes custom constraints that don't need to be added to the model as
+    constraints, which reduces the time taken to build the model and its size.
+
+    The presolve:
+        1. Sums repeated terms for the same variable and drops terms with a zero
+           coefficient.
+        2. Removes constraints left with no LHS terms.
+        3. Removes duplicate and dominated constraints. Constraints are grouped on
+           their sorted tuple of terms, with coefficients normalised by the largest
+           absolute coefficient. Of the constraints with the same terms and type,
+           only the tightest is kept, and an equality makes same-term inequalities
+           it satisfies redundant.
+        4. Converts constraints with a single `p_nom` term on an extendable Generator
+           or Link into `p_nom_min` and `p_nom_max` bounds on the component.
+
+    Args:
+        pypsa_inputs: dictionary of dataframes in the `PyPSA` friendly format. The
+            relevant tables for this function are:
+                - custom_constraints_lhs
+                - custom_constraints_rhs
+                - generators
+                - custom_constraints_generators
+                - links
+
+    Returns: dictionary of the tables updated by the presolve, the custom constraint
+        lhs and rhs tables, and any component tables that bounds were added to.
+    """
+    lhs = pypsa_inputs.get("custom_constraints_lhs")
+    rhs = pypsa_inputs.get("custom_constraints_rhs")
+    if lhs is None or rhs is None or lhs.empty or rhs.empty:
+        return {}
+
+    n_constraints, n_terms = len(rhs), len(lhs)
+    lhs = _combine_custom_constraint_terms(lhs)
+    rhs = _filter_rhs_without_lhs_terms(rhs.reset_index(drop=True), lhs)
+    n_empty = n_constraints - len(rhs)
+
+    redundant = _find_redundant_custom_constraints(lhs, rhs)
+    rhs = rhs[~rhs["constraint_name"].isin(redundant)]
+
+    presolved_tables, converted = _convert_single_variable_constraints_to_bounds(
+        lhs, rhs, pypsa_inputs
+    )
+    rhs = rhs[~rhs["constraint_name"].isin(converted)].reset_index(drop=True)
+    lhs = lhs[lhs["constraint_name"].isin(rhs["constraint_name"])].reset_index(
+        drop=True
+    )
+
+    logger.info(
+        f"Custom constraint presolve reduced {n_constraints} constraints with "
+        f"{n_terms} LHS terms to {len(rhs)} constraints with {len(lhs)} LHS terms: "
+        f"{n_empty} empty, {len(redundant)} duplicate or dominated, and "
+        f"{len(converted)} converted to bounds."
+    )
+
+    presolved_tables["custom_constraints_lhs"] = lhs
+    presolved_tables["custom_constraints_rhs"] = rhs
+    return presolved_tables
+
+
+def _combine_custom_constraint_terms(lhs: pd.DataFrame) -> pd.DataFrame:
+    """Sums the coefficients of repeated terms for the same variable and drops
+    terms with a zero coefficient."""
+    term_columns = [column for column in lhs.columns if column != "coefficient"]
+    combined = lhs.groupby(term_columns, as_index=False, sort=False, dropna=False)[
+        "coefficient"
+    ].sum()
+    combined = combined.loc[combined["coefficient"] != 0, list(lhs.columns)]
+    return combined.reset_index(drop=True)
+
+
+def _find_redundant_custom_constraints(
+    lhs: pd.DataFrame,
+    rhs: pd.DataFrame,
+) -> list[str]:
+    """Finds the constraints which are duplicates of, or dominated by, another
+    constraint with the same terms.
+
+    Returns: list of the names of the redundant constraints.
+    """
+    scale = lhs["coefficient"].abs().groupby(lhs["constraint_name"]).max()
+    terms = lhs.assign(
+        coefficient=(lhs["coefficient"] / lhs["constraint_name"].map(scale)).round(12)
+    ).sort_values(["constraint_name", "component", "attribute", "variable_name"])
+    # Grouping on the term tuples themselves, rather than their hashes, means
+    # constraints are only compared when their terms are equal.
+    constraint_terms = terms.groupby("constraint_name", sort=False)[
+        ["component", "attribute", "variable_name", "coefficient"]
+    ].apply(lambda t: tuple(t.itertuples(index=False, name=None)))
+
+    constraints = rhs.assign(
+        terms=rhs["constraint_name"].map(constraint_terms),
+        normalised_rhs=(
+            rhs["rhs"].astype(float) / rhs["constraint_name"].map(scale)
+        ).round(12),
+    )
+    redundant = []
+    for _, group in constraints.groupby("terms", sort=False):
+        if len(group) == 1:
+            continue
+        equalities = group[group["constraint_type"] == "=="]
+        at_most = group[group["constraint_type"] == "<="]
+        at_least = group[group["constraint_type"] == ">="]
+        if not equalities.empty:
+            value = equalities["normalised_rhs"].iloc[0]
+            # Equalities with a different rhs make the model infeasible, so they're
+            # kept for the solver to report.
+            others = equalities.iloc[1:]
+            redundant += list(
+                others.loc[others["normalised_rhs"] == value, "constraint_name"]
+            )
+            redundant += list(
+                at_most.loc[at_most["normalised_rhs"] >= value, "constraint_name"]
+            )
+            redundant += list(
+                at_least.loc[at_least["normalised_rhs"] <= value, "constraint_name"]
+            )
+        else:
+            if len(at_most) > 1:
+                tightest = at_most["normalised_rhs"].idxmin()
+                redundant += list(at_most.drop(index=tightest)["constraint_name"])
+            if len(at_least) > 1:
+                tightest = at_least["normalised_rhs"].idxmax()
+                redundant += list(at_least.drop(index=tightest)["constraint_name"])
+    return redundant
+
+
+def _convert_single_variable_constraints_to_bounds(
+    lhs: pd.DataFrame,
+    rhs: pd.DataFrame,
+    pypsa_inputs: dict[str, pd.DataFrame],
+) -> tuple[dict[str, pd.DataFrame], list[str]]:
+    """Converts constraints with a single `p_nom` term on an extendable component
+    into `p_nom_min` and `p_nom_max` bounds on the component.
+
+    Returns: tuple of a dictionary of the component tables with bounds added, and
+        the names of the constraints converted.
+    """
+    n_terms = lhs.groupby("constraint_name")["variable_name"].transform("size")
+    single = lhs[
+        (n_terms == 1)
+        & (lhs["attribute"] == "p_nom")
+        & lhs["component"].isin(_CUSTOM_CONSTRAINT_BOUND_TABLES.keys())
+    ].merge(rhs.loc[:, ["constraint_name", "rhs", "constraint_type"]])
+    bound = single["rhs"].astype(float) / single["coefficient"]
+    # Dividing by a negative coefficient flips the inequality.
+    flipped = single["constraint_type"].replace({"<=": ">=", ">=": "<="})
+    constraint_type = single["constraint_type"].where(
+        single["coefficient"] > 0, flipped
+    )
+    single = single.assign(
+        upper=bound.where(constraint_type.isin(["<=", "=="]), np.inf),
+        lower=bound.where(constraint_type.isin([">=", "=="]), -np.inf),
+    )
+
+    tables = {}
+    converted = []
+    for component, table_names in _CUSTOM_CONSTRAINT_BOUND_TABLES.items():
+        for table_name in table_names:
+            table = pypsa_inputs.get(table_name)
+            if table is None or table.empty or "p_nom_extendable" not in table:
+                continue
+            extendable = table.loc[table["p_nom_extendable"].astype(bool), "name"]
+            bounds = single[
+                (single["component"] == component)
+                & single["variable_name"].isin(extendable)
+            ]
+            if bounds.empty:
+                continue
+            upper = bounds.groupby("variable_name")["upper"].min()
+            lower = bounds.groupby("variable_name")["lower"].max()
+            table = table.copy()
+            p_nom_max = table.get("p_nom_max", pd.Series(np.inf, index=table.index))
+            p_nom_min = table.get("p_nom_min", pd.Series(0.0, index=table.index))
+            table["p_nom_max"] = np.minimum(
+                p_nom_max.fillna(np.inf), table["name"].map(upper).fillna(np.inf)
+            )
+            table["p_nom_min"] = np.maximum(
+                p_nom_min.fillna(0.0), table["name"].map(lower).fillna(0.0)
+            )
+            tables[table_name] = table
+            converted += list(bounds["constraint_name"])
+    return tables, converted
+
+
 def _create_expansion_limit_constraints(
     links: pd.DataFrame,
     constraint_generators: pd.DataFrame,
@@ -1035,37 +1234,40 @@ def _create_vre_constraint_lhs_rhs(
             + f" for constraint group type {constraint_group_type}"
         )
 
-    lhs = []
-    rhs = []
-    for _, row in build_or_resource_limits.iterrows():
-        constrained_generators = generators.loc[
-            (
-                (generators[constraint_filter_col] == row[constraint_filter_col])
-                & (generators["bus"] == row["rez_id"])
-                & (generators["p_nom_extendable"] == True)
-            ),
-            "name",
-        ]
-        if not constrained_generators.empty:
-            lhs.append(
-                pd.DataFrame(
-                    {
-                        "constraint_name": row["constraint_name"],
-                        "variable_name": constrained_generators,
-                    }
-                )
-            )
-            rhs.append(row[["constraint_name", rhs_constraint_col]].to_frame().T)
-
-    lhs_constraint_group = pd.DataFrame()
-    rhs_constraint_group = pd.DataFrame()
-    if lhs and rhs:
-        lhs_constraint_group = _translate_build_or_resource_limit_lhs(
-            pd.concat(lhs, ignore_index=True)
-        )
-        rhs_constraint_group = _translate_build_or_resource_limit_rhs(
-            pd.concat(rhs, ignore_index=True)
+    # Join each limit to the extendable generators at its REZ with a matching
+    # resource type or carrier, keeping limits in order and, within each limit,
+    # generators in the order they appear in the generators table. Rows with a
+    # missing REZ or resource type/carrier are dropped first, because merge
+    # matches missing keys to each other.
+    join_cols = ["rez_id", constraint_filter_col]
+    extendable_generators = generators.loc[
+        generators["p_nom_extendable"] == True, ["bus", constraint_filter_col, "name"]
+    ].rename(columns={"bus": "rez_id"})
+    extendable_generators["generator_order"] = range(len(extendable_generators))
+    limits = build_or_resource_limits.loc[
+        :, ["constraint_name", "rez_id", constraint_filter_col, rhs_constraint_col]
+    ]
+    limits["limit_order"] = range(len(limits))
+    constrained_generators = (
+        limits.dropna(subset=join_cols)
+        .merge(
+            extendable_generators.dropna(subset=join_cols), on=join_cols, how="inner"
         )
+        .sort_values(["limit_order", "generator_order"])
+    )
+
+    if constrained_generators.empty:
+        return pd.DataFrame(), pd.DataFrame()
+
+    lhs = constrained_generators.loc[:, ["constraint_name", "name"]].rename(
+        columns={"name": "variable_name"}
+    )
+    rhs = limits.loc[
+        limits["limit_order"].isin(constrained_generators["limit_order"]),
+        ["constraint_name", rhs_constraint_col],
+    ]
+    lhs_constraint_group = _translate_build_or_resource_limit_lhs(lhs)
+    rhs_constraint_group = _translate_build_or_resource_limit_rhs(rhs)
 
     return lhs_constraint_group, rhs_constraint_group
 
@@ -1142,8 +1344,8 @@ def _create_dummy_generators_for_vre_resource_limit_constraints(
     dummy_generators = _add_investment_periods_as_build_years(
         dummy_generators, investment_periods
     )
-    dummy_generators["capital_cost"] = dummy_generators["penalty_$/mw"].apply(
-        lambda x: _annuitised_investment_costs(x, wacc, asset_lifetime)
+    dummy_generators["capital_cost"] = _annuitised_investment_costs(
+        dummy_generators["penalty_$/mw"], wacc, asset_lifetime
     )
     return _format_resource_limit_relaxation_generators(
         dummy_generators, asset_lifetime
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 from isp_trace_parser import get_data
 
+from ispypsa.profiling import profiled
 from ispypsa.templater.helpers import (
     _snakecase_string,
     _where_any_substring_appears,
@@ -13,8 +14,13 @@ from ispypsa.templater.helpers import (
 from ispypsa.translator.helpers import (
     _add_investment_periods_as_build_years,
     _annuitised_investment_costs,
-    _get_commissioning_or_build_year_as_int,
+    _empty_trace,
+    _get_commissioning_or_build_years_as_int,
     _get_financial_year_int_from_string,
+    _get_financial_year_ints_from_strings,
+    _get_traces_by_reference_year,
+    _resample_trace,
+    _split_traces,
 )
 from ispypsa.translator.mappings import (
     _CARRIER_TO_FUEL_COST_TABLES,
@@ -26,6 +32,7 @@ from ispypsa.translator.temporal_filters import _time_series_filter
 from ispypsa.translator.time_series_checker import _check_time_series
 
 
+@profiled
 def _translate_ecaa_generators(
     ispypsa_tables: dict[str, pd.DataFrame],
     investment_periods: list[int],
@@ -84,8 +91,8 @@ def _translate_ecaa_generators(
             rez_mask, "rez_id"
         ]
 
-    ecaa_generators["commissioning_date"] = ecaa_generators["commissioning_date"].apply(
-        _get_commissioning_or_build_year_as_int,
+    ecaa_generators["commissioning_date"] = _get_commissioning_or_build_years_as_int(
+        ecaa_generators["commissioning_date"],
         default_build_year=investment_periods[0] - 1,
         year_type=year_type,
     )
@@ -114,6 +121,7 @@ def _translate_ecaa_generators(
     return ecaa_generators_pypsa_format[columns_in_order]
 
 
+@profiled
 def _translate_new_entrant_generators(
     ispypsa_tables: dict[str, pd.DataFrame],
     investment_periods: list[int],
@@ -266,9 +274,8 @@ def _add_new_entrant_generator_build_costs(
         id_vars=["technology"], var_name="build_year", value_name="build_cost_$/mw"
     ).rename(columns={"technology": "generator_name"})
     # get the financial year int from build_year string:
-    build_costs["build_year"] = build_costs["build_year"].apply(
-        _get_financial_year_int_from_string,
-        args=("new entrant generator build costs", "fy"),
+    build_costs["build_year"] = _get_financial_year_ints_from_strings(
+        build_costs["build_year"], "new entrant generator build costs", "fy"
     )
     # make sure new_entrant_generators_table has build_year column with ints:
     new_entrant_generators_table["build_year"] = new_entrant_generators_table[
@@ -318,20 +325,7 @@ def _add_new_entrant_generator_connection_costs(
         pd.DataFrame: new_entrant_generators_table with connection costs in $/MW merged in
             as new column named "connection_cost_$/mw".
     """
-    new_entrant_generators_table["connection_cost_$/mw"] = new_entrant_generators_table[
-        "connection_cost_rez/_region_id"
-    ]
-
-    def _add_build_year_or_technology_string(row):
-        if row["fuel_type"] in ["Wind", "Solar"]:
-            return f"{row['connection_cost_$/mw']}_{row['build_year']}"
-        else:
-            snake_case_technology = _snakecase_string(row["connection_cost_technology"])
-            return f"{row['connection_cost_$/mw']}_{snake_case_technology}"
-
-    new_entrant_generators_table["connection_cost_$/mw"] = (
-        new_entrant_generators_table.apply(_add_build_year_or_technology_string, axis=1)
-    )
+    connection_cost_keys = _get_connection_cost_keys(new_entrant_generators_table)
     # VRE
     vre_connection_cost_dict = {}
     if new_entrant_wind_and_solar_connection_costs is not None:
@@ -347,17 +341,17 @@ def _add_new_entrant_generator_connection_costs(
 
     # COMBINE & FILL
     connection_cost_dict = vre_connection_cost_dict | non_vre_connection_cost_dict
-    new_entrant_generators_table["connection_cost_$/mw"] = new_entrant_generators_table[
-        "connection_cost_$/mw"
-    ].replace(connection_cost_dict)
+    new_entrant_generators_table["connection_cost_$/mw"] = connection_cost_keys.map(
+        connection_cost_dict
+    )
 
     new_entrant_generators_table = _set_offshore_wind_connection_costs_to_zero(
         new_entrant_generators_table
     )
 
-    missing_connection_costs = new_entrant_generators_table["connection_cost_$/mw"].map(
-        lambda x: not isinstance(x, (float, int))
-    )
+    missing_connection_costs = new_entrant_generators_table[
+        "connection_cost_$/mw"
+    ].isna()
     gens_missing_connection_costs = new_entrant_generators_table.loc[
         missing_connection_costs
     ]
@@ -369,6 +363,43 @@ def _add_new_entrant_generator_connection_costs(
     return new_entrant_generators_table
 
 
+def _get_connection_cost_keys(new_entrant_generators_table: pd.DataFrame) -> pd.Series:
+    """
+    Creates the keys used to look up the connection cost of each new entrant generator.
+
+    VRE (wind and solar) connection costs vary by REZ and build year, so their keys
+    are of the form "{rez}_{build_year}", while non-VRE connection costs vary by region
+    and technology, so their keys are of the form "{region}_{connection_cost_technology}"
+    with the technology in snakecase. These match the keys returned by
+    `_get_vre_connection_costs_dict` and `_get_non_vre_connection_costs_dict`.
+
+    Args:
+        new_entrant_generators_table: dataframe containing `ISPyPSA` formatted
+            new-entrant generator detail, with a row for each generator in every possible
+            build year. Must have columns "connection_cost_rez/_region_id", "fuel_type",
+            "build_year" and "connection_cost_technology".
+
+    Returns:
+        pd.Series: connection cost keys, with the same index as
+            new_entrant_generators_table.
+    """
+    location = new_entrant_generators_table["connection_cost_rez/_region_id"].astype(
+        str
+    )
+    # Only a handful of distinct technologies, so snakecase each once.
+    technologies = new_entrant_generators_table["connection_cost_technology"]
+    snakecase_technologies = technologies.map(
+        {
+            technology: _snakecase_string(technology)
+            for technology in technologies.dropna().unique()
+        }
+    )
+    vre_keys = location + "_" + new_entrant_generators_table["build_year"].astype(str)
+    non_vre_keys = location + "_" + snakecase_technologies
+    is_vre = new_entrant_generators_table["fuel_type"].isin(["Wind", "Solar"])
+    return vre_keys.where(is_vre, non_vre_keys)
+
+
 def _get_vre_connection_costs_dict(
     new_entrant_wind_and_solar_connection_costs: pd.DataFrame,
 ) -> dict[str, float]:
@@ -408,11 +439,10 @@ def _get_vre_connection_costs_dict(
         value_name="connection_cost_$/mw",
     ).fillna(0.0)
     # set build_year to int to merge with new_entrant_generators_table:
-    new_vre_connection_costs_long["build_year"] = new_vre_connection_costs_long[
-        "build_year"
-    ].apply(
-        _get_financial_year_int_from_string,
-        args=("new entrant VRE generator connection costs", "fy"),
+    new_vre_connection_costs_long["build_year"] = _get_financial_year_ints_from_strings(
+        new_vre_connection_costs_long["build_year"],
+        "new entrant VRE generator connection costs",
+        "fy",
     )
     # sum the connection costs and system strength connection costs for each year:
     new_vre_connection_costs_long["connection_cost_$/mw"] = (
@@ -538,9 +568,10 @@ def _calculate_annuitised_new_entrant_gen_capital_costs(
         + new_entrant_generators_table["connection_cost_$/mw"]
     )
     # annuitise:
-    new_entrant_generators_table["capital_cost"] = new_entrant_generators_table.apply(
-        lambda x: _annuitised_investment_costs(x["capital_cost"], wacc, x["lifetime"]),
-        axis=1,
+    new_entrant_generators_table["capital_cost"] = _annuitised_investment_costs(
+        new_entrant_generators_table["capital_cost"],
+        wacc,
+        new_entrant_generators_table["lifetime"],
     )
     # add annual fixed opex (first converting to $/MW/annum)
     new_entrant_generators_table["capital_cost"] += (
@@ -549,6 +580,7 @@ def _calculate_annuitised_new_entrant_gen_capital_costs(
     return new_entrant_generators_table
 
 
+@profiled
 def create_pypsa_friendly_dynamic_marginal_costs(
     ispypsa_tables: dict[str, pd.DataFrame],
     generators: pd.DataFrame,
@@ -952,12 +984,15 @@ def _create_unserved_energy_generators(
     return generators
 
 
+@profiled
 def create_pypsa_friendly_ecaa_generator_timeseries(
     ecaa_generators: pd.DataFrame,
     trace_data_path: Path | str,
     generator_types: List[Literal["solar", "wind"]],
     reference_year_mapping: dict[int, int],
     year_type: Literal["fy", "calendar"],
+    value_dtype: Literal["float64", "float32"] = "float64",
+    resolution_min: int = 30,
 ) -> dict[str, dict[str, pd.DataFrame]]:
     """Gets trace data for generators by constructing a timeseries from the start to end
     year using the reference year cycle provided. Returns a dictionary organized by
@@ -975,6 +1010,11 @@ def create_pypsa_friendly_ecaa_generator_timeseries(
             year with start_year and end_year specifiying the financial year to return
             data for, using year ending nomenclature (2016 -> FY2015/2016). If
             'calendar', then filtering is by calendar year.
+        value_dtype: str, 'float64' or 'float32', the dtype to store trace values as.
+            Defaults to 'float64'.
+        resolution_min: int, the model's temporal resolution in minutes. Traces are
+            averaged over each interval if coarser than the 30 minute traces.
+            Defaults to 30.
 
     Returns:
         dict[str, dict[str, pd.DataFrame]]: Dictionary with generator types as keys
@@ -1000,30 +1040,28 @@ def create_pypsa_friendly_ecaa_generator_timeseries(
     # Initialize dict with generator types
     generator_traces = {gen_type: {} for gen_type in generator_types}
 
-    trace_data = get_data.get_project_multiple_reference_years(
-        reference_year_mapping=reference_year_mapping,
-        project=generators["generator"].unique(),
-        directory=trace_data_path / "project",
-        year_type=year_type,
-        select_columns=["project", "datetime", "value"],
-    )
-
-    trace_data = pd.merge(
-        generators,
-        trace_data,
-        how="left",
-        left_on="generator",
-        right_on="project",
+    traces_by_project = _split_traces(
+        _get_traces_by_reference_year(
+            get_data.get_project_single_reference_year,
+            reference_year_mapping,
+            year_type,
+            project=generators["generator"].unique(),
+            directory=trace_data_path / "project",
+            select_columns=["project", "datetime", "value"],
+        ),
+        key_columns=["project"],
+        value_dtype=value_dtype,
     )
 
-    for (name, fuel_type), trace in trace_data.groupby(["generator", "fuel_type"]):
-        # datetime in nanoseconds required by PyPSA
-        trace["datetime"] = trace["datetime"].astype("datetime64[ns]")
-        generator_traces[fuel_type][name] = trace
+    for name, fuel_type in generators.drop_duplicates().itertuples(index=False):
+        generator_traces[fuel_type][name] = _resample_trace(
+            traces_by_project.get(name, _empty_trace(value_dtype)), resolution_min
+        )
 
     return generator_traces
 
 
+@profiled
 def create_pypsa_friendly_new_entrant_generator_timeseries(
     new_entrant_generators: pd.DataFrame,
     trace_data_path: Path | str,
@@ -1032,6 +1070,8 @@ def create_pypsa_friendly_new_entrant_generator_timeseries(
     reference_year_mapping: dict[int, int],
     year_type: Literal["fy", "calendar"],
     snapshots: pd.DataFrame,
+    value_dtype: Literal["float64", "float32"] = "float64",
+    resolution_min: int = 30,
 ) -> None:
     """Gets trace data for generators by constructing a timeseries from the start to end
     year using the reference year cycle provided. Trace data is then saved as a parquet
@@ -1053,6 +1093,11 @@ def create_pypsa_friendly_new_entrant_generator_timeseries(
             data for, using year ending nomenclature (2016 -> FY2015/2016). If
             'calendar', then filtering is by calendar year.
         snapshots: pd.DataFrame containing the expected time series values.
+        value_dtype: str, 'float64' or 'float32', the dtype to save trace values as.
+            Defaults to 'float64'.
+        resolution_min: int, the model's temporal resolution in minutes. Traces are
+            averaged over each interval if coarser than the 30 minute traces.
+            Defaults to 30.
 
     Returns:
         None
@@ -1081,26 +1126,25 @@ def create_pypsa_friendly_new_entrant_generator_timeseries(
     generators["fuel_type"] = generators["fuel_type"].str.lower()
     generators = generators.drop_duplicates()
 
-    trace_data = get_data.get_zone_multiple_reference_years(
-        reference_year_mapping=reference_year_mapping,
-        zone=generators["rez_id"].unique(),
-        resource_type=generators["isp_resource_type"].unique(),
-        directory=trace_data_path / Path("zone"),
-        year_type=year_type,
-        select_columns=["zone", "resource_type", "datetime", "value"],
-    )
-
-    trace_data = pd.merge(
-        generators,
-        trace_data,
-        how="left",
-        left_on=["rez_id", "isp_resource_type"],
-        right_on=["zone", "resource_type"],
+    traces_by_zone = _split_traces(
+        _get_traces_by_reference_year(
+            get_data.get_zone_single_reference_year,
+            reference_year_mapping,
+            year_type,
+            zone=generators["rez_id"].unique(),
+            resource_type=generators["isp_resource_type"].unique(),
+            directory=trace_data_path / Path("zone"),
+            select_columns=["zone", "resource_type", "datetime", "value"],
+        ),
+        key_columns=["zone", "resource_type"],
+        value_dtype=value_dtype,
     )
 
-    for (name, fuel_type), trace in trace_data.groupby(["generator", "fuel_type"]):
-        # datetime in nanoseconds required by PyPSA
-        trace["datetime"] = trace["datetime"].astype("datetime64[ns]")
+    for name, resource_type, fuel_type, rez_id in generators.itertuples(index=False):
+        trace = _resample_trace(
+            traces_by_zone.get((rez_id, resource_type), _empty_trace(value_dtype)),
+            resolution_min,
+        )
         trace = trace.rename(columns={"datetime": "snapshots", "value": "p_max_pu"})
 
         trace = _time_series_filter(trace, snapshots)
@@ -1,5 +1,8 @@
 import re
+from collections.abc import Callable
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -19,10 +22,13 @@ def _get_iteration_start_and_end_time(year_type: str, start_year: int, end_year:
 
 
 def _annuitised_investment_costs(
-    capital_cost: float, wacc: float, asset_lifetime: int
-) -> float:
+    capital_cost: float | pd.Series, wacc: float, asset_lifetime: int | pd.Series
+) -> float | pd.Series:
     """Calculate the cost of capital cost spread over the asset lifetime.
 
+    Works elementwise when `capital_cost` and/or `asset_lifetime` are `pd.Series`,
+    so whole columns of costs can be annuitised at once.
+
     Args:
         capital_cost: as float, typically in $/MW
         wacc: as float, weighted average cost of capital, an interest rate specifying
@@ -34,21 +40,24 @@ def _annuitised_investment_costs(
     return (capital_cost * wacc) / (1 - (1 + wacc) ** (-1.0 * asset_lifetime))
 
 
-def _get_commissioning_or_build_year_as_int(
-    commissioning_date_str: str, default_build_year: int, year_type: str = "fy"
-) -> int:
-    """Return build year of CAA generator as an int, or default_build_year if no build year given.
+def _get_commissioning_or_build_years_as_int(
+    commissioning_dates: pd.Series, default_build_year: int, year_type: str = "fy"
+) -> pd.Series:
+    """Return build years of CAA generators or batteries as ints, or default_build_year
+    where no build year is given.
 
     Build years are related to investment periods, so the year type (financial or
     calendar) is used to determine the correct integer year to return.
 
-    If the commissioning date results in a year earlier than default_build_year,
+    If a commissioning date results in a year earlier than default_build_year,
     default_build_year is returned instead to align existing generators with the
     model's first investment period.
 
     Args:
-        commissioning_date_str: string describing commissioning date of committed, anticipated
-            or additional generator. Expects a date string in the format "%Y-%m-%d".
+        commissioning_dates: `pd.Series` of strings describing the commissioning date of
+            committed, anticipated or additional generators or batteries. Expects date
+            strings in the format "%Y-%m-%d". Values that aren't strings (e.g. NaN)
+            are treated as no build year being given.
         default_build_year: integer to return if no build year is given or if the
             commissioning year is earlier than this value. Typically this will be
             one year before the first investment period year.
@@ -56,18 +65,24 @@ def _get_commissioning_or_build_year_as_int(
             periods are interpreted as specifying financial years (according to the
             calendar year the financial year ends in).
 
-    Returns: integer, default_build_year or year of commissioning date (whichever is later).
+    Returns: `pd.Series` of integers, default_build_year or the year of the
+        commissioning date (whichever is later).
     """
-    if not isinstance(commissioning_date_str, str):
-        return default_build_year
-    else:
-        commissioning_date = pd.to_datetime(commissioning_date_str, format="%Y-%m-%d")
-        if commissioning_date.month < 7 or year_type == "calendar":
-            commissioning_year = int(commissioning_date.year)
-        else:
-            commissioning_year = int(commissioning_date.year) + 1
-        # Cap at default_build_year to align early generators with model start
-        return max(commissioning_year, default_build_year)
+    build_years = pd.Series(
+        default_build_year, index=commissioning_dates.index, dtype="int64"
+    )
+    is_date_string = [isinstance(date, str) for date in commissioning_dates]
+    if not any(is_date_string):
+        return build_years
+
+    dates = pd.to_datetime(commissioning_dates[is_date_string], format="%Y-%m-%d")
+    commissioning_years = dates.dt.year.astype("int64")
+    if year_type != "calendar":
+        # Dates from July onwards fall in the financial year ending the next year.
+        commissioning_years += (dates.dt.month >= 7).astype("int64")
+    # Cap at default_build_year to align early generators with model start
+    build_years[is_date_string] = commissioning_years.clip(lower=default_build_year)
+    return build_years
 
 
 def _get_financial_year_int_from_string(
@@ -114,6 +129,51 @@ def _get_financial_year_int_from_string(
         raise ValueError(f"Unknown year_type: {year_type}")
 
 
+def _get_financial_year_ints_from_strings(
+    input_strings: pd.Series, quantity: str, year_type: str = "fy"
+) -> pd.Series:
+    """
+    Vectorised `_get_financial_year_int_from_string`, taking a `pd.Series` of strings
+    containing financial years in the format YYYY_YY and returning the financial
+    years as ints.
+
+    Args:
+        input_strings: `pd.Series` of strings representing financial years in the
+            format YYYY_YY
+        quantity: string noting what quantity is being translated when this function
+            is called; used for error messaging. For example, "generator marginal costs".
+        year_type: str which should be "fy" or "calendar".
+
+    Returns:
+        `pd.Series` of ints representing the financial years. For example, the
+        string "2023_24" becomes 2024.
+
+    Raises:
+        ValueError if any input string does not match the expected format.
+    """
+    if year_type == "fy":
+        start_years = (
+            input_strings.astype(str)
+            .str.extract(r"^(\d{4})_\d{2}(?:$|_)", expand=False)
+            .rename(input_strings.name)
+        )
+        invalid = start_years.isna()
+        if invalid.any():
+            raise ValueError(
+                f"Invalid financial year string for {quantity}: "
+                f"{input_strings[invalid].iloc[0]}"
+            )
+        # adding 1 to start year instead of just returning end year to avoid
+        # any potential century crossover issues
+        return start_years.astype("int64") + 1
+    elif year_type == "calendar":
+        raise NotImplementedError(
+            f"Calendar years are not implemented yet for {quantity}"
+        )
+    else:
+        raise ValueError(f"Unknown year_type: {year_type}")
+
+
 def _add_investment_periods_as_build_years(
     df: pd.DataFrame, investment_periods: list[int]
 ):
@@ -177,7 +237,16 @@ def _resolve_wildcards(
     Once the blanks are filled in, several rows can land on the same key — a
     specific row and a wildcard one. The row that used the fewest wildcards (the
     most specific) wins; callers rely on the schema's *_resolve_unambiguously
-    rule to guarantee there is never a tie.
+    rule to guarantee there is never a tie. Should one slip through, the earlier
+    of two rows with the same blank columns wins, and rows with different blank
+    columns are ranked by _patterns_most_specific_first.
+
+    Keys are numbered rather than expanded into a table: each row's filled-in
+    key becomes an integer. Rows are resolved a wildcard pattern at a time,
+    most specific first, filling in one blank column at a time and dropping
+    partial keys as soon as a more specific row is known to cover them, by
+    looking them up among that row pattern's numbered keys. So keys covered by
+    more than one row are never built, and only the resolved rows are.
 
     I/O Example:
         table (a blank cell is a wildcard):
@@ -199,51 +268,114 @@ def _resolve_wildcards(
             N1-CNSW  reverse               NaN       #   row is more specific, so it wins
     """
     key_columns = [c for c in table.columns if c not in value_columns]
-    work = table.copy()
-    # Count each row's wildcards now, before the blanks are filled in, so that
-    # after expansion we can keep the row that used the fewest wildcards wherever
-    # rows land on the same key.
-    work["_wildcards"] = sum(work[c].isna().astype(int) for c in allowed_values)
-    # Resolve one wildcardable column per pass; each pass fills that column in.
     for column, values in allowed_values.items():
-        work = _expand_column(work, column, values)
-    # Most specific (fewest wildcards) wins where rows now share a key.
-    most_specific_first = work.sort_values("_wildcards", kind="stable")
-    resolved = most_specific_first.drop_duplicates(key_columns, keep="first")
-    return resolved.loc[:, list(table.columns)].reset_index(drop=True)
-
-
-def _expand_column(
-    table: pd.DataFrame, column: str, allowed_values: list
-) -> pd.DataFrame:
-    """Resolve a single wildcardable column of a wildcard table.
-
-    Splits the rows on whether ``column`` is blank, then recombines: a filled
-    cell is kept as-is (after checking its value is allowed), while each blank
-    (wildcard) cell is cross-joined with the allowed values so it fans out to
-    one row per value. Splitting first is the trick that keeps any blank out of
-    the merge key (a NaN key would not match itself in a merge).
+        _raise_on_disallowed_values(table[column], values, column)
+    # Number each concrete key: the group of its ride-along key columns, then
+    # the position of each wildcardable column's value in its allowed values.
+    # Keys can then be handled as integers without building the expanded table.
+    ride_along_columns = [c for c in key_columns if c not in allowed_values]
+    if ride_along_columns:
+        ride_along_group = table.groupby(
+            ride_along_columns, dropna=False, sort=False
+        ).ngroup()
+    else:
+        ride_along_group = pd.Series(0, index=table.index)
+    allowed = {
+        column: pd.unique(pd.Series(values))
+        for column, values in allowed_values.items()
+    }
+    strides = {}
+    stride = 1
+    for column in reversed(list(allowed_values)):
+        strides[column] = stride
+        stride *= len(allowed[column])
+    base_key = ride_along_group.to_numpy(dtype="int64") * stride
+    is_wildcard = table[list(allowed_values)].isna()
+    for column in allowed_values:
+        positions = pd.Index(allowed[column]).get_indexer(table[column])
+        base_key += np.where(is_wildcard[column], 0, positions) * strides[column]
+
+    # Resolve the rows of each wildcard pattern, most specific first, to the
+    # keys that no more specific row covers. A key is covered by a row of an
+    # earlier pattern if it matches the row in the pattern's filled columns, so
+    # it is looked up among the numbered keys of those rows.
+    n_allowed = {column: len(values) for column, values in allowed.items()}
+    earlier_patterns = []
+    winning_keys, winning_rows = [], []
+    for pattern in _patterns_most_specific_first(is_wildcard):
+        rows = np.flatnonzero((is_wildcard == pattern).all(axis=1))
+        # Rows of a pattern with the same filled-in key cover the same keys, so
+        # the earliest one wins them all.
+        _, first = np.unique(base_key[rows], return_index=True)
+        rows = rows[np.sort(first)]
+        keys = base_key[rows]
+        filled = {c for c, blank in zip(allowed_values, pattern) if not blank}
+        earlier_patterns_to_check = list(earlier_patterns)
+        earlier_patterns.append((set(filled), keys))
+        # Fill in the blank columns one at a time, dropping partial keys as soon
+        # as an earlier pattern is known to cover every key they expand to, i.e.
+        # once all its filled columns are filled in here too.
+        for column in [None] + [c for c in allowed_values if c not in filled]:
+            if column is not None:
+                offsets = np.arange(n_allowed[column]) * strides[column]
+                keys = np.repeat(keys, n_allowed[column]) + np.tile(offsets, len(keys))
+                rows = np.repeat(rows, n_allowed[column])
+                filled.add(column)
+            still_to_check = []
+            for earlier_filled, earlier_keys in earlier_patterns_to_check:
+                if not earlier_filled <= filled:
+                    still_to_check.append((earlier_filled, earlier_keys))
+                    continue
+                # The key with the columns the earlier pattern leaves blank
+                # zeroed, as they are in its rows' keys.
+                projected = keys.copy()
+                for other in filled - earlier_filled:
+                    projected -= (
+                        keys // strides[other] % n_allowed[other] * (strides[other])
+                    )
+                not_covered = ~np.isin(projected, earlier_keys)
+                keys, rows = keys[not_covered], rows[not_covered]
+            earlier_patterns_to_check = still_to_check
+        winning_keys.append(keys)
+        winning_rows.append(rows)
+    if not winning_keys:
+        return table.reset_index(drop=True)
+    winning_keys = np.concatenate(winning_keys)
+
+    resolved = table.iloc[np.concatenate(winning_rows)].reset_index(drop=True)
+    for column in allowed_values:
+        if is_wildcard[column].any():
+            positions = winning_keys // strides[column] % len(allowed[column])
+            values = pd.Series(allowed[column]).take(positions).to_numpy()
+            # Filled cells equal their allowed value, so the allowed values can
+            # stand in for the whole column, widened to the table's dtype where
+            # that is wider (e.g. a float year column with blanks stays float).
+            dtype = np.result_type(table[column].dtype, values.dtype)
+            resolved[column] = pd.Series(values, dtype=dtype)
+    return resolved
+
+
+def _patterns_most_specific_first(is_wildcard: pd.DataFrame) -> list[tuple]:
+    """Lists the distinct wildcard patterns of a table, most specific first.
+
+    A pattern is a tuple of flags, one per wildcardable column, marking which
+    columns a row leaves blank. Patterns with fewer wildcards come first. Ties
+    are broken column by column from the last wildcardable column to the
+    first, a filled column before a blank one, which is the order in which
+    expanding one column at a time leaves the rows.
 
     I/O Example:
-        table:                      column = "direction"
-            path_id  direction      allowed_values = ["forward", "reverse"]
-            CQ-NQ    forward
-            N1-CNSW                  # blank: a wildcard
+        is_wildcard (columns path_id, direction):
+            False  True
+            True   False
+            False  False
+            True   True
 
         returns:
-            path_id  direction
-            CQ-NQ    forward         # filled and allowed: kept as-is
-            N1-CNSW  forward         # blank: fanned out to every allowed value
-            N1-CNSW  reverse
+            [(False, False), (True, False), (False, True), (True, True)]
     """
-    is_wildcard = table[column].isna()
-    _raise_on_disallowed_values(table.loc[~is_wildcard, column], allowed_values, column)
-    # Every filled cell is now known to be allowed, so it is kept as-is...
-    concrete = table[~is_wildcard]
-    # ...and a blank cell fans out to one row per allowed value (a cross join).
-    allowed_frame = pd.DataFrame({column: allowed_values})
-    expanded = table[is_wildcard].drop(columns=column).merge(allowed_frame, how="cross")
-    return pd.concat([concrete, expanded], ignore_index=True)
+    patterns = is_wildcard.drop_duplicates().itertuples(index=False, name=None)
+    return sorted(patterns, key=lambda pattern: (sum(pattern), pattern[::-1]))
 
 
 def _raise_on_disallowed_values(
@@ -267,3 +399,204 @@ def _raise_on_disallowed_values(
             f"Cannot resolve wildcards: {column} contains values outside the "
             f"allowed set: {disallowed}"
         )
+
+
+def _get_traces_by_reference_year(
+    get_single_reference_year: Callable[..., pd.DataFrame],
+    reference_year_mapping: dict[int, int],
+    year_type: str,
+    **query: Any,
+) -> pd.DataFrame:
+    """Gets trace data for a reference year mapping with one query per distinct
+    reference year.
+
+    The isp-trace-parser `get_*_multiple_reference_years` functions run one
+    query per model year, and every query decodes the row groups of every
+    parquet file it matches, so with a repeating reference year cycle each
+    file is read once per model year. Here each distinct reference year is
+    queried once, from the first to the last model year mapped to it, and only
+    the rows in those model years are kept. Each model year covers the same
+    (start, end] interval as in isp-trace-parser.
+
+    The traces of a reference year differ from one model year to the next, so
+    each model year's rows have to be read rather than derived from another
+    model year. With a reference year cycle, each query's result holds the
+    model years of the other reference years until they are dropped, so peak
+    memory is up to the traces of the whole horizon on top of the rows kept.
+
+    I/O Example:
+        reference_year_mapping = {2025: 2011, 2026: 2018, 2027: 2011}
+
+        queries FY2025-FY2027 with reference year 2011, keeping FY2025 and
+        FY2027, and FY2026 with reference year 2018, then returns the rows of all
+        three model years sorted by 'datetime' — the same rows as
+        `get_*_multiple_reference_years`.
+
+    Args:
+        get_single_reference_year: An isp-trace-parser
+            `get_*_single_reference_year` function.
+        reference_year_mapping: dict[int: int], mapping model years to trace data
+            reference years.
+        year_type: str, 'fy' or 'calendar'.
+        **query: The other arguments of `get_single_reference_year`, e.g.
+            `directory` and `select_columns`, which must include 'datetime'.
+
+    Returns:
+        `pd.DataFrame` with the trace data of every model year, sorted by
+            'datetime'.
+    """
+    model_years_by_reference_year = {}
+    for model_year, reference_year in reference_year_mapping.items():
+        model_years_by_reference_year.setdefault(reference_year, []).append(model_year)
+
+    traces = []
+    for reference_year, model_years in model_years_by_reference_year.items():
+        trace = get_single_reference_year(
+            start_year=min(model_years),
+            end_year=max(model_years),
+            reference_year=reference_year,
+            year_type=year_type,
+            **query,
+        )
+        traces.append(trace[_in_model_years(trace["datetime"], model_years, year_type)])
+    traces = pd.concat(traces)
+    return traces.sort_values("datetime", kind="stable").reset_index(drop=True)
+
+
+def _in_model_years(
+    datetimes: pd.Series, model_years: list[int], year_type: str
+) -> np.ndarray:
+    """Whether each datetime falls in one of the model years, each covering the
+    interval (start, end].
+
+    I/O Example:
+        datetimes = [2024-07-01 00:00, 2024-07-01 00:30, 2025-07-01 00:30],
+        model_years = [2025], year_type = "fy"
+        -> [False, True, False]
+    """
+    month, offset = (7, 1) if year_type == "fy" else (1, 0)
+    model_years = sorted(model_years)
+    starts = pd.to_datetime(
+        [f"{year - offset}-{month:02d}-01" for year in model_years]
+    ).to_numpy()
+    ends = pd.to_datetime(
+        [f"{year - offset + 1}-{month:02d}-01" for year in model_years]
+    ).to_numpy()
+    values = datetimes.to_numpy().astype(starts.dtype)
+    # The first model year ending at or after each datetime is the only one it
+    # can fall in.
+    position = np.searchsorted(ends, values, side="left")
+    in_range = position < len(model_years)
+    in_range[in_range] = values[in_range] > starts[position[in_range]]
+    return in_range
+
+
+def _split_traces(
+    trace_data: pd.DataFrame,
+    key_columns: list[str],
+    value_dtype: str = "float64",
+) -> dict:
+    """Splits long format trace data into a 'datetime', 'value' table per key.
+
+    The key columns repeat for every timestep, so they are converted to categoricals
+    before grouping and are not kept in the tables returned, as the dict keys
+    already identify each trace. 'datetime' is converted to nanosecond precision,
+    as required by PyPSA.
+
+    Args:
+        trace_data: `pd.DataFrame` with the `key_columns`, 'datetime' and 'value'.
+        key_columns: list of str, the columns identifying each trace.
+        value_dtype: str, the float dtype to store 'value' as, e.g. 'float32'.
+
+    Returns:
+        dict mapping each key (a tuple of the key column values, or a single value
+            when there is one key column) to a `pd.DataFrame` with the columns
+            'datetime' and 'value'.
+    """
+    trace_data = pd.DataFrame(
+        {
+            **{col: trace_data[col].astype("category") for col in key_columns},
+            "datetime": trace_data["datetime"].astype("datetime64[ns]"),
+            "value": trace_data["value"].astype(value_dtype),
+        }
+    )
+    keys = key_columns[0] if len(key_columns) == 1 else key_columns
+    return {
+        key: trace.loc[:, ["datetime", "value"]]
+        for key, trace in trace_data.groupby(keys, observed=True)
+    }
+
+
+def _resample_trace(trace: pd.DataFrame, resolution_min: int) -> pd.DataFrame:
+    """Averages a 30 minute trace over intervals of `resolution_min` minutes.
+
+    Trace datetimes mark the end of each interval, so each value is averaged
+    into the interval ending at or after its datetime, on a grid of
+    `resolution_min` that starts at midnight. When the trace is made of
+    complete, consecutive intervals, which is the case for traces covering
+    whole years, the values are averaged by reshaping them into one row per
+    interval. Otherwise values are summed into their intervals with
+    `np.bincount`.
+
+    Examples:
+
+    >>> trace = pd.DataFrame({
+    ...     "datetime": pd.date_range("2024-07-01 00:30", periods=4, freq="30min"),
+    ...     "value": [1.0, 3.0, 5.0, 7.0],
+    ... })
+    >>> _resample_trace(trace, 60)
+                 datetime  value
+    0 2024-07-01 01:00:00    2.0
+    1 2024-07-01 02:00:00    6.0
+
+    Args:
+        trace: `pd.DataFrame` with the columns 'datetime' and 'value', sorted by
+            'datetime', at 30 minute resolution.
+        resolution_min: int, the resolution to average to, a multiple of 30
+            minutes that divides a day evenly.
+
+    Returns:
+        `pd.DataFrame` with the columns 'datetime' and 'value', keeping the
+            'value' dtype.
+    """
+    if resolution_min == 30 or trace.empty:
+        return trace
+
+    resolution = np.int64(resolution_min) * 60 * 10**9
+    times = trace["datetime"].to_numpy().astype("datetime64[ns]").view("int64")
+    # Interval ends on a grid aligned with midnight: ceil(times / resolution).
+    ends = -(-times // resolution) * resolution
+    values = trace["value"].to_numpy()
+    steps = resolution_min // 30
+
+    if len(times) % steps == 0:
+        ends_by_interval = ends.reshape(-1, steps)
+        if (ends_by_interval == ends_by_interval[:, :1]).all():
+            return pd.DataFrame(
+                {
+                    "datetime": ends_by_interval[:, 0].view("datetime64[ns]"),
+                    "value": values.reshape(-1, steps)
+                    .mean(axis=1)
+                    .astype(values.dtype),
+                }
+            )
+
+    unique_ends, interval = np.unique(ends, return_inverse=True)
+    sums = np.bincount(interval, weights=values)
+    counts = np.bincount(interval)
+    return pd.DataFrame(
+        {
+            "datetime": unique_ends.view("datetime64[ns]"),
+            "value": (sums / counts).astype(values.dtype),
+        }
+    )
+
+
+def _empty_trace(value_dtype: str = "float64") -> pd.DataFrame:
+    """An empty trace, for a key with no rows in the trace data."""
+    return pd.DataFrame(
+        {
+            "datetime": pd.Series(dtype="datetime64[ns]"),
+            "value": pd.Series(dtype=value_dtype),
+        }
+    )
@@ -2,10 +2,12 @@ import numpy as np
 import pandas as pd
 
 from ispypsa.config import ModelConfig
+from ispypsa.profiling import profiled
 from ispypsa.translator.helpers import _annuitised_investment_costs
 from ispypsa.translator.mappings import _LINK_ATTRIBUTES
 
 
+@profiled
 def _translate_flow_paths_to_links(
     ispypsa_tables: dict[str, pd.DataFrame],
     config: ModelConfig,
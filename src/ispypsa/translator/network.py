@@ -350,9 +350,9 @@ def _translate_timeslice_limits_to_pu(
     Named-timeslice rows carry their timeslice; a timeslice = NaN row is the
     fallback applied to snapshots no named timeslice covers (the coverage
     contract is Open-ISP/ISPyPSA#123). pypsa_build expands these into per-snapshot
-    series via the timeslice_snapshots mapping. Zero-p_nom links (new parallel
-    corridors) are skipped — all their limits are zero and the per-unit form is
-    undefined.
+    series via the timeslice_calendar table (see ispypsa.pypsa_build.timeslices).
+    Zero-p_nom links (new parallel corridors) are skipped — all their limits are
+    zero and the per-unit form is undefined.
 
     I/O Example:
         limits:
@@ -2,10 +2,12 @@ import numpy as np
 import pandas as pd
 
 from ispypsa.config import ModelConfig
+from ispypsa.profiling import profiled
 from ispypsa.translator.links import _translate_expansion_costs_to_links
 from ispypsa.translator.mappings import _REZ_LINK_ATTRIBUTES
 
 
+@profiled
 def _translate_renewable_energy_zone_build_limits_to_links(
     renewable_energy_zone_build_limits: pd.DataFrame,
     rez_expansion_costs: pd.DataFrame,
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Literal
 
@@ -7,10 +7,16 @@ import pandas as pd
 
 from ispypsa.config import ModelConfig, load_config
 from ispypsa.data_fetch import read_csvs
+from ispypsa.profiling import profiled
 from ispypsa.translator.helpers import _get_iteration_start_and_end_time
-from ispypsa.translator.temporal_filters import _filter_snapshots
+from ispypsa.translator.temporal_filters import (
+    _filter_snapshots,
+    _prepare_net_load_for_segmentation,
+    _segment_snapshots,
+)
 
 
+@profiled
 def create_pypsa_friendly_snapshots(
     config: ModelConfig,
     model_phase: Literal["capacity_expansion", "operational"],
@@ -59,6 +65,27 @@ def create_pypsa_friendly_snapshots(
         each time interval modelled. 'investment_periods' periods are refered to by the
         year (financial or calander) in which they begin.
     """
+    snapshots, _ = _create_snapshots_and_period_sequence(
+        config,
+        model_phase,
+        existing_generators=existing_generators,
+        demand_traces=demand_traces,
+        generator_traces=generator_traces,
+    )
+    return snapshots
+
+
+def _create_snapshots_and_period_sequence(
+    config: ModelConfig,
+    model_phase: Literal["capacity_expansion", "operational"],
+    existing_generators: pd.DataFrame | None = None,
+    demand_traces: dict[str, pd.DataFrame] | None = None,
+    generator_traces: dict[str, pd.DataFrame] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """Creates the snapshots as `create_pypsa_friendly_snapshots` does, and returns
+    them with the representative period sequence from `_filter_snapshots`, which is
+    None unless representative_periods is configured.
+    """
     if model_phase == "capacity_expansion":
         resolution_min = config.temporal.capacity_expansion.resolution_min
         aggregation = config.temporal.capacity_expansion.aggregation
@@ -75,7 +102,7 @@ def create_pypsa_friendly_snapshots(
         year_type=config.temporal.year_type,
     )
 
-    snapshots = _filter_snapshots(
+    snapshots, period_sequence = _filter_snapshots(
         config.temporal.year_type,
         config.temporal.range,
         aggregation,
@@ -85,11 +112,24 @@ def create_pypsa_friendly_snapshots(
         generator_traces=generator_traces,
     )
 
+    if getattr(aggregation, "segmentation", None) is not None:
+        snapshots = _segment_snapshots(
+            snapshots,
+            segments_per_day=aggregation.segmentation.segments_per_day,
+            temporal_resolution_min=resolution_min,
+            start_year=config.temporal.range.start_year,
+            end_year=config.temporal.range.end_year,
+            year_type=config.temporal.year_type,
+            net_load=_prepare_net_load_for_segmentation(
+                existing_generators, demand_traces, generator_traces
+            ),
+        )
+
     snapshots = _add_investment_periods(
         snapshots, investment_periods, config.temporal.year_type
     )
 
-    return snapshots
+    return snapshots, period_sequence
 
 
 def _create_complete_snapshots_index(
@@ -118,14 +158,10 @@ def _create_complete_snapshots_index(
         year_type, start_year, end_year
     )
 
-    if temporal_resolution_min < 60:
-        hour = 0
-        minute = temporal_resolution_min
-    else:
-        hour = temporal_resolution_min // 60
-        minute = temporal_resolution_min % 60
-
-    start_date = datetime(year=start_year, month=month, day=1, hour=hour, minute=minute)
+    # Snapshots mark the end of each interval, so the first is one interval in.
+    start_date = datetime(year=start_year, month=month, day=1) + timedelta(
+        minutes=temporal_resolution_min
+    )
     end_date = datetime(year=end_year, month=month, day=1, hour=0, minute=0)
 
     time_index = pd.date_range(
@@ -156,7 +192,8 @@ def _add_investment_periods(
             calendar year the financial year ends in).
 
 
-    Returns: pd.DataFrame with column "investment_periods" and "snapshots".
+    Returns: pd.DataFrame with column "investment_periods" and "snapshots", and
+        "representative_period_weight" and "segment_start" if `snapshots` has them.
     """
     snapshots = snapshots.copy()
     snapshots["calendar_year"] = snapshots["snapshots"].dt.year
@@ -191,7 +228,11 @@ def _add_investment_periods(
             f"Earliest investment period: {earliest_period}."
         )
 
-    return result.loc[:, ["investment_periods", "snapshots"]]
+    columns = ["investment_periods", "snapshots"]
+    for col in ["representative_period_weight", "segment_start"]:
+        if col in result.columns:
+            columns.append(col)
+    return result.loc[:, columns]
 
 
 def _add_snapshot_weightings(
@@ -207,6 +248,13 @@ def _add_snapshot_weightings(
     weight of a single year.
     - The stores snapshot is calculated as the temporal resolution in hours. Such that the
     charging and discharging of storage systems is consistent with the temporal resolution.
+    - If the snapshots have a "representative_period_weight" column, from clustering
+    representative periods, the objective and generators weightings are shared out in
+    proportion to it instead, so that each representative period stands in for all the
+    periods in its cluster. The column is dropped.
+    - If the snapshots have been segmented (they have a "segment_start" column), each
+    snapshot's weightings, including stores, are scaled by the number of intervals
+    of `temporal_resolution_min` its segment spans. The column is dropped.
 
 
     Args:
@@ -219,22 +267,36 @@ def _add_snapshot_weightings(
     the three types of snapshot weights.
     """
 
-    # Calculate the number of snapshots in each investment period
-    snapshots["snapshot_count"] = snapshots.groupby("investment_periods").transform(
-        "count"
+    if "representative_period_weight" in snapshots.columns:
+        # Each snapshot counts for as many periods as its cluster holds.
+        snapshot_weight = snapshots["representative_period_weight"].astype("float64")
+        snapshots = snapshots.drop(columns=["representative_period_weight"])
+    else:
+        snapshot_weight = pd.Series(1.0, index=snapshots.index)
+
+    if "segment_start" in snapshots.columns:
+        # Each segment counts for as many intervals as it spans.
+        segment_length = (
+            snapshots["snapshots"] - snapshots["segment_start"]
+        ) / pd.Timedelta(minutes=temporal_resolution_min)
+        snapshots = snapshots.drop(columns=["segment_start"])
+    else:
+        segment_length = pd.Series(1.0, index=snapshots.index)
+    snapshot_weight = snapshot_weight * segment_length
+
+    # Calculate the total snapshot weight in each investment period
+    period_weight = snapshot_weight.groupby(snapshots["investment_periods"]).transform(
+        "sum"
     )
 
     # Calculate the objective snapshot weighting
-    snapshots["objective"] = 8760 / snapshots["snapshot_count"]
+    snapshots["objective"] = 8760 * snapshot_weight / period_weight
 
     # Calculate the generators snapshot weighting
-    snapshots["generators"] = 8760 / snapshots["snapshot_count"]
-
-    # Drop the snapshot count column
-    snapshots = snapshots.drop(columns=["snapshot_count"])
+    snapshots["generators"] = 8760 * snapshot_weight / period_weight
 
     # Calculate the stores snapshot weighting
-    snapshots["stores"] = temporal_resolution_min / 60
+    snapshots["stores"] = temporal_resolution_min / 60 * segment_length
 
     return snapshots
 
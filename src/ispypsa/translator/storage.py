@@ -3,11 +3,12 @@ import logging
 import numpy as np
 import pandas as pd
 
+from ispypsa.profiling import profiled
 from ispypsa.translator.helpers import (
     _add_investment_periods_as_build_years,
     _annuitised_investment_costs,
-    _get_commissioning_or_build_year_as_int,
-    _get_financial_year_int_from_string,
+    _get_commissioning_or_build_years_as_int,
+    _get_financial_year_ints_from_strings,
 )
 from ispypsa.translator.mappings import (
     _BATTERY_ATTRIBUTE_ORDER,
@@ -16,6 +17,7 @@ from ispypsa.translator.mappings import (
 )
 
 
+@profiled
 def _translate_ecaa_batteries(
     ispypsa_tables: dict[str, pd.DataFrame],
     investment_periods: list[int],
@@ -75,8 +77,8 @@ def _translate_ecaa_batteries(
             rez_mask, "rez_id"
         ]
 
-    ecaa_batteries["commissioning_date"] = ecaa_batteries["commissioning_date"].apply(
-        _get_commissioning_or_build_year_as_int,
+    ecaa_batteries["commissioning_date"] = _get_commissioning_or_build_years_as_int(
+        ecaa_batteries["commissioning_date"],
         default_build_year=investment_periods[0],
         year_type=year_type,
     )
@@ -109,6 +111,7 @@ def _translate_ecaa_batteries(
     return ecaa_batteries_pypsa_format[columns_in_order]
 
 
+@profiled
 def _translate_new_entrant_batteries(
     ispypsa_tables: dict[str, pd.DataFrame],
     investment_periods: list[int],
@@ -252,9 +255,8 @@ def _add_new_entrant_battery_build_costs(
         id_vars=["technology"], var_name="build_year", value_name="build_cost_$/mw"
     ).rename(columns={"technology": "technology_type"})
     # get the financial year int from build_year string:
-    build_costs["build_year"] = build_costs["build_year"].apply(
-        _get_financial_year_int_from_string,
-        args=("new entrant battery build costs", "fy"),
+    build_costs["build_year"] = _get_financial_year_ints_from_strings(
+        build_costs["build_year"], "new entrant battery build costs", "fy"
     )
 
     # make sure new_entrant_batteries has build_year column with ints:
@@ -265,13 +267,15 @@ def _add_new_entrant_battery_build_costs(
     new_entrants_with_build_costs = new_entrant_batteries.merge(build_costs, how="left")
 
     # check for empty/undefined build costs:
-    undefined_build_cost_batteries = (
-        new_entrants_with_build_costs[
-            new_entrants_with_build_costs["build_cost_$/mw"].isna()
-        ][["storage_name", "build_year"]]
-        .apply(tuple, axis=1)
-        .unique()
-        .tolist()
+    undefined_build_costs = new_entrants_with_build_costs.loc[
+        new_entrants_with_build_costs["build_cost_$/mw"].isna(),
+        ["storage_name", "build_year"],
+    ].drop_duplicates()
+    undefined_build_cost_batteries = list(
+        zip(
+            undefined_build_costs["storage_name"].tolist(),
+            undefined_build_costs["build_year"].tolist(),
+        )
     )
     if undefined_build_cost_batteries:
         raise ValueError(
@@ -306,9 +310,8 @@ def _calculate_annuitised_new_entrant_battery_capital_costs(
         + new_entrant_batteries["connection_cost_$/mw"]
     )
     # annuitise:
-    new_entrant_batteries["capital_cost"] = new_entrant_batteries.apply(
-        lambda x: _annuitised_investment_costs(x["capital_cost"], wacc, x["lifetime"]),
-        axis=1,
+    new_entrant_batteries["capital_cost"] = _annuitised_investment_costs(
+        new_entrant_batteries["capital_cost"], wacc, new_entrant_batteries["lifetime"]
     )
     # add annual fixed opex (first converting to $/MW/annum)
     new_entrant_batteries["capital_cost"] += (
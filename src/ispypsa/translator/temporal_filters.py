@@ -1,3 +1,4 @@
+import heapq
 from datetime import datetime, timedelta
 from typing import Literal
 
@@ -5,6 +6,7 @@ import numpy as np
 import pandas as pd
 
 from ispypsa.config import (
+    RepresentativePeriodsConfig,
     TemporalAggregationConfig,
     TemporalRangeConfig,
 )
@@ -15,6 +17,10 @@ def _time_series_filter(time_series_data: pd.DataFrame, snapshots: pd.DataFrame)
     """Filters a timeseries pandas DataFrame based using the datetime values in
      the snapshots index.
 
+    If the snapshots have been segmented (they have a 'segment_start' column),
+    the time series values are instead averaged over each segment, see
+    `_average_over_segments`.
+
     Examples:
 
     >>> datetime_index = pd.date_range('2020-01-01', '2020-01-03', freq='h')
@@ -33,6 +39,8 @@ def _time_series_filter(time_series_data: pd.DataFrame, snapshots: pd.DataFrame)
         snapshots: pd.DataFrame with datetime index
 
     """
+    if "segment_start" in snapshots.columns:
+        return _average_over_segments(time_series_data, snapshots)
     return time_series_data[time_series_data["snapshots"].isin(snapshots["snapshots"])]
 
 
@@ -44,13 +52,18 @@ def _filter_snapshots(
     existing_generators: pd.DataFrame | None = None,
     demand_traces: dict[str, pd.DataFrame] | None = None,
     generator_traces: dict[str, pd.DataFrame] | None = None,
-) -> pd.DataFrame:
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
     """Appy filter to the snapshots based on the model config.
 
     - If config.representative_weeks is not None then filter the
       snapshots based on the supplied list of representative weeks.
     - If config.named_representative_weeks is not None then filter the
       snapshots based on the supplied list of named representative weeks.
+    - If config.representative_periods is not None then filter the snapshots
+      for the days or weeks chosen by clustering the demand, wind and solar
+      traces, and add the column 'representative_period_weight'. The sequence
+      of representative periods standing for each period of each year is also
+      returned.
 
     Examples:
 
@@ -84,7 +97,7 @@ def _filter_snapshots(
     ... {"snapshots": pd.date_range('2024-01-01', '2024-12-31', freq='h')}
     ... )
 
-    >>> snapshots = _filter_snapshots(
+    >>> snapshots, period_sequence = _filter_snapshots(
     ...     "calendar",
     ...     temporal_range,
     ...     temporal_agg,
@@ -97,16 +110,27 @@ def _filter_snapshots(
     >>> snapshots["snapshots"].iloc[-1]
     Timestamp('2024-01-08 00:00:00')
 
+    >>> period_sequence is None
+    True
+
     Args:
          year_type: "fy" for financial year or "calendar" for calendar year
          temporal_range: TemporalRangeConfig with start and end years
          temporal_aggregation_config: TemporalAggregationConfig with filtering options
          snapshots: pd.DataFrame with datetime index containing the snapshot
          existing_generators: pd.DataFrame with generator data (optional, required for residual metrics)
-         demand_traces: dict[str, pd.DataFrame] with demand traces, required for named_representative_weeks
-         generator_traces: dict[str, pd.DataFrame] with generator traces, required for residual metrics
+         demand_traces: dict[str, pd.DataFrame] with demand traces, required for
+            named_representative_weeks and representative_periods
+         generator_traces: dict[str, pd.DataFrame] with generator traces, required for
+            residual metrics, and clustered on if given with representative_periods
+
+    Returns:
+        Tuple of the filtered snapshots and, if representative_periods is set, the
+            period sequence returned by `_cluster_representative_periods`, else
+            None.
     """
     filtered_snapshots = []
+    period_sequence = None
 
     if temporal_aggregation_config.representative_weeks is not None:
         representative_snapshots = _filter_snapshots_for_representative_weeks(
@@ -141,6 +165,23 @@ def _filter_snapshots(
         )
         filtered_snapshots.append(named_snapshots)
 
+    if (
+        hasattr(temporal_aggregation_config, "representative_periods")
+        and temporal_aggregation_config.representative_periods is not None
+    ):
+        features = _prepare_features_for_representative_periods(
+            existing_generators, demand_traces, generator_traces
+        )
+        representative_snapshots, period_sequence = _cluster_representative_periods(
+            representative_periods=temporal_aggregation_config.representative_periods,
+            snapshots=snapshots,
+            start_year=temporal_range.start_year,
+            end_year=temporal_range.end_year,
+            year_type=year_type,
+            features=features,
+        )
+        filtered_snapshots.append(representative_snapshots)
+
     if filtered_snapshots:
         # Combine all filtered snapshots and drop duplicates
         combined_snapshots = pd.concat(filtered_snapshots, ignore_index=True)
@@ -149,9 +190,9 @@ def _filter_snapshots(
             .sort_values("snapshots")
             .reset_index(drop=True)
         )
-        return combined_snapshots
+        return combined_snapshots, period_sequence
 
-    return snapshots
+    return snapshots, period_sequence
 
 
 def _filter_snapshots_for_representative_weeks(
@@ -668,3 +709,609 @@ def _aggregate_wind_solar_traces(
         )
 
     return renewable_aggregated
+
+
+def _cluster_representative_periods(
+    representative_periods: RepresentativePeriodsConfig,
+    snapshots: pd.DataFrame,
+    start_year: int,
+    end_year: int,
+    year_type: str,
+    features: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Filters snapshots for representative days or weeks chosen by clustering.
+
+    In each model year, the complete days or weeks of the `features` time series
+    are clustered into `representative_periods.n_periods` groups, and the medoid
+    of each group (the member closest to the rest of the group) is kept as a
+    representative period. Each snapshot is given the number of periods its
+    representative period stands for as its 'representative_period_weight'.
+
+    Days run from 00:00:00 (exclusive) to 00:00:00 the next day (inclusive) and
+    weeks from Monday 00:00:00 (exclusive) to the next Monday 00:00:00
+    (inclusive), matching the named representative weeks. Periods spanning the
+    start or end of a year are excluded from the clustering.
+
+    Examples:
+
+    >>> from dataclasses import dataclass
+
+    >>> @dataclass
+    ... class RepresentativePeriodsConfig:
+    ...     n_periods: int
+    ...     period_length: str
+    ...     method: str
+
+    >>> snapshots = pd.DataFrame(
+    ...     {"snapshots": pd.date_range("2024-01-01 12:00", "2024-01-08", freq="12h")}
+    ... )
+    >>> features = pd.DataFrame(
+    ...     {"demand_A": [1, 1, 5, 5, 1, 1, 1.1, 1.1, 5, 5, 5.1, 5.1, 1, 1]},
+    ...     index=snapshots["snapshots"].rename("datetime"),
+    ... )
+
+    >>> representative_snapshots, period_sequence = _cluster_representative_periods(
+    ...     RepresentativePeriodsConfig(2, "day", "k-medoids"),
+    ...     snapshots,
+    ...     start_year=2024,
+    ...     end_year=2024,
+    ...     year_type="calendar",
+    ...     features=features,
+    ... )
+
+    >>> representative_snapshots
+                snapshots  representative_period_weight
+    0 2024-01-01 12:00:00                             4
+    1 2024-01-02 00:00:00                             4
+    2 2024-01-02 12:00:00                             3
+    3 2024-01-03 00:00:00                             3
+
+    >>> period_sequence["representative_period_end"].dt.day.tolist()
+    [2, 3, 2, 2, 3, 3, 2]
+
+    Args:
+        representative_periods: RepresentativePeriodsConfig with the number of
+            periods to keep per year, the period length ('day' or 'week') and the
+            clustering method ('k-medoids' or 'hierarchical').
+        snapshots: pd.DataFrame with the column 'snapshots'.
+        start_year: int, first model year (inclusive).
+        end_year: int, last model year (inclusive).
+        year_type: str, 'fy' for financial year or 'calendar'.
+        features: pd.DataFrame indexed by datetime with one column per time
+            series to cluster on, e.g. from
+            `_prepare_features_for_representative_periods`.
+
+    Returns:
+        Tuple of
+            - pd.DataFrame with the columns 'snapshots' and
+              'representative_period_weight', holding the snapshots in the
+              representative periods.
+            - pd.DataFrame with the columns 'year', 'period_end' and
+              'representative_period_end', giving, in chronological order, the
+              representative period standing for each period of each year. This
+              links the representative periods back into a chronology, e.g. for
+              tracking storage state of charge across periods, and is saved
+              with the time series inputs.
+    """
+    start_year, end_year, month = _get_iteration_start_and_end_time(
+        year_type, start_year, end_year
+    )
+    period_days = 1 if representative_periods.period_length == "day" else 7
+
+    features = _normalise_features(features)
+    period_ends = _assign_period_ends(features.index.to_series(), period_days)
+
+    sequences = []
+    for year in range(start_year, end_year):
+        year_start = datetime(year=year, month=month, day=1)
+        year_end = datetime(year=year + 1, month=month, day=1)
+        in_year = (period_ends - timedelta(days=period_days) >= year_start) & (
+            period_ends <= year_end
+        )
+        year_features = features[in_year.to_numpy()]
+        year_period_ends = period_ends[in_year]
+
+        ends, period_vectors = _stack_periods(year_features, year_period_ends)
+        n_clusters = min(representative_periods.n_periods, len(ends))
+        if n_clusters == 0:
+            continue
+
+        distances = _pairwise_distances(period_vectors)
+        if representative_periods.method == "hierarchical":
+            medoids, labels = _hierarchical_medoids(distances, n_clusters)
+        else:
+            medoids, labels = _k_medoids(distances, n_clusters)
+
+        sequences.append(
+            pd.DataFrame(
+                {
+                    "year": year if month == 1 else year + 1,
+                    "period_end": ends,
+                    "representative_period_end": ends[medoids[labels]],
+                }
+            )
+        )
+
+    if not sequences:
+        raise ValueError(
+            "No complete periods of trace data found to cluster for "
+            "representative_periods."
+        )
+    period_sequence = pd.concat(sequences, ignore_index=True)
+
+    weights = period_sequence["representative_period_end"].value_counts()
+    snapshot_period_ends = _assign_period_ends(snapshots["snapshots"], period_days)
+    representative_weight = snapshot_period_ends.map(weights)
+    is_representative = representative_weight.notna().to_numpy()
+
+    representative_snapshots = pd.DataFrame(
+        {
+            "snapshots": snapshots["snapshots"].to_numpy()[is_representative],
+            "representative_period_weight": representative_weight.to_numpy()[
+                is_representative
+            ].astype("int64"),
+        }
+    )
+    return representative_snapshots, period_sequence
+
+
+def _assign_period_ends(datetimes: pd.Series, period_days: int) -> pd.Series:
+    """The end time of the day or week each datetime falls in.
+
+    Periods end at 00:00:00, which belongs to the period it ends, and weeks end
+    on a Monday.
+
+    Examples:
+
+    >>> datetimes = pd.Series(pd.to_datetime(
+    ...     ["2024-01-01 00:00", "2024-01-01 00:30", "2024-01-07 23:30"]
+    ... ))
+    >>> _assign_period_ends(datetimes, 1).dt.day.tolist()
+    [1, 2, 8]
+    >>> _assign_period_ends(datetimes, 7).dt.day.tolist()
+    [1, 8, 8]
+    """
+    day_ends = (datetimes - pd.Timedelta(microseconds=1)).dt.normalize() + pd.Timedelta(
+        days=1
+    )
+    if period_days == 1:
+        return day_ends
+    days_until_monday = (7 - day_ends.dt.weekday) % 7
+    return day_ends + pd.to_timedelta(days_until_monday, unit="days")
+
+
+def _stack_periods(
+    features: pd.DataFrame, period_ends: pd.Series
+) -> tuple[np.ndarray, np.ndarray]:
+    """Stacks the feature values of each complete period into one row.
+
+    Periods missing time steps, e.g. because the traces don't cover them, are
+    dropped, so every row has the same length.
+
+    Args:
+        features: pd.DataFrame indexed by datetime, sorted, with one column per
+            feature.
+        period_ends: pd.Series with the end time of the period of each row of
+            `features`.
+
+    Returns:
+        Tuple of an array of the period end times and an array with one row
+        per period holding its time steps' feature values.
+    """
+    ends, steps = np.unique(period_ends.to_numpy(), return_counts=True)
+    if len(ends) == 0:
+        return ends, np.empty((0, 0))
+    steps_per_period = steps.max()
+    complete = np.isin(period_ends.to_numpy(), ends[steps == steps_per_period])
+    values = features.to_numpy()[complete]
+    return (
+        ends[steps == steps_per_period],
+        values.reshape(-1, steps_per_period * features.shape[1]),
+    )
+
+
+def _normalise_features(features: pd.DataFrame) -> pd.DataFrame:
+    """Scales each feature to the range 0 to 1, so that features in MW and per
+    unit carry the same weight in the clustering. Constant features become 0.
+    """
+    features = features.sort_index().astype("float64")
+    minimum = features.min()
+    spread = (features.max() - minimum).replace(0.0, 1.0)
+    return ((features - minimum) / spread).fillna(0.0)
+
+
+def _pairwise_distances(period_vectors: np.ndarray) -> np.ndarray:
+    """Euclidean distances between every pair of rows, from one matrix product.
+
+    Uses |a - b|^2 = |a|^2 + |b|^2 - 2 a.b rather than broadcasting the
+    difference of every pair, which would need an array of size
+    n_periods x n_periods x period length.
+    """
+    squared_norms = np.einsum("ij,ij->i", period_vectors, period_vectors)
+    squared = (
+        squared_norms[:, None]
+        + squared_norms[None, :]
+        - 2.0 * period_vectors @ period_vectors.T
+    )
+    np.fill_diagonal(squared, 0.0)
+    return np.sqrt(np.clip(squared, 0.0, None))
+
+
+def _medoids_of_clusters(distances: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """The member of each cluster with the smallest total distance to the rest
+    of its cluster, as row positions, in the order of the cluster labels.
+    """
+    n_clusters = labels.max() + 1
+    same_cluster = labels[:, None] == labels[None, :]
+    total_distance = np.where(same_cluster, distances, 0.0).sum(axis=1)
+    medoids = np.empty(n_clusters, dtype="int64")
+    for cluster in range(n_clusters):
+        members = np.flatnonzero(labels == cluster)
+        medoids[cluster] = members[np.argmin(total_distance[members])]
+    return medoids
+
+
+def _hierarchical_medoids(
+    distances: np.ndarray, n_clusters: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Clusters periods with Ward's agglomerative clustering.
+
+    Starting from one cluster per period, the pair of clusters whose merge least
+    increases the within-cluster variance is merged until `n_clusters` remain.
+    Distances between merged clusters are updated with the Lance-Williams
+    formula, so each merge only updates one row of the distance matrix.
+
+    Returns:
+        Tuple of the row positions of the cluster medoids and each period's
+        cluster label, where label i is the cluster of medoid i.
+    """
+    n_periods = len(distances)
+    squared = distances.astype("float64") ** 2
+    np.fill_diagonal(squared, np.inf)
+    sizes = np.ones(n_periods)
+    cluster_of = np.arange(n_periods)
+    active = np.ones(n_periods, dtype=bool)
+
+    for _ in range(n_periods - n_clusters):
+        i, j = np.unravel_index(np.argmin(squared), squared.shape)
+        i, j = min(i, j), max(i, j)
+        size_i, size_j = sizes[i], sizes[j]
+        merged = (
+            (size_i + sizes) * squared[i]
+            + (size_j + sizes) * squared[j]
+            - sizes * squared[i, j]
+        ) / (size_i + size_j + sizes)
+        merged[~active] = np.inf
+        squared[i, :] = merged
+        squared[:, i] = merged
+        squared[i, i] = np.inf
+        squared[j, :] = np.inf
+        squared[:, j] = np.inf
+        sizes[i] = size_i + size_j
+        active[j] = False
+        cluster_of[cluster_of == j] = i
+
+    _, labels = np.unique(cluster_of, return_inverse=True)
+    return _medoids_of_clusters(distances, labels), labels
+
+
+def _k_medoids(
+    distances: np.ndarray, n_clusters: int, max_iterations: int = 100
+) -> tuple[np.ndarray, np.ndarray]:
+    """Clusters periods with k-medoids, alternating between assigning each
+    period to its nearest medoid and moving each medoid to the member closest to
+    the rest of its cluster.
+
+    The medoids start from Ward's hierarchical clustering, so the result is
+    deterministic and never worse than the hierarchical medoids.
+
+    Returns:
+        Tuple of the row positions of the cluster medoids and each period's
+        cluster label, where label i is the cluster of medoid i.
+    """
+    medoids, _ = _hierarchical_medoids(distances, n_clusters)
+    for _ in range(max_iterations):
+        labels = np.argmin(distances[:, medoids], axis=1)
+        # A medoid is always nearest to itself, so no cluster is empty.
+        labels[medoids] = np.arange(len(medoids))
+        new_medoids = _medoids_of_clusters(distances, labels)
+        if np.array_equal(new_medoids, medoids):
+            break
+        medoids = new_medoids
+    labels = np.argmin(distances[:, medoids], axis=1)
+    labels[medoids] = np.arange(len(medoids))
+    return medoids, labels
+
+
+def _prepare_features_for_representative_periods(
+    existing_generators: pd.DataFrame | None,
+    demand_traces: dict[str, pd.DataFrame] | None,
+    generator_traces: dict[str, pd.DataFrame] | None,
+) -> pd.DataFrame:
+    """Prepare the time series to cluster representative periods on.
+
+    There is one demand feature per demand node, and, if generator traces are
+    given, one wind and one solar feature per sub region: the capacity weighted
+    average availability of its existing wind or solar generators. Without a
+    'sub_region_id' column in `existing_generators` all wind and solar
+    generators are averaged together.
+
+    Args:
+        existing_generators: DataFrame with generator data including fuel_type
+            and maximum_capacity_mw (optional, required with generator_traces)
+        demand_traces: Dictionary with node names as keys and demand traces as values
+        generator_traces: Dictionary with generator names as keys and traces as
+            values (optional)
+
+    Returns:
+        DataFrame indexed by datetime with one column per feature.
+    """
+    if demand_traces is None:
+        raise ValueError(
+            "demand_traces must be provided when using representative_periods"
+        )
+
+    traces = [
+        trace[["datetime", "value"]].assign(feature=f"demand_{node}")
+        for node, trace in demand_traces.items()
+    ]
+
+    if generator_traces is not None and existing_generators is not None:
+        is_vre = existing_generators["fuel_type"].isin(["Wind", "Solar"])
+        vre = existing_generators[
+            is_vre & existing_generators["generator"].isin(generator_traces)
+        ]
+        if "sub_region_id" in vre.columns:
+            regions = vre["sub_region_id"]
+        else:
+            regions = pd.Series("NEM", index=vre.index)
+        feature_of = dict(
+            zip(vre["generator"], vre["fuel_type"].str.lower() + "_" + regions)
+        )
+        capacity_of = dict(zip(vre["generator"], vre["maximum_capacity_mw"]))
+        total_capacity = pd.Series(capacity_of).groupby(pd.Series(feature_of)).sum()
+
+        for name, feature in feature_of.items():
+            trace = generator_traces[name]
+            weight = capacity_of[name] / total_capacity[feature]
+            traces.append(
+                pd.DataFrame(
+                    {
+                        "datetime": trace["datetime"],
+                        "value": trace["value"] * weight,
+                        "feature": feature,
+                    }
+                )
+            )
+
+    traces = pd.concat(traces, ignore_index=True)
+    return traces.pivot_table(
+        index="datetime", columns="feature", values="value", aggfunc="sum"
+    ).fillna(0.0)
+
+
+def _segment_snapshots(
+    snapshots: pd.DataFrame,
+    segments_per_day: int,
+    temporal_resolution_min: int,
+    start_year: int,
+    end_year: int,
+    year_type: str,
+    net_load: pd.DataFrame,
+) -> pd.DataFrame:
+    """Merges runs of consecutive snapshots with similar net load into segments.
+
+    The snapshots are split into blocks of consecutive snapshots (e.g. one per
+    representative week), which never cross the start of a model year. Within
+    each block, adjacent segments are merged, starting from one segment per
+    snapshot, until the block has `segments_per_day` segments per day of
+    snapshots. Each merge joins the adjacent pair whose merge least increases
+    the within-segment variance of the net load (Ward's criterion), so periods
+    of steady net load are merged first and peaks keep their full resolution.
+
+    Each segment is labelled by its last snapshot, as snapshots mark the end of
+    their interval, and gets a 'segment_start' column with the (exclusive)
+    start of the segment, from which time series are averaged over the segment
+    (see `_average_over_segments`) and snapshot weightings are scaled (see
+    `_add_snapshot_weightings`).
+
+    Examples:
+
+    >>> snapshots = pd.DataFrame(
+    ...     {"snapshots": pd.date_range("2024-01-01 06:00", periods=4, freq="6h")}
+    ... )
+    >>> net_load = pd.DataFrame(
+    ...     {"datetime": snapshots["snapshots"], "value": [10.0, 11.0, 50.0, 12.0]}
+    ... )
+    >>> _segment_snapshots(snapshots, 3, 360, 2024, 2024, "calendar", net_load)
+                snapshots       segment_start
+    0 2024-01-01 12:00:00 2024-01-01 00:00:00
+    1 2024-01-01 18:00:00 2024-01-01 12:00:00
+    2 2024-01-02 00:00:00 2024-01-01 18:00:00
+
+    Args:
+        snapshots: pd.DataFrame with the column 'snapshots', sorted, and
+            optionally 'representative_period_weight', which is kept.
+        segments_per_day: int, the number of segments to keep per day of
+            snapshots.
+        temporal_resolution_min: int, the snapshot resolution in minutes.
+        start_year: int, first model year (inclusive).
+        end_year: int, last model year (inclusive).
+        year_type: str, 'fy' for financial year or 'calendar'.
+        net_load: pd.DataFrame with the columns 'datetime' and 'value', the
+            total demand less wind and solar generation.
+
+    Returns:
+        pd.DataFrame with one row per segment, with the columns of `snapshots`
+            plus 'segment_start'.
+    """
+    resolution = pd.Timedelta(minutes=temporal_resolution_min)
+    snapshots_per_day = pd.Timedelta(days=1) // resolution
+    start_year, end_year, month = _get_iteration_start_and_end_time(
+        year_type, start_year, end_year
+    )
+    year_starts = pd.to_datetime(
+        [datetime(year, month, 1) for year in range(start_year, end_year + 1)]
+    )
+
+    times = snapshots["snapshots"].reset_index(drop=True)
+    starts = times - resolution
+    # A new block starts after a gap, or at the start of a model year.
+    new_block = (starts != times.shift()) | starts.isin(year_starts)
+    block = new_block.cumsum().to_numpy()
+
+    values = (
+        net_load.set_index("datetime")["value"].reindex(times).to_numpy(dtype="float64")
+    )
+    if np.isnan(values).any():
+        raise ValueError("net load data must cover every snapshot to segment them")
+
+    segment_ends = []
+    block_bounds = np.flatnonzero(np.diff(block, prepend=0, append=block[-1] + 1))
+    for first, stop in zip(block_bounds[:-1], block_bounds[1:]):
+        n_segments = int(np.ceil((stop - first) / snapshots_per_day * segments_per_day))
+        sizes = _merge_adjacent_segments(values[first:stop], n_segments)
+        segment_ends.append(first + np.cumsum(sizes) - 1)
+    segment_ends = np.concatenate(segment_ends)
+    segment_starts = np.concatenate([[0], segment_ends[:-1] + 1])
+
+    segmented = snapshots.reset_index(drop=True).iloc[segment_ends]
+    segmented = segmented.reset_index(drop=True)
+    segmented["segment_start"] = starts.iloc[segment_starts].to_numpy()
+    return segmented
+
+
+def _merge_adjacent_segments(values: np.ndarray, n_segments: int) -> np.ndarray:
+    """Merges adjacent values into `n_segments` segments with Ward's criterion.
+
+    The cheapest merge is repeatedly taken from a heap of the merge costs of
+    adjacent segments. Each segment is held at the position of its first value,
+    and merged values are masked out rather than deleted, so merging is
+    O(n log n) in the number of values.
+
+    Returns:
+        np.ndarray with the number of values in each segment, in order.
+    """
+    n_values = len(values)
+    sizes = np.ones(n_values)
+    sums = values.astype("float64").copy()
+    merged = np.zeros(n_values, dtype=bool)
+    next_segment = np.arange(1, n_values + 1)
+    previous_segment = np.arange(-1, n_values - 1)
+
+    def merge_cost(i, j):
+        mean_step = sums[j] / sizes[j] - sums[i] / sizes[i]
+        return sizes[i] * sizes[j] / (sizes[i] + sizes[j]) * mean_step**2
+
+    # Entries hold the sizes of the segments they were costed for, so entries
+    # left stale by a later merge can be skipped.
+    costs = [(merge_cost(i, i + 1), i, i + 1, 1.0, 1.0) for i in range(n_values - 1)]
+    heapq.heapify(costs)
+    for _ in range(n_values - n_segments):
+        while True:
+            _, i, j, size_i, size_j = heapq.heappop(costs)
+            if (
+                not merged[i]
+                and next_segment[i] == j
+                and sizes[i] == size_i
+                and sizes[j] == size_j
+            ):
+                break
+        sizes[i] += sizes[j]
+        sums[i] += sums[j]
+        merged[j] = True
+        next_segment[i] = next_segment[j]
+        if next_segment[i] < n_values:
+            previous_segment[next_segment[i]] = i
+            k = next_segment[i]
+            heapq.heappush(costs, (merge_cost(i, k), i, k, sizes[i], sizes[k]))
+        h = previous_segment[i]
+        if h >= 0:
+            heapq.heappush(costs, (merge_cost(h, i), h, i, sizes[h], sizes[i]))
+    return sizes[~merged].astype("int64")
+
+
+def _average_over_segments(
+    time_series_data: pd.DataFrame, snapshots: pd.DataFrame
+) -> pd.DataFrame:
+    """Averages a time series over segmented snapshots.
+
+    Each value is averaged into the segment whose interval, from 'segment_start'
+    (exclusive) to 'snapshots' (inclusive), holds it. Values outside every
+    segment are dropped.
+
+    Examples:
+
+    >>> snapshots = pd.DataFrame({
+    ...     "snapshots": pd.to_datetime(["2024-01-01 02:00", "2024-01-01 03:00"]),
+    ...     "segment_start": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 02:00"]),
+    ... })
+    >>> time_series_data = pd.DataFrame({
+    ...     "snapshots": pd.date_range("2024-01-01 01:00", periods=4, freq="h"),
+    ...     "p_set": [1.0, 3.0, 5.0, 7.0],
+    ... })
+    >>> _average_over_segments(time_series_data, snapshots)
+                snapshots  p_set
+    0 2024-01-01 02:00:00    2.0
+    1 2024-01-01 03:00:00    5.0
+
+    Args:
+        time_series_data: pd.DataFrame with the column 'snapshots' and numeric
+            value columns.
+        snapshots: pd.DataFrame with the columns 'snapshots' and
+            'segment_start', sorted.
+
+    Returns:
+        pd.DataFrame with the columns of `time_series_data`, with one row per
+            segment holding a value, labelled by the segment's 'snapshots'.
+    """
+    ends = snapshots["snapshots"].to_numpy()
+    starts = snapshots["segment_start"].to_numpy()
+    times = time_series_data["snapshots"].to_numpy().astype(ends.dtype)
+
+    # The first segment ending at or after each time is the only one it can be in.
+    segment = np.searchsorted(ends, times, side="left")
+    in_segment = segment < len(ends)
+    in_segment[in_segment] = times[in_segment] > starts[segment[in_segment]]
+    segment = segment[in_segment]
+
+    value_columns = [col for col in time_series_data.columns if col != "snapshots"]
+    held, position = np.unique(segment, return_inverse=True)
+    counts = np.bincount(position)
+    averaged = {"snapshots": ends[held]}
+    for col in value_columns:
+        column_values = time_series_data[col].to_numpy()[in_segment]
+        sums = np.bincount(position, weights=column_values.astype("float64"))
+        averaged[col] = (sums / counts).astype(column_values.dtype)
+    return pd.DataFrame(averaged)
+
+
+def _prepare_net_load_for_segmentation(
+    existing_generators: pd.DataFrame | None,
+    demand_traces: dict[str, pd.DataFrame] | None,
+    generator_traces: dict[str, pd.DataFrame] | None,
+) -> pd.DataFrame:
+    """Prepare the total net load (demand less existing wind and solar generation)
+    to segment snapshots on. Without generator data, the net load is the demand.
+
+    Args:
+        existing_generators: DataFrame with generator data (optional)
+        demand_traces: Dictionary of demand traces
+        generator_traces: Dictionary of generator traces (optional)
+
+    Returns:
+        DataFrame with columns: datetime, value (net load in MW)
+    """
+    if demand_traces is None:
+        raise ValueError("demand_traces must be provided when using segmentation")
+
+    demand_data = _aggregate_demand_traces(demand_traces)
+    renewable_data = None
+    if existing_generators is not None and generator_traces is not None:
+        renewable_data = _aggregate_wind_solar_traces(
+            generator_traces, existing_generators
+        )
+    net_load = _prepare_demand_with_residual(demand_data, renewable_data, ["residual"])
+    return net_load.loc[:, ["datetime", "residual_demand"]].rename(
+        columns={"residual_demand": "value"}
+    )
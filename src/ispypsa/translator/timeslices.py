@@ -0,0 +1,72 @@
+"""Re-sequence the templated timeslice patterns onto the model's years.
+
+The templater emits one month-day window pattern per reference (weather) year.
+Each model year takes the pattern of the reference year it is assigned by the
+reference_year_mapping — the same assignment used for the demand and VRE traces
+— so timeslice-tagged limits line up with the weather they were derived from.
+
+The result, the pypsa friendly timeslice_calendar table, stays in month-day form
+with one row per window and model year; pypsa_build expands it against the
+snapshots once per snapshot set (see ispypsa.pypsa_build.timeslices).
+"""
+
+from datetime import datetime
+
+import pandas as pd
+
+_TIMESLICE_CALENDAR_COLUMNS = [
+    "year_start",
+    "year_end",
+    "timeslice_id",
+    "start_month_day",
+    "end_month_day",
+]
+
+
+def _translate_timeslices_to_model_years(
+    timeslices: pd.DataFrame,
+    reference_year_mapping: dict[int, int],
+    year_type: str,
+) -> pd.DataFrame:
+    """Gives each model year the timeslice windows of its reference year.
+
+    Each model year is written as the [year_start, year_end) datetime range it
+    covers, so pypsa_build can place snapshots in years without knowing the
+    year type. Model years whose reference year has no windows get no rows; no
+    timeslice is active in them.
+
+    I/O Example:
+        timeslices:
+            timeslice_id          reference_year  start_month_day  end_month_day
+            qld_summer_typical    2011            10-01            04-01
+            qld_winter_reference  2011            04-01            10-01
+            qld_summer_typical    2015            11-01            04-01
+            qld_winter_reference  2015            04-01            11-01
+
+        reference_year_mapping = {2025: 2015, 2026: 2011}, year_type = "fy"
+
+        returns:
+            year_start  year_end    timeslice_id          start_month_day  end_month_day
+            2024-07-01  2025-07-01  qld_summer_typical    11-01            04-01
+            2024-07-01  2025-07-01  qld_winter_reference  04-01            11-01
+            2025-07-01  2026-07-01  qld_summer_typical    10-01            04-01
+            2025-07-01  2026-07-01  qld_winter_reference  04-01            10-01
+    """
+    years = pd.DataFrame(
+        {
+            "year": list(reference_year_mapping.keys()),
+            "reference_year": list(reference_year_mapping.values()),
+        }
+    )
+    # A financial year runs from July and is named after the calendar year it
+    # ends in.
+    month, offset = (7, 1) if year_type == "fy" else (1, 0)
+    years["year_start"] = [
+        datetime(year=year - offset, month=month, day=1) for year in years["year"]
+    ]
+    years["year_end"] = [
+        datetime(year=year - offset + 1, month=month, day=1) for year in years["year"]
+    ]
+    calendar = years.merge(timeslices, on="reference_year")
+    calendar = calendar.sort_values(["year_start", "timeslice_id", "start_month_day"])
+    return calendar.loc[:, _TIMESLICE_CALENDAR_COLUMNS].reset_index(drop=True)
@@ -0,0 +1,11 @@
+from ispypsa.validation.table_validator import (
+    TableSchema,
+    load_schemas,
+    validate_ispypsa_tables,
+)
+
+__all__ = [
+    "TableSchema",
+    "load_schemas",
+    "validate_ispypsa_tables",
+]
@@ -0,0 +1,373 @@
+"""Validates ISPyPSA input tables against the YAML schemas in `schemas/`.
+
+Each schema describes a table: whether the table is required, its unique keys
+and, per column, its type, whether it is required, allowed values or bounds and
+the columns of other tables its values must come from (`allowed_values_from`).
+
+`load_schemas` compiles each schema once into a `TableSchema`, a set of
+vectorised checks over whole columns:
+
+- type checks cast each column (e.g. with `pd.to_numeric`) and flag the filled
+  values the cast turns into missing values,
+- unique keys are checked by hashing each key's columns row by row and only
+  comparing the rows whose hashes collide,
+- foreign keys (`allowed_values_from`) are checked by converting each column to
+  a categorical with the referenced values as categories, so a value not in the
+  referenced table gets code -1.
+
+`validate_ispypsa_tables` runs the checks over a whole set of tables and
+reports every problem found at once, rather than stopping at the first.
+
+The `custom_validation` rules listed in some schemas are checked where the
+tables are used, not here.
+"""
+
+import functools
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from ispypsa.profiling import profiled
+
+_SCHEMA_DIRECTORY = Path(__file__).parent / "schemas"
+
+# How many offending values are listed in each error message.
+_MAX_EXAMPLES = 5
+
+_BOUNDS = {
+    "gt": (np.greater, ">"),
+    "gte": (np.greater_equal, ">="),
+    "lt": (np.less, "<"),
+    "lte": (np.less_equal, "<="),
+}
+
+
+class TableSchema:
+    """A table schema compiled into vectorised checks.
+
+    Args:
+        schema: dict, the parsed contents of a schema YAML file.
+    """
+
+    def __init__(self, schema: dict) -> None:
+        self.table = schema["table"]
+        self.required = schema.get("required", False)
+        self.unique = [list(key) for key in schema.get("unique", [])]
+        self.columns = list(schema["columns"])
+        self.required_columns = [
+            column
+            for column, spec in schema["columns"].items()
+            if spec.get("required", False)
+        ]
+        # Required columns with a nan_fill can be left blank, so only columns
+        # without one are checked for missing values.
+        self.not_null_columns = [
+            column
+            for column in self.required_columns
+            if "nan_fill" not in schema["columns"][column]
+        ]
+        self.casts = {
+            column: _compile_cast(spec) for column, spec in schema["columns"].items()
+        }
+        self.value_checks = {
+            column: _compile_value_checks(spec)
+            for column, spec in schema["columns"].items()
+        }
+        self.foreign_keys = {
+            column: [
+                (table, referenced_column)
+                for reference in spec["allowed_values_from"]
+                for table, referenced_column in reference.items()
+            ]
+            for column, spec in schema["columns"].items()
+            if "allowed_values_from" in spec
+        }
+
+    def find_errors(
+        self,
+        table: pd.DataFrame,
+        reference_values: Callable[[str, str], pd.Index | None],
+    ) -> list[str]:
+        """Runs the schema's checks on a table.
+
+        Args:
+            table: `pd.DataFrame` to check.
+            reference_values: Returns the unique filled values of a column of
+                another table, given the table and column names, or None if
+                that table or column isn't available.
+
+        Returns:
+            list of str, one message per problem found.
+        """
+        errors = []
+        missing_columns = [
+            column for column in self.required_columns if column not in table.columns
+        ]
+        if missing_columns:
+            errors.append(f"missing required columns {missing_columns}")
+
+        for column in self.columns:
+            if column not in table.columns:
+                continue
+            values = table[column]
+            is_null = values.isna().to_numpy()
+            if column in self.not_null_columns and is_null.any():
+                errors.append(f"{column}: {is_null.sum()} rows have no value")
+
+            filled = values[~is_null]
+            if filled.empty:
+                continue
+            cast_values, cast_error = self.casts[column](filled)
+            if cast_error is not None:
+                errors.append(f"{column}: {cast_error}")
+                continue
+            for check, description in self.value_checks[column]:
+                failed = ~check(cast_values)
+                if failed.any():
+                    errors.append(
+                        f"{column}: {failed.sum()} values are not {description}, "
+                        f"e.g. {_examples(filled[failed])}"
+                    )
+            if column in self.foreign_keys:
+                errors += self._find_foreign_key_errors(
+                    column, filled, reference_values
+                )
+
+        for key in self.unique:
+            if all(column in table.columns for column in key):
+                errors += _find_duplicate_keys(table, key)
+
+        return errors
+
+    def _find_foreign_key_errors(
+        self,
+        column: str,
+        filled: pd.Series,
+        reference_values: Callable[[str, str], pd.Index | None],
+    ) -> list[str]:
+        references = [
+            (table, referenced_column, reference_values(table, referenced_column))
+            for table, referenced_column in self.foreign_keys[column]
+        ]
+        available = [values for _, _, values in references if values is not None]
+        if not available:
+            return []
+        categories = available[0].append(available[1:]).unique()
+        codes = pd.Categorical(filled, categories=categories).codes
+        not_found = codes == -1
+        if not not_found.any():
+            return []
+        referenced = " or ".join(
+            f"{table}.{referenced_column}"
+            for table, referenced_column, values in references
+            if values is not None
+        )
+        return [
+            f"{column}: {not_found.sum()} values are not in {referenced}, "
+            f"e.g. {_examples(filled[not_found])}"
+        ]
+
+
+def _compile_cast(spec: dict) -> Callable[[pd.Series], tuple]:
+    """Returns a function casting a column's filled values to the schema type.
+
+    The function returns the cast values and None, or None and an error message
+    if some values can't be cast.
+    """
+    column_type = spec["type"]
+    date_format = spec.get("format")
+
+    def cast(values: pd.Series) -> tuple:
+        if column_type in ("float", "int"):
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(
+                values
+            ):
+                cast_values = values
+            else:
+                cast_values = pd.to_numeric(values, errors="coerce")
+            failed = cast_values.isna()
+            if column_type == "int" and not failed.all():
+                failed |= cast_values.mod(1).ne(0) & ~failed
+            description = "numbers" if column_type == "float" else "integers"
+        elif column_type == "date" or date_format is not None:
+            if date_format is not None and not _has_year(date_format):
+                # Without a year pandas parses into 1900, which has no 29 February,
+                # so year-less dates are parsed into a leap year instead.
+                cast_values = pd.to_datetime(
+                    "2000-" + values.astype(str),
+                    format="%Y-" + date_format,
+                    errors="coerce",
+                )
+            else:
+                cast_values = pd.to_datetime(
+                    values, format=date_format, errors="coerce"
+                )
+            failed = cast_values.isna()
+            description = f"dates in the format {date_format!r}"
+        else:
+            return values, None
+        if failed.any():
+            return None, (
+                f"{failed.sum()} values are not {description}, "
+                f"e.g. {_examples(values[failed])}"
+            )
+        return cast_values, None
+
+    return cast
+
+
+def _has_year(date_format: str) -> bool:
+    """Returns True if a strftime format has a year directive."""
+    return any(directive in date_format for directive in ("%Y", "%y", "%G"))
+
+
+def _compile_value_checks(spec: dict) -> list[tuple[Callable, str]]:
+    """Returns (check, description) pairs for a column's bounds and allowed values.
+
+    Each check takes the column's cast, filled values and returns a boolean array,
+    True where a value passes.
+    """
+    checks = []
+    for bound, (compare, symbol) in _BOUNDS.items():
+        if bound in spec:
+            limit = spec[bound]
+            checks.append(
+                (
+                    functools.partial(_compare, compare=compare, limit=limit),
+                    f"{symbol} {limit}",
+                )
+            )
+    if "allowed_values" in spec:
+        allowed = pd.Index(spec["allowed_values"])
+        checks.append(
+            (lambda values: values.isin(allowed).to_numpy(), f"in {list(allowed)}")
+        )
+    return checks
+
+
+def _compare(values: pd.Series, compare: Callable, limit: float) -> np.ndarray:
+    return compare(values.to_numpy(), limit)
+
+
+def _find_duplicate_keys(table: pd.DataFrame, key: list[str]) -> list[str]:
+    """Finds rows sharing a unique key, comparing only rows whose hashes collide."""
+    hashes = pd.util.hash_pandas_object(table[key], index=False)
+    candidates = hashes.duplicated(keep=False).to_numpy()
+    if not candidates.any():
+        return []
+    duplicated = table.loc[candidates, key]
+    duplicated = duplicated[duplicated.duplicated(keep=False)]
+    if duplicated.empty:
+        return []
+    examples = duplicated.drop_duplicates().head(_MAX_EXAMPLES)
+    return [
+        f"{len(duplicated)} rows share a value of the unique key {key}, e.g. "
+        f"{list(examples.itertuples(index=False, name=None))}"
+    ]
+
+
+def _examples(values: pd.Series) -> list:
+    # tolist() converts numpy scalars to native types so the message reads
+    # "[2025]" rather than "[np.int64(2025)]".
+    return values.drop_duplicates().head(_MAX_EXAMPLES).tolist()
+
+
+@functools.cache
+def load_schemas(schema_directory: Path | str | None = None) -> dict[str, TableSchema]:
+    """Loads and compiles the table schemas, once per schema directory.
+
+    Args:
+        schema_directory: Directory of schema YAML files. Defaults to the
+            schemas packaged with `ispypsa`.
+
+    Returns:
+        dict mapping each table name to its `TableSchema`.
+    """
+    directory = Path(schema_directory or _SCHEMA_DIRECTORY)
+    schemas = {}
+    for path in sorted(directory.glob("*.yaml")):
+        with open(path) as f:
+            schema = TableSchema(yaml.safe_load(f))
+        schemas[schema.table] = schema
+    return schemas
+
+
+@profiled
+def validate_ispypsa_tables(
+    ispypsa_tables: dict[str, pd.DataFrame],
+    check_required_tables: bool = True,
+    raise_on_error: bool = True,
+    schemas: dict[str, TableSchema] | None = None,
+) -> list[str]:
+    """Checks a set of ISPyPSA input tables against their schemas.
+
+    Every table with a schema is checked for missing required columns, blank
+    values in required columns, values that don't match the column's type,
+    bounds or allowed values, duplicated unique keys and values missing from
+    the tables they reference. Tables without a schema are ignored, and
+    references to tables that aren't in `ispypsa_tables` are not checked.
+
+    Examples:
+        Perform required imports.
+        >>> from pathlib import Path
+        >>> from ispypsa.data_fetch import read_csvs
+        >>> from ispypsa.validation import validate_ispypsa_tables
+
+        Check the ISPyPSA input tables, raising a ValueError listing every
+        problem found.
+        >>> ispypsa_tables = read_csvs(Path("ispypsa_inputs"))
+        >>> validate_ispypsa_tables(ispypsa_tables)
+
+    Args:
+        ispypsa_tables: dict of ISPyPSA input tables, keyed by table name.
+        check_required_tables: Whether to report tables marked as required in
+            their schema that are missing from `ispypsa_tables`. Defaults to
+            True.
+        raise_on_error: Whether to raise if any problems are found, rather than
+            just returning them. Defaults to True.
+        schemas: Compiled schemas to check against. Defaults to
+            `load_schemas()`.
+
+    Returns:
+        list of str, a message for each problem found, prefixed with the table
+            name.
+
+    Raises:
+        ValueError: If `raise_on_error` and any problems are found, listing
+            them all.
+    """
+    if schemas is None:
+        schemas = load_schemas()
+
+    reference_values = functools.cache(
+        functools.partial(_unique_filled_values, ispypsa_tables)
+    )
+
+    errors = []
+    for name, schema in schemas.items():
+        if name not in ispypsa_tables:
+            if check_required_tables and schema.required:
+                errors.append(f"{name}: required table is missing")
+            continue
+        errors += [
+            f"{name}: {error}"
+            for error in schema.find_errors(ispypsa_tables[name], reference_values)
+        ]
+
+    if errors and raise_on_error:
+        raise ValueError(
+            f"{len(errors)} problems found in the ISPyPSA input tables:\n  - "
+            + "\n  - ".join(errors)
+        )
+    return errors
+
+
+def _unique_filled_values(
+    ispypsa_tables: dict[str, pd.DataFrame], table: str, column: str
+) -> pd.Index | None:
+    if table not in ispypsa_tables or column not in ispypsa_tables[table].columns:
+        return None
+    return pd.Index(ispypsa_tables[table][column].dropna().unique())
@@ -0,0 +1,46 @@
+from benchmarks.synthetic import (
+    make_synthetic_config,
+    make_synthetic_ispypsa_tables,
+    write_synthetic_trace_directory,
+)
+from ispypsa.translator import (
+    create_pypsa_friendly_inputs,
+    create_pypsa_friendly_timeseries_inputs,
+)
+
+
+def test_synthetic_inputs_run_through_translator(tmp_path):
+    ispypsa_tables = make_synthetic_ispypsa_tables(
+        n_sub_regions=3, n_rezs=4, n_generators=12, investment_periods=[2025]
+    )
+    trace_directory = write_synthetic_trace_directory(
+        tmp_path / "traces", ispypsa_tables, start_year=2025, end_year=2025
+    )
+    config = make_synthetic_config(
+        trace_directory, investment_periods=[2025], representative_weeks=[10]
+    )
+
+    pypsa_tables = create_pypsa_friendly_inputs(
+        config, {name: table.copy() for name, table in ispypsa_tables.items()}
+    )
+    snapshots = create_pypsa_friendly_timeseries_inputs(
+        config,
+        "capacity_expansion",
+        ispypsa_tables,
+        pypsa_tables["generators"],
+        trace_directory,
+        tmp_path / "timeseries",
+    )
+
+    assert len(pypsa_tables["buses"]) == 3 + 4
+    assert len(pypsa_tables["custom_constraints_lhs"]) > 0
+    assert len(snapshots) == 7 * 48
+    assert len(list((tmp_path / "timeseries" / "demand_traces").iterdir())) == 3
+
+
+def test_synthetic_inputs_are_seeded():
+    first = make_synthetic_ispypsa_tables(n_sub_regions=2, n_rezs=2, n_generators=5)
+    second = make_synthetic_ispypsa_tables(n_sub_regions=2, n_rezs=2, n_generators=5)
+
+    for name, table in first.items():
+        assert table.equals(second[name]), name
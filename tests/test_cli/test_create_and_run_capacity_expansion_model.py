@@ -143,3 +143,27 @@ def test_core_functionality_and_triggers(
     assert_task_ran(result.stdout, "create_and_run_capacity_expansion_model")
     assert target_file.exists(), "Missing file was not regenerated"
     assert target_file.stat().st_size > 0, "Regenerated file is empty"
+
+
+def test_foresight_change_reruns_solve(
+    mock_config,
+    prepare_test_cache,
+    run_cli_command,
+    monkeypatch,
+):
+    """Changing the foresight re-runs the solve even though translation writes
+    the same PyPSA friendly tables."""
+    monkeypatch.setenv("ISPYPSA_TEST_MOCK_CACHE", "true")
+
+    args = [
+        f"config={mock_config}",
+        "create_and_run_capacity_expansion_model",
+    ]
+    result = run_cli_command(args)
+    assert result.returncode == 0, f"{result.stdout}\n{result.stderr}"
+    assert_task_ran(result.stdout, "create_and_run_capacity_expansion_model")
+
+    modify_config_value(mock_config, "temporal.capacity_expansion.foresight", "myopic")
+    result = run_cli_command(args)
+    assert result.returncode == 0, f"{result.stdout}\n{result.stderr}"
+    assert_task_ran(result.stdout, "create_and_run_capacity_expansion_model")
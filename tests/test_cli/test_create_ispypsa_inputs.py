@@ -77,7 +77,7 @@ def test_create_ispypsa_inputs_task(
     verify_output_files(output_dir, expected_file_names)
 
     # Check log and config files
-    log_file = tmp_path / "run_dir" / "test_run" / "ISPyPSA.log"
+    log_file = tmp_path / "run_dir" / "test_run" / "logs" / "create_ispypsa_inputs.log"
     assert log_file.exists()
     saved_config = tmp_path / "run_dir" / "test_run" / "test_config.yaml"
     assert saved_config.exists()
@@ -145,6 +145,41 @@ def test_create_ispypsa_inputs_task(
     assert target_file.stat().st_size > 0
 
 
+def test_up_to_date_checks_use_content_and_relevant_config(
+    mock_config, prepare_test_cache, tmp_path, run_cli_command, monkeypatch
+):
+    """Test that re-written but unchanged inputs and irrelevant config changes
+    don't re-run the task, and that the output says why a task ran or didn't.
+
+    Runs: 4 (fresh + rewritten input + irrelevant config + relevant config)
+    """
+    monkeypatch.setenv("ISPYPSA_TEST_MOCK_CACHE", "true")
+
+    result = run_cli_command([f"config={mock_config}", "create_ispypsa_inputs"])
+    assert result.returncode == 0, result.stdout
+    assert "no previous successful run" in result.stdout
+
+    # Re-write a cache file with the same table but different formatting.
+    time.sleep(0.1)
+    cache_file = tmp_path / "cache" / "existing_generators_summary.csv"
+    pd.read_csv(cache_file).to_csv(cache_file, index=False, lineterminator="\r\n")
+    result = run_cli_command([f"config={mock_config}", "create_ispypsa_inputs"])
+    assert result.returncode == 0
+    assert_task_up_to_date(result.stdout, "create_ispypsa_inputs")
+    assert "up to date: config and inputs unchanged" in result.stdout
+
+    modify_config_value(mock_config, "create_plots", True)
+    result = run_cli_command([f"config={mock_config}", "create_ispypsa_inputs"])
+    assert result.returncode == 0
+    assert_task_up_to_date(result.stdout, "create_ispypsa_inputs")
+
+    modify_config_value(mock_config, "scenario", "Progressive Change")
+    result = run_cli_command([f"config={mock_config}", "create_ispypsa_inputs"])
+    assert result.returncode == 0
+    assert_task_ran(result.stdout, "create_ispypsa_inputs")
+    assert "config changed: scenario" in result.stdout
+
+
 def test_cli_flags_and_dependency_chain(
     mock_config, prepare_test_cache, tmp_path, run_cli_command, monkeypatch
 ):
@@ -154,6 +189,9 @@ def test_cli_flags_and_dependency_chain(
     - test_force_execution_with_always_flag
     - test_dependency_chain_execution
 
+    The dependency chain is run with two processes, so each task runs in its
+    own process and writes its own log file.
+
     Runs: 3 (initial + force + dependency chain)
     """
     monkeypatch.setenv("ISPYPSA_TEST_MOCK_CACHE", "true")
@@ -181,8 +219,10 @@ def test_cli_flags_and_dependency_chain(
     if cache_dir.exists():
         shutil.rmtree(cache_dir)
 
-    result = run_cli_command([f"config={mock_config}", "create_ispypsa_inputs"])
-    assert result.returncode == 0
+    result = run_cli_command(
+        [f"config={mock_config}", "-n", "2", "create_ispypsa_inputs"]
+    )
+    assert result.returncode == 0, result.stdout
     assert_task_ran(result.stdout, "cache_required_iasr_workbook_tables")
     assert_task_ran(result.stdout, "create_ispypsa_inputs")
 
@@ -190,6 +230,10 @@ def test_cli_flags_and_dependency_chain(
     expected_file_names = list_templater_output_files("sub_regions")
     verify_output_files(output_dir, expected_file_names)
 
+    logs_dir = tmp_path / "run_dir" / "test_run" / "logs"
+    assert (logs_dir / "cache_required_iasr_workbook_tables.log").exists()
+    assert (logs_dir / "create_ispypsa_inputs.log").exists()
+
 
 def test_config_path_variations(
     mock_config,
@@ -128,7 +128,7 @@ def test_create_ispypsa_inputs_task_new_format(
     verify_output_files(output_dir, _NEW_FORMAT_OUTPUTS)
 
     # Check log and config files
-    log_file = tmp_path / "run_dir" / "test_run" / "ISPyPSA.log"
+    log_file = tmp_path / "run_dir" / "test_run" / "logs" / "create_ispypsa_inputs.log"
     assert log_file.exists()
     saved_config = tmp_path / "run_dir" / "test_run" / "test_config.yaml"
     assert saved_config.exists()
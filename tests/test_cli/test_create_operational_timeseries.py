@@ -98,11 +98,19 @@ def test_core_functionality_and_triggers(
     if not run_extensive:
         return
 
-    # Test config file modification triggers rerun (extensive only)
+    # Test a config change the task doesn't read doesn't trigger a rerun, and one
+    # it does read does (extensive only)
     time.sleep(0.1)
     modify_config_value(mock_config, "discount_rate", 0.06)
     result = run_cli_command([f"config={mock_config}", "create_operational_timeseries"])
     assert result.returncode == 0
+    assert_task_up_to_date(result.stdout, "create_operational_timeseries")
+
+    modify_config_value(
+        mock_config, "temporal.operational.aggregation.representative_weeks", [1]
+    )
+    result = run_cli_command([f"config={mock_config}", "create_operational_timeseries"])
+    assert result.returncode == 0
     assert_task_ran(result.stdout, "create_operational_timeseries")
 
     # Test dependency modification trigger (extensive only)
@@ -0,0 +1,100 @@
+import os
+
+from doit.task import Task
+
+from ispypsa.cli.fingerprints import (
+    TableContentChecker,
+    TaskFingerprint,
+    explain_task_status,
+    hash_file_contents,
+)
+
+
+def test_hash_file_contents_ignores_csv_formatting(tmp_path):
+    table = tmp_path / "table.csv"
+    reformatted = tmp_path / "reformatted.csv"
+    changed = tmp_path / "changed.csv"
+    table.write_text("name,capacity\nA,1.0\nB,2.5\n")
+    reformatted.write_text('"name","capacity"\r\nA,1\r\nB,2.50\r\n')
+    changed.write_text("name,capacity\nA,1.0\nB,3.5\n")
+
+    assert hash_file_contents(table) == hash_file_contents(reformatted)
+    assert hash_file_contents(table) != hash_file_contents(changed)
+
+
+def test_hash_file_contents_of_other_files_uses_bytes(tmp_path):
+    empty_csv = tmp_path / "empty.csv"
+    network = tmp_path / "network.nc"
+    empty_csv.write_text("")
+    network.write_bytes(b"\x00\x01")
+
+    assert hash_file_contents(empty_csv) != hash_file_contents(network)
+
+
+def test_table_content_checker_ignores_rewrites_with_the_same_table(tmp_path):
+    table = tmp_path / "table.csv"
+    table.write_text("name,capacity\nA,1.5\n")
+    checker = TableContentChecker()
+    state = checker.get_state(str(table), None)
+
+    table.write_text("name,capacity\r\nA,1.50\r\n")
+    os.utime(table, ns=(state[1] + 10**9, state[1] + 10**9))
+    assert not checker.check_modified(str(table), os.stat(table), state)
+
+    table.write_text("name,capacity\nA,2.0\n")
+    assert checker.check_modified(str(table), os.stat(table), state)
+
+
+def _run_and_save(fingerprint):
+    """Checks a fingerprint with no saved state, then returns the saved values."""
+    assert not fingerprint(None, {})
+    return fingerprint._save_fingerprint()
+
+
+def test_task_fingerprint_is_up_to_date_when_nothing_changed(tmp_path):
+    results = tmp_path / "results.csv"
+    results.write_text("a\n1\n")
+    values = _run_and_save(
+        TaskFingerprint({"solver": "highs"}, input_files=lambda: [results])
+    )
+
+    fingerprint = TaskFingerprint({"solver": "highs"}, input_files=lambda: [results])
+
+    assert fingerprint(None, values)
+    assert fingerprint.reasons == []
+
+
+def test_task_fingerprint_names_what_changed(tmp_path):
+    results = tmp_path / "results.csv"
+    plot = tmp_path / "plot.html"
+    results.write_text("a\n1\n")
+    values = _run_and_save(
+        TaskFingerprint(
+            {"solver": "highs", "wacc": 0.07}, input_files=lambda: [results]
+        )
+    )
+
+    results.write_text("a\n2\n")
+    fingerprint = TaskFingerprint(
+        {"solver": "gurobi", "wacc": 0.07},
+        input_files=lambda: [results],
+        output_files=lambda: [plot],
+    )
+
+    assert not fingerprint(None, values)
+    assert fingerprint.reasons == [
+        "config changed: solver",
+        "inputs changed: results.csv",
+        "missing outputs: plot.html",
+    ]
+
+
+def test_explain_task_status():
+    fingerprint = TaskFingerprint({"solver": "highs"})
+    task = Task("solve", actions=["echo"], uptodate=[fingerprint])
+    fingerprint(task, {})
+
+    assert explain_task_status(task, executed=True) == ["no previous successful run"]
+    assert explain_task_status(task, executed=False) == [
+        "up to date: config and inputs unchanged"
+    ]
@@ -188,8 +188,8 @@ def invalid_path_wrong_structure(config):
     return config, ValueError
 
 
-def invalid_resolution_min_not_30(config):
-    config["temporal"]["capacity_expansion"]["resolution_min"] = 60
+def invalid_resolution_min_not_dividing_day(config):
+    config["temporal"]["capacity_expansion"]["resolution_min"] = 420
     return config, ValueError
 
 
@@ -304,6 +304,56 @@ def invalid_named_representative_weeks(config):
     return config, ValidationError
 
 
+def invalid_representative_periods_n_periods(config):
+    config["temporal"]["capacity_expansion"]["aggregation"][
+        "representative_periods"
+    ] = {"n_periods": 0}
+    return config, ValidationError
+
+
+def invalid_representative_periods_with_representative_weeks(config):
+    config["temporal"]["capacity_expansion"]["aggregation"]["representative_weeks"] = [
+        1
+    ]
+    config["temporal"]["capacity_expansion"]["aggregation"][
+        "representative_periods"
+    ] = {"n_periods": 4}
+    return config, ValidationError
+
+
+def invalid_segmentation_segments_per_day(config):
+    config["temporal"]["capacity_expansion"]["aggregation"]["segmentation"] = {
+        "segments_per_day": 0
+    }
+    return config, ValidationError
+
+
+def invalid_foresight(config):
+    config["temporal"]["capacity_expansion"]["foresight"] = "limited"
+    return config, ValidationError
+
+
+def invalid_foresight_window(config):
+    config["temporal"]["capacity_expansion"]["foresight_window"] = 0
+    return config, ValidationError
+
+
+def invalid_compare_foresight_with_perfect_foresight(config):
+    config["temporal"]["capacity_expansion"]["compare_foresight"] = True
+    return config, ValidationError
+
+
+def invalid_decomposition_processes(config):
+    config["temporal"]["capacity_expansion"]["decomposition"] = {"processes": 0}
+    return config, ValidationError
+
+
+def invalid_decomposition_with_myopic_foresight(config):
+    config["temporal"]["capacity_expansion"]["foresight"] = "myopic"
+    config["temporal"]["capacity_expansion"]["decomposition"] = {}
+    return config, ValidationError
+
+
 @pytest.mark.parametrize(
     "modifier_func",
     [
@@ -320,7 +370,7 @@ def invalid_named_representative_weeks(config):
         invalid_rez_transmission_limit,
         invalid_end_year,
         invalid_path_not_directory,
-        invalid_resolution_min_not_30,
+        invalid_resolution_min_not_dividing_day,
         invalid_resolution_min_less_than_30,
         invalid_resolution_min_not_multiple_of_30,
         invalid_representative_weeks,
@@ -341,6 +391,14 @@ def invalid_named_representative_weeks(config):
         invalid_trace_dataset_type,
         invalid_trace_dataset_year,
         invalid_named_representative_weeks,
+        invalid_representative_periods_n_periods,
+        invalid_representative_periods_with_representative_weeks,
+        invalid_segmentation_segments_per_day,
+        invalid_foresight,
+        invalid_foresight_window,
+        invalid_compare_foresight_with_perfect_foresight,
+        invalid_decomposition_processes,
+        invalid_decomposition_with_myopic_foresight,
     ],
     ids=lambda f: f.__name__,  # Use function name as test ID
 )
@@ -373,6 +431,49 @@ def test_operational_is_optional():
     ModelConfig(**config)
 
 
+@pytest.mark.parametrize("resolution_min", [30, 60, 120, 240, 1440])
+def test_valid_resolution_min(resolution_min):
+    config = get_valid_config()
+    config["temporal"]["capacity_expansion"]["resolution_min"] = resolution_min
+    config["temporal"]["operational"]["resolution_min"] = resolution_min
+    model = ModelConfig(**config)
+    assert model.temporal.capacity_expansion.resolution_min == resolution_min
+
+
+def test_representative_periods_defaults():
+    config = get_valid_config()
+    config["temporal"]["capacity_expansion"]["aggregation"] = {
+        "representative_weeks": None,
+        "representative_periods": {"n_periods": 8},
+    }
+    model = ModelConfig(**config)
+    representative_periods = (
+        model.temporal.capacity_expansion.aggregation.representative_periods
+    )
+    assert representative_periods.n_periods == 8
+    assert representative_periods.period_length == "week"
+    assert representative_periods.method == "k-medoids"
+
+
+def test_foresight_defaults():
+    config = get_valid_config()
+    model = ModelConfig(**config)
+    assert model.temporal.capacity_expansion.foresight == "perfect"
+    assert model.temporal.capacity_expansion.foresight_window == 1
+    assert model.temporal.capacity_expansion.compare_foresight is False
+
+
+def test_decomposition_defaults():
+    config = get_valid_config()
+    config["temporal"]["capacity_expansion"]["decomposition"] = {}
+    model = ModelConfig(**config)
+    decomposition = model.temporal.capacity_expansion.decomposition
+    assert decomposition.subproblems == "investment_period"
+    assert decomposition.max_iterations == 100
+    assert decomposition.tolerance == 1e-4
+    assert decomposition.processes == 1
+
+
 def test_unserved_energy_defaults():
     """Test that UnservedEnergyConfig uses default values when not provided."""
     config = get_valid_config()
@@ -1,6 +1,16 @@
 from unittest.mock import patch
 
-from ispypsa.iasr_table_caching.local_cache import _build_required_tables
+import openpyxl
+import pytest
+
+from ispypsa.iasr_table_caching.local_cache import (
+    _build_required_tables,
+    _group_tables_by_sheet,
+    _load_table_configs,
+    _read_cache_manifest,
+    _write_sheet_subset_workbook,
+    build_local_cache,
+)
 
 
 def test_build_required_tables_new_format():
@@ -57,3 +67,124 @@ def test_build_required_tables_old_format():
     assert "build_costs_current_policies" in result
     assert "expected_closure_years" in result
     assert "maximum_capacity_existing_generators" in result
+
+
+class _FakeParser:
+    """Stands in for `isp_workbook_parser.Parser`, recording requested tables."""
+
+    saved_tables = []
+
+    def __init__(self, file_path):
+        self.workbook_version = "6.0"
+
+    def save_tables(self, directory, tables):
+        _FakeParser.saved_tables.append(list(tables))
+        for table in tables:
+            (directory / f"{table}.csv").write_text("a\n1\n")
+
+
+def _build_cache(tmp_path, workbook, required_tables):
+    with (
+        patch("ispypsa.iasr_table_caching.local_cache.Parser", _FakeParser),
+        patch(
+            "ispypsa.iasr_table_caching.local_cache._build_required_tables",
+            return_value=required_tables,
+        ),
+    ):
+        build_local_cache(tmp_path / "cache", workbook, "6.0")
+
+
+def test_build_local_cache_only_extracts_missing_or_stale_tables(tmp_path):
+    _FakeParser.saved_tables = []
+    workbook = tmp_path / "workbook.xlsx"
+    workbook.write_bytes(b"workbook contents")
+
+    _build_cache(tmp_path, workbook, ["table_a", "table_b"])
+    assert _FakeParser.saved_tables == [["table_a", "table_b"]]
+
+    # Nothing changed, so the workbook isn't opened.
+    _build_cache(tmp_path, workbook, ["table_a", "table_b"])
+    assert len(_FakeParser.saved_tables) == 1
+
+    # A newly required table and a deleted cache file are extracted.
+    (tmp_path / "cache" / "table_a.csv").unlink()
+    _build_cache(tmp_path, workbook, ["table_a", "table_b", "table_c"])
+    assert _FakeParser.saved_tables[-1] == ["table_a", "table_c"]
+
+    # A changed workbook invalidates every table.
+    workbook.write_bytes(b"updated workbook contents")
+    _build_cache(tmp_path, workbook, ["table_a", "table_b", "table_c"])
+    assert _FakeParser.saved_tables[-1] == ["table_a", "table_b", "table_c"]
+
+    manifest = _read_cache_manifest(tmp_path / "cache")
+    assert set(manifest) == {"table_a", "table_b", "table_c"}
+    assert manifest["table_a"]["iasr_workbook_version"] == "6.0"
+
+
+def test_build_local_cache_version_mismatch_raises(tmp_path):
+    workbook = tmp_path / "workbook.xlsx"
+    workbook.write_bytes(b"workbook contents")
+    with (
+        patch("ispypsa.iasr_table_caching.local_cache.Parser", _FakeParser),
+        pytest.raises(ValueError, match="does not match the version"),
+    ):
+        build_local_cache(tmp_path / "cache", workbook, "7.5")
+
+
+def test_group_tables_by_sheet():
+    table_configs = _load_table_configs("7.5")
+    tables = [
+        "flow_path_augmentation_options_CQ-NQ",
+        "flow_path_augmentation_options_NNSW-SQ",
+        "renewable_energy_zones",
+        "not_a_table",
+    ]
+    groups = _group_tables_by_sheet(tables, "7.5")
+    assert sorted(t for group in groups for t in group) == sorted(tables)
+    assert [len(group) for group in groups] == sorted(
+        (len(group) for group in groups), reverse=True
+    )
+    assert ["not_a_table"] in groups
+    for group in groups:
+        if group != ["not_a_table"]:
+            assert len({table_configs[t].sheet_name.lower() for t in group}) == 1
+
+
+def test_build_local_cache_dispatches_to_process_pool(tmp_path):
+    workbook = tmp_path / "workbook.xlsx"
+    workbook.write_bytes(b"workbook contents")
+    with (
+        patch(
+            "ispypsa.iasr_table_caching.local_cache._build_required_tables",
+            return_value=["table_a"],
+        ),
+        patch(
+            "ispypsa.iasr_table_caching.local_cache._extract_tables_in_parallel"
+        ) as extract_in_parallel,
+    ):
+        build_local_cache(tmp_path / "cache", workbook, "6.0", n_processes=4)
+    extract_in_parallel.assert_called_once_with(
+        tmp_path / "cache", workbook, ["table_a"], "6.0", 4
+    )
+
+
+def test_write_sheet_subset_workbook(tmp_path):
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Change Log"
+    workbook["Change Log"]["B1"] = 6.0
+    for sheet_name in ["Summary Mapping", "Capacity Factors", "Build Costs"]:
+        workbook.create_sheet(sheet_name)["A1"] = sheet_name
+    workbook["Build Costs"]["A1"].comment = openpyxl.comments.Comment("note", "me")
+    workbook.save(tmp_path / "workbook.xlsx")
+
+    _write_sheet_subset_workbook(
+        tmp_path / "workbook.xlsx", {"summary mapping"}, tmp_path / "subset.xlsx"
+    )
+
+    subset = openpyxl.load_workbook(tmp_path / "subset.xlsx")
+    assert subset.sheetnames == workbook.sheetnames
+    assert subset["Change Log"]["B1"].value == 6.0
+    assert subset["Summary Mapping"]["A1"].value == "Summary Mapping"
+    assert subset["Capacity Factors"].max_row == 1
+    assert subset["Capacity Factors"]["A1"].value is None
+    assert subset["Build Costs"]["A1"].value is None
@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def two_period_model(csv_str_to_df, tmp_path):
+    """A single bus model where capacity is cheap to build in 2025 but expensive to
+    build in 2030, and demand doubles between the two investment periods. Unserved
+    energy keeps the model feasible with any capacity built."""
+    snapshots = pd.DataFrame(
+        {
+            "investment_periods": [2025, 2025, 2030, 2030],
+            "snapshots": pd.to_datetime(
+                [
+                    "2025-01-01 01:00:00",
+                    "2025-01-01 02:00:00",
+                    "2030-01-01 01:00:00",
+                    "2030-01-01 02:00:00",
+                ]
+            ),
+            "objective": 1.0,
+            "generators": 1.0,
+            "stores": 1.0,
+        }
+    )
+    demand = snapshots.loc[:, ["investment_periods", "snapshots"]]
+    demand["p_set"] = [100.0, 100.0, 200.0, 200.0]
+    (tmp_path / "demand_traces").mkdir()
+    demand.to_parquet(tmp_path / "demand_traces" / "bus_one.parquet")
+
+    tables = {
+        "snapshots": snapshots,
+        "investment_period_weights": csv_str_to_df("""
+            period,  years,  objective
+            2025,    5,      1.0
+            2030,    5,      1.0
+            """),
+        "buses": csv_str_to_df("""
+            name
+            bus_one
+            """),
+        "generators": csv_str_to_df("""
+            name,      bus,      carrier,  p_nom,  p_nom_extendable,  capital_cost,  marginal_cost,  build_year,  lifetime
+            new_2025,  bus_one,  Gas,      0.0,    True,              10.0,          1.0,            2025,        100
+            new_2030,  bus_one,  Gas,      0.0,    True,              100.0,         1.0,            2030,        100
+            unserved,  bus_one,  Unserved, 1000.0, False,             0.0,           10000.0,        2025,        100
+            """),
+        "custom_constraints_lhs": csv_str_to_df("""
+            constraint_name,  component,  attribute,  variable_name,  coefficient
+            con_one,          Generator,  p_nom,      new_2025,       1.0
+            con_one,          Generator,  p_nom,      new_2030,       1.0
+            """),
+        "custom_constraints_rhs": csv_str_to_df("""
+            constraint_name,  rhs,   constraint_type
+            con_one,          1000,  <=
+            """),
+    }
+    return tables, tmp_path
@@ -3,7 +3,7 @@ import pypsa
 import pytest
 
 from ispypsa.pypsa_build.generators import (
-    _add_generator_to_network,
+    _add_generators_to_network,
 )
 
 
@@ -83,7 +83,7 @@ def mock_trace_paths(tmp_path, csv_str_to_df):
     }
 
 
-def test_add_generator_to_network_static_marginal_cost(mock_network, mock_trace_paths):
+def test_add_generators_to_network_static_marginal_cost(mock_network, mock_trace_paths):
     """Test adding a generator with static marginal cost."""
     # Generator definition with static marginal cost
     generator_def = {
@@ -96,12 +96,10 @@ def test_add_generator_to_network_static_marginal_cost(mock_network, mock_trace_
     }
 
     # Call the function
-    _add_generator_to_network(
-        generator_def,
+    _add_generators_to_network(
         mock_network,
-        mock_trace_paths["solar"],
-        mock_trace_paths["wind"],
-        mock_trace_paths["marginal_costs"],
+        pd.DataFrame([generator_def]),
+        mock_trace_paths["solar"].parent,
     )
 
     # Check the generator was added correctly
@@ -110,7 +108,7 @@ def test_add_generator_to_network_static_marginal_cost(mock_network, mock_trace_
     assert "isp_custom_attribute" not in mock_network.generators.columns
 
 
-def test_add_generator_to_network_dynamic_marginal_cost(
+def test_add_generators_to_network_dynamic_marginal_cost(
     mock_network, mock_trace_paths, csv_str_to_df
 ):
     """Test adding a generator with dynamic marginal cost."""
@@ -124,12 +122,10 @@ def test_add_generator_to_network_dynamic_marginal_cost(
     }
 
     # Call the function
-    _add_generator_to_network(
-        generator_def,
+    _add_generators_to_network(
         mock_network,
-        mock_trace_paths["solar"],
-        mock_trace_paths["wind"],
-        mock_trace_paths["marginal_costs"],
+        pd.DataFrame([generator_def]),
+        mock_trace_paths["solar"].parent,
     )
 
     # Check the generator was added correctly
@@ -144,7 +140,7 @@ def test_add_generator_to_network_dynamic_marginal_cost(
     )
 
 
-def test_add_generator_to_network_with_traces(mock_network, mock_trace_paths):
+def test_add_generators_to_network_with_traces(mock_network, mock_trace_paths):
     """Test adding wind/solar generators with availability traces."""
     # Test for Wind
     wind_gen_def = {
@@ -155,14 +151,6 @@ def test_add_generator_to_network_with_traces(mock_network, mock_trace_paths):
         "marginal_cost": 0.0,
     }
 
-    _add_generator_to_network(
-        wind_gen_def,
-        mock_network,
-        mock_trace_paths["solar"],
-        mock_trace_paths["wind"],
-        mock_trace_paths["marginal_costs"],
-    )
-
     # Test for Solar
     solar_gen_def = {
         "name": "solar_gen",
@@ -172,12 +160,10 @@ def test_add_generator_to_network_with_traces(mock_network, mock_trace_paths):
         "marginal_cost": 0.0,
     }
 
-    _add_generator_to_network(
-        solar_gen_def,
+    _add_generators_to_network(
         mock_network,
-        mock_trace_paths["solar"],
-        mock_trace_paths["wind"],
-        mock_trace_paths["marginal_costs"],
+        pd.DataFrame([wind_gen_def, solar_gen_def]),
+        mock_trace_paths["solar"].parent,
     )
 
     # Check generators were added with correct p_max_pu values
@@ -0,0 +1,111 @@
+import pandas as pd
+import pytest
+
+from ispypsa.pypsa_build import build_pypsa_network, solve_with_benders_decomposition
+from ispypsa.pypsa_build.decomposition import (
+    _split_custom_constraints,
+    _split_snapshots,
+)
+
+
+def _solve_full_model(tables, timeseries_path):
+    network = build_pypsa_network(
+        {name: table.copy() for name, table in tables.items()}, timeseries_path
+    )
+    network.optimize.solve_model()
+    return network
+
+
+@pytest.mark.parametrize(
+    "subproblems, processes", [("investment_period", 1), ("week", 2)]
+)
+def test_benders_decomposition_matches_full_model(
+    two_period_model, subproblems, processes
+):
+    tables, timeseries_path = two_period_model
+    full_network = _solve_full_model(tables, timeseries_path)
+
+    network, convergence = solve_with_benders_decomposition(
+        tables,
+        timeseries_path,
+        subproblems=subproblems,
+        tolerance=1e-6,
+        processes=processes,
+    )
+
+    assert network.generators.loc["new_2025", "p_nom_opt"] == pytest.approx(200.0)
+    assert network.generators.loc["new_2030", "p_nom_opt"] == pytest.approx(0.0)
+    assert network.objective == pytest.approx(full_network.objective)
+    assert list(convergence.columns) == [
+        "iteration",
+        "lower_bound",
+        "upper_bound",
+        "gap",
+    ]
+    assert convergence["gap"].iloc[-1] <= 1e-6
+    assert convergence["upper_bound"].iloc[-1] == pytest.approx(full_network.objective)
+
+
+def test_benders_decomposition_master_custom_constraint(two_period_model):
+    tables, timeseries_path = two_period_model
+    # Only 150 MW can be built across both options, so the rest of the 2030 demand
+    # is unserved.
+    tables["custom_constraints_rhs"]["rhs"] = 150
+    full_network = _solve_full_model(tables, timeseries_path)
+
+    network, _ = solve_with_benders_decomposition(
+        tables, timeseries_path, tolerance=1e-6
+    )
+
+    assert network.generators.loc["new_2025", "p_nom_opt"] == pytest.approx(150.0)
+    assert network.objective == pytest.approx(full_network.objective)
+
+
+def test_split_custom_constraints(csv_str_to_df):
+    tables = {
+        "custom_constraints_lhs": csv_str_to_df("""
+            constraint_name,  component,  attribute,  variable_name,  coefficient
+            capacity_limit,   Generator,  p_nom,      gen_one,        1.0
+            capacity_limit,   Link,       p_nom,      link_one,       2.0
+            flow_limit,       Link,       p,          link_one,       1.0
+            flow_limit,       Generator,  p_nom,      flow_limit-EXPANSION, -1.0
+            """),
+        "custom_constraints_rhs": csv_str_to_df("""
+            constraint_name,  rhs,  constraint_type
+            capacity_limit,   500,  <=
+            flow_limit,       100,  <=
+            """),
+    }
+
+    master_constraints, subproblem_tables = _split_custom_constraints(tables)
+
+    assert list(master_constraints["constraint_name"].unique()) == ["capacity_limit"]
+    assert list(master_constraints["rhs"]) == [500, 500]
+    assert list(subproblem_tables["custom_constraints_rhs"]["constraint_name"]) == [
+        "flow_limit"
+    ]
+    assert len(subproblem_tables["custom_constraints_lhs"]) == 2
+
+
+def test_split_snapshots_by_week():
+    snapshots = pd.DataFrame(
+        {
+            "investment_periods": [2025, 2025, 2025, 2030],
+            "snapshots": pd.to_datetime(
+                [
+                    "2025-01-05 23:00:00",
+                    # Monday midnight ends the week starting the previous Monday.
+                    "2025-01-06 00:00:00",
+                    "2025-01-06 00:30:00",
+                    "2030-01-01 00:30:00",
+                ]
+            ),
+        }
+    )
+
+    groups = _split_snapshots(snapshots, "week")
+
+    assert [len(group) for group in groups] == [2, 1, 1]
+    assert len(_split_snapshots(snapshots, "investment_period")) == 2
+    with pytest.raises(ValueError, match="subproblems must be"):
+        _split_snapshots(snapshots, "month")
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+import pypsa
+import pytest
+
+from ispypsa.pypsa_build.timeslices import (
+    _add_link_timeslice_limits_to_network,
+    _expand_link_timeslice_limits,
+    _TimesliceCodes,
+)
+
+
+@pytest.fixture
+def snapshots_index():
+    timesteps = pd.to_datetime(
+        [
+            "2025-03-31 12:00",  # FY2025 summer (wraps past the year end)
+            "2025-04-01 00:00",  # FY2025 winter starts
+            "2025-07-01 00:00",  # FY2026 winter, carried past 30 June
+            "2025-11-18 12:00",  # FY2026 peak
+            "2026-07-01 00:00",  # outside every model year
+        ]
+    )
+    return pd.MultiIndex.from_arrays(
+        [[2025, 2025, 2026, 2026, 2026], timesteps],
+        names=["period", "timestep"],
+    )
+
+
+@pytest.fixture
+def timeslice_calendar(csv_str_to_df):
+    return csv_str_to_df("""
+        year_start,  year_end,    timeslice_id,          start_month_day,  end_month_day
+        2024-07-01,  2025-07-01,  qld_summer_typical,    10-01,            04-01
+        2024-07-01,  2025-07-01,  qld_winter_reference,  04-01,            10-01
+        2025-07-01,  2026-07-01,  qld_peak_demand,       11-18,            11-20
+        2025-07-01,  2026-07-01,  qld_summer_typical,    11-20,            04-01
+        2025-07-01,  2026-07-01,  qld_winter_reference,  04-01,            11-18
+        2025-07-01,  2026-07-01,  nsw_winter_reference,  01-01,            01-01
+    """)
+
+
+def test_timeslice_codes(snapshots_index, timeslice_calendar):
+    codes = _TimesliceCodes(snapshots_index, timeslice_calendar)
+
+    assert list(codes.timeslices["qld"]) == [
+        "qld_peak_demand",
+        "qld_summer_typical",
+        "qld_winter_reference",
+    ]
+    np.testing.assert_array_equal(codes.codes["qld"], [1, 2, 2, 0, -1])
+    # A window ending where it starts covers the whole year.
+    np.testing.assert_array_equal(codes.codes["nsw"], [-1, -1, 0, 0, -1])
+
+
+def test_expand_link_timeslice_limits(
+    csv_str_to_df, snapshots_index, timeslice_calendar
+):
+    link_timeslice_limits = csv_str_to_df("""
+        name,       attribute,  timeslice,             value
+        CQ-NQ,      p_max_pu,   qld_peak_demand,       0.5
+        CQ-NQ,      p_max_pu,   qld_winter_reference,  0.75
+        CQ-NQ,      p_max_pu,   ,                      1.0
+        NQ-SQ,      p_max_pu,   qld_summer_typical,    0.25
+        NNSW-SQ,    p_max_pu,   ,                      0.9
+        CQ-NQ,      p_min_pu,   ,                      -1.0
+    """)
+    defaults = csv_str_to_df("""
+        name,     p_max_pu,  p_min_pu
+        CQ-NQ,    1.0,       0.0
+        NQ-SQ,    0.8,       0.0
+        NNSW-SQ,  1.0,       0.0
+    """).set_index("name")
+    codes = _TimesliceCodes(snapshots_index, timeslice_calendar)
+
+    result = _expand_link_timeslice_limits(
+        link_timeslice_limits, defaults, codes, "p_max_pu"
+    )
+
+    # NQ-SQ has no fallback, so outside summer it keeps its static p_max_pu.
+    expected = pd.DataFrame(
+        {
+            "CQ-NQ": [1.0, 0.75, 0.75, 0.5, 1.0],
+            "NQ-SQ": [0.25, 0.8, 0.8, 0.8, 0.8],
+            "NNSW-SQ": [0.9, 0.9, 0.9, 0.9, 0.9],
+        },
+        index=snapshots_index,
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_expand_link_timeslice_limits_raises_on_several_regions(
+    csv_str_to_df, snapshots_index, timeslice_calendar
+):
+    link_timeslice_limits = csv_str_to_df("""
+        name,      attribute,  timeslice,             value
+        NNSW-SQ,   p_max_pu,   qld_peak_demand,       0.5
+        NNSW-SQ,   p_max_pu,   nsw_winter_reference,  0.75
+    """)
+    defaults = pd.DataFrame({"p_max_pu": [1.0]}, index=["NNSW-SQ"])
+    codes = _TimesliceCodes(snapshots_index, timeslice_calendar)
+
+    with pytest.raises(ValueError, match="more than one region: \\['NNSW-SQ'\\]"):
+        _expand_link_timeslice_limits(
+            link_timeslice_limits, defaults, codes, "p_max_pu"
+        )
+
+
+def test_add_link_timeslice_limits_to_network(
+    csv_str_to_df, snapshots_index, timeslice_calendar
+):
+    network = pypsa.Network()
+    network.set_snapshots(snapshots_index)
+    network.add("Bus", ["CQ", "NQ"])
+    network.add("Link", "CQ-NQ", bus0="CQ", bus1="NQ", p_nom=100.0)
+    link_timeslice_limits = csv_str_to_df("""
+        name,   attribute,  timeslice,        value
+        CQ-NQ,  p_max_pu,   qld_peak_demand,  0.5
+        CQ-NQ,  p_max_pu,   ,                 1.0
+        CQ-NQ,  p_min_pu,   ,                 -0.8
+    """)
+
+    _add_link_timeslice_limits_to_network(
+        network,
+        link_timeslice_limits,
+        _TimesliceCodes(network.snapshots, timeslice_calendar),
+    )
+
+    assert list(network.links_t.p_max_pu["CQ-NQ"]) == [1.0, 1.0, 1.0, 0.5, 1.0]
+    assert list(network.links_t.p_min_pu["CQ-NQ"]) == [-0.8] * 5
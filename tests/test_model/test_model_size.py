@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ispypsa.pypsa_build import (
+    build_pypsa_network,
+    estimate_model_size,
+    model_statistics,
+)
+
+
+@pytest.fixture
+def two_period_model_with_links_and_storage(two_period_model, csv_str_to_df):
+    tables, timeseries_path = two_period_model
+    tables["buses"] = csv_str_to_df("""
+        name
+        bus_one
+        bus_two
+        """)
+    tables["links"] = csv_str_to_df("""
+        name,      bus0,     bus1,     p_nom,  p_min_pu,  p_nom_extendable,  capital_cost,  build_year,  lifetime
+        existing,  bus_one,  bus_two,  50.0,   -1.0,      False,             0.0,           2020,        8
+        new_2030,  bus_one,  bus_two,  0.0,    -1.0,      True,              10.0,          2030,        100
+        """)
+    tables["batteries"] = csv_str_to_df("""
+        name,          bus,      p_nom,  p_nom_extendable,  carrier,  max_hours,  capital_cost,  build_year,  lifetime,  efficiency_store,  efficiency_dispatch
+        existing_bat,  bus_two,  10.0,   False,             Battery,  2.0,        0.0,           2020,        50,        0.9,               0.9
+        new_bat,       bus_one,  0.0,    True,              Battery,  1.0,        5.0,           2030,        20,        0.9,               0.9
+        """)
+    tables["generators"]["p_nom_max"] = [np.inf, 300.0, np.inf]
+    tables["custom_constraints_lhs"] = csv_str_to_df("""
+        constraint_name,  component,  attribute,  variable_name,  coefficient
+        con_one,          Generator,  p_nom,      new_2025,       1.0
+        con_one,          Generator,  p_nom,      new_2030,       1.0
+        flow_limit,       Link,       p,          existing,       1.0
+        flow_limit,       Link,       p,          new_2030,       1.0
+        flow_limit,       Generator,  p_nom,      new_2030,       -1.0
+        """)
+    tables["custom_constraints_rhs"] = csv_str_to_df("""
+        constraint_name,  rhs,   constraint_type
+        con_one,          1000,  <=
+        flow_limit,       100,   <=
+        """)
+    return tables, timeseries_path
+
+
+def test_estimate_model_size_matches_built_model(
+    two_period_model_with_links_and_storage,
+):
+    tables, timeseries_path = two_period_model_with_links_and_storage
+
+    estimate = estimate_model_size(tables)
+    network = build_pypsa_network(
+        {name: table.copy() for name, table in tables.items()}, timeseries_path
+    )
+    statistics = model_statistics(network)
+
+    pd.testing.assert_frame_equal(estimate, statistics["model_size"])
+    assert list(estimate["group"]) == [
+        "Generator",
+        "Link",
+        "StorageUnit",
+        "Bus",
+        "con_one",
+        "flow_limit",
+    ]
+    # The existing link is retired before 2030, so only the new link's flow
+    # contributes in that period.
+    flow_limit = estimate.set_index("group").loc["flow_limit"]
+    assert flow_limit["constraints"] == 4
+    assert flow_limit["nonzeros"] == 2 + 2 + 4
+
+
+def test_model_statistics_blocks_and_coefficient_ranges(two_period_model):
+    tables, timeseries_path = two_period_model
+    network = build_pypsa_network(tables, timeseries_path)
+
+    statistics = model_statistics(network)
+
+    constraint_blocks = statistics["constraint_blocks"]
+    assert constraint_blocks["nonzeros"].is_monotonic_decreasing
+    assert (
+        constraint_blocks.loc[constraint_blocks["block"] == "con_one", "group"]
+        == "con_one"
+    ).all()
+
+    ranges = statistics["coefficient_ranges"].set_index("coefficient")
+    assert list(ranges.index) == ["matrix", "objective", "bounds", "rhs"]
+    assert ranges.loc["objective", "max"] == pytest.approx(10000.0)
+    assert ranges.loc["rhs", "max"] == pytest.approx(1000.0)
+    assert ranges.loc["matrix", "min"] == pytest.approx(1.0)
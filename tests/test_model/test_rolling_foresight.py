@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+from ispypsa.pypsa_build import (
+    build_pypsa_network,
+    solve_with_rolling_foresight,
+)
+
+
+def test_rolling_foresight_commits_capacity_one_period_at_a_time(two_period_model):
+    tables, timeseries_path = two_period_model
+
+    network, foresight_report = solve_with_rolling_foresight(
+        tables, timeseries_path, foresight_window=1
+    )
+
+    # Without seeing 2030 demand only 100 MW is built in 2025, so the shortfall in
+    # 2030 has to be met with the expensive 2030 option.
+    assert network.generators.loc["new_2025", "p_nom_opt"] == pytest.approx(100.0)
+    assert network.generators.loc["new_2030", "p_nom_opt"] == pytest.approx(100.0)
+    assert list(network.investment_periods) == [2025, 2030]
+
+    assert list(foresight_report["investment_period"]) == [2025, 2030]
+    assert list(foresight_report["window_end"]) == [2025, 2030]
+    assert foresight_report["system_cost"].sum() == pytest.approx(network.objective)
+
+
+def test_rolling_foresight_costs_more_than_perfect_foresight(two_period_model):
+    tables, timeseries_path = two_period_model
+
+    perfect_foresight_network = build_pypsa_network(
+        {name: table.copy() for name, table in tables.items()}, timeseries_path
+    )
+    perfect_foresight_network.optimize.solve_model()
+    myopic_network, foresight_report = solve_with_rolling_foresight(
+        tables, timeseries_path, foresight_window=1, compare_to_perfect_foresight=True
+    )
+
+    assert myopic_network.objective > perfect_foresight_network.objective
+    assert list(foresight_report.columns) == [
+        "investment_period",
+        "window_end",
+        "window_objective",
+        "system_cost",
+        "perfect_foresight_cost",
+        "cost_difference",
+    ]
+    assert foresight_report["perfect_foresight_cost"].sum() == pytest.approx(
+        perfect_foresight_network.objective
+    )
+    assert foresight_report["cost_difference"].sum() == pytest.approx(
+        myopic_network.objective - perfect_foresight_network.objective
+    )
+
+
+def test_rolling_foresight_window_covering_all_periods_matches_perfect_foresight(
+    two_period_model,
+):
+    tables, timeseries_path = two_period_model
+
+    perfect_foresight_network = build_pypsa_network(
+        {name: table.copy() for name, table in tables.items()}, timeseries_path
+    )
+    perfect_foresight_network.optimize.solve_model()
+    network, foresight_report = solve_with_rolling_foresight(
+        tables, timeseries_path, foresight_window=2
+    )
+
+    assert list(foresight_report["window_end"]) == [2030, 2030]
+    assert network.generators.loc["new_2025", "p_nom_opt"] == pytest.approx(200.0)
+    assert network.objective == pytest.approx(perfect_foresight_network.objective)
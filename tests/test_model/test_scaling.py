@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from ispypsa.pypsa_build import build_pypsa_network, scale_model
+from ispypsa.pypsa_build.scaling import _geometric_scaling
+
+
+def test_scaled_model_solution_matches_unscaled_model(two_period_model):
+    tables, timeseries_path = two_period_model
+    unscaled_network = build_pypsa_network(
+        {name: table.copy() for name, table in tables.items()}, timeseries_path
+    )
+    unscaled_network.optimize.solve_model()
+
+    network = build_pypsa_network(tables, timeseries_path)
+    coefficient_ranges = scale_model(network)
+    network.optimize.solve_model()
+
+    assert network.objective == pytest.approx(unscaled_network.objective)
+    np.testing.assert_allclose(
+        network.generators["p_nom_opt"], unscaled_network.generators["p_nom_opt"]
+    )
+    # Duals are unscaled before PyPSA assigns them as marginal prices.
+    np.testing.assert_allclose(
+        network.buses_t.marginal_price, unscaled_network.buses_t.marginal_price
+    )
+
+    assert list(coefficient_ranges.columns) == [
+        "coefficient",
+        "unscaled_min",
+        "unscaled_max",
+        "scaled_min",
+        "scaled_max",
+    ]
+    objective = coefficient_ranges.set_index("coefficient").loc["objective"]
+    assert objective["unscaled_max"] == pytest.approx(10000.0)
+    assert (
+        objective["scaled_max"] / objective["scaled_min"]
+        <= objective["unscaled_max"] / objective["unscaled_min"]
+    )
+
+
+def test_geometric_scaling_balances_rows_and_columns():
+    matrix = np.array(
+        [
+            [1e4, 1e-2, 0.0],
+            [1e6, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+        ]
+    )
+    rows, columns = np.nonzero(matrix)
+
+    row_scaling, column_scaling = _geometric_scaling(
+        rows, columns, matrix[rows, columns], matrix.shape, iterations=10
+    )
+
+    scaled = row_scaling[:, None] * matrix * column_scaling[None, :]
+    nonzero = np.abs(scaled[scaled != 0])
+    assert nonzero.max() / nonzero.min() < 4.0
+    # Factors are powers of two, and empty rows and columns are left unscaled.
+    assert np.all(np.log2(row_scaling) == np.round(np.log2(row_scaling)))
+    assert row_scaling[2] == 1.0
+    assert column_scaling[2] == 1.0
@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+
+from ispypsa.pypsa_build.snapshots import _set_timeseries, _SnapshotRegistry
+
+
+@pytest.fixture
+def snapshots_index(csv_str_to_df):
+    snapshots = csv_str_to_df(
+        """
+        investment_periods,  snapshots
+        2025,                2025-01-01__00:00:00
+        2025,                2025-01-01__00:30:00
+        2026,                2026-01-01__00:00:00
+        """
+    )
+    snapshots["snapshots"] = pd.to_datetime(snapshots["snapshots"])
+    return pd.MultiIndex.from_frame(snapshots)
+
+
+@pytest.fixture
+def make_trace(csv_str_to_df):
+    def _make_trace(trace_csv):
+        trace = csv_str_to_df(trace_csv)
+        trace["snapshots"] = pd.to_datetime(trace["snapshots"])
+        return trace
+
+    return _make_trace
+
+
+def test_stack_aligned_and_reordered_traces(snapshots_index, make_trace):
+    aligned = make_trace(
+        """
+        investment_periods,  snapshots,             p_set
+        2025,                2025-01-01__00:00:00,  1.0
+        2025,                2025-01-01__00:30:00,  2.0
+        2026,                2026-01-01__00:00:00,  3.0
+        """
+    )
+    reordered = make_trace(
+        """
+        investment_periods,  snapshots,             p_set
+        2026,                2026-01-01__00:00:00,  30.0
+        2025,                2025-01-01__00:00:00,  10.0
+        2025,                2025-01-01__00:30:00,  20.0
+        """
+    )
+    registry = _SnapshotRegistry(snapshots_index)
+
+    stacked = registry.stack({"a": aligned, "b": reordered}, "p_set")
+
+    assert registry.is_aligned(aligned)
+    assert not registry.is_aligned(reordered)
+    assert stacked.index is snapshots_index
+    pd.testing.assert_frame_equal(
+        stacked,
+        pd.DataFrame(
+            {"a": [1.0, 2.0, 3.0], "b": [10.0, 20.0, 30.0]}, index=snapshots_index
+        ),
+    )
+
+
+def test_stack_raises_on_trace_missing_snapshots(snapshots_index, make_trace):
+    trace = make_trace(
+        """
+        investment_periods,  snapshots,             p_set
+        2025,                2025-01-01__00:00:00,  1.0
+        2025,                2025-01-01__00:30:00,  2.0
+        """
+    )
+    registry = _SnapshotRegistry(snapshots_index)
+
+    with pytest.raises(ValueError, match="p_set time series for a has no values"):
+        registry.stack({"a": trace}, "p_set")
+
+
+def test_set_timeseries_overwrites_and_adds_columns(snapshots_index):
+    network_timeseries = {
+        "p_set": pd.DataFrame({"a": [0.0, 0.0, 0.0]}, index=snapshots_index)
+    }
+    network_timeseries["p_set"].columns.name = "name"
+
+    _set_timeseries(
+        network_timeseries,
+        "p_set",
+        pd.DataFrame(
+            {"b": [4.0, 5.0, 6.0], "a": [1.0, 2.0, 3.0]}, index=snapshots_index
+        ),
+    )
+
+    expected = pd.DataFrame(
+        {"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]}, index=snapshots_index
+    )
+    expected.columns.name = "name"
+    pd.testing.assert_frame_equal(network_timeseries["p_set"], expected)
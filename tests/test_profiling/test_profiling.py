@@ -0,0 +1,161 @@
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+from ispypsa import profiling
+from ispypsa.profiling import configure_profiling, profile_span, profiled
+
+
+@pytest.fixture(autouse=True)
+def disable_profiling_after_test():
+    yield
+    configure_profiling(enabled=False)
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@profiled
+def _make_table(n_rows):
+    return pd.DataFrame({"a": range(n_rows)})
+
+
+def test_profiled_function_disabled_calls_through(tmp_path):
+    result = _make_table(3)
+
+    assert len(result) == 3
+    assert profiling._profiler is None
+    assert profile_span("disabled") is profiling._NULL_SPAN
+    with profile_span("disabled") as span:
+        span["rows"] = 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_nested_spans_jsonl(tmp_path):
+    profile_file = tmp_path / "profile.jsonl"
+    configure_profiling(profile_file=profile_file)
+
+    with profile_span("outer", stage="test") as span:
+        _make_table(5)
+        span["rows"] = 2
+
+    records = _read_jsonl(profile_file)
+    inner, outer = records
+    assert inner["name"] == f"{__name__}._make_table"
+    assert inner["rows"] == 5
+    assert inner["parent_id"] == outer["span_id"]
+    assert inner["depth"] == 1
+    assert outer["name"] == "outer"
+    assert outer["parent_id"] is None
+    assert outer["depth"] == 0
+    assert outer["rows"] == 2
+    assert outer["stage"] == "test"
+    assert outer["wall_s"] >= inner["wall_s"] >= 0
+    for key in ["cpu_s", "start_s", "peak_rss_mib", "peak_rss_growth_mib"]:
+        assert key in outer
+
+
+def test_profiled_counts_rows_of_dict_of_tables(tmp_path):
+    @profiled(name="tables")
+    def make_tables():
+        return {"a": pd.DataFrame({"x": [1, 2]}), "b": pd.DataFrame({"x": [3]})}
+
+    @profiled(name="nothing")
+    def make_nothing():
+        return None
+
+    profile_file = tmp_path / "profile.jsonl"
+    configure_profiling(profile_file=profile_file)
+    make_tables()
+    make_nothing()
+
+    tables, nothing = _read_jsonl(profile_file)
+    assert tables["rows"] == 3
+    assert "rows" not in nothing
+
+
+def test_span_cpu_time_excludes_other_threads(tmp_path):
+    profile_file = tmp_path / "profile.jsonl"
+    configure_profiling(profile_file=profile_file)
+    span_started = threading.Event()
+    busy_done = threading.Event()
+
+    def idle_span():
+        with profile_span("idle"):
+            span_started.set()
+            busy_done.wait()
+
+    thread = threading.Thread(target=idle_span)
+    thread.start()
+    span_started.wait()
+    with profile_span("busy"):
+        sum(i * i for i in range(2_000_000))
+    busy_done.set()
+    thread.join()
+
+    records = {record["name"]: record for record in _read_jsonl(profile_file)}
+    assert records["busy"]["cpu_s"] > 0.05
+    assert records["idle"]["cpu_s"] < records["busy"]["cpu_s"] / 4
+
+
+def test_span_records_error(tmp_path):
+    profile_file = tmp_path / "profile.jsonl"
+    configure_profiling(profile_file=profile_file)
+
+    with pytest.raises(KeyError):
+        with profile_span("failing"):
+            raise KeyError("missing")
+    with profile_span("after"):
+        pass
+
+    failing, after = _read_jsonl(profile_file)
+    assert failing["error"] == "KeyError"
+    assert after["depth"] == 0
+
+
+def test_spans_in_threads_nest_separately(tmp_path):
+    profile_file = tmp_path / "profile.jsonl"
+    configure_profiling(profile_file=profile_file)
+
+    def work():
+        with profile_span("in_thread"):
+            pass
+
+    with profile_span("main"):
+        thread = threading.Thread(target=work, name="worker")
+        thread.start()
+        thread.join()
+
+    in_thread, main = _read_jsonl(profile_file)
+    assert in_thread["thread"] == "worker"
+    assert in_thread["parent_id"] is None
+    assert main["thread"] != "worker"
+
+
+def test_chrome_trace_written_on_close(tmp_path):
+    profile_file = tmp_path / "profile.json"
+    configure_profiling(profile_file=profile_file, output_format="chrome")
+
+    with profile_span("outer"):
+        _make_table(4)
+    assert not profile_file.exists()
+    configure_profiling(enabled=False)
+
+    events = json.loads(profile_file.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == [
+        f"{__name__}._make_table",
+        "outer",
+    ]
+    inner, outer = events
+    assert inner["ph"] == outer["ph"] == "X"
+    assert inner["args"]["rows"] == 4
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_configure_profiling_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="Unknown profile output format 'csv'"):
+        configure_profiling(profile_file=tmp_path / "profile", output_format="csv")
@@ -168,3 +168,47 @@ def test_extract_tabular_results(csv_str_to_df):
     assert "rez_transmission_flows" in result
     assert "isp_sub_region_transmission_flows" in result
     assert "nem_region_transmission_flows" in result
+
+
+def test_extract_tabular_results_categorical_identifiers(csv_str_to_df):
+    dispatch = csv_str_to_df("""
+    generator,  fuel_type,  investment_period,  timestep,             dispatch_mw
+    Gen A,      Wind,       2025,               2025-01-01__00:00:00, 10.0
+    Gen B,      Solar,      2025,               2025-01-01__00:00:00, 20.0
+    Gen A,      Wind,       2025,               2025-01-01__00:30:00, 30.0
+    """)
+    dispatch["timestep"] = pd.to_datetime(dispatch["timestep"])
+    expansion = csv_str_to_df("""
+    generator,  fuel_type,  capacity_mw
+    Gen A,      Wind,       100.0
+    """)
+    mock_results_files = {
+        "regions_and_zones_mapping": MagicMock(),
+        "transmission_flows": MagicMock(return_value=pd.DataFrame()),
+        "generation_expansion": MagicMock(return_value=expansion),
+        "generator_dispatch": MagicMock(return_value=dispatch),
+    }
+    ispypsa_tables = {
+        "sub_regions": csv_str_to_df("""
+        nem_region_id,  isp_sub_region_id
+        NSW1,           CNSW
+        """),
+    }
+
+    with patch.dict(
+        "ispypsa.results.extract.RESULTS_FILES",
+        mock_results_files,
+        clear=True,
+    ):
+        result = extract_tabular_results(
+            MagicMock(), ispypsa_tables, categorical_identifiers=True
+        )
+
+    got_dispatch = result["generator_dispatch"]
+    assert list(got_dispatch.select_dtypes("category").columns) == [
+        "generator",
+        "fuel_type",
+    ]
+    pd.testing.assert_frame_equal(got_dispatch.astype(dispatch.dtypes), dispatch)
+    # Tables without a time series are left as they are.
+    pd.testing.assert_frame_equal(result["generation_expansion"], expansion)
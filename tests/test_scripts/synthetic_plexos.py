@@ -0,0 +1,186 @@
+"""Writes synthetic PLEXOS XML models for testing and benchmarking
+``scripts/extract_plexos_constraints.py``."""
+
+import uuid
+from pathlib import Path
+
+from extract_plexos_constraints import CONSTRAINT_NAMES
+
+_NAMESPACE = "http://tempuri.org/MasterDataSet.xsd"
+_CLASSES = {
+    "System": 1,
+    "Generator": 2,
+    "Line": 3,
+    "Node": 4,
+    "Battery": 7,
+    "Timeslice": 70,
+    "Constraint": 78,
+}
+_PROPERTIES = {
+    "Generation Sent Out Coefficient": 44,
+    "Flow Coefficient": 45,
+    "Generation Coefficient": 46,
+    "RHS": 12,
+    "Sense": 13,
+    "Penalty Price": 14,
+    "Max Capacity": 100,
+    "Heat Rate": 101,
+    "Units": 102,
+    "FO&M Charge": 103,
+}
+_FILLER_PROPERTIES = ["Max Capacity", "Heat Rate", "Units", "FO&M Charge"]
+_TIMESLICES = ["Hot Day", "Typical Summer", "Winter"]
+_LHS_TERMS_PER_CONSTRAINT = 42
+
+
+def write_synthetic_plexos_xml(
+    path: Path, n_generators: int, n_years: int = 30, n_filler_constraints: int = 500
+) -> None:
+    """Write a synthetic PLEXOS XML model to ``path``.
+
+    Every generator gets one membership to the System object carrying one
+    dated data point per filler property per year, the first of which is
+    banded -- the bulk that makes a real model large. The constraints in
+    ``CONSTRAINT_NAMES`` plus ``n_filler_constraints`` others each get
+    generator, battery and line LHS terms and a System membership with a
+    Sense, a Penalty Price and one timeslice-tagged RHS per timeslice, so the
+    extracted constraints pass every structural check.
+    """
+    ids = {"object": 0, "membership": 0, "data": 0}
+
+    def next_id(kind: str) -> int:
+        ids[kind] += 1
+        return ids[kind]
+
+    def row(table: str, **columns) -> str:
+        cells = "".join(f"<{col}>{value}</{col}>" for col, value in columns.items())
+        return f"<{table}>{cells}</{table}>\n"
+
+    def write_object(f, class_name: str, name: str) -> int:
+        object_id = next_id("object")
+        f.write(
+            row(
+                "t_object",
+                object_id=object_id,
+                class_id=_CLASSES[class_name],
+                name=name.replace("&", "&amp;"),
+                GUID=uuid.UUID(int=object_id),
+            )
+        )
+        return object_id
+
+    def write_data(f, membership_id: int, property_name: str, value) -> int:
+        data_id = next_id("data")
+        f.write(
+            row(
+                "t_data",
+                data_id=data_id,
+                membership_id=membership_id,
+                property_id=_PROPERTIES[property_name],
+                value=value,
+                # AEMO's uids overflow a signed 64-bit integer.
+                uid=10**19 + data_id,
+            )
+        )
+        return data_id
+
+    with open(path, "w") as f:
+        f.write(
+            f'<?xml version="1.0" standalone="yes"?>\n<MasterDataSet xmlns="{_NAMESPACE}">\n'
+        )
+        for name, class_id in _CLASSES.items():
+            f.write(row("t_class", class_id=class_id, name=name))
+        for name, property_id in _PROPERTIES.items():
+            f.write(
+                row(
+                    "t_property",
+                    property_id=property_id,
+                    name=name.replace("&", "&amp;"),
+                )
+            )
+
+        system = write_object(f, "System", "NEM")
+        timeslices = [write_object(f, "Timeslice", name) for name in _TIMESLICES]
+        generators = [
+            write_object(f, "Generator", f"GEN_{i}") for i in range(n_generators)
+        ]
+        batteries = [
+            write_object(f, "Battery", f"BATTERY_{i}")
+            for i in range(max(n_generators // 20, 1))
+        ]
+        lines = [
+            write_object(f, "Line", f"LINE_{i}")
+            for i in range(max(n_generators // 100, 1))
+        ]
+        constraint_names = CONSTRAINT_NAMES + [
+            f"Filler_{i}" for i in range(n_filler_constraints)
+        ]
+        constraints = [write_object(f, "Constraint", name) for name in constraint_names]
+
+        memberships = []
+        for generator in generators:
+            membership_id = next_id("membership")
+            f.write(
+                row(
+                    "t_membership",
+                    membership_id=membership_id,
+                    parent_object_id=system,
+                    child_object_id=generator,
+                )
+            )
+            memberships.append(membership_id)
+        constraint_memberships = []
+        for i, constraint in enumerate(constraints):
+            terms = []
+            for kind, pool in enumerate([generators, batteries, lines]):
+                # Distinct parents per constraint, so no data point is duplicated.
+                n_terms = min(_LHS_TERMS_PER_CONSTRAINT // 3, len(pool))
+                for j in range(n_terms):
+                    parent = pool[(i * n_terms + j) % len(pool)]
+                    terms.append((next_id("membership"), parent, kind))
+            system_membership = next_id("membership")
+            for membership_id, parent, _ in terms + [(system_membership, system, 0)]:
+                f.write(
+                    row(
+                        "t_membership",
+                        membership_id=membership_id,
+                        parent_object_id=parent,
+                        child_object_id=constraint,
+                    )
+                )
+            constraint_memberships.append((terms, system_membership))
+
+        dated, banded, tagged = [], [], []
+        for membership_id in memberships:
+            for property_name in _FILLER_PROPERTIES:
+                for year in range(n_years):
+                    data_id = write_data(f, membership_id, property_name, 100.5 + year)
+                    dated.append((data_id, f"{2025 + year}-07-01T00:00:00"))
+                    if year == 0:
+                        banded.append(data_id)
+        coefficient_properties = [
+            "Generation Sent Out Coefficient",
+            "Generation Coefficient",
+            "Flow Coefficient",
+        ]
+        for terms, system_membership in constraint_memberships:
+            for membership_id, _, kind in terms:
+                write_data(f, membership_id, coefficient_properties[kind], 0.25)
+            # A coefficient that changes when a project comes online.
+            membership_id, _, kind = terms[0]
+            data_id = write_data(f, membership_id, coefficient_properties[kind], 0.5)
+            dated.append((data_id, "2037-07-01T00:00:00"))
+            write_data(f, system_membership, "Sense", -1)
+            write_data(f, system_membership, "Penalty Price", -1)
+            for timeslice in timeslices:
+                tagged.append(
+                    (write_data(f, system_membership, "RHS", 3000), timeslice)
+                )
+
+        for data_id, date in dated:
+            f.write(row("t_date_from", data_id=data_id, date=date))
+        for data_id, object_id in tagged:
+            f.write(row("t_tag", data_id=data_id, object_id=object_id))
+        for data_id in banded:
+            f.write(row("t_band", data_id=data_id, band_id=1))
+        f.write("</MasterDataSet>\n")
@@ -2,15 +2,20 @@
 
 The query and database-level functions need a loaded PLEXOS database and are
 not unit-tested here; they are covered instead by the script's own structural-
-invariant checks, which run against the real model on every extraction.
+invariant checks, which run against the real model on every extraction. The
+streamed reader is checked against them on a small synthetic model.
 """
 
+import numpy as np
 import pandas as pd
 import pytest
 from extract_plexos_constraints import (
+    CONSTRAINT_NAMES,
+    _assert_constraints_are_never_parents,
     _assert_every_constraint_has_lhs,
     _assert_every_constraint_has_rhs,
     _assert_merge_is_one_to_one,
+    _assert_no_banded_data_points,
     _assert_no_duplicate_data_points,
     _assert_no_unresolved_references,
     _assert_one_sense_per_constraint,
@@ -21,12 +26,20 @@ from extract_plexos_constraints import (
     _assert_tags_only_on_rhs,
     _assert_values_are_numeric,
     _check_constraints_resolved,
+    _load_plexos_db,
+    _local_name,
+    _lookup_positions,
     _merge_into_long_table,
     _placeholders,
+    _query_constraint_rows,
+    _read_plexos_tables,
     _split_into_tables,
+    _stream_constraint_rows,
     _validate_constraint_rows,
 )
 
+from tests.test_scripts.synthetic_plexos import write_synthetic_plexos_xml
+
 
 @pytest.fixture
 def valid_rows(csv_str_to_df):
@@ -284,3 +297,131 @@ def test_assert_merge_is_one_to_one_raises_on_row_count_mismatch():
     rows = pd.DataFrame({"value": [1, 2, 3, 4]})
     with pytest.raises(ValueError, match="Merge changed the row count"):
         _assert_merge_is_one_to_one(data_points, rows)
+
+
+# --- _assert_constraints_are_never_parents / _assert_no_banded_data_points ---
+
+
+def test_assert_constraints_are_never_parents_raises_on_count():
+    _assert_constraints_are_never_parents(0)  # must not raise
+    with pytest.raises(ValueError, match="constraint as the parent"):
+        _assert_constraints_are_never_parents(2)
+
+
+def test_assert_no_banded_data_points_raises_on_count():
+    _assert_no_banded_data_points(0)  # must not raise
+    with pytest.raises(ValueError, match="banded"):
+        _assert_no_banded_data_points(1)
+
+
+# --- streaming extraction ---
+
+
+def test_local_name():
+    assert _local_name("{http://tempuri.org/MasterDataSet.xsd}t_data") == "t_data"
+    assert _local_name("t_data") == "t_data"
+
+
+def test_lookup_positions():
+    keys = np.array([30, 10, 20])
+    positions = _lookup_positions(keys, np.array([10, 99, 30, 5]))
+    np.testing.assert_array_equal(positions, [1, -1, 0, -1])
+
+
+def test_lookup_positions_with_no_keys():
+    positions = _lookup_positions(np.array([], dtype=np.int64), np.array([1, 2]))
+    np.testing.assert_array_equal(positions, [-1, -1])
+
+
+def _write_xml(path, rows):
+    path.write_text(
+        '<MasterDataSet xmlns="http://tempuri.org/MasterDataSet.xsd">'
+        + "".join(rows)
+        + "</MasterDataSet>"
+    )
+
+
+_CATALOGUE_ROWS = [
+    "<t_class><class_id>78</class_id><name>Constraint</name></t_class>",
+    "<t_object><object_id>20</object_id><class_id>78</class_id>"
+    "<name>C1</name><GUID>x</GUID></t_object>",
+    "<t_membership><membership_id>500</membership_id>"
+    "<parent_object_id>10</parent_object_id>"
+    "<child_object_id>20</child_object_id></t_membership>",
+]
+
+
+def test_read_plexos_tables(tmp_path):
+    xml_path = tmp_path / "model.xml"
+    _write_xml(
+        xml_path,
+        _CATALOGUE_ROWS
+        + [
+            "<t_data><data_id>900</data_id><membership_id>500</membership_id>"
+            "<property_id>44</property_id><value>0.14</value>"
+            "<uid>12345678901234567890</uid></t_data>",
+            "<t_data><data_id>901</data_id><membership_id>500</membership_id>"
+            "<value>a formula</value></t_data>",
+            # On a membership of no named constraint, so not kept.
+            "<t_data><data_id>950</data_id><membership_id>777</membership_id>"
+            "<property_id>44</property_id><value>1</value></t_data>",
+            "<t_text><data_id>901</data_id><value>ignored</value></t_text>",
+            "<t_date_from><data_id>900</data_id><date>2037-07-01T00:00:00</date>"
+            "</t_date_from>",
+            "<t_date_from><data_id>950</data_id><date>2030-07-01T00:00:00</date>"
+            "</t_date_from>",
+        ],
+    )
+
+    tables = _read_plexos_tables(xml_path, ["C1"])
+
+    assert tables["t_class"]["name"] == ["Constraint"]
+    np.testing.assert_array_equal(tables["t_object"]["object_id"], [20])
+    data = tables["t_data"]
+    np.testing.assert_array_equal(data["data_id"], [900, 901])
+    # A missing id column is stored as -1, a non-numeric value as NaN + text.
+    np.testing.assert_array_equal(data["property_id"], [44, -1])
+    np.testing.assert_array_equal(data["value"], [0.14, np.nan])
+    assert data["value_text"] == {1: "a formula"}
+    assert tables["t_date_from"]["date"] == ["2037-07-01T00:00:00"]
+    assert tables["t_tag"]["object_id"].size == 0
+    assert "t_text" not in tables
+
+
+@pytest.mark.parametrize(
+    "late_row",
+    [
+        # A catalogue row after t_data has started.
+        "<t_membership><membership_id>501</membership_id>"
+        "<child_object_id>20</child_object_id></t_membership>",
+        # A t_data row after its sidecars have started.
+        "<t_data><data_id>902</data_id><membership_id>500</membership_id></t_data>",
+    ],
+)
+def test_read_plexos_tables_raises_on_out_of_order_tables(tmp_path, late_row):
+    xml_path = tmp_path / "model.xml"
+    _write_xml(
+        xml_path,
+        _CATALOGUE_ROWS
+        + [
+            "<t_data><data_id>900</data_id><membership_id>500</membership_id></t_data>",
+            "<t_band><data_id>900</data_id></t_band>",
+            late_row,
+        ],
+    )
+
+    with pytest.raises(ValueError, match="Rerun with --plexosdb"):
+        _read_plexos_tables(xml_path, ["C1"])
+
+
+def test_stream_constraint_rows_matches_plexosdb(tmp_path):
+    pytest.importorskip("plexosdb")
+    xml_path = tmp_path / "model.xml"
+    write_synthetic_plexos_xml(xml_path, n_generators=60, n_years=2)
+
+    streamed = _stream_constraint_rows(xml_path, CONSTRAINT_NAMES)
+    queried = _query_constraint_rows(_load_plexos_db(str(xml_path)), CONSTRAINT_NAMES)
+
+    assert set(streamed["constraint_name"]) == set(CONSTRAINT_NAMES)
+    assert streamed["date_from"].notna().any()
+    pd.testing.assert_frame_equal(streamed, queried)
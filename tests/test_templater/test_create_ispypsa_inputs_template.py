@@ -189,6 +189,53 @@ def test_create_ispypsa_inputs_template_sub_regions(
     assert "NNSW" in template_tables["flow_paths"]["node_from"].values
 
 
+def test_create_ispypsa_inputs_template_concurrent_builders_match_serial(
+    workbook_table_cache_test_path: Path,
+):
+    manual_tables = load_manually_extracted_tables("6.0")
+    serial = create_ispypsa_inputs_template(
+        "Step Change",
+        "sub_regions",
+        read_csvs(workbook_table_cache_test_path),
+        manual_tables,
+        "6.0",
+    )
+    concurrent = create_ispypsa_inputs_template(
+        "Step Change",
+        "sub_regions",
+        read_csvs(workbook_table_cache_test_path),
+        manual_tables,
+        "6.0",
+        max_workers=4,
+    )
+
+    assert list(serial) == list(concurrent)
+    for table in serial:
+        pd.testing.assert_frame_equal(serial[table], concurrent[table])
+
+
+def test_create_ispypsa_inputs_template_non_vre_connection_costs_converted_once(
+    workbook_table_cache_test_path: Path,
+):
+    # The battery templater converts connection_costs_other to $/MW as well, which
+    # used to leak into the generator templater and convert the costs twice.
+    iasr_tables = read_csvs(workbook_table_cache_test_path)
+    raw_costs = iasr_tables["connection_costs_other"].copy()
+    template_tables = create_ispypsa_inputs_template(
+        "Step Change",
+        "sub_regions",
+        iasr_tables,
+        load_manually_extracted_tables("6.0"),
+        "6.0",
+    )
+
+    non_vre_costs = template_tables["new_entrant_non_vre_connection_costs"]
+    assert non_vre_costs["ccgt_$/mw"].tolist() == pytest.approx(
+        (raw_costs["CCGT"] * 1000).tolist(), nan_ok=True
+    )
+    pd.testing.assert_frame_equal(iasr_tables["connection_costs_other"], raw_costs)
+
+
 def test_create_ispypsa_inputs_template_regions(workbook_table_cache_test_path: Path):
     iasr_tables = read_csvs(workbook_table_cache_test_path)
     manual_tables = load_manually_extracted_tables("6.0")
@@ -1,10 +1,16 @@
+import random
+
+import numpy as np
 import pandas as pd
 import pytest
+from thefuzz import fuzz
 
 from ispypsa.templater.helpers import (
     _best_fuzzy_match,
+    _cached_one_to_one_priority_based_fuzzy_matching,
     _fuzzy_map_to_allowed_values,
     _fuzzy_match_names,
+    _one_to_one_priority_based_fuzzy_matching,
 )
 
 
@@ -287,3 +293,60 @@ def test_fuzzy_map_to_allowed_values_empty_series():
     )
     expected = pd.Series([], dtype=object)
     pd.testing.assert_series_equal(result, expected)
+
+
+# ── _one_to_one_priority_based_fuzzy_matching ────────────────────────────────
+
+
+def _pairwise_greedy_fuzzy_matching(strings_to_match, choices, not_match, threshold):
+    """Reference greedy matcher that rescores every remaining pair per match."""
+    exact = strings_to_match & choices
+    matches = {s: s for s in exact}
+    remaining_strings = sorted(strings_to_match - exact)
+    remaining_choices = sorted(choices - exact)
+    while remaining_strings and remaining_choices:
+        best_score, best_pair = -1, None
+        for i, str_a in enumerate(remaining_strings):
+            for j, str_b in enumerate(remaining_choices):
+                score = fuzz.ratio(str_a, str_b)
+                if score > best_score and score >= threshold:
+                    best_score, best_pair = score, (i, j)
+        if best_pair is None:
+            break
+        i, j = best_pair
+        matches[remaining_strings.pop(i)] = remaining_choices.pop(j)
+    for s in remaining_strings:
+        matches[s] = s if not_match == "existing" else not_match
+    return matches
+
+
+@pytest.mark.parametrize("threshold", [0, 50, 80])
+def test_one_to_one_matching_equals_pairwise_greedy_matching(threshold):
+    rng = random.Random(threshold)
+    alphabet = "abcde "
+    strings = {"".join(rng.choices(alphabet, k=rng.randint(1, 8))) for _ in range(40)}
+    choices = {"".join(rng.choices(alphabet, k=rng.randint(1, 8))) for _ in range(30)}
+    expected = _pairwise_greedy_fuzzy_matching(
+        set(strings), set(choices), "No Match", threshold
+    )
+    result = _one_to_one_priority_based_fuzzy_matching(
+        set(strings), set(choices), "No Match", threshold
+    )
+    assert result == expected
+
+
+def test_one_to_one_matching_is_memoised_and_returns_copies():
+    strings, choices = {"Bigtoria", "Radmania"}, {"Victoria", "Tasmania"}
+    first = _one_to_one_priority_based_fuzzy_matching(strings, choices, "existing", 0)
+    first["Bigtoria"] = "mutated"
+    second = _one_to_one_priority_based_fuzzy_matching(strings, choices, "existing", 0)
+    assert second == {"Bigtoria": "Victoria", "Radmania": "Tasmania"}
+    assert strings == {"Bigtoria", "Radmania"}
+    assert _cached_one_to_one_priority_based_fuzzy_matching.cache_info().hits >= 1
+
+
+def test_one_to_one_matching_scores_missing_values_as_zero():
+    result = _one_to_one_priority_based_fuzzy_matching(
+        {np.nan, "Victria"}, {"Victoria"}, "No Match", 50
+    )
+    assert result == {"Victria": "Victoria", np.nan: "No Match"}
@@ -0,0 +1,150 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from ispypsa.templater.scheduler import _run_template_builders
+
+
+def _builder(name, inputs, outputs, build=None, intermediate=False):
+    def default_build(iasr_tables, builder_inputs):
+        return {table: pd.DataFrame({"source": [name]}) for table in outputs}
+
+    builder = {
+        "name": name,
+        "inputs": inputs,
+        "outputs": outputs,
+        "build": build or default_build,
+    }
+    if intermediate:
+        builder["intermediate"] = True
+    return builder
+
+
+def test_run_template_builders_passes_outputs_to_dependent_builders():
+    def build_b(iasr_tables, inputs):
+        return {"b": inputs["a"].assign(value=inputs["a"]["value"] * 2)}
+
+    def build_a(iasr_tables, inputs):
+        return {"a": iasr_tables["raw"].copy()}
+
+    builders = [
+        # Declared before its dependency, so must wait for "a" to be built.
+        _builder("b", ["a"], ["b"], build_b),
+        _builder("a", [], ["a"], build_a),
+    ]
+    iasr_tables = {"raw": pd.DataFrame({"value": [1, 2]})}
+
+    template = _run_template_builders(builders, iasr_tables)
+
+    assert list(template) == ["b", "a"]
+    pd.testing.assert_frame_equal(template["b"], pd.DataFrame({"value": [2, 4]}))
+
+
+def test_run_template_builders_excludes_intermediate_outputs():
+    builders = [
+        _builder("geography", [], ["geography"], intermediate=True),
+        _builder("paths", ["geography"], ["paths", "limits"]),
+    ]
+
+    template = _run_template_builders(builders, {})
+
+    assert list(template) == ["paths", "limits"]
+
+
+def test_run_template_builders_isolates_in_place_modifications():
+    def build_mutating(iasr_tables, inputs):
+        iasr_tables["costs"]["cost"] *= 1000
+        iasr_tables["extra"] = pd.DataFrame()
+        return {"mutated": iasr_tables["costs"]}
+
+    def build_reading(iasr_tables, inputs):
+        assert "extra" not in iasr_tables
+        return {"read": iasr_tables["costs"]}
+
+    iasr_tables = {"costs": pd.DataFrame({"cost": [1.0, 2.0]})}
+    builders = [
+        _builder("mutating", [], ["mutated"], build_mutating),
+        _builder("reading", [], ["read"], build_reading),
+    ]
+
+    template = _run_template_builders(builders, iasr_tables)
+
+    pd.testing.assert_frame_equal(
+        template["mutated"], pd.DataFrame({"cost": [1000.0, 2000.0]})
+    )
+    pd.testing.assert_frame_equal(template["read"], pd.DataFrame({"cost": [1.0, 2.0]}))
+    pd.testing.assert_frame_equal(
+        iasr_tables["costs"], pd.DataFrame({"cost": [1.0, 2.0]})
+    )
+    assert list(iasr_tables) == ["costs"]
+
+
+def test_run_template_builders_runs_independent_builders_concurrently():
+    # Both builders wait on the barrier, so this only finishes if they run at once.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def build(name):
+        def waiting_build(iasr_tables, inputs):
+            barrier.wait()
+            return {name: pd.DataFrame({"source": [name]})}
+
+        return waiting_build
+
+    builders = [
+        _builder("a", [], ["a"], build("a")),
+        _builder("b", [], ["b"], build("b")),
+        _builder("c", ["a", "b"], ["c"]),
+    ]
+
+    template = _run_template_builders(builders, {}, max_workers=2)
+
+    assert list(template) == ["a", "b", "c"]
+
+
+def test_run_template_builders_output_independent_of_max_workers():
+    builders = [_builder(name, [], [name]) for name in ["e", "d", "c", "b", "a"]] + [
+        _builder("z", ["a", "e"], ["z"])
+    ]
+
+    serial = _run_template_builders(builders, {}, max_workers=1)
+    concurrent = _run_template_builders(builders, {}, max_workers=4)
+
+    assert list(serial) == list(concurrent) == ["e", "d", "c", "b", "a", "z"]
+    for table in serial:
+        pd.testing.assert_frame_equal(serial[table], concurrent[table])
+
+
+def test_run_template_builders_duplicate_outputs():
+    builders = [_builder("a", [], ["x"]), _builder("b", [], ["x"])]
+
+    with pytest.raises(ValueError, match="output by both the 'a' and 'b'"):
+        _run_template_builders(builders, {})
+
+
+def test_run_template_builders_missing_inputs():
+    builders = [_builder("a", ["not_built"], ["a"])]
+
+    with pytest.raises(ValueError, match=r"no builder outputs: \['not_built'\]"):
+        _run_template_builders(builders, {})
+
+
+def test_run_template_builders_cyclic_dependencies():
+    builders = [
+        _builder("root", [], ["root"]),
+        _builder("a", ["b"], ["a"]),
+        _builder("b", ["a"], ["b"]),
+    ]
+
+    with pytest.raises(ValueError, match=r"cyclic dependencies: \['a', 'b'\]"):
+        _run_template_builders(builders, {})
+
+
+def test_run_template_builders_undeclared_outputs():
+    def build(iasr_tables, inputs):
+        return {"a": pd.DataFrame(), "surprise": pd.DataFrame()}
+
+    builders = [_builder("a", [], ["a"], build)]
+
+    with pytest.raises(ValueError, match="'a' builder returned tables"):
+        _run_template_builders(builders, {})
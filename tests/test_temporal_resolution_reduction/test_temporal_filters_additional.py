@@ -61,7 +61,7 @@ def test_filter_snapshots_with_both_representative_and_named_weeks(csv_str_to_df
 
     demand_traces = {"node1": demand_data}
 
-    result = _filter_snapshots(
+    result, _ = _filter_snapshots(
         year_type="calendar",
         temporal_range=temporal_range,
         temporal_aggregation_config=temporal_agg,
@@ -109,7 +109,7 @@ def test_filter_snapshots_no_filtering_returns_original(csv_str_to_df):
     snapshots = csv_str_to_df(snapshots_csv)
     snapshots["snapshots"] = pd.to_datetime(snapshots["snapshots"])
 
-    result = _filter_snapshots(
+    result, period_sequence = _filter_snapshots(
         year_type="calendar",
         temporal_range=temporal_range,
         temporal_aggregation_config=temporal_agg,
@@ -117,6 +117,7 @@ def test_filter_snapshots_no_filtering_returns_original(csv_str_to_df):
     )
 
     pd.testing.assert_frame_equal(result, snapshots)
+    assert period_sequence is None
 
 
 def test_prepare_data_for_named_weeks_no_residual_metrics(csv_str_to_df):
@@ -0,0 +1,216 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ispypsa.translator.snapshots import _create_complete_snapshots_index
+from ispypsa.translator.temporal_filters import (
+    _cluster_representative_periods,
+    _filter_snapshots,
+    _hierarchical_medoids,
+    _k_medoids,
+    _pairwise_distances,
+    _prepare_features_for_representative_periods,
+)
+
+
+@dataclass
+class RepresentativePeriodsConfig:
+    n_periods: int
+    period_length: str
+    method: str
+
+
+def _demand_with_weekly_levels(snapshots: pd.DataFrame, levels: dict) -> pd.DataFrame:
+    """Demand with a daily shape, shifted up by the level of the week (Monday
+    00:00:00 exclusive to Monday 00:00:00 inclusive) each datetime falls in."""
+    datetimes = snapshots["snapshots"]
+    week_start = (datetimes - pd.Timedelta(microseconds=1)).dt.to_period("W-SUN")
+    level = week_start.dt.start_time.map(levels).fillna(0.0)
+    daily_shape = np.sin(datetimes.dt.hour.to_numpy() / 24 * np.pi)
+    return pd.DataFrame(
+        {"datetime": datetimes, "value": 100 + 10 * daily_shape + level}
+    )
+
+
+@pytest.mark.parametrize("method", ["k-medoids", "hierarchical"])
+def test_cluster_representative_weeks_fy(method):
+    snapshots = _create_complete_snapshots_index(
+        start_year=2025, end_year=2025, temporal_resolution_min=30, year_type="fy"
+    )
+    # Two weeks with much higher demand, the rest at a normal level.
+    peak_weeks = {pd.Timestamp("2024-07-15"): 500.0, pd.Timestamp("2025-01-13"): 505.0}
+    demand = _demand_with_weekly_levels(snapshots, peak_weeks)
+    features = _prepare_features_for_representative_periods(None, {"A": demand}, None)
+
+    result, period_sequence = _cluster_representative_periods(
+        RepresentativePeriodsConfig(2, "week", method),
+        snapshots,
+        start_year=2025,
+        end_year=2025,
+        year_type="fy",
+        features=features,
+    )
+
+    # FY2025 has 52 complete weeks, the first ending Monday 2024-07-08.
+    assert len(period_sequence) == 52
+    assert (period_sequence["year"] == 2025).all()
+    assert period_sequence["period_end"].iloc[0] == pd.Timestamp("2024-07-08")
+
+    # One representative week for the two peak weeks, one for the other 50.
+    assert len(result) == 2 * 7 * 48
+    weights = result.groupby(
+        (result["snapshots"] - pd.Timedelta(microseconds=1)).dt.to_period("W-SUN")
+    )["representative_period_weight"].unique()
+    assert sorted(weight[0] for weight in weights) == [2, 50]
+    peak_representative = period_sequence.loc[
+        period_sequence["period_end"] == pd.Timestamp("2024-07-22"),
+        "representative_period_end",
+    ].iloc[0]
+    assert peak_representative in [
+        pd.Timestamp("2024-07-22"),
+        pd.Timestamp("2025-01-20"),
+    ]
+
+
+def test_cluster_representative_days_weights_sum_to_periods_per_year():
+    snapshots = _create_complete_snapshots_index(
+        start_year=2024, end_year=2025, temporal_resolution_min=60, year_type="calendar"
+    )
+    rng = np.random.default_rng(0)
+    demand = pd.DataFrame(
+        {
+            "datetime": snapshots["snapshots"],
+            "value": rng.normal(100, 10, len(snapshots)),
+        }
+    )
+    features = _prepare_features_for_representative_periods(None, {"A": demand}, None)
+
+    result, period_sequence = _cluster_representative_periods(
+        RepresentativePeriodsConfig(5, "day", "k-medoids"),
+        snapshots,
+        start_year=2024,
+        end_year=2025,
+        year_type="calendar",
+        features=features,
+    )
+
+    assert period_sequence.groupby("year").size().to_dict() == {2024: 366, 2025: 365}
+    assert len(result) == 2 * 5 * 24
+    day = (result["snapshots"] - pd.Timedelta(microseconds=1)).dt.floor("D")
+    per_day = result.groupby(day)["representative_period_weight"].first()
+    assert per_day.sum() == 366 + 365
+
+
+def test_k_medoids_never_worse_than_hierarchical():
+    rng = np.random.default_rng(1)
+    period_vectors = np.concatenate(
+        [rng.normal(centre, 1.0, size=(20, 4)) for centre in [0.0, 5.0, 10.0]]
+    )
+    distances = _pairwise_distances(period_vectors)
+
+    def cost(medoids):
+        return distances[:, medoids].min(axis=1).sum()
+
+    hierarchical_medoids, hierarchical_labels = _hierarchical_medoids(distances, 3)
+    k_medoids, k_labels = _k_medoids(distances, 3)
+
+    assert sorted(np.bincount(hierarchical_labels)) == [20, 20, 20]
+    assert sorted(np.bincount(k_labels)) == [20, 20, 20]
+    assert cost(k_medoids) <= cost(hierarchical_medoids)
+    np.testing.assert_array_equal(k_labels[k_medoids], np.arange(3))
+
+
+def test_pairwise_distances():
+    period_vectors = np.array([[0.0, 0.0], [3.0, 4.0], [6.0, 8.0]])
+
+    np.testing.assert_allclose(
+        _pairwise_distances(period_vectors),
+        [[0.0, 5.0, 10.0], [5.0, 0.0, 5.0], [10.0, 5.0, 0.0]],
+    )
+
+
+def test_prepare_features_for_representative_periods(csv_str_to_df):
+    demand_traces = {
+        "CNSW": csv_str_to_df("""
+        datetime,              value
+        2024-01-01__00:30:00,  100
+        2024-01-01__01:00:00,  110
+        """),
+    }
+    generator_traces = {
+        "wind_a": csv_str_to_df("""
+        datetime,              value
+        2024-01-01__00:30:00,  0.2
+        2024-01-01__01:00:00,  0.4
+        """),
+        "wind_b": csv_str_to_df("""
+        datetime,              value
+        2024-01-01__00:30:00,  0.6
+        2024-01-01__01:00:00,  0.8
+        """),
+        "coal": csv_str_to_df("""
+        datetime,              value
+        2024-01-01__00:30:00,  1.0
+        2024-01-01__01:00:00,  1.0
+        """),
+    }
+    existing_generators = csv_str_to_df("""
+    generator,  fuel_type,  maximum_capacity_mw,  sub_region_id
+    wind_a,     Wind,       100,                  CNSW
+    wind_b,     Wind,       300,                  CNSW
+    coal,       Black Coal, 500,                  CNSW
+    """)
+
+    features = _prepare_features_for_representative_periods(
+        existing_generators, demand_traces, generator_traces
+    )
+
+    assert list(features.columns) == ["demand_CNSW", "wind_CNSW"]
+    np.testing.assert_allclose(features["demand_CNSW"], [100, 110])
+    # Capacity weighted: 0.25 * 0.2 + 0.75 * 0.6, and 0.25 * 0.4 + 0.75 * 0.8
+    np.testing.assert_allclose(features["wind_CNSW"], [0.5, 0.7])
+
+
+def test_filter_snapshots_with_representative_periods():
+    @dataclass
+    class TemporalAggregationConfig:
+        representative_weeks: list[int] | None
+        named_representative_weeks: list[str] | None
+        representative_periods: RepresentativePeriodsConfig | None
+
+    @dataclass
+    class TemporalRangeConfig:
+        start_year: int
+        end_year: int
+
+    snapshots = _create_complete_snapshots_index(
+        start_year=2024, end_year=2024, temporal_resolution_min=30, year_type="calendar"
+    )
+    demand = _demand_with_weekly_levels(snapshots, {pd.Timestamp("2024-03-04"): 400.0})
+
+    result, period_sequence = _filter_snapshots(
+        "calendar",
+        TemporalRangeConfig(2024, 2024),
+        TemporalAggregationConfig(
+            None, None, RepresentativePeriodsConfig(3, "week", "hierarchical")
+        ),
+        snapshots,
+        demand_traces={"A": demand},
+    )
+
+    assert list(result.columns) == ["snapshots", "representative_period_weight"]
+    assert len(result) == 3 * 7 * 48
+    assert result["snapshots"].is_monotonic_increasing
+    assert list(period_sequence.columns) == [
+        "year",
+        "period_end",
+        "representative_period_end",
+    ]
+    assert period_sequence["period_end"].is_monotonic_increasing
+
+
+def test_prepare_features_requires_demand_traces():
+    with pytest.raises(ValueError, match="demand_traces must be provided"):
+        _prepare_features_for_representative_periods(None, None, None)
@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from ispypsa.translator.snapshots import (
+    _add_investment_periods,
+    _add_snapshot_weightings,
+    _create_complete_snapshots_index,
+)
+from ispypsa.translator.temporal_filters import (
+    _average_over_segments,
+    _merge_adjacent_segments,
+    _prepare_net_load_for_segmentation,
+    _segment_snapshots,
+    _time_series_filter,
+)
+
+
+def test_merge_adjacent_segments_keeps_peak():
+    values = np.array([1.0, 1.1, 1.0, 0.9, 9.0, 1.0, 1.2, 1.1])
+
+    sizes = _merge_adjacent_segments(values, 3)
+
+    assert sizes.tolist() == [4, 1, 3]
+
+
+def test_segment_snapshots_blocks_and_counts():
+    snapshots = _create_complete_snapshots_index(
+        start_year=2024, end_year=2024, temporal_resolution_min=30, year_type="calendar"
+    )
+    # Two separate weeks, as after filtering for representative weeks.
+    in_weeks = (
+        (snapshots["snapshots"] > "2024-01-01")
+        & (snapshots["snapshots"] <= "2024-01-08")
+    ) | (
+        (snapshots["snapshots"] > "2024-06-03")
+        & (snapshots["snapshots"] <= "2024-06-10")
+    )
+    snapshots = snapshots.loc[in_weeks, ["snapshots"]].reset_index(drop=True)
+    net_load = pd.DataFrame(
+        {
+            "datetime": snapshots["snapshots"],
+            "value": np.random.default_rng(0).normal(1000, 100, len(snapshots)),
+        }
+    )
+
+    result = _segment_snapshots(snapshots, 6, 30, 2024, 2024, "calendar", net_load)
+
+    # 6 segments per day for each of the two 7 day blocks.
+    assert len(result) == 2 * 7 * 6
+    assert result["snapshots"].is_monotonic_increasing
+    # Segments tile the two weeks exactly, with no segment spanning the gap.
+    lengths = result["snapshots"] - result["segment_start"]
+    assert lengths.sum() == pd.Timedelta(days=14)
+    assert (
+        result["segment_start"].iloc[1:].to_numpy()
+        >= result["snapshots"].iloc[:-1].to_numpy()
+    ).all()
+    assert result["segment_start"].iloc[0] == pd.Timestamp("2024-01-01")
+    assert pd.Timestamp("2024-06-03") in set(result["segment_start"])
+
+
+def test_segment_snapshots_does_not_cross_year_start():
+    snapshots = _create_complete_snapshots_index(
+        start_year=2025, end_year=2026, temporal_resolution_min=60, year_type="fy"
+    )
+    snapshots = snapshots.loc[
+        (snapshots["snapshots"] > "2025-06-30")
+        & (snapshots["snapshots"] <= "2025-07-02"),
+        ["snapshots"],
+    ].reset_index(drop=True)
+    net_load = pd.DataFrame({"datetime": snapshots["snapshots"], "value": 1.0})
+
+    result = _segment_snapshots(snapshots, 1, 60, 2025, 2026, "fy", net_load)
+
+    assert result["snapshots"].tolist() == [
+        pd.Timestamp("2025-07-01"),
+        pd.Timestamp("2025-07-02"),
+    ]
+    assert result["segment_start"].tolist() == [
+        pd.Timestamp("2025-06-30"),
+        pd.Timestamp("2025-07-01"),
+    ]
+
+
+def test_segment_snapshots_missing_net_load():
+    snapshots = pd.DataFrame(
+        {"snapshots": pd.date_range("2024-01-01 01:00", periods=4, freq="h")}
+    )
+    net_load = pd.DataFrame({"datetime": snapshots["snapshots"].iloc[:2], "value": 1.0})
+
+    with pytest.raises(ValueError, match="net load data must cover every snapshot"):
+        _segment_snapshots(snapshots, 1, 60, 2024, 2024, "calendar", net_load)
+
+
+def test_time_series_filter_averages_over_segments():
+    snapshots = pd.DataFrame(
+        {
+            "snapshots": pd.to_datetime(["2024-01-01 01:00", "2024-01-01 03:00"]),
+            "segment_start": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 01:00"]),
+        }
+    )
+    trace = pd.DataFrame(
+        {
+            "snapshots": pd.date_range("2024-01-01 00:30", periods=8, freq="30min"),
+            "p_max_pu": np.array([0.1, 0.3, 0.2, 0.2, 0.4, 0.6, 0.9, 0.9], "float32"),
+        }
+    )
+
+    result = _time_series_filter(trace, snapshots)
+
+    expected = pd.DataFrame(
+        {
+            "snapshots": snapshots["snapshots"],
+            "p_max_pu": np.array([0.2, 0.35], "float32"),
+        }
+    )
+    assert_frame_equal(result, expected)
+
+
+def test_average_over_segments_preserves_energy():
+    snapshots = _create_complete_snapshots_index(
+        start_year=2024, end_year=2024, temporal_resolution_min=30, year_type="calendar"
+    ).loc[:, ["snapshots"]]
+    snapshots = snapshots[snapshots["snapshots"] <= "2024-01-08"]
+    values = np.random.default_rng(1).random(len(snapshots))
+    net_load = pd.DataFrame({"datetime": snapshots["snapshots"], "value": values})
+    segments = _segment_snapshots(snapshots, 4, 30, 2024, 2024, "calendar", net_load)
+
+    averaged = _average_over_segments(snapshots.assign(p_set=values), segments)
+
+    segment_length = (segments["snapshots"] - segments["segment_start"]) / pd.Timedelta(
+        minutes=30
+    )
+    np.testing.assert_allclose((averaged["p_set"] * segment_length).sum(), values.sum())
+
+
+def test_add_snapshot_weightings_segments():
+    snapshots = pd.DataFrame(
+        {
+            "snapshots": pd.to_datetime(
+                ["2026-01-01 03:00", "2026-01-01 04:00", "2026-01-02 00:00"]
+            ),
+            "segment_start": pd.to_datetime(
+                ["2026-01-01 00:00", "2026-01-01 03:00", "2026-01-01 04:00"]
+            ),
+        }
+    )
+    snapshots = _add_investment_periods(snapshots, [2026], "calendar")
+
+    result = _add_snapshot_weightings(snapshots, temporal_resolution_min=60)
+
+    # Segments of 3, 1 and 20 hours share out 8760 hours in proportion.
+    assert list(result.columns) == [
+        "investment_periods",
+        "snapshots",
+        "objective",
+        "generators",
+        "stores",
+    ]
+    np.testing.assert_allclose(result["objective"], [1095.0, 365.0, 7300.0])
+    np.testing.assert_allclose(result["generators"], [1095.0, 365.0, 7300.0])
+    np.testing.assert_allclose(result["stores"], [3.0, 1.0, 20.0])
+
+
+def test_prepare_net_load_for_segmentation(csv_str_to_df):
+    demand_traces = {
+        "A": csv_str_to_df("""
+        datetime,              value
+        2024-01-01__00:30:00,  100
+        2024-01-01__01:00:00,  120
+        """),
+    }
+    generator_traces = {
+        "wind": csv_str_to_df("""
+        datetime,              value
+        2024-01-01__00:30:00,  0.5
+        2024-01-01__01:00:00,  0.1
+        """),
+    }
+    existing_generators = csv_str_to_df("""
+    generator,  fuel_type,  maximum_capacity_mw
+    wind,       Wind,       100
+    """)
+
+    net_load = _prepare_net_load_for_segmentation(
+        existing_generators, demand_traces, generator_traces
+    )
+
+    assert list(net_load.columns) == ["datetime", "value"]
+    np.testing.assert_allclose(net_load["value"], [50.0, 110.0])
+
+    demand_only = _prepare_net_load_for_segmentation(None, demand_traces, None)
+    np.testing.assert_allclose(demand_only["value"], [100.0, 120.0])
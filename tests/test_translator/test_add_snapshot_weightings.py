@@ -216,3 +216,38 @@ def test_add_snapshot_weightings_many_snapshots(csv_str_to_df):
         result[["snapshots"]].reset_index(drop=True),
         input_df[["snapshots"]].reset_index(drop=True),
     )
+
+
+def test_add_snapshot_weightings_representative_period_weights(csv_str_to_df):
+    """Test snapshot weightings shared out by the weights of clustered representative
+    periods."""
+
+    # Period 2026 has two representative periods of two snapshots, standing for
+    # three periods and one period, so 8760 is shared 3:3:1:1.
+    input_csv = """
+    investment_periods,  snapshots,             representative_period_weight
+    2026,                2026-01-01__01:00:00,  3
+    2026,                2026-01-01__02:00:00,  3
+    2026,                2026-01-02__01:00:00,  1
+    2026,                2026-01-02__02:00:00,  1
+    2028,                2028-01-01__01:00:00,  2
+    2028,                2028-01-01__02:00:00,  2
+    """
+
+    input_df = csv_str_to_df(input_csv, parse_dates=["snapshots"])
+
+    result = _add_snapshot_weightings(input_df, temporal_resolution_min=60)
+
+    expected_csv = """
+    investment_periods,  snapshots,               objective,  generators,  stores
+    2026,                2026-01-01__01:00:00,     3285.0,     3285.0,      1.0
+    2026,                2026-01-01__02:00:00,     3285.0,     3285.0,      1.0
+    2026,                2026-01-02__01:00:00,     1095.0,     1095.0,      1.0
+    2026,                2026-01-02__02:00:00,     1095.0,     1095.0,      1.0
+    2028,                2028-01-01__01:00:00,     4380.0,     4380.0,      1.0
+    2028,                2028-01-01__02:00:00,     4380.0,     4380.0,      1.0
+    """
+
+    expected_df = csv_str_to_df(expected_csv, parse_dates=["snapshots"])
+
+    assert_frame_equal(result, expected_df)
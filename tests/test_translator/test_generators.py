@@ -1369,3 +1369,54 @@ def test_create_pypsa_friendly_new_entrant_generator_timeseries(tmp_path):
     got_trace = pd.read_parquet(tmp_path / Path("wind_traces/Wind_Q1_WM.parquet"))
 
     pd.testing.assert_frame_equal(expected_trace, got_trace)
+
+
+def test_create_pypsa_friendly_new_entrant_generator_timeseries_float32(tmp_path):
+    parsed_trace_path = Path(__file__).parent.parent / Path("trace_data/isp_2024")
+
+    new_entrant_ispypsa = pd.DataFrame(
+        {
+            "generator": ["Large scale Solar PV_N1_SAT", "Wind_Q1_WM"],
+            "fuel_type": ["Solar", "Wind"],
+            "rez_id": ["N1", "Q1"],
+            "isp_resource_type": ["SAT", "WM"],
+        }
+    )
+
+    snapshots = _create_complete_snapshots_index(
+        start_year=2025,
+        end_year=2026,
+        temporal_resolution_min=30,
+        year_type="fy",
+    )
+
+    snapshots = _add_investment_periods(snapshots, [2025], "fy")
+
+    for value_dtype in ["float64", "float32"]:
+        create_pypsa_friendly_new_entrant_generator_timeseries(
+            new_entrant_ispypsa,
+            parsed_trace_path,
+            tmp_path / value_dtype,
+            generator_types=["solar", "wind"],
+            reference_year_mapping={2025: 2011, 2026: 2018},
+            year_type="fy",
+            snapshots=snapshots,
+            value_dtype=value_dtype,
+        )
+
+    for trace_file in [
+        "solar_traces/Large scale Solar PV_N1_SAT",
+        "wind_traces/Wind_Q1_WM",
+    ]:
+        full = pd.read_parquet(tmp_path / f"float64/{trace_file}.parquet")
+        compact = pd.read_parquet(tmp_path / f"float32/{trace_file}.parquet")
+
+        assert compact["p_max_pu"].dtype == "float32"
+        pd.testing.assert_frame_equal(
+            full.drop(columns="p_max_pu"), compact.drop(columns="p_max_pu")
+        )
+        # Rounding to float32 stays within a typical solver feasibility
+        # tolerance (1e-7) of the full precision values.
+        np.testing.assert_allclose(
+            compact["p_max_pu"], full["p_max_pu"], rtol=1e-7, atol=0
+        )
@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+
+from ispypsa.translator.custom_constraints import _presolve_custom_constraints
+
+
+def test_presolve_custom_constraints(csv_str_to_df):
+    """Test duplicate, dominated, empty and single variable constraints are removed."""
+
+    lhs_csv = """
+    constraint_name,  variable_name,   component,  attribute,  coefficient
+    CONS1,            GEN1,            Generator,  p_nom,      1.0
+    CONS1,            GEN2,            Generator,  p_nom,      1.0
+    CONS2,            GEN1,            Generator,  p_nom,      2.0
+    CONS2,            GEN2,            Generator,  p_nom,      2.0
+    CONS3,            GEN1,            Generator,  p_nom,      1.0
+    CONS3,            GEN2,            Generator,  p_nom,      1.0
+    CONS4,            GEN1,            Generator,  p_nom,      1.0
+    CONS4,            GEN2,            Generator,  p_nom,      1.0
+    EMPTY,            GEN1,            Generator,  p_nom,      1.0
+    EMPTY,            GEN1,            Generator,  p_nom,      -1.0
+    GEN_BOUND,        GEN3,            Generator,  p_nom,      -2.0
+    LINK_BOUND,       PATH1_exp_2025,  Link,       p_nom,      1.0
+    FLOW,             PATH1_exp_2025,  Link,       p,          1.0
+    FIXED,            GEN4,            Generator,  p_nom,      1.0
+    """
+
+    rhs_csv = """
+    constraint_name,  rhs,  constraint_type
+    CONS1,            100,  <=
+    CONS2,            150,  <=
+    CONS3,            10,   >=
+    CONS4,            10,   >=
+    EMPTY,            5,    <=
+    GEN_BOUND,        -20,  <=
+    LINK_BOUND,       500,  <=
+    FLOW,             300,  <=
+    FIXED,            50,   <=
+    """
+
+    generators_csv = """
+    name,  bus,   p_nom,  p_nom_extendable,  p_nom_max
+    GEN1,  BUS1,  0.0,    True,              inf
+    GEN2,  BUS1,  0.0,    True,              inf
+    GEN3,  BUS1,  0.0,    True,              40.0
+    GEN4,  BUS1,  80.0,   False,             inf
+    """
+
+    links_csv = """
+    isp_name,  name,            bus0,  bus1,  p_nom,  p_nom_extendable
+    PATH1,     PATH1_existing,  BUS1,  BUS2,  1000,   False
+    PATH1,     PATH1_exp_2025,  BUS1,  BUS2,  0,      True
+    """
+
+    pypsa_inputs = {
+        "custom_constraints_lhs": csv_str_to_df(lhs_csv),
+        "custom_constraints_rhs": csv_str_to_df(rhs_csv),
+        "generators": csv_str_to_df(generators_csv),
+        "links": csv_str_to_df(links_csv),
+    }
+
+    presolved = _presolve_custom_constraints(pypsa_inputs)
+
+    # CONS2 is CONS1 scaled by two with a tighter rhs, and CONS4 duplicates CONS3.
+    # The dispatch constraint and the constraint on the non-extendable generator
+    # aren't converted to bounds.
+    expected_rhs_csv = """
+    constraint_name,  rhs,  constraint_type
+    CONS2,            150,  <=
+    CONS3,            10,   >=
+    FLOW,             300,  <=
+    FIXED,            50,   <=
+    """
+    pd.testing.assert_frame_equal(
+        presolved["custom_constraints_rhs"], csv_str_to_df(expected_rhs_csv)
+    )
+    assert list(presolved["custom_constraints_lhs"]["constraint_name"]) == [
+        "CONS2",
+        "CONS2",
+        "CONS3",
+        "CONS3",
+        "FLOW",
+        "FIXED",
+    ]
+
+    generators = presolved["generators"].set_index("name")
+    np.testing.assert_array_equal(
+        generators["p_nom_max"], [np.inf, np.inf, 40.0, np.inf]
+    )
+    np.testing.assert_array_equal(generators["p_nom_min"], [0.0, 0.0, 10.0, 0.0])
+
+    links = presolved["links"].set_index("name")
+    assert links.loc["PATH1_exp_2025", "p_nom_max"] == 500.0
+    assert links.loc["PATH1_existing", "p_nom_max"] == np.inf
+
+
+def test_presolve_custom_constraints_equality_dominates_inequalities(csv_str_to_df):
+    """Test inequalities an equality with the same terms satisfies are removed, and
+    conflicting equalities are kept."""
+
+    lhs_csv = """
+    constraint_name,  variable_name,   component,  attribute,  coefficient
+    EQ1,              PATH1_exp_2025,  Link,       p,          1.0
+    EQ2,              PATH1_exp_2025,  Link,       p,          1.0
+    EQ3,              PATH1_exp_2025,  Link,       p,          1.0
+    LE,               PATH1_exp_2025,  Link,       p,          1.0
+    GE,               PATH1_exp_2025,  Link,       p,          1.0
+    TIGHT_LE,         PATH1_exp_2025,  Link,       p,          1.0
+    """
+
+    rhs_csv = """
+    constraint_name,  rhs,  constraint_type
+    EQ1,              100,  ==
+    EQ2,              100,  ==
+    EQ3,              200,  ==
+    LE,               150,  <=
+    GE,               50,   >=
+    TIGHT_LE,         80,   <=
+    """
+
+    pypsa_inputs = {
+        "custom_constraints_lhs": csv_str_to_df(lhs_csv),
+        "custom_constraints_rhs": csv_str_to_df(rhs_csv),
+    }
+
+    presolved = _presolve_custom_constraints(pypsa_inputs)
+
+    assert list(presolved["custom_constraints_rhs"]["constraint_name"]) == [
+        "EQ1",
+        "EQ3",
+        "TIGHT_LE",
+    ]
+
+
+def test_presolve_custom_constraints_no_constraints():
+    pypsa_inputs = {
+        "custom_constraints_lhs": pd.DataFrame(),
+        "custom_constraints_rhs": pd.DataFrame(),
+    }
+
+    assert _presolve_custom_constraints(pypsa_inputs) == {}
+
+
+def test_presolve_custom_constraints_different_terms_with_hash_collision(
+    csv_str_to_df, monkeypatch
+):
+    """Test constraints are only compared when their terms are equal, not when the
+    hashes of their terms collide."""
+
+    lhs_csv = """
+    constraint_name,  variable_name,   component,  attribute,  coefficient
+    CONS1,            PATH1_exp_2025,  Link,       p,          1.0
+    CONS2,            PATH2_exp_2025,  Link,       p,          1.0
+    """
+
+    rhs_csv = """
+    constraint_name,  rhs,  constraint_type
+    CONS1,            100,  <=
+    CONS2,            50,   <=
+    """
+
+    pypsa_inputs = {
+        "custom_constraints_lhs": csv_str_to_df(lhs_csv),
+        "custom_constraints_rhs": csv_str_to_df(rhs_csv),
+    }
+    monkeypatch.setattr("builtins.hash", lambda value: 0)
+
+    presolved = _presolve_custom_constraints(pypsa_inputs)
+
+    assert list(presolved["custom_constraints_rhs"]["constraint_name"]) == [
+        "CONS1",
+        "CONS2",
+    ]
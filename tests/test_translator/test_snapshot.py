@@ -43,6 +43,16 @@ from ispypsa.translator.snapshots import (
             datetime(year=2021, month=7, day=1, minute=0),
             8760 / 4,
         ),
+        # One financial year with daily resolution
+        (
+            2021,
+            2021,
+            "fy",
+            1440,
+            datetime(year=2020, month=7, day=2),
+            datetime(year=2021, month=7, day=1),
+            365,
+        ),
         # One financial year with fifteen minute resolution
         (
             2021,
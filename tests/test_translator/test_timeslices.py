@@ -0,0 +1,42 @@
+import pandas as pd
+
+from ispypsa.translator.timeslices import _translate_timeslices_to_model_years
+
+
+def test_translate_timeslices_to_model_years(csv_str_to_df):
+    timeslices = csv_str_to_df("""
+        timeslice_id,          reference_year,  start_month_day,  end_month_day
+        qld_summer_typical,    2011,            10-01,            04-01
+        qld_winter_reference,  2011,            04-01,            10-01
+        qld_summer_typical,    2015,            11-01,            04-01
+        qld_winter_reference,  2015,            04-01,            11-01
+    """)
+    # 2027's reference year has no windows, so 2027 gets no rows.
+    reference_year_mapping = {2025: 2015, 2026: 2011, 2027: 2018}
+
+    result = _translate_timeslices_to_model_years(
+        timeslices, reference_year_mapping, "fy"
+    )
+
+    expected = csv_str_to_df("""
+        year_start,  year_end,    timeslice_id,          start_month_day,  end_month_day
+        2024-07-01,  2025-07-01,  qld_summer_typical,    11-01,            04-01
+        2024-07-01,  2025-07-01,  qld_winter_reference,  04-01,            11-01
+        2025-07-01,  2026-07-01,  qld_summer_typical,    10-01,            04-01
+        2025-07-01,  2026-07-01,  qld_winter_reference,  04-01,            10-01
+    """)
+    expected["year_start"] = pd.to_datetime(expected["year_start"])
+    expected["year_end"] = pd.to_datetime(expected["year_end"])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_translate_timeslices_to_calendar_years(csv_str_to_df):
+    timeslices = csv_str_to_df("""
+        timeslice_id,          reference_year,  start_month_day,  end_month_day
+        qld_winter_reference,  2011,            04-01,            04-01
+    """)
+
+    result = _translate_timeslices_to_model_years(timeslices, {2025: 2011}, "calendar")
+
+    assert list(result["year_start"]) == [pd.Timestamp("2025-01-01")]
+    assert list(result["year_end"]) == [pd.Timestamp("2026-01-01")]
@@ -3,6 +3,7 @@ import pytest
 
 from ispypsa.translator.custom_constraints import (
     _create_vre_build_and_resource_limit_constraints,
+    _create_vre_constraint_lhs_rhs,
     _translate_custom_constraints,
     _validate_lhs_rhs_constraints,
 )
@@ -856,3 +857,94 @@ def test_create_vre_build_limit_constraints_no_matching_generators(csv_str_to_df
 
     # Dummy generators should not be returned either:
     assert dummy_generators is None
+
+
+def test_create_vre_build_limit_constraints_only_extendable_generators_in_order(
+    csv_str_to_df,
+):
+    """Test existing (non-extendable) generators are left out of VRE limit constraints
+    and that constraint terms keep the order of the limits and the generators."""
+    renewable_energy_zones_csv = """
+    rez_id,         wind_generation_total_limits_mw_high,   wind_generation_total_limits_mw_medium, solar_pv_plus_solar_thermal_limits_mw_solar,    wind_generation_total_limits_mw_offshore_floating,  wind_generation_total_limits_mw_offshore_fixed,  land_use_limits_mw_wind,     land_use_limits_mw_solar,   rez_resource_limit_violation_penalty_factor_$/mw
+    REZ1,           1000,                                   800,                                    NaN,                                            NaN,                                                NaN,                                             2300,                        NaN,                        NaN
+    REZ2,           1200,                                   NaN,                                    NaN,                                            NaN,                                                NaN,                                             NaN,                         NaN,                        NaN
+    """
+    renewable_energy_zones = csv_str_to_df(renewable_energy_zones_csv)
+
+    generators_csv = """
+    name,               bus,    carrier,    p_nom,  p_nom_extendable,   build_year,     isp_resource_type
+    wh_REZ2_2030,       REZ2,   Wind,       0,      True,               2030,           WH
+    existing_wind,      REZ1,   Wind,       100,    False,              2020,           WH
+    wm_REZ1_2025,       REZ1,   Wind,       0,      True,               2025,           WM
+    wh_REZ1_2030,       REZ1,   Wind,       0,      True,               2030,           WH
+    wh_REZ1_2025,       REZ1,   Wind,       0,      True,               2025,           WH
+    wh_REZ2_2025,       REZ2,   Wind,       0,      True,               2025,           WH
+    """
+    generators = csv_str_to_df(generators_csv)
+
+    lhs, rhs, dummy_generators = _create_vre_build_and_resource_limit_constraints(
+        renewable_energy_zones, generators, [2025, 2030], 0.05, 30
+    )
+
+    expected_lhs_csv = """
+    constraint_name,            variable_name
+    REZ1_WH_resource_limit,     wh_REZ1_2030
+    REZ1_WH_resource_limit,     wh_REZ1_2025
+    REZ2_WH_resource_limit,     wh_REZ2_2030
+    REZ2_WH_resource_limit,     wh_REZ2_2025
+    REZ1_WM_resource_limit,     wm_REZ1_2025
+    REZ1_Wind_build_limit,      wm_REZ1_2025
+    REZ1_Wind_build_limit,      wh_REZ1_2030
+    REZ1_Wind_build_limit,      wh_REZ1_2025
+    """
+    expected_rhs_csv = """
+    constraint_name,            rhs,        constraint_type
+    REZ1_WH_resource_limit,     1000.0,     <=
+    REZ2_WH_resource_limit,     1200.0,     <=
+    REZ1_WM_resource_limit,     800.0,      <=
+    REZ1_Wind_build_limit,      2300.0,     <=
+    """
+
+    pd.testing.assert_frame_equal(
+        lhs[["constraint_name", "variable_name"]], csv_str_to_df(expected_lhs_csv)
+    )
+    pd.testing.assert_frame_equal(rhs, csv_str_to_df(expected_rhs_csv))
+    assert dummy_generators is None
+
+
+def test_create_vre_constraint_lhs_rhs_missing_keys_dont_match(csv_str_to_df):
+    """Test limits and generators with a missing REZ or resource type aren't joined
+    to each other."""
+    limits_csv = """
+    constraint_name,        rez_id,     isp_resource_type,  resource_limit_mw
+    REZ1_WH_resource_limit, REZ1,       WH,                 1000.0
+    NaN_WH_resource_limit,  NaN,        WH,                 500.0
+    REZ1_NaN_limit,         REZ1,       NaN,                200.0
+    """
+    generators_csv = """
+    name,           bus,    carrier,    p_nom,  p_nom_extendable,   isp_resource_type
+    wh_REZ1_2025,   REZ1,   Wind,       0,      True,               WH
+    wh_no_rez,      NaN,    Wind,       0,      True,               WH
+    no_type_REZ1,   REZ1,   Wind,       0,      True,               NaN
+    """
+
+    lhs, rhs = _create_vre_constraint_lhs_rhs(
+        "wind_resource_limits",
+        csv_str_to_df(limits_csv),
+        csv_str_to_df(generators_csv),
+        "isp_resource_type",
+        "resource_limit_mw",
+    )
+
+    expected_lhs_csv = """
+    constraint_name,            variable_name
+    REZ1_WH_resource_limit,     wh_REZ1_2025
+    """
+    expected_rhs_csv = """
+    constraint_name,            rhs,        constraint_type
+    REZ1_WH_resource_limit,     1000.0,     <=
+    """
+    pd.testing.assert_frame_equal(
+        lhs[["constraint_name", "variable_name"]], csv_str_to_df(expected_lhs_csv)
+    )
+    pd.testing.assert_frame_equal(rhs, csv_str_to_df(expected_rhs_csv))
@@ -1,12 +1,23 @@
 # tests/test_translator/test_helpers.py
+import re
+
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
 
 from ispypsa.translator.helpers import (
     _add_investment_periods_as_build_years,
+    _get_commissioning_or_build_years_as_int,
     _get_financial_year_int_from_string,
+    _get_financial_year_ints_from_strings,
+    _get_traces_by_reference_year,
+    _in_model_years,
+    _patterns_most_specific_first,
+    _raise_on_disallowed_values,
+    _resample_trace,
     _resolve_wildcards,
+    _split_traces,
 )
 
 
@@ -28,6 +39,55 @@ def test_get_financial_year_int_from_string():
         _get_financial_year_int_from_string("2023", "test", "calendar")
 
 
+def test_get_financial_year_ints_from_strings():
+    """Test vectorised financial year string translation to integers."""
+    strings = pd.Series(["2023_24", "2023_24_extra", "2099_00"])
+    result = _get_financial_year_ints_from_strings(strings, "test", "fy")
+    pd.testing.assert_series_equal(result, pd.Series([2024, 2024, 2100], dtype="int64"))
+
+    with pytest.raises(
+        ValueError, match="Invalid financial year string for test: invalid"
+    ):
+        _get_financial_year_ints_from_strings(
+            pd.Series(["2023_24", "invalid"]), "test", "fy"
+        )
+
+    with pytest.raises(ValueError, match="Unknown year_type"):
+        _get_financial_year_ints_from_strings(strings, "test", "unknown")
+
+    with pytest.raises(NotImplementedError, match="Calendar years are not implemented"):
+        _get_financial_year_ints_from_strings(strings, "test", "calendar")
+
+
+def test_get_commissioning_or_build_years_as_int():
+    """Test commissioning dates are converted to build years, defaulting where
+    no date is given or the date is before the default build year."""
+    commissioning_dates = pd.Series(
+        ["2026-06-30", "2026-07-01", None, "2010-01-01", float("nan")],
+        index=[10, 11, 12, 13, 14],
+    )
+
+    fy_result = _get_commissioning_or_build_years_as_int(
+        commissioning_dates, default_build_year=2024, year_type="fy"
+    )
+    calendar_result = _get_commissioning_or_build_years_as_int(
+        commissioning_dates, default_build_year=2024, year_type="calendar"
+    )
+    no_dates_result = _get_commissioning_or_build_years_as_int(
+        pd.Series([float("nan")] * 2), default_build_year=2024
+    )
+
+    pd.testing.assert_series_equal(
+        fy_result,
+        pd.Series([2026, 2027, 2024, 2024, 2024], index=commissioning_dates.index),
+    )
+    pd.testing.assert_series_equal(
+        calendar_result,
+        pd.Series([2026, 2026, 2024, 2024, 2024], index=commissioning_dates.index),
+    )
+    pd.testing.assert_series_equal(no_dates_result, pd.Series([2024, 2024]))
+
+
 def test_add_investment_periods_as_build_years(csv_str_to_df):
     """Test adding investment periods as build years to a DataFrame."""
     # Input DataFrame
@@ -179,3 +239,272 @@ def test_resolve_wildcards_empty(csv_str_to_df):
         path_id,  direction,  timeslice,  capacity
     """)
     assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_resolve_wildcards_tie_between_equally_specific_rows(csv_str_to_df):
+    """Rows with the same number of blanks that land on the same key are
+    ranked by which columns are blank: a row blank only in the first column
+    beats one blank only in the last."""
+    table = csv_str_to_df("""
+        path_id,  direction,  capacity
+        CQ-NQ,    ,           100
+        ,         forward,    200
+    """)
+
+    result = _resolve_wildcards(
+        table,
+        {"path_id": ["CQ-NQ"], "direction": ["forward", "reverse"]},
+        ["capacity"],
+    )
+
+    expected = csv_str_to_df("""
+        path_id,  direction,  capacity
+        CQ-NQ,    forward,    200
+        CQ-NQ,    reverse,    100
+    """)
+    assert_frame_equal(
+        result.sort_values("direction").reset_index(drop=True),
+        expected,
+        check_dtype=False,
+    )
+
+
+def test_patterns_most_specific_first():
+    is_wildcard = pd.DataFrame(
+        {
+            "path_id": [True, False, True, False, True],
+            "direction": [True, True, False, False, False],
+        }
+    )
+
+    assert _patterns_most_specific_first(is_wildcard) == [
+        (False, False),
+        (True, False),
+        (False, True),
+        (True, True),
+    ]
+
+
+def _resolve_wildcards_by_full_expansion(table, allowed_values, value_columns):
+    """Reference resolver: cross joins every wildcard row with the allowed
+    values, then keeps the least-wildcarded row for each key."""
+    key_columns = [c for c in table.columns if c not in value_columns]
+    expanded = table.copy()
+    expanded["_wildcards"] = sum(expanded[c].isna().astype(int) for c in allowed_values)
+    for column, allowed in allowed_values.items():
+        is_wildcard = expanded[column].isna()
+        _raise_on_disallowed_values(expanded.loc[~is_wildcard, column], allowed, column)
+        cross = (
+            expanded[is_wildcard]
+            .drop(columns=column)
+            .merge(pd.DataFrame({column: allowed}), how="cross")
+        )
+        expanded = pd.concat([expanded[~is_wildcard], cross], ignore_index=True)
+    resolved = expanded.sort_values("_wildcards", kind="stable").drop_duplicates(
+        key_columns, keep="first"
+    )
+    return resolved.loc[:, list(table.columns)].reset_index(drop=True)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_resolve_wildcards_matches_full_expansion(seed):
+    """On random tables of blank and filled keys, the resolver returns exactly
+    what expanding every wildcard and de-duplicating does, row order and dtypes
+    included, and raises the same errors."""
+    rng = np.random.default_rng(seed)
+    n_rows = rng.integers(0, 12)
+    allowed_values = {
+        "path_id": ["CQ-NQ", "Q1-NQ", "N1-CNSW"],
+        "direction": ["forward", "reverse"],
+        "year": [2025, 2026, 2028],
+    }
+    table = pd.DataFrame(
+        {
+            "path_id": rng.choice(allowed_values["path_id"] + [None], n_rows),
+            "direction": rng.choice(allowed_values["direction"] + [None], n_rows),
+            # 2027 is outside the allowed years, so a few seeds raise.
+            "year": rng.choice(
+                [2025.0, 2026.0, 2028.0, np.nan, 2027.0],
+                n_rows,
+                p=[0.24, 0.24, 0.24, 0.24, 0.04],
+            ),
+            "timeslice": rng.choice(["peak", None], n_rows),
+            "capacity": rng.integers(0, 5, n_rows).astype(float),
+        }
+    )
+
+    try:
+        expected = _resolve_wildcards_by_full_expansion(
+            table, allowed_values, ["capacity"]
+        )
+    except ValueError as error:
+        with pytest.raises(ValueError, match=re.escape(str(error))):
+            _resolve_wildcards(table, allowed_values, ["capacity"])
+        return
+
+    result = _resolve_wildcards(table, allowed_values, ["capacity"])
+
+    assert_frame_equal(result, expected)
+
+
+def test_split_traces(csv_str_to_df):
+    trace_data = csv_str_to_df("""
+    zone,  resource_type,  datetime,             value
+    N1,    WH,             2025-01-01__00:30:00, 0.1
+    Q1,    WH,             2025-01-01__00:30:00, 0.3
+    N1,    WH,             2025-01-01__01:00:00, 0.2
+    N1,    SAT,            2025-01-01__00:30:00, 0.5
+    """)
+    trace_data["datetime"] = pd.to_datetime(trace_data["datetime"]).astype(
+        "datetime64[us]"
+    )
+
+    traces = _split_traces(trace_data, ["zone", "resource_type"], "float32")
+
+    assert list(traces) == [("N1", "SAT"), ("N1", "WH"), ("Q1", "WH")]
+    expected = pd.DataFrame(
+        {
+            "datetime": pd.to_datetime(
+                ["2025-01-01 00:30:00", "2025-01-01 01:00:00"]
+            ).astype("datetime64[ns]"),
+            "value": np.array([0.1, 0.2], dtype="float32"),
+        },
+        index=[0, 2],
+    )
+    assert_frame_equal(traces[("N1", "WH")], expected)
+
+
+def test_in_model_years():
+    datetimes = pd.Series(
+        pd.to_datetime(
+            [
+                "2024-07-01 00:00:00",
+                "2024-07-01 00:30:00",
+                "2025-07-01 00:00:00",
+                "2025-07-01 00:30:00",
+                "2026-07-01 00:00:00",
+                "2026-07-01 00:30:00",
+            ]
+        )
+    )
+
+    result = _in_model_years(datetimes, [2027, 2025], "fy")
+
+    assert list(result) == [False, True, True, False, False, True]
+
+
+def test_get_traces_by_reference_year_matches_one_query_per_model_year():
+    # One row per half hour at the start of each month and on 29 February, for
+    # each reference year, shaped like the isp-trace-parser parquet files.
+    datetimes = pd.date_range("2024-07-01 00:30", "2031-07-01 00:00", freq="30min")
+    datetimes = datetimes[(datetimes.day == 1) | (datetimes.day == 29)]
+    trace_data = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "reference_year": reference_year,
+                    "datetime": datetimes,
+                    "value": np.arange(len(datetimes)) + reference_year,
+                }
+            )
+            for reference_year in [2011, 2013, 2018]
+        ]
+    )
+    queries = []
+
+    def get_single_reference_year(
+        start_year, end_year, reference_year, year_type, select_columns
+    ):
+        queries.append((reference_year, start_year, end_year))
+        start = pd.Timestamp(f"{start_year - 1}-07-01")
+        end = pd.Timestamp(f"{end_year}-07-01")
+        rows = trace_data[
+            (trace_data["reference_year"] == reference_year)
+            & (trace_data["datetime"] > start)
+            & (trace_data["datetime"] <= end)
+        ]
+        return rows[select_columns].sort_values("datetime")
+
+    # A repeating 2011, 2013, 2018 cycle.
+    reference_year_cycle = [2011, 2013, 2018]
+    reference_year_mapping = {
+        year: reference_year_cycle[i % 3] for i, year in enumerate(range(2025, 2032))
+    }
+    expected = pd.concat(
+        [
+            get_single_reference_year(
+                year, year, reference_year, "fy", ["datetime", "value"]
+            )
+            for year, reference_year in reference_year_mapping.items()
+        ]
+    ).reset_index(drop=True)
+    queries.clear()
+
+    result = _get_traces_by_reference_year(
+        get_single_reference_year,
+        reference_year_mapping,
+        "fy",
+        select_columns=["datetime", "value"],
+    )
+
+    # Each reference year is queried once, over its first to last model year.
+    assert len(queries) == len(set(reference_year_cycle))
+    assert queries == [(2011, 2025, 2031), (2013, 2026, 2029), (2018, 2027, 2030)]
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("resolution_min", [60, 120, 240])
+def test_resample_trace_matches_mean_over_intervals(resolution_min):
+    datetimes = pd.date_range("2024-07-01 00:30", "2025-07-01 00:00", freq="30min")
+    trace = pd.DataFrame(
+        {
+            "datetime": datetimes,
+            "value": np.random.default_rng(0).random(len(datetimes)),
+        }
+    )
+
+    result = _resample_trace(trace, resolution_min)
+
+    expected = (
+        trace.set_index("datetime")["value"]
+        .resample(f"{resolution_min}min", closed="right", label="right")
+        .mean()
+        .reset_index()
+    )
+    assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_resample_trace_with_gaps(csv_str_to_df):
+    trace = csv_str_to_df("""
+    datetime,             value
+    2024-07-01__00:30:00, 1.0
+    2024-07-01__01:00:00, 3.0
+    2024-07-01__02:00:00, 6.0
+    2024-07-01__03:30:00, 2.0
+    2024-07-01__04:00:00, 4.0
+    """)
+    trace["datetime"] = pd.to_datetime(trace["datetime"])
+
+    result = _resample_trace(trace, 60)
+
+    expected = pd.DataFrame(
+        {
+            "datetime": pd.to_datetime(
+                ["2024-07-01 01:00", "2024-07-01 02:00", "2024-07-01 04:00"]
+            ),
+            "value": [2.0, 6.0, 3.0],
+        }
+    )
+    assert_frame_equal(result, expected)
+
+
+def test_resample_trace_keeps_30_min_and_dtype():
+    trace = pd.DataFrame(
+        {
+            "datetime": pd.date_range("2024-07-01 00:30", periods=4, freq="30min"),
+            "value": np.array([1.0, 2.0, 3.0, 4.0], dtype="float32"),
+        }
+    )
+
+    assert _resample_trace(trace, 30) is trace
+    assert _resample_trace(trace, 60)["value"].dtype == np.float32
@@ -0,0 +1,140 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ispypsa import validation
+from ispypsa.validation import load_schemas, validate_ispypsa_tables
+
+
+@pytest.fixture
+def network_tables(csv_str_to_df):
+    return {
+        "network_geography": csv_str_to_df("""
+            geo_id,  geo_type,   region_id,  subregion_id
+            NQ,      subregion,  QLD,        NQ
+            CQ,      subregion,  QLD,        CQ
+            Q1,      rez,        QLD,        NQ
+        """),
+        "network_transmission_paths": csv_str_to_df("""
+            path_id,  geo_from,  geo_to,  carrier
+            CQ-NQ,    CQ,        NQ,      AC
+            Q1-NQ,    Q1,        NQ,      AC
+        """),
+        "network_expansion_options": csv_str_to_df("""
+            expansion_id,  expansion_type,  allowed_expansion,  expansion_option
+            CQ-NQ,         forward,         1000.0,             Option 1
+            CQ-NQ,         reverse,         1000.0,             Option 1
+            ,              ,                500.0,              Default
+        """),
+    }
+
+
+def test_load_schemas_compiles_every_schema_file():
+    schema_files = (Path(validation.__file__).parent / "schemas").glob("*.yaml")
+    schemas = load_schemas()
+
+    assert sorted(schemas) == sorted(path.stem for path in schema_files)
+    assert load_schemas() is schemas
+    assert schemas["network_geography"].unique == [["geo_id"]]
+    assert schemas["network_expansion_options"].foreign_keys == {
+        "expansion_id": [
+            ("network_transmission_paths", "path_id"),
+            ("custom_constraints_rhs", "constraint_id"),
+        ]
+    }
+
+
+def test_validate_ispypsa_tables_passes_valid_tables(network_tables):
+    # Tables without a schema are ignored.
+    network_tables["ecaa_generators"] = pd.DataFrame({"generator": ["A"]})
+
+    assert validate_ispypsa_tables(network_tables, check_required_tables=False) == []
+
+
+def test_validate_ispypsa_tables_reports_every_problem(network_tables, csv_str_to_df):
+    network_tables["network_geography"] = csv_str_to_df("""
+        geo_id,  geo_type,   region_id
+        NQ,      subregion,  QLD
+        CQ,      subregion,  QLD
+        CQ,      zone,       QLD
+    """)
+    network_tables["network_expansion_options"] = csv_str_to_df("""
+        expansion_id,  expansion_type,  allowed_expansion,  expansion_option
+        CQ-NQ,         forward,         1000.0,             Option 1
+        Q2-NQ,         forward,         -5.0,               Option 1
+        ,              ,                500.0,              Default
+        ,              ,                lots,               Default
+    """)
+
+    errors = validate_ispypsa_tables(
+        network_tables, check_required_tables=False, raise_on_error=False
+    )
+
+    assert errors == [
+        "network_expansion_options: expansion_id: 1 values are not in "
+        "network_transmission_paths.path_id, e.g. ['Q2-NQ']",
+        "network_expansion_options: allowed_expansion: 1 values are not numbers, "
+        "e.g. ['lots']",
+        "network_expansion_options: 2 rows share a value of the unique key "
+        "['expansion_id', 'expansion_type'], e.g. [(nan, nan)]",
+        "network_geography: geo_type: 1 values are not in "
+        "['subregion', 'region', 'rez'], e.g. ['zone']",
+        "network_geography: 2 rows share a value of the unique key ['geo_id'], "
+        "e.g. [('CQ',)]",
+        "network_transmission_paths: geo_from: 1 values are not in "
+        "network_geography.geo_id, e.g. ['Q1']",
+    ]
+
+
+def test_validate_ispypsa_tables_checks_bounds_and_missing_values(csv_str_to_df):
+    costs_connection = csv_str_to_df("""
+        geo_id,  technology,  year,  connection_cost,  system_strength_cost
+        Q1,      Wind,        2025,  -1.0,             0.0
+        Q1,      Wind,        2026.5,  ,               0.0
+        ,        Wind,        2027,  ,                 0.0
+    """)
+
+    errors = validate_ispypsa_tables(
+        {"costs_connection": costs_connection},
+        check_required_tables=False,
+        raise_on_error=False,
+    )
+
+    assert errors == [
+        "costs_connection: geo_id: 1 rows have no value",
+        "costs_connection: year: 1 values are not integers, e.g. [2026.5]",
+        "costs_connection: connection_cost: 1 values are not >= 0.0, e.g. [-1.0]",
+    ]
+
+
+def test_validate_ispypsa_tables_parses_month_days_in_a_leap_year(csv_str_to_df):
+    timeslices = csv_str_to_df("""
+        timeslice_id,        reference_year,  start_month_day,  end_month_day
+        qld_peak_demand,     2012,            02-29,            03-20
+        qld_summer_typical,  2012,            03-20,            02-29
+        qld_peak_demand,     2013,            02-30,            03-20
+    """)
+
+    errors = validate_ispypsa_tables(
+        {"timeslices": timeslices},
+        check_required_tables=False,
+        raise_on_error=False,
+    )
+
+    assert errors == [
+        "timeslices: start_month_day: 1 values are not dates in the format "
+        "'%m-%d', e.g. ['02-30']",
+    ]
+
+
+def test_validate_ispypsa_tables_raises_listing_missing_required_tables(
+    network_tables,
+):
+    with pytest.raises(ValueError) as error:
+        validate_ispypsa_tables(network_tables)
+
+    message = str(error.value)
+    assert "problems found in the ISPyPSA input tables" in message
+    assert "costs_fuel_prices: required table is missing" in message
+    assert "network_geography" not in message